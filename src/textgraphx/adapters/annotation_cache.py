@@ -0,0 +1,226 @@
+"""Content-addressed cache for temporal annotation service responses.
+
+TTK and HeidelTime are deterministic for a given (service URL, document text,
+document creation time) triple, yet a single document used to be sent to them
+up to six times per run: ``TemporalPhase`` requests TTK output separately for
+events, signals and GLINKs, and ``TlinksRecognizer`` requests it again for the
+E2E/E2T/T2T seed passes.
+
+``AnnotationCache`` keys responses on ``(service URL, sha256(text),
+normalized DCT)`` and keeps them in two tiers:
+
+* an in-process LRU (bounded by ``maxsize`` entries), shared by every phase
+  instance in the process;
+* an optional on-disk tier under ``<paths.output_dir>/cache/annotations`` so
+  re-runs over an unchanged corpus skip the service round-trip entirely. It
+  keeps at most ``services.annotation_cache_max_entries`` files; the least
+  recently used ones (by modification time, refreshed on every hit) are
+  evicted once the directory grows past that bound.
+
+Only non-empty responses are cached, so a failed or unavailable service is
+retried on the next call rather than being remembered as "no annotations".
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_ANNOTATION_CACHE_MAX = 256
+_ANNOTATION_DISK_MAX_ENTRIES = 20000
+# Disk entry count is re-checked against the bound every this many writes.
+_EVICTION_CHECK_EVERY = 64
+
+
+def normalize_dct(dct) -> str:
+    """Return the ``YYYYMMDD`` form of a DCT value (empty string when unset)."""
+    if dct is None:
+        return ""
+    return str(dct).strip().split("T")[0].replace("-", "")
+
+
+class AnnotationCache:
+    """Two-tier (memory + disk) cache of raw annotation service responses."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        maxsize: int = _ANNOTATION_CACHE_MAX,
+        max_disk_entries: int = _ANNOTATION_DISK_MAX_ENTRIES,
+    ):
+        self._maxsize = max(1, int(maxsize))
+        self.max_disk_entries = max(1, int(max_disk_entries))
+        self._store: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes_since_check = 0
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.disk_evictions = 0
+
+    @staticmethod
+    def key(url: str, text: str, dct) -> str:
+        text_digest = hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+        raw = "\x1f".join([str(url or ""), text_digest, normalize_dct(dct)])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / key[:2] / f"{key}.xml"
+
+    def _remember(self, key: str, value: str) -> None:
+        self._store[key] = value
+        self._store.move_to_end(key)
+        while len(self._store) > self._maxsize:
+            self._store.popitem(last=False)
+
+    def get(self, url: str, text: str, dct) -> Optional[str]:
+        key = self.key(url, text, dct)
+        with self._lock:
+            if key in self._store:
+                self._store.move_to_end(key)
+                self.memory_hits += 1
+                return self._store[key]
+
+        path = self._path(key)
+        if path is not None and path.exists():
+            try:
+                value = path.read_text(encoding="utf-8")
+            except OSError as exc:
+                logger.warning("Annotation cache read failed for %s: %s", path, exc)
+            else:
+                try:
+                    os.utime(path)
+                except OSError:
+                    pass
+                with self._lock:
+                    self._remember(key, value)
+                    self.disk_hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, url: str, text: str, dct, value: str) -> None:
+        if not value:
+            return
+        key = self.key(url, text, dct)
+        with self._lock:
+            self._remember(key, value)
+
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(value, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Annotation cache write failed for %s: %s", path, exc)
+            return
+        with self._lock:
+            self._writes_since_check += 1
+            check = self._writes_since_check >= _EVICTION_CHECK_EVERY
+            if check:
+                self._writes_since_check = 0
+        if check:
+            self.evict()
+
+    def evict(self) -> int:
+        """Delete the least recently used disk entries beyond ``max_disk_entries``; return how many."""
+        if self.cache_dir is None or not self.cache_dir.exists():
+            return 0
+        entries = []
+        for path in self.cache_dir.glob("*/*.xml"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        excess = len(entries) - self.max_disk_entries
+        if excess <= 0:
+            return 0
+        entries.sort(key=lambda entry: entry[0])
+        removed = 0
+        for _, path in entries[:excess]:
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                continue
+        with self._lock:
+            self.disk_evictions += removed
+        logger.debug("Evicted %d annotation response(s) from %s", removed, self.cache_dir)
+        return removed
+
+    def get_or_fetch(self, url: str, text: str, dct, fetch: Callable[[], str]) -> str:
+        """Return the cached response, calling *fetch* only on a miss."""
+        cached = self.get(url, text, dct)
+        if cached is not None:
+            logger.debug("Annotation cache hit for %s", url)
+            return cached
+        value = fetch()
+        self.set(url, text, dct, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop the in-process tier and reset counters (disk entries are kept)."""
+        with self._lock:
+            self._store.clear()
+            self.memory_hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+            self.disk_evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._store),
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "disk_evictions": self.disk_evictions,
+            }
+
+
+_annotation_cache: Optional[AnnotationCache] = None
+_annotation_cache_lock = threading.Lock()
+
+
+def get_annotation_cache() -> AnnotationCache:
+    """Return the process-wide cache, configured from ``paths``/``features``."""
+    global _annotation_cache
+    with _annotation_cache_lock:
+        if _annotation_cache is None:
+            cache_dir = None
+            max_disk_entries = _ANNOTATION_DISK_MAX_ENTRIES
+            try:
+                from textgraphx.infrastructure.config import get_config
+
+                cfg = get_config()
+                if bool(getattr(cfg.features, "persist_annotation_cache", True)):
+                    cache_dir = os.path.join(cfg.paths.output_dir, "cache", "annotations")
+                max_disk_entries = getattr(
+                    getattr(cfg, "services", None), "annotation_cache_max_entries", max_disk_entries
+                )
+            except Exception:
+                logger.debug("Annotation cache: config unavailable; using memory tier only", exc_info=True)
+            _annotation_cache = AnnotationCache(cache_dir=cache_dir, max_disk_entries=max_disk_entries)
+        return _annotation_cache
+
+
+def reset_annotation_cache() -> None:
+    """Forget the process-wide cache so the next access re-reads configuration."""
+    global _annotation_cache
+    with _annotation_cache_lock:
+        _annotation_cache = None
@@ -58,7 +58,16 @@ class GraphDBBase():
             # if config isn't present just continue with defaults
             pass
 
-        self._driver = GraphDatabase.driver(uri, auth=(user, password), **other_params)
+        if self.uri or self.neo4j_user or self.neo4j_password or other_params:
+            # Explicit connection overrides get a private driver.
+            self._driver = GraphDatabase.driver(uri, auth=(user, password), **other_params)
+            self._owns_driver = True
+        else:
+            # Otherwise share the process-wide driver and connection pool.
+            from textgraphx.database.connection_manager import get_connection_manager
+
+            self._driver = get_connection_manager().driver
+            self._owns_driver = False
         self._session = None
         logger.info("GraphDBBase initialized for uri=%s user=%s", uri, user)
 
@@ -73,7 +82,8 @@ class GraphDBBase():
         return default
 
     def close(self):
-        self._driver.close()
+        if getattr(self, "_owns_driver", True):
+            self._driver.close()
 
     def get_session(self):
         return self._driver.session()
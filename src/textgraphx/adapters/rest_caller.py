@@ -3,93 +3,108 @@ import hashlib
 import json
 import logging
 import re
-import time
+import threading
 from collections import OrderedDict
-from typing import List
+from typing import List, Optional
 
-import httpx
 import requests
 
+from textgraphx.adapters.service_client import (  # noqa: F401 - re-exported
+    _CB_COOLDOWN_SEC,
+    _CB_FAILURE_THRESHOLD,
+    _CircuitBreaker,
+    circuit_breaker,
+    get_service_client,
+)
+from textgraphx.adapters.srl_response_store import get_srl_response_store
 from textgraphx.infrastructure.config import get_config
 
 logger = logging.getLogger(__name__)
 logger.info("textgraphx.util.RestCaller module imported")
 
 # ---------------------------------------------------------------------------
-# Phase F: sentence-hash LRU cache
+# Phase F: sentence-hash LRU cache (front tier of the persistent SRL store)
 # ---------------------------------------------------------------------------
 _SRL_CACHE_MAX = 5000
 
 class _LruCache:
-    """Thread-safe-ish ordered-dict LRU of fixed capacity."""
+    """Thread-safe ordered-dict LRU of fixed capacity.
 
-    def __init__(self, maxsize: int = _SRL_CACHE_MAX):
+    The remote ingestion stage calls it from several worker threads, so the
+    in-memory tier and hit counters are guarded by a lock. With a
+    *backend_factory* (returning an ``SrlResponseStore`` or ``None``) misses
+    fall through to the persistent store and writes go to both tiers; the
+    store does its own locking and is called outside the lock.
+    """
+
+    def __init__(self, maxsize: int = _SRL_CACHE_MAX, backend_factory=None):
         self._maxsize = maxsize
         self._store: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._backend_factory = backend_factory
+        self.memory_hits = 0
+        self.store_hits = 0
+        self.misses = 0
 
     def _key(self, url: str, sentence: str) -> str:
         digest = hashlib.sha256(sentence.encode("utf-8")).hexdigest()
         return f"{url}:{digest}"
 
+    def _backend(self):
+        return self._backend_factory() if self._backend_factory is not None else None
+
+    def _remember(self, k: str, value) -> None:
+        with self._lock:
+            if k in self._store:
+                self._store.move_to_end(k)
+            self._store[k] = value
+            if len(self._store) > self._maxsize:
+                self._store.popitem(last=False)
+
     def get(self, url: str, sentence: str):
         k = self._key(url, sentence)
-        if k not in self._store:
+        with self._lock:
+            if k in self._store:
+                self._store.move_to_end(k)
+                self.memory_hits += 1
+                return self._store[k]
+        backend = self._backend()
+        value = backend.get(url, sentence) if backend is not None else None
+        if value is None:
+            with self._lock:
+                self.misses += 1
             return None
-        self._store.move_to_end(k)
-        return self._store[k]
+        with self._lock:
+            self.store_hits += 1
+        self._remember(k, value)
+        return value
 
     def set(self, url: str, sentence: str, value) -> None:
-        k = self._key(url, sentence)
-        if k in self._store:
-            self._store.move_to_end(k)
-        self._store[k] = value
-        if len(self._store) > self._maxsize:
-            self._store.popitem(last=False)
-
-
-_srl_cache = _LruCache()
+        self._remember(self._key(url, sentence), value)
+        backend = self._backend()
+        if backend is not None:
+            backend.set(url, sentence, value)
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = {
+                "entries": len(self._store),
+                "memory_hits": self.memory_hits,
+                "store_hits": self.store_hits,
+                "misses": self.misses,
+            }
+        backend = self._backend()
+        if backend is not None:
+            stats["store"] = backend.stats()
+        return stats
+
+
+_srl_cache = _LruCache(backend_factory=get_srl_response_store)
 
 # ---------------------------------------------------------------------------
-# Phase F: per-service circuit breakers
+# Phase F: per-service circuit breakers (shared with the pooled service clients)
 # ---------------------------------------------------------------------------
-_CB_FAILURE_THRESHOLD = 5
-_CB_COOLDOWN_SEC = 30.0
-
-
-class _CircuitBreaker:
-    def __init__(self, threshold: int = _CB_FAILURE_THRESHOLD, cooldown: float = _CB_COOLDOWN_SEC):
-        self._threshold = threshold
-        self._cooldown = cooldown
-        self._failures: dict = {}   # url -> consecutive count
-        self._backoff_until: dict = {}  # url -> float timestamp
-
-    def is_open(self, url: str) -> bool:
-        until = self._backoff_until.get(url, 0.0)
-        if time.monotonic() < until:
-            return True
-        # cooldown expired — reset failure counter so we try again
-        if until > 0.0:
-            self._failures[url] = 0
-            self._backoff_until[url] = 0.0
-        return False
-
-    def record_success(self, url: str) -> None:
-        self._failures[url] = 0
-        self._backoff_until[url] = 0.0
-
-    def record_failure(self, url: str) -> None:
-        count = self._failures.get(url, 0) + 1
-        self._failures[url] = count
-        if count >= self._threshold:
-            self._backoff_until[url] = time.monotonic() + self._cooldown
-            logger.warning(
-                "Circuit breaker OPEN for %s after %d consecutive failures; "
-                "cooling down for %.0f s",
-                url, count, self._cooldown,
-            )
-
-
-_circuit_breaker = _CircuitBreaker()
+_circuit_breaker = circuit_breaker
 
 
 def _service_timeout() -> int:
@@ -109,8 +124,7 @@ def amuse_wsd_api_call2(api_endpoint, sentence):
 
     try:
         logger.debug("POST %s (AMuSE-WSD) payload size=%d", api_endpoint, len(data_json))
-        response = requests.post(api_endpoint, data=data_json, headers=headers, timeout=_service_timeout())
-        response.raise_for_status()
+        response = get_service_client("wsd").post(api_endpoint, data=data_json, headers=headers, timeout=_service_timeout())
         return response.json()
     except requests.exceptions.RequestException as e:
         logger.exception("Error while calling AMuSE-WSD API: %s", e)
@@ -144,8 +158,7 @@ def amuse_wsd_api_call(api_endpoint, sentences):
 
     try:
         logger.debug("POST %s (AMuSE-WSD bulk) sentences=%d", api_endpoint, len(data))
-        response = requests.post(api_endpoint, json=data, headers=headers, timeout=_service_timeout())
-        response.raise_for_status()
+        response = get_service_client("wsd").post(api_endpoint, json=data, headers=headers, timeout=_service_timeout())
         return response.json()
     except requests.exceptions.RequestException as e:
         logger.exception("Error while calling AMuSE-WSD API: %s", e)
@@ -161,8 +174,7 @@ def callHeidelTimeService(parameters):
 
     url = get_config().services.heideltime_url
     try:
-        response = requests.post(url, json=data, headers=headers, timeout=_service_timeout())
-        response.raise_for_status()
+        response = get_service_client("heideltime").post(url, json=data, headers=headers, timeout=_service_timeout())
         logger.debug("HeidelTime POST to %s (dct=%s)", url, dct)
         return response.text
     except requests.exceptions.RequestException as e:
@@ -205,11 +217,9 @@ def callAllenNlpApi(apiName, string):
         payload = {"document": string}
 
     try:
-        r = requests.post(URL, headers=PARAMS, data=json.dumps(payload), timeout=_service_timeout())
-        r.raise_for_status()
+        r = get_service_client("srl").post(URL, headers=PARAMS, data=json.dumps(payload), timeout=_service_timeout())
         logger.debug("SRL POST %s response: %s", URL, r.text)
         data = json.loads(r.text)
-        _circuit_breaker.record_success(URL)
         _srl_cache.set(URL, string, data)
         if _detect_legacy_srl_schema(data):
             logger.warning(
@@ -220,7 +230,10 @@ def callAllenNlpApi(apiName, string):
                 URL,
             )
         return data
-    except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+    except requests.exceptions.RequestException as e:
+        logger.exception("Error while calling SRL API: %s", e)
+        return {}
+    except json.JSONDecodeError as e:
         _circuit_breaker.record_failure(URL)
         logger.exception("Error while calling SRL API: %s", e)
         return {}
@@ -264,40 +277,48 @@ def callNominalSrlApi(sentence):
     headers = {"Content-Type": "application/json"}
     payload = {"sentence": sentence}
     try:
-        r = requests.post(url, headers=headers, data=json.dumps(payload), timeout=_service_timeout())
-        r.raise_for_status()
+        r = get_service_client("nom_srl").post(url, headers=headers, data=json.dumps(payload), timeout=_service_timeout())
         logger.debug("Nominal-SRL response: %s", r.text)
         data = json.loads(r.text)
-        _circuit_breaker.record_success(url)
         _srl_cache.set(url, sentence, data)
         return data
-    except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+    except requests.exceptions.RequestException as e:
+        logger.exception("Error while calling Nominal-SRL API: %s", e)
+        return {}
+    except json.JSONDecodeError as e:
         _circuit_breaker.record_failure(url)
         logger.exception("Error while calling Nominal-SRL API: %s", e)
         return {}
 
 
 # ---------------------------------------------------------------------------
-# Phase F: async batch helpers using httpx.AsyncClient
+# Phase F: async batch helpers over the pooled service clients
 # ---------------------------------------------------------------------------
 
-async def _async_post_one(client: httpx.AsyncClient, url: str, payload: dict, timeout: float) -> dict:
-    """Fire a single POST and return parsed JSON, or {} on error."""
+def _post_json_or_empty(service: str, url: str, payload: dict, timeout: float) -> dict:
+    """POST *payload* through the pooled *service* client; parsed JSON or {} on error."""
     try:
-        resp = await client.post(url, json=payload, timeout=timeout)
-        resp.raise_for_status()
-        return resp.json()
+        return get_service_client(service).post(url, json=payload, timeout=timeout).json()
     except Exception as exc:
-        logger.debug("Async SRL request to %s failed: %s", url, exc)
+        logger.debug("Batched %s request to %s failed: %s", service, url, exc)
         return {}
 
 
-async def _async_batch_srl(url: str, sentences: List[str], payload_key: str, timeout: float) -> List[dict]:
-    """Send *sentences* concurrently to *url* using httpx.AsyncClient.
+async def _async_batch_srl(
+    url: str,
+    sentences: List[str],
+    payload_key: str,
+    timeout: float,
+    service: str = "srl",
+    cached: Optional[List[Optional[dict]]] = None,
+) -> List[dict]:
+    """Send *sentences* concurrently to *url* through the pooled *service* client.
 
-    Sentences that hit the cache are resolved without a network call.
+    Sentences that hit the cache (or have a non-``None`` entry in *cached*, the
+    caller's own cache lookup) are resolved without a network call.
     The circuit breaker is checked once before firing; if open, all sentences
-    return ``{}``.
+    return ``{}``. Requests run on worker threads; the client's semaphore
+    (``services.http_max_concurrency``) bounds how many are in flight.
 
     Returns a list of response dicts in the same order as *sentences*.
     """
@@ -309,8 +330,9 @@ async def _async_batch_srl(url: str, sentences: List[str], payload_key: str, tim
     pending_indices: List[int] = []
 
     # Fill from cache
-    for i, sent in enumerate(sentences):
-        hit = _srl_cache.get(url, sent)
+    if cached is None:
+        cached = [_srl_cache.get(url, sent) for sent in sentences]
+    for i, hit in enumerate(cached):
         if hit is not None:
             results[i] = hit
         else:
@@ -319,30 +341,22 @@ async def _async_batch_srl(url: str, sentences: List[str], payload_key: str, tim
     if not pending_indices:
         return results  # type: ignore[return-value]
 
-    async with httpx.AsyncClient() as client:
-        tasks = [
-            _async_post_one(client, url, {payload_key: sentences[i]}, timeout)
-            for i in pending_indices
-        ]
-        responses = await asyncio.gather(*tasks)
+    tasks = [
+        asyncio.to_thread(_post_json_or_empty, service, url, {payload_key: sentences[i]}, timeout)
+        for i in pending_indices
+    ]
+    responses = await asyncio.gather(*tasks)
 
-    any_failure = False
     for idx, resp in zip(pending_indices, responses):
         if resp:
-            _circuit_breaker.record_success(url)
             _srl_cache.set(url, sentences[idx], resp)
-        else:
-            any_failure = True
         results[idx] = resp if resp else {}
 
-    if any_failure:
-        _circuit_breaker.record_failure(url)
-
     return results  # type: ignore[return-value]
 
 
 def callAllenNlpApiBatch(sentences: List[str]) -> List[dict]:
-    """Batch verbal SRL — fires all sentences concurrently via httpx.
+    """Batch verbal SRL — fires all sentences concurrently over the pooled SRL client.
 
     Returns a list of SRL response dicts in the same order as *sentences*.
     Sentences already cached are resolved without a network call.
@@ -361,11 +375,11 @@ def callAllenNlpApiBatch(sentences: List[str]) -> List[dict]:
     if all(r is not None for r in results):
         return results  # type: ignore[return-value]
 
-    return asyncio.run(_async_batch_srl(url, sentences, "sentence", timeout))
+    return asyncio.run(_async_batch_srl(url, sentences, "sentence", timeout, cached=results))
 
 
 def callNominalSrlApiBatch(sentences: List[str]) -> List[dict]:
-    """Batch nominal SRL — fires all sentences concurrently via httpx.
+    """Batch nominal SRL — fires all sentences concurrently over the pooled client.
 
     Returns a list of CogComp nominal-SRL response dicts in the same order as
     *sentences*.  Returns a list of empty dicts when the service is not
@@ -386,7 +400,7 @@ def callNominalSrlApiBatch(sentences: List[str]) -> List[dict]:
     if all(r is not None for r in results):
         return results  # type: ignore[return-value]
 
-    return asyncio.run(_async_batch_srl(url, sentences, "sentence", timeout))
+    return asyncio.run(_async_batch_srl(url, sentences, "sentence", timeout, service="nom_srl", cached=results))
 
 
 #ss = """LemonDuck's activities were first spotted in China in May 2019, before it began adopting COVID_19_themed lures in email attacks in 2020 and even the recently addressed ""ProxyLogon"" Exchange Server flaws to gain access to unpatched systems.""""
@@ -0,0 +1,229 @@
+"""Shared, connection-pooled HTTP clients for the NLP microservices.
+
+Every service call used to go through a bare ``requests.post`` (or a fresh
+``httpx.AsyncClient`` per SRL batch), paying TCP/TLS setup on each request and
+fanning out without any bound. ``ServiceClient`` gives each service (SRL,
+nominal SRL, HeidelTime, TTK, AMuSE-WSD, coreference) one process-wide client
+with:
+
+* a keep-alive ``requests.Session`` whose connection pool holds
+  ``services.http_pool_size`` connections per host;
+* a semaphore capping in-flight requests at ``services.http_max_concurrency``;
+* up to ``services.http_retries`` retries of connection errors, timeouts and
+  429/5xx gateway responses, with jittered exponential backoff starting at
+  ``services.http_backoff_sec``;
+* the shared per-URL :class:`_CircuitBreaker`, consulted before every request
+  and updated once per call (not per retry);
+* request, failure, retry and latency counters (:meth:`ServiceClient.stats`,
+  :func:`service_stats`).
+
+Clients are created lazily by :func:`get_service_client` and live until
+:func:`reset_service_clients`.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Per-URL circuit breaker
+# ---------------------------------------------------------------------------
+_CB_FAILURE_THRESHOLD = 5
+_CB_COOLDOWN_SEC = 30.0
+
+
+class _CircuitBreaker:
+    def __init__(self, threshold: int = _CB_FAILURE_THRESHOLD, cooldown: float = _CB_COOLDOWN_SEC):
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._failures: dict = {}   # url -> consecutive count
+        self._backoff_until: dict = {}  # url -> float timestamp
+        self._lock = threading.Lock()
+
+    def is_open(self, url: str) -> bool:
+        with self._lock:
+            until = self._backoff_until.get(url, 0.0)
+            if time.monotonic() < until:
+                return True
+            # cooldown expired — reset failure counter so we try again
+            if until > 0.0:
+                self._failures[url] = 0
+                self._backoff_until[url] = 0.0
+            return False
+
+    def record_success(self, url: str) -> None:
+        with self._lock:
+            self._failures[url] = 0
+            self._backoff_until[url] = 0.0
+
+    def record_failure(self, url: str) -> None:
+        with self._lock:
+            count = self._failures.get(url, 0) + 1
+            self._failures[url] = count
+            if count >= self._threshold:
+                self._backoff_until[url] = time.monotonic() + self._cooldown
+                logger.warning(
+                    "Circuit breaker OPEN for %s after %d consecutive failures; "
+                    "cooling down for %.0f s",
+                    url, count, self._cooldown,
+                )
+
+
+circuit_breaker = _CircuitBreaker()
+
+# ---------------------------------------------------------------------------
+# Pooled service clients
+# ---------------------------------------------------------------------------
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class ServiceUnavailableError(requests.exceptions.RequestException):
+    """Raised instead of sending a request while the URL's circuit is open."""
+
+
+class ServiceClient:
+    """Keep-alive HTTP client with bounded concurrency and retries for one service."""
+
+    def __init__(
+        self,
+        name: str,
+        pool_size: int = 10,
+        max_concurrency: int = 8,
+        retries: int = 2,
+        backoff_sec: float = 0.5,
+        breaker: Optional[_CircuitBreaker] = None,
+    ):
+        self.name = name
+        self.retries = max(0, int(retries))
+        self.backoff_sec = max(0.0, float(backoff_sec))
+        self.breaker = breaker if breaker is not None else circuit_breaker
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrency)
+        pool_size = max(1, int(pool_size))
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+        self.retried = 0
+        self.total_latency_sec = 0.0
+        self.max_latency_sec = 0.0
+
+    def _backoff(self, attempt: int) -> float:
+        return self.backoff_sec * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+    def _record(self, latency: float, failed: bool = False, retried: bool = False) -> None:
+        with self._lock:
+            self.requests += 1
+            self.total_latency_sec += latency
+            self.max_latency_sec = max(self.max_latency_sec, latency)
+            if failed:
+                self.failures += 1
+            if retried:
+                self.retried += 1
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """POST through the pooled session; raises ``RequestException`` on failure.
+
+        The response is returned only after ``raise_for_status`` succeeded.
+        """
+        if self.breaker.is_open(url):
+            raise ServiceUnavailableError(f"circuit breaker open for {url}")
+
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            retry = False
+            try:
+                with self._semaphore:
+                    response = self.session.post(url, **kwargs)
+                if response.status_code in _RETRY_STATUSES and attempt < self.retries:
+                    retry = True
+                else:
+                    response.raise_for_status()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exc:
+                if attempt >= self.retries:
+                    self._record(time.perf_counter() - started, failed=True)
+                    self.breaker.record_failure(url)
+                    raise
+                logger.debug("%s request to %s failed (%s); retrying", self.name, url, exc)
+                retry = True
+            except requests.exceptions.RequestException:
+                self._record(time.perf_counter() - started, failed=True)
+                self.breaker.record_failure(url)
+                raise
+
+            if not retry:
+                self._record(time.perf_counter() - started)
+                self.breaker.record_success(url)
+                return response
+            self._record(time.perf_counter() - started, retried=True)
+            time.sleep(self._backoff(attempt))
+            attempt += 1
+
+    def close(self) -> None:
+        self.session.close()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "failures": self.failures,
+                "retries": self.retried,
+                "mean_latency_ms": round(1000.0 * self.total_latency_sec / self.requests, 2) if self.requests else 0.0,
+                "max_latency_ms": round(1000.0 * self.max_latency_sec, 2),
+            }
+
+
+_service_clients: Dict[str, ServiceClient] = {}
+_service_clients_lock = threading.Lock()
+
+
+def get_service_client(name: str) -> ServiceClient:
+    """Return the process-wide client for service *name*, configured from ``services``."""
+    with _service_clients_lock:
+        client = _service_clients.get(name)
+        if client is None:
+            settings = {}
+            try:
+                from textgraphx.infrastructure.config import get_config
+
+                services = get_config().services
+                settings = {
+                    "pool_size": services.http_pool_size,
+                    "max_concurrency": services.http_max_concurrency,
+                    "retries": services.http_retries,
+                    "backoff_sec": services.http_backoff_sec,
+                }
+            except Exception:
+                logger.debug("Service client %s: config unavailable; using defaults", name, exc_info=True)
+            client = ServiceClient(name, **settings)
+            _service_clients[name] = client
+        return client
+
+
+def service_stats() -> Dict[str, Dict[str, float]]:
+    """Return :meth:`ServiceClient.stats` of every client created so far."""
+    with _service_clients_lock:
+        clients = dict(_service_clients)
+    return {name: client.stats() for name, client in sorted(clients.items())}
+
+
+def reset_service_clients() -> None:
+    """Close every client so the next access re-reads configuration."""
+    with _service_clients_lock:
+        clients = list(_service_clients.values())
+        _service_clients.clear()
+    for client in clients:
+        client.close()
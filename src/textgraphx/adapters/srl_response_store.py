@@ -0,0 +1,199 @@
+"""Persistent, size-bounded store of SRL and nominal-SRL service responses.
+
+``rest_caller._srl_cache`` is an in-process LRU, so every pipeline re-run or
+A/B benchmark used to send identical sentences to the SRL services again.
+``SrlResponseStore`` is its on-disk second tier: a SQLite table keyed on
+``sha256(service URL, model version, sha256(sentence))`` where the model version
+comes from ``services.srl_model_version`` (bump it when a service model
+changes to stop serving stale responses).
+
+The table lives at ``services.srl_cache_path`` (default
+``<paths.output_dir>/cache/srl_responses.sqlite``) and is shared by shard
+worker processes (WAL journal). It keeps at most
+``services.srl_cache_max_entries`` rows; the least recently used rows are
+evicted once the table grows past that bound. Disable it with
+``features.persist_srl_cache = false``. Fill it ahead of a run with
+``python -m textgraphx.tools.warm_srl_cache``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_SRL_STORE_MAX_ENTRIES = 200000
+# Row count is re-checked against the bound every this many writes.
+_EVICTION_CHECK_EVERY = 256
+
+_TABLE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS srl_responses (
+        key TEXT PRIMARY KEY,
+        url TEXT NOT NULL,
+        model_version TEXT NOT NULL,
+        response TEXT NOT NULL,
+        last_used REAL NOT NULL
+    )
+"""
+
+
+class SrlResponseStore:
+    """SQLite tier of the SRL response cache with LRU eviction."""
+
+    def __init__(self, db_path: str, max_entries: int = _SRL_STORE_MAX_ENTRIES, model_version: str = ""):
+        self.db_path = Path(db_path)
+        self.max_entries = max(1, int(max_entries))
+        self.model_version = str(model_version or "")
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes_since_check = 0
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(_TABLE_SCHEMA)
+            conn.execute("CREATE INDEX IF NOT EXISTS srl_responses_last_used ON srl_responses (last_used)")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = self._local.__dict__.get("conn")
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def key(self, url: str, sentence: str) -> str:
+        sentence_digest = hashlib.sha256((sentence or "").encode("utf-8")).hexdigest()
+        raw = "\x1f".join([str(url or ""), self.model_version, sentence_digest])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, url: str, sentence: str) -> Optional[dict]:
+        key = self.key(url, sentence)
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT response FROM srl_responses WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    conn.execute("UPDATE srl_responses SET last_used = ? WHERE key = ?", (time.time(), key))
+        except sqlite3.Error:
+            logger.debug("SRL response store lookup failed for %s", url, exc_info=True)
+            row = None
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, url: str, sentence: str, value: dict) -> None:
+        if not value:
+            return
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO srl_responses VALUES (?, ?, ?, ?, ?)",
+                    (self.key(url, sentence), str(url or ""), self.model_version, json.dumps(value), time.time()),
+                )
+        except sqlite3.Error as exc:
+            logger.warning("SRL response store write failed for %s: %s", self.db_path, exc)
+            return
+        with self._lock:
+            self.writes += 1
+            self._writes_since_check += 1
+            check = self._writes_since_check >= _EVICTION_CHECK_EVERY
+            if check:
+                self._writes_since_check = 0
+        if check:
+            self.evict()
+
+    def evict(self) -> int:
+        """Delete the least recently used rows beyond ``max_entries``; return how many."""
+        try:
+            with self._connect() as conn:
+                (count,) = conn.execute("SELECT count(*) FROM srl_responses").fetchone()
+                excess = count - self.max_entries
+                if excess <= 0:
+                    return 0
+                conn.execute(
+                    "DELETE FROM srl_responses WHERE key IN "
+                    "(SELECT key FROM srl_responses ORDER BY last_used LIMIT ?)",
+                    (excess,),
+                )
+        except sqlite3.Error as exc:
+            logger.warning("SRL response store eviction failed for %s: %s", self.db_path, exc)
+            return 0
+        with self._lock:
+            self.evictions += excess
+        logger.debug("Evicted %d SRL response(s) from %s", excess, self.db_path)
+        return excess
+
+    def entries(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT count(*) FROM srl_responses").fetchone()[0]
+
+    def clear(self) -> int:
+        with self._connect() as conn:
+            cursor = conn.execute("DELETE FROM srl_responses")
+        return cursor.rowcount
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions,
+            }
+
+
+def srl_store_path() -> str:
+    """Return the configured store path (``services.srl_cache_path`` or the default)."""
+    from textgraphx.infrastructure.config import get_config
+
+    cfg = get_config()
+    return cfg.services.srl_cache_path or os.path.join(cfg.paths.output_dir, "cache", "srl_responses.sqlite")
+
+
+_srl_response_store: Optional[SrlResponseStore] = None
+_srl_response_store_resolved = False
+_srl_response_store_lock = threading.Lock()
+
+
+def get_srl_response_store() -> Optional[SrlResponseStore]:
+    """Return the process-wide store, or ``None`` when persistence is disabled."""
+    global _srl_response_store, _srl_response_store_resolved
+    with _srl_response_store_lock:
+        if not _srl_response_store_resolved:
+            _srl_response_store_resolved = True
+            try:
+                from textgraphx.infrastructure.config import get_config
+
+                cfg = get_config()
+                if bool(getattr(cfg.features, "persist_srl_cache", True)):
+                    _srl_response_store = SrlResponseStore(
+                        srl_store_path(),
+                        max_entries=cfg.services.srl_cache_max_entries,
+                        model_version=cfg.services.srl_model_version,
+                    )
+            except Exception:
+                logger.warning("SRL response store unavailable; using the in-memory cache only", exc_info=True)
+                _srl_response_store = None
+        return _srl_response_store
+
+
+def reset_srl_response_store() -> None:
+    """Forget the process-wide store so the next access re-reads configuration."""
+    global _srl_response_store, _srl_response_store_resolved
+    with _srl_response_store_lock:
+        _srl_response_store = None
+        _srl_response_store_resolved = False
@@ -0,0 +1,169 @@
+"""Synset-keyed cache of WordNet token features.
+
+``WordnetTokenEnricher`` derives the same features (hypernym closure,
+synonyms, lexname, derivational forms, entailments/causes, depth) for every
+token, although they depend only on the token's synset and frequent synsets
+repeat thousands of times per corpus.
+
+``WordNetFeatureCache`` keeps the features of a synset, keyed by its NLTK name
+(``dog.n.01``), in two tiers:
+
+* an in-process LRU bounded by ``maxsize`` entries, shared by every enricher
+  in the process;
+* an optional read-only SQLite table precomputed once for the whole WordNet
+  (``python -m textgraphx.tools.build_wordnet_feature_table``) and configured
+  with ``paths.wordnet_feature_table`` / ``TEXTGRAPHX_WORDNET_FEATURE_TABLE``.
+
+A synset missing from both tiers is computed and kept in the LRU.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+_WORDNET_FEATURE_CACHE_MAX = 20000
+
+_TABLE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS synset_features (
+        synset TEXT PRIMARY KEY,
+        features TEXT NOT NULL
+    )
+"""
+
+
+class WordNetFeatureCache:
+    """Two-tier (memory + precomputed table) cache of per-synset features."""
+
+    def __init__(self, table_path: Optional[str] = None, maxsize: int = _WORDNET_FEATURE_CACHE_MAX):
+        self._maxsize = max(1, int(maxsize))
+        self._store: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.table_path = Path(table_path) if table_path else None
+        if self.table_path is not None and not self.table_path.exists():
+            logger.warning("WordNet feature table %s not found; computing features on demand", self.table_path)
+            self.table_path = None
+        self._local = threading.local()
+        self.memory_hits = 0
+        self.table_hits = 0
+        self.misses = 0
+
+    def _remember(self, synset_name: str, features: Dict[str, Any]) -> None:
+        with self._lock:
+            self._store[synset_name] = features
+            self._store.move_to_end(synset_name)
+            while len(self._store) > self._maxsize:
+                self._store.popitem(last=False)
+
+    def _table_lookup(self, synset_name: str) -> Optional[Dict[str, Any]]:
+        if self.table_path is None:
+            return None
+        conn = self._local.__dict__.get("conn")
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.table_path}?mode=ro", uri=True)
+            self._local.conn = conn
+        try:
+            row = conn.execute(
+                "SELECT features FROM synset_features WHERE synset = ?", (synset_name,)
+            ).fetchone()
+        except sqlite3.Error:
+            logger.debug("WordNet feature table lookup failed for %s", synset_name, exc_info=True)
+            return None
+        return json.loads(row[0]) if row else None
+
+    def get_or_compute(self, synset_name: str, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Return the features of *synset_name*, calling *compute* only on a miss."""
+        with self._lock:
+            features = self._store.get(synset_name)
+            if features is not None:
+                self._store.move_to_end(synset_name)
+                self.memory_hits += 1
+                return features
+
+        features = self._table_lookup(synset_name)
+        if features is not None:
+            with self._lock:
+                self.table_hits += 1
+        else:
+            features = compute()
+            with self._lock:
+                self.misses += 1
+        self._remember(synset_name, features)
+        return features
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._store),
+                "memory_hits": self.memory_hits,
+                "table_hits": self.table_hits,
+                "misses": self.misses,
+            }
+
+
+def build_feature_table(
+    table_path: str,
+    synsets: Iterable[Any],
+    compute: Callable[[Any], Dict[str, Any]],
+    batch_size: int = 1000,
+) -> int:
+    """Compute the features of every synset in *synsets* into a SQLite table.
+
+    Returns:
+        The number of synsets written.
+    """
+    path = Path(table_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    with sqlite3.connect(path) as conn:
+        conn.execute(_TABLE_SCHEMA)
+        batch = []
+        for synset in synsets:
+            batch.append((synset.name(), json.dumps(compute(synset))))
+            if len(batch) >= batch_size:
+                conn.executemany("INSERT OR REPLACE INTO synset_features VALUES (?, ?)", batch)
+                written += len(batch)
+                batch = []
+        if batch:
+            conn.executemany("INSERT OR REPLACE INTO synset_features VALUES (?, ?)", batch)
+            written += len(batch)
+        conn.commit()
+    return written
+
+
+_wordnet_feature_cache: Optional[WordNetFeatureCache] = None
+_wordnet_feature_cache_lock = threading.Lock()
+
+
+def get_wordnet_feature_cache() -> WordNetFeatureCache:
+    """Return the process-wide cache, using ``paths.wordnet_feature_table`` if set."""
+    global _wordnet_feature_cache
+    with _wordnet_feature_cache_lock:
+        if _wordnet_feature_cache is None:
+            table_path = None
+            try:
+                from textgraphx.infrastructure.config import get_config
+
+                table_path = get_config().paths.wordnet_feature_table or None
+            except Exception:
+                logger.debug("WordNet feature cache: config unavailable; using memory tier only", exc_info=True)
+            _wordnet_feature_cache = WordNetFeatureCache(table_path=table_path)
+        return _wordnet_feature_cache
+
+
+def reset_wordnet_feature_cache() -> None:
+    """Forget the process-wide cache so the next access re-reads configuration."""
+    global _wordnet_feature_cache
+    with _wordnet_feature_cache_lock:
+        _wordnet_feature_cache = None
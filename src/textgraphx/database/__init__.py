@@ -6,6 +6,12 @@ from textgraphx.database.client import (
     make_bolt_driver_from_config,
     make_graph_from_config,
 )
+from textgraphx.database.connection_manager import (
+    Neo4jConnectionManager,
+    get_connection_manager,
+    reset_connection_manager,
+    summary_counters,
+)
 from textgraphx.database.cypher_optimizer import (
     CypherOptimizer,
     CypherPatternOptimizer,
@@ -17,9 +23,13 @@ __all__ = [
     "BoltGraphCompat",
     "CypherOptimizer",
     "CypherPatternOptimizer",
+    "Neo4jConnectionManager",
     "QueryPerformanceContract",
     "get_config_section",
+    "get_connection_manager",
     "make_bolt_driver_from_config",
     "make_graph_from_config",
+    "reset_connection_manager",
     "suggest_optimization_for_phase",
+    "summary_counters",
 ]
\ No newline at end of file
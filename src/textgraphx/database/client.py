@@ -20,16 +20,25 @@ Examples
 This module intentionally keeps a very small surface: callers should get an
 object supporting ``.run(query, parameters).data()`` so the rest of the codebase
 needs no changes when switching drivers.
+
+``make_graph_from_config()`` no longer creates a driver per call: every wrapper
+it returns without an explicit config path shares the process-wide
+:class:`~textgraphx.database.connection_manager.Neo4jConnectionManager`.
 """
 
 from __future__ import annotations
 
-import atexit
 from typing import Any, Dict, Optional
 
 from neo4j import Driver, GraphDatabase
 
-from textgraphx.infrastructure.config import get_config
+from textgraphx.database.connection_manager import (
+    READ,
+    WRITE,
+    Neo4jConnectionManager,
+    get_connection_manager,
+)
+from textgraphx.infrastructure.config import get_config, load_config
 
 
 def get_config_section(path: Optional[str] = None, section: str = "py2neo") -> Dict[str, Any]:
@@ -46,8 +55,12 @@ def get_config_section(path: Optional[str] = None, section: str = "py2neo") -> D
 
 
 def make_bolt_driver_from_config(path: Optional[str] = None) -> Driver:
-    """Create and return an official neo4j bolt driver using the configured credentials."""
-    cfg = get_config()
+    """Create and return an official neo4j bolt driver using the configured credentials.
+
+    ``path`` loads the credentials from that config file instead of the
+    process-wide configuration.
+    """
+    cfg = load_config(path) if path else get_config()
     uri = cfg.neo4j.uri
     username = cfg.neo4j.user
     password = cfg.neo4j.password
@@ -57,75 +70,51 @@ def make_bolt_driver_from_config(path: Optional[str] = None) -> Driver:
             "Missing Neo4j configuration. Provide a config file or set NEO4J_URI, NEO4J_USER and NEO4J_PASSWORD environment variables."
         )
 
-    return GraphDatabase.driver(uri, auth=(username, password))
-
-
-def _safe_close_driver(driver: Optional[Driver]) -> None:
-    """Try to close a neo4j driver without raising during interpreter shutdown."""
-    try:
-        if driver is not None:
-            driver.close()
-    except Exception:
-        pass
+    return GraphDatabase.driver(
+        uri,
+        auth=(username, password),
+        max_connection_pool_size=cfg.neo4j.max_connection_pool_size,
+        connection_acquisition_timeout=cfg.neo4j.connection_acquisition_timeout,
+    )
 
 
 class BoltGraphCompat:
     """Compatibility wrapper exposing a ``.run(query, parameters).data()`` API.
 
-    A single Neo4j session is opened lazily on the first ``.run()`` call and
-    reused for all subsequent calls on the same instance.  This eliminates the
-    per-query session-creation overhead that appeared as N+1 round-trips during
-    pipeline phases.  The session is closed (and the driver released) when
-    ``.close()`` is called or the object is garbage-collected.
-
-    The pipeline phases are single-threaded; sessions are **not** shared across
-    threads, so reuse is safe here.
+    Queries are executed through a :class:`Neo4jConnectionManager`, which keeps
+    one session per thread and access mode, so an instance may be used from
+    worker threads without sharing a session between them. Wrappers returned by
+    :func:`make_graph_from_config` share the process-wide manager; passing a
+    bare ``driver`` keeps the old behaviour of a wrapper that owns its driver.
     """
 
-    def __init__(self, driver: Driver):
-        self._driver = driver
-        self._session = None  # opened lazily; reused across .run() calls
+    def __init__(self, driver: Optional[Driver] = None, manager: Optional[Neo4jConnectionManager] = None):
+        if manager is None:
+            manager = Neo4jConnectionManager(driver)
+            self._owns_manager = True
+        else:
+            self._owns_manager = False
+        self._manager = manager
+        self._driver = manager.driver
 
-    def _open_session(self):
-        """Return the live session, opening one if needed."""
-        if self._session is None:
-            self._session = self._driver.session()
-        return self._session
+    @property
+    def manager(self) -> Neo4jConnectionManager:
+        return self._manager
 
     def close(self) -> None:
-        """Close the session and the underlying driver."""
-        if getattr(self, "_session", None) is not None:
-            try:
-                self._session.close()
-            except Exception:
-                pass
-            finally:
-                self._session = None
-        if getattr(self, "_driver", None) is not None:
-            try:
-                self._driver.close()
-            except Exception:
-                pass
-            finally:
-                self._driver = None
-
-    def run(self, query: str, parameters: Optional[Dict[str, Any]] = None):
+        """Release this wrapper; the driver is closed only if the wrapper owns it."""
+        if getattr(self, "_manager", None) is None:
+            return
+        if self._owns_manager:
+            self._manager.close()
+        else:
+            self._manager.release_thread_sessions()
+        self._manager = None
+        self._driver = None
+
+    def run(self, query: str, parameters: Optional[Dict[str, Any]] = None, mode: str = WRITE):
         """Execute a Cypher query and return a small wrapper exposing ``data()``."""
-        session = self._open_session()
-        try:
-            result = session.run(query, parameters)
-            records = list(result)
-        except Exception:
-            # Session may be broken (e.g. connection reset). Reset it and retry
-            # once with a fresh session before propagating the error.
-            try:
-                self._session.close()
-            except Exception:
-                pass
-            self._session = None
-            session = self._open_session()
-            result = session.run(query, parameters)
-            records = list(result)
+        records = self._manager.run(query, parameters, mode=mode)
 
         class ResultWrapper:
             def __init__(self, records):
@@ -136,16 +125,31 @@ class BoltGraphCompat:
 
         return ResultWrapper(records)
 
+    def write(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> Dict[str, int]:
+        """Execute a write statement and return only its summary update counters."""
+        return self._manager.consume(query, parameters, mode=WRITE)
+
+    def read(self, query: str, parameters: Optional[Dict[str, Any]] = None):
+        """Like :meth:`run`, on a read-routed session."""
+        return self.run(query, parameters, mode=READ)
+
+    def read_transaction(self, work, *args, **kwargs):
+        return self._manager.read_transaction(work, *args, **kwargs)
+
+    def write_transaction(self, work, *args, **kwargs):
+        return self._manager.write_transaction(work, *args, **kwargs)
+
 
 def make_graph_from_config(path: Optional[str] = None):
-    """Create a compatibility graph object using the bolt driver."""
-    driver = make_bolt_driver_from_config(path)
-    try:
-        atexit.register(_safe_close_driver, driver)
-    except Exception:
-        pass
-
-    return BoltGraphCompat(driver)
+    """Return a compatibility graph object backed by the shared connection manager.
+
+    With an explicit config ``path`` the wrapper gets a private driver built
+    from that file, closed by :meth:`BoltGraphCompat.close`, so tools pointed
+    at another database never reuse the shared connection.
+    """
+    if path:
+        return BoltGraphCompat(make_bolt_driver_from_config(path))
+    return BoltGraphCompat(manager=get_connection_manager())
 
 
 __all__ = [
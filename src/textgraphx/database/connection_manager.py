@@ -0,0 +1,350 @@
+"""Process-wide Neo4j connection manager.
+
+Every graph wrapper in the pipeline (``BoltGraphCompat`` returned by
+``make_graph_from_config()``, ``Neo4jRepository`` used by ingestion, and the
+``GraphDBBase`` driver inherited by the phase classes) shares one
+:class:`Neo4jConnectionManager`, so a process holds one driver and one Bolt
+connection pool instead of one per phase object.
+
+Sessions are never shared across threads. Each thread lazily gets its own
+session per access mode (read / write); the driver's connection pool bounds the
+number of live Bolt connections. Read sessions use ``READ_ACCESS`` so that on a
+cluster (``neo4j://`` URI) they are routed to followers/read replicas, while
+write sessions are routed to the leader.
+
+Examples
+    >>> from textgraphx.database.connection_manager import get_connection_manager
+    >>> manager = get_connection_manager()
+    >>> manager.read_transaction(lambda tx: tx.run("RETURN 1 AS x").single()["x"])
+    1
+    >>> manager.metrics()["read_transactions"]
+    1
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+READ = "READ"
+WRITE = "WRITE"
+
+# Update counters reported by ``summary_counters``.
+UPDATE_COUNTERS = (
+    "nodes_created",
+    "nodes_deleted",
+    "relationships_created",
+    "relationships_deleted",
+    "properties_set",
+    "labels_added",
+    "labels_removed",
+)
+
+
+def _access_mode(mode: str):
+    try:
+        from neo4j import READ_ACCESS, WRITE_ACCESS
+    except Exception:  # pragma: no cover - neo4j is a hard dependency
+        return mode
+    return READ_ACCESS if mode == READ else WRITE_ACCESS
+
+
+def _retryable(exc: BaseException, mode: str) -> bool:
+    """Return True if *exc* means the statement may be safely re-run on a new session.
+
+    Only a lost connection (``ServiceUnavailable`` / ``SessionExpired``) is
+    retried, plus transient server errors on reads. Syntax, constraint and
+    other client errors always propagate on the first attempt.
+    """
+    try:
+        from neo4j.exceptions import ServiceUnavailable, SessionExpired, TransientError
+    except Exception:  # pragma: no cover - neo4j is a hard dependency
+        return False
+    if isinstance(exc, (ServiceUnavailable, SessionExpired)):
+        return True
+    return mode == READ and isinstance(exc, TransientError)
+
+
+def summary_counters(summary) -> Dict[str, int]:
+    """Return the update counters of a ``neo4j.ResultSummary`` as a plain dict."""
+    counters = getattr(summary, "counters", None)
+    return {name: int(getattr(counters, name, 0) or 0) for name in UPDATE_COUNTERS}
+
+
+def profile_db_hits(profile) -> int:
+    """Sum ``dbHits`` over a ``PROFILE`` plan tree (``ResultSummary.profile``)."""
+    if not isinstance(profile, dict):
+        return 0
+    hits = int(profile.get("dbHits", 0) or 0)
+    for child in profile.get("children") or ():
+        hits += profile_db_hits(child)
+    return hits
+
+
+def _profiled(query: str) -> str:
+    head = query.lstrip()[:8].upper()
+    if head.startswith("PROFILE") or head.startswith("EXPLAIN"):
+        return query
+    return "PROFILE " + query
+
+
+class Neo4jConnectionManager:
+    """Thread-safe owner of a Neo4j driver and per-thread sessions.
+
+    Args:
+        driver: A ``neo4j.Driver``. Its connection pool is shared by every
+            session handed out by this manager.
+        database: Optional database name passed to each session.
+        owns_driver: When ``True`` (default) :meth:`close` also closes the
+            driver; wrappers built around a caller-owned driver pass ``False``.
+    """
+
+    def __init__(self, driver, database: Optional[str] = None, owns_driver: bool = True):
+        self.driver = driver
+        self.database = database
+        self.owns_driver = owns_driver
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: Dict[tuple, Any] = {}
+        self._counters = {
+            "sessions_opened": 0,
+            "session_resets": 0,
+            "queries": 0,
+            "read_transactions": 0,
+            "write_transactions": 0,
+            "errors": 0,
+        }
+
+    # -- sessions ---------------------------------------------------------
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[key] += amount
+
+    def session(self, mode: str = WRITE):
+        """Return the calling thread's session for *mode*, opening it lazily."""
+        sessions = self._local.__dict__.setdefault("sessions", {})
+        session = sessions.get(mode)
+        if session is None:
+            kwargs = {"default_access_mode": _access_mode(mode)}
+            if self.database:
+                kwargs["database"] = self.database
+            session = self.driver.session(**kwargs)
+            sessions[mode] = session
+            with self._lock:
+                self._sessions[(threading.get_ident(), mode)] = session
+                self._counters["sessions_opened"] += 1
+        return session
+
+    def _reset_session(self, mode: str) -> None:
+        sessions = self._local.__dict__.setdefault("sessions", {})
+        session = sessions.pop(mode, None)
+        with self._lock:
+            self._sessions.pop((threading.get_ident(), mode), None)
+            self._counters["session_resets"] += 1
+        if session is not None:
+            try:
+                session.close()
+            except Exception:
+                pass
+
+    def release_thread_sessions(self) -> None:
+        """Close the calling thread's sessions (call at the end of a worker)."""
+        for mode in list(self._local.__dict__.get("sessions", {})):
+            sessions = self._local.__dict__["sessions"]
+            session = sessions.pop(mode)
+            with self._lock:
+                self._sessions.pop((threading.get_ident(), mode), None)
+            try:
+                session.close()
+            except Exception:
+                pass
+
+    # -- per-thread statement accounting ---------------------------------
+
+    def thread_totals(self) -> Dict[str, int]:
+        """Return the update counters summed over the calling thread's statements.
+
+        Includes ``db_hits`` for statements run while :meth:`profiling` is
+        active. Callers take a snapshot before and after a unit of work and
+        diff the two, so totals are never reset.
+        """
+        return dict(self._local.__dict__.get("totals", {}))
+
+    @contextlib.contextmanager
+    def profiling(self, enabled: bool = True):
+        """Prefix the calling thread's statements with ``PROFILE`` inside the block."""
+        previous = self._local.__dict__.get("profile", False)
+        self._local.profile = enabled
+        try:
+            yield
+        finally:
+            self._local.profile = previous
+
+    def _statement(self, query: str) -> str:
+        return _profiled(query) if self._local.__dict__.get("profile", False) else query
+
+    def _record_summary(self, summary) -> Dict[str, int]:
+        counters = summary_counters(summary)
+        totals = self._local.__dict__.setdefault("totals", {})
+        for name, value in counters.items():
+            totals[name] = totals.get(name, 0) + value
+        db_hits = profile_db_hits(getattr(summary, "profile", None))
+        if db_hits:
+            totals["db_hits"] = totals.get("db_hits", 0) + db_hits
+        return counters
+
+    def _run_records(self, session, query, parameters) -> List[Any]:
+        result = session.run(self._statement(query), parameters)
+        records = list(result)
+        consume = getattr(result, "consume", None)
+        if consume is not None:
+            try:
+                self._record_summary(consume())
+            except Exception:
+                logger.debug("Could not read result summary", exc_info=True)
+        return records
+
+    # -- execution --------------------------------------------------------
+
+    def _retry_once(self, mode: str, work: Callable[[Any], Any]):
+        self._count("queries")
+        try:
+            return work(self.session(mode))
+        except Exception as exc:
+            if not _retryable(exc, mode):
+                self._count("errors")
+                raise
+            self._reset_session(mode)
+            try:
+                return work(self.session(mode))
+            except Exception:
+                self._count("errors")
+                raise
+
+    def run(self, query: str, parameters: Optional[Dict[str, Any]] = None, mode: str = WRITE) -> List[Any]:
+        """Run *query* as an auto-commit statement and return its records.
+
+        A session whose connection was lost is replaced and the query is
+        retried once before the error propagates; transient server errors are
+        retried for reads only. Any other error propagates immediately.
+        """
+        return self._retry_once(mode, lambda session: self._run_records(session, query, parameters))
+
+    def consume(self, query: str, parameters: Optional[Dict[str, Any]] = None, mode: str = WRITE) -> Dict[str, int]:
+        """Run *query*, discard its records and return the summary update counters.
+
+        Use this for write statements whose rows are not needed: records are
+        never materialized client-side. Retries like :meth:`run`.
+        """
+        return self._retry_once(
+            mode,
+            lambda session: self._record_summary(session.run(self._statement(query), parameters).consume()),
+        )
+
+    def read_transaction(self, work: Callable, *args, **kwargs):
+        """Run ``work(tx, *args, **kwargs)`` in a managed, retried read transaction."""
+        self._count("read_transactions")
+        try:
+            return self.session(READ).execute_read(work, *args, **kwargs)
+        except Exception:
+            self._count("errors")
+            self._reset_session(READ)
+            raise
+
+    def write_transaction(self, work: Callable, *args, **kwargs):
+        """Run ``work(tx, *args, **kwargs)`` in a managed, retried write transaction."""
+        self._count("write_transactions")
+        try:
+            return self.session(WRITE).execute_write(work, *args, **kwargs)
+        except Exception:
+            self._count("errors")
+            self._reset_session(WRITE)
+            raise
+
+    def begin_transaction(self, mode: str = WRITE):
+        """Open an explicit transaction on the calling thread's session."""
+        self._count("read_transactions" if mode == READ else "write_transactions")
+        return self.session(mode).begin_transaction()
+
+    # -- lifecycle / metrics ----------------------------------------------
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return session/query counters plus the driver's pool settings."""
+        with self._lock:
+            snapshot = dict(self._counters)
+            snapshot["active_sessions"] = len(self._sessions)
+            snapshot["active_threads"] = len({ident for ident, _ in self._sessions})
+        snapshot.update(self._pool_metrics())
+        return snapshot
+
+    def _pool_metrics(self) -> Dict[str, Any]:
+        # The driver does not expose pool state publicly; read it best-effort.
+        pool = getattr(self.driver, "_pool", None)
+        metrics: Dict[str, Any] = {"max_connection_pool_size": None, "pool_connections": None}
+        try:
+            metrics["max_connection_pool_size"] = pool.pool_config.max_connection_pool_size
+            metrics["pool_connections"] = sum(len(conns) for conns in pool.connections.values())
+        except Exception:
+            pass
+        return metrics
+
+    def close(self) -> None:
+        """Close every tracked session and, if owned, the driver."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            try:
+                session.close()
+            except Exception:
+                pass
+        self._local = threading.local()
+        if self.owns_driver and self.driver is not None:
+            try:
+                self.driver.close()
+            except Exception:
+                pass
+
+
+_manager: Optional[Neo4jConnectionManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_connection_manager() -> Neo4jConnectionManager:
+    """Return the process-wide manager, creating its driver from config once."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            from textgraphx.database.client import make_bolt_driver_from_config
+            from textgraphx.infrastructure.config import get_config
+
+            driver = make_bolt_driver_from_config()
+            _manager = Neo4jConnectionManager(driver, database=get_config().neo4j.database)
+            logger.info("Neo4j connection manager initialised (shared driver)")
+        return _manager
+
+
+def shared_manager_for(driver) -> Optional[Neo4jConnectionManager]:
+    """Return the process-wide manager if it already wraps *driver*."""
+    manager = _manager
+    if manager is not None and manager.driver is driver:
+        return manager
+    return None
+
+
+def reset_connection_manager() -> None:
+    """Close and forget the process-wide manager (tests, config reloads)."""
+    global _manager
+    with _manager_lock:
+        manager, _manager = _manager, None
+    if manager is not None:
+        manager.close()
+
+
+atexit.register(reset_connection_manager)
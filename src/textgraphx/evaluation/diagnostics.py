@@ -2,15 +2,25 @@
 
 The registry provides stable query names and result schemas so CI and
 operator tooling can consume diagnostics safely across refactors.
+``RuntimeDiagnosticsCache`` serves repeated runtime-metrics requests (the
+``/diagnostics/runtime`` endpoint) from results keyed on the latest
+``PhaseRun`` marker, re-running only stale or explicitly refreshed sections.
 """
 
 from __future__ import annotations
 
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from textgraphx.queries.query_pack import load_query
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class DiagnosticQuery:
@@ -327,33 +337,130 @@ def query_temporal_anchor_connectivity_gaps(graph: Any) -> List[Dict[str, Any]]:
     return _execute_registered_query(graph, "temporal_anchor_connectivity_gaps")
 
 
-def get_runtime_metrics(graph: Any) -> Dict[str, Any]:
-    """Collect runtime diagnostics in one payload."""
-    phase_summary = query_phase_execution_summary(graph)
-    assertion_violations = query_phase_assertion_violations(graph)
-    orphaned_nodes = query_orphaned_nodes_detection(graph)
-    bottleneck_analysis = query_pipeline_bottleneck_analysis(graph)
-    edge_type_distribution = query_edge_type_distribution(graph)
-    entity_density = query_entity_density(graph)
-    endpoint_violations = query_endpoint_contract_violations(graph)
-    referential_violations = query_referential_integrity_violations(graph)
-    identity_violations = query_identity_contract_violations(graph)
-    numeric_value_transition = query_numeric_value_transition_inventory(graph)
-    provenance_violations = _execute_registered_query(graph, "provenance_contract_violations")
-    tlink_violations = _execute_registered_query(graph, "tlink_consistency_violations")
-    tlink_anchor_inventory = _execute_registered_query(graph, "tlink_anchor_consistency_inventory")
-    tlink_reciprocal_cycle_signals = query_tlink_reciprocal_cycle_signals(graph)
-    temporal_anchor_connectivity_gaps = query_temporal_anchor_connectivity_gaps(graph)
-    entity_state_coverage = query_entity_state_coverage(graph)
-    entity_state_type_distribution = query_entity_state_type_distribution(graph)
-    entity_specificity_coverage = query_entity_specificity_coverage(graph)
-    event_external_ref_coverage = query_event_external_ref_coverage(graph)
-    factuality_coverage = query_factuality_coverage(graph)
-    factuality_attribution_violations = query_factuality_attribution_violations(graph)
-    factuality_alignment_violations = query_factuality_alignment_violations(graph)
-    glink_relation_inventory = query_glink_relation_inventory(graph)
-    participation_edge_inventory = query_participation_edge_migration_inventory(graph)
-    timexmention_contract_inventory = query_timexmention_contract_inventory(graph)
+# Sections of the get_runtime_metrics payload, in execution order.
+RUNTIME_METRIC_SECTIONS: Tuple[str, ...] = (
+    "phase_execution_summary",
+    "phase_assertion_violations",
+    "orphaned_nodes_detection",
+    "pipeline_bottleneck_analysis",
+    "edge_type_distribution",
+    "entity_density",
+    "endpoint_contract_violations",
+    "referential_integrity_violations",
+    "identity_contract_violations",
+    "numeric_value_transition_inventory",
+    "provenance_contract_violations",
+    "tlink_consistency_violations",
+    "tlink_anchor_consistency_inventory",
+    "tlink_reciprocal_cycle_signals",
+    "temporal_anchor_connectivity_gaps",
+    "entity_state_coverage",
+    "entity_state_type_distribution",
+    "entity_specificity_coverage",
+    "event_external_ref_coverage",
+    "factuality_coverage",
+    "factuality_attribution_violations",
+    "factuality_alignment_violations",
+    "glink_relation_inventory",
+    "participation_edge_migration_inventory",
+    "timexmention_contract_inventory",
+)
+
+
+def _run_sections_concurrently(
+    graph: Any,
+    sections: Sequence[str],
+    workers: int,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Run *sections* on *workers* threads through read-routed sessions.
+
+    The diagnostics are read-only and independent, so each worker drains a
+    shared queue with ``graph.read`` (one pooled session per worker thread)
+    and releases its sessions once the queue is empty.
+    """
+    pending: "queue.Queue[str]" = queue.Queue()
+    for name in sections:
+        pending.put(name)
+    read = getattr(graph, "read", None) or graph.run
+
+    def _worker() -> Dict[str, List[Dict[str, Any]]]:
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        try:
+            while True:
+                try:
+                    name = pending.get_nowait()
+                except queue.Empty:
+                    return results
+                query = load_query(DIAGNOSTIC_QUERY_REGISTRY[name].query_pack_name)
+                results[name] = read(query, {}).data()
+        finally:
+            release = getattr(getattr(graph, "manager", None), "release_thread_sessions", None)
+            if callable(release):
+                release()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="diagnostics") as pool:
+        futures = [pool.submit(_worker) for _ in range(workers)]
+        merged: Dict[str, List[Dict[str, Any]]] = {}
+        for future in futures:
+            merged.update(future.result())
+    return {name: merged[name] for name in sections}
+
+
+def run_diagnostic_sections(
+    graph: Any,
+    sections: Optional[Sequence[str]] = None,
+    workers: int = 1,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Run registered diagnostics and return their rows keyed by name.
+
+    *sections* defaults to :data:`RUNTIME_METRIC_SECTIONS`. With ``workers > 1``
+    the queries run concurrently; otherwise they run in order on ``graph.run``.
+    """
+    sections = list(RUNTIME_METRIC_SECTIONS if sections is None else sections)
+    for name in sections:
+        if name not in DIAGNOSTIC_QUERY_REGISTRY:
+            raise KeyError(f"Unknown diagnostics query: {name}")
+    workers = min(max(1, int(workers)), len(sections) or 1)
+    if workers == 1:
+        return {name: _execute_registered_query(graph, name) for name in sections}
+    return _run_sections_concurrently(graph, sections, workers)
+
+
+def get_runtime_metrics(graph: Any, workers: int = 1) -> Dict[str, Any]:
+    """Collect runtime diagnostics in one payload.
+
+    ``workers > 1`` runs the diagnostic queries concurrently.
+    """
+    return build_runtime_metrics(run_diagnostic_sections(graph, workers=workers))
+
+
+def build_runtime_metrics(sections: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Assemble the :func:`get_runtime_metrics` payload from per-section rows."""
+    phase_summary = sections.get("phase_execution_summary", [])
+    assertion_violations = sections.get("phase_assertion_violations", [])
+    orphaned_nodes = sections.get("orphaned_nodes_detection", [])
+    bottleneck_analysis = sections.get("pipeline_bottleneck_analysis", [])
+    edge_type_distribution = sections.get("edge_type_distribution", [])
+    entity_density = sections.get("entity_density", [])
+    endpoint_violations = sections.get("endpoint_contract_violations", [])
+    referential_violations = sections.get("referential_integrity_violations", [])
+    identity_violations = sections.get("identity_contract_violations", [])
+    numeric_value_transition = sections.get("numeric_value_transition_inventory", [])
+    provenance_violations = sections.get("provenance_contract_violations", [])
+    tlink_violations = sections.get("tlink_consistency_violations", [])
+    tlink_anchor_inventory = sections.get("tlink_anchor_consistency_inventory", [])
+    tlink_reciprocal_cycle_signals = sections.get("tlink_reciprocal_cycle_signals", [])
+    temporal_anchor_connectivity_gaps = sections.get("temporal_anchor_connectivity_gaps", [])
+    entity_state_coverage = sections.get("entity_state_coverage", [])
+    entity_state_type_distribution = sections.get("entity_state_type_distribution", [])
+    entity_specificity_coverage = sections.get("entity_specificity_coverage", [])
+    event_external_ref_coverage = sections.get("event_external_ref_coverage", [])
+    factuality_coverage = sections.get("factuality_coverage", [])
+    factuality_attribution_violations = sections.get("factuality_attribution_violations", [])
+    factuality_alignment_violations = sections.get("factuality_alignment_violations", [])
+    glink_relation_inventory = sections.get("glink_relation_inventory", [])
+    participation_edge_inventory = sections.get("participation_edge_migration_inventory", [])
+    timexmention_contract_inventory = sections.get("timexmention_contract_inventory", [])
     total_orphaned_nodes = sum(int(row.get("orphan_count", 0) or 0) for row in orphaned_nodes)
 
     total_endpoint_violations = sum(int(row.get("violation_count", 0) or 0) for row in endpoint_violations)
@@ -481,11 +588,150 @@ def get_runtime_metrics(graph: Any) -> Dict[str, Any]:
     }
 
 
+# PhaseRun markers are written at the end of every pipeline phase, so the
+# latest marker (plus the marker count) identifies the graph state that the
+# diagnostics describe.
+_GRAPH_VERSION_QUERY = """
+MATCH (r:PhaseRun)
+RETURN max(r.timestamp) AS last_run, count(r) AS run_count
+"""
+
+
+def graph_version_stamp(graph: Any) -> Optional[str]:
+    """Return a stamp that changes whenever a new ``PhaseRun`` marker is written.
+
+    Returns ``None`` when the stamp cannot be read, which disables caching.
+    """
+    try:
+        rows = graph.run(_GRAPH_VERSION_QUERY, {}).data()
+    except Exception:
+        logger.debug("Could not read the graph version stamp", exc_info=True)
+        return None
+    row = rows[0] if rows else {}
+    return f"{row.get('last_run') or ''}#{int(row.get('run_count', 0) or 0)}"
+
+
+class RuntimeDiagnosticsCache:
+    """Serve :func:`get_runtime_metrics` payloads from a graph-version-keyed cache.
+
+    Section rows are reused until :func:`graph_version_stamp` changes (or they
+    are older than ``ttl_sec`` when that is positive). Missing, expired and
+    explicitly refreshed sections are re-run concurrently on ``workers``
+    threads; the others come from the cache. Calls are serialized, so
+    concurrent pollers wait for one refresh instead of repeating it.
+    """
+
+    def __init__(self, workers: int = 4, ttl_sec: float = 0.0):
+        self.workers = max(1, int(workers))
+        self.ttl_sec = max(0.0, float(ttl_sec))
+        self._lock = threading.Lock()
+        self._stamp: Optional[str] = None
+        self._sections: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _is_fresh(self, name: str, now: float) -> bool:
+        entry = self._sections.get(name)
+        if entry is None:
+            return False
+        return self.ttl_sec <= 0 or now - entry[0] < self.ttl_sec
+
+    def metrics(self, graph: Any, refresh: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Return the runtime metrics payload, re-running only stale sections.
+
+        *refresh* names sections to re-run even when cached; pass
+        :data:`RUNTIME_METRIC_SECTIONS` to force a full refresh.
+        """
+        forced = set(refresh or ())
+        unknown = sorted(forced.difference(RUNTIME_METRIC_SECTIONS))
+        if unknown:
+            raise KeyError(f"Unknown diagnostics query: {', '.join(unknown)}")
+
+        with self._lock:
+            stamp = graph_version_stamp(graph)
+            if stamp is None or stamp != self._stamp:
+                self._sections.clear()
+                self._stamp = stamp
+            now = time.monotonic()
+            stale = [
+                name for name in RUNTIME_METRIC_SECTIONS
+                if name in forced or not self._is_fresh(name, now)
+            ]
+            if stale:
+                for name, rows in run_diagnostic_sections(graph, stale, workers=self.workers).items():
+                    self._sections[name] = (now, rows)
+            self.misses += len(stale)
+            self.hits += len(RUNTIME_METRIC_SECTIONS) - len(stale)
+            rows_by_section = {name: entry[1] for name, entry in self._sections.items()}
+            if stamp is None:
+                self._sections.clear()
+
+        payload = build_runtime_metrics(rows_by_section)
+        payload["graph_version"] = stamp
+        payload["refreshed_sections"] = stale
+        return payload
+
+    def invalidate(self, sections: Optional[Iterable[str]] = None) -> None:
+        """Drop the given cached sections, or every section when *sections* is None."""
+        with self._lock:
+            if sections is None:
+                self._sections.clear()
+                self._stamp = None
+            else:
+                for name in sections:
+                    self._sections.pop(name, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "graph_version": self._stamp,
+                "cached_sections": len(self._sections),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_runtime_diagnostics_cache: Optional[RuntimeDiagnosticsCache] = None
+_runtime_diagnostics_cache_lock = threading.Lock()
+
+
+def get_runtime_diagnostics_cache() -> RuntimeDiagnosticsCache:
+    """Return the process-wide cache, configured from ``runtime.diagnostics_*``."""
+    global _runtime_diagnostics_cache
+    with _runtime_diagnostics_cache_lock:
+        if _runtime_diagnostics_cache is None:
+            settings = {}
+            try:
+                from textgraphx.infrastructure.config import get_config
+
+                runtime = get_config().runtime
+                settings = {
+                    "workers": runtime.diagnostics_workers,
+                    "ttl_sec": runtime.diagnostics_cache_ttl_sec,
+                }
+            except Exception:
+                logger.debug("Runtime diagnostics cache: config unavailable; using defaults", exc_info=True)
+            _runtime_diagnostics_cache = RuntimeDiagnosticsCache(**settings)
+        return _runtime_diagnostics_cache
+
+
+def reset_runtime_diagnostics_cache() -> None:
+    """Forget the process-wide cache so the next access re-reads configuration."""
+    global _runtime_diagnostics_cache
+    with _runtime_diagnostics_cache_lock:
+        _runtime_diagnostics_cache = None
+
+
 __all__ = [
     "DiagnosticQuery",
     "DIAGNOSTIC_QUERY_REGISTRY",
+    "RUNTIME_METRIC_SECTIONS",
+    "RuntimeDiagnosticsCache",
+    "build_runtime_metrics",
     "get_registered_diagnostics",
+    "get_runtime_diagnostics_cache",
     "get_runtime_metrics",
+    "graph_version_stamp",
     "list_diagnostic_queries",
     "query_edge_type_distribution",
     "query_entity_density",
@@ -509,5 +755,7 @@ __all__ = [
     "query_temporal_anchor_connectivity_gaps",
     "query_timexmention_contract_inventory",
     "query_tlink_reciprocal_cycle_signals",
+    "reset_runtime_diagnostics_cache",
+    "run_diagnostic_sections",
     "run_registered_diagnostic",
 ]
\ No newline at end of file
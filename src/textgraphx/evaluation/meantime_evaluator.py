@@ -14,8 +14,9 @@ import hashlib
 import logging
 import re
 
+import numpy as np
 
-from typing import Dict, Any, List, Tuple, Optional, Sequence
+from typing import Dict, Any, Iterable, List, Set, Tuple, Optional, Sequence
 import os
 import spacy
 
@@ -822,6 +823,11 @@ def build_document_from_neo4j(
         )
         doc.timex_mentions.add(Mention(kind="timex", span=span, attrs=attrs))
 
+    # Mention sets are final from here on; relation endpoints snap through one index per layer.
+    event_span_index = _MentionSpanIndex(doc.event_mentions, ("event",))
+    entity_span_index = _MentionSpanIndex(doc.entity_mentions, ("entity",))
+    timex_span_index = _MentionSpanIndex(doc.timex_mentions, ("timex", "timex3"))
+
     tlink_rows = graph.run(
         """
             MATCH (a)-[r:TLINK]->(b)
@@ -869,13 +875,13 @@ def build_document_from_neo4j(
         tgt_span = _span_from_bounds(int(row["b_start"]), int(row["b_end"]), token_index_alignment)
 
         if src_kind == "event":
-            src_span = _align_relation_event_span(src_span, doc.event_mentions)
+            src_span = event_span_index.align(src_span)
         if tgt_kind == "event":
-            tgt_span = _align_relation_event_span(tgt_span, doc.event_mentions)
+            tgt_span = event_span_index.align(tgt_span)
         if src_kind == "timex":
-            src_span = _align_relation_timex_span(src_span, doc.timex_mentions)
+            src_span = timex_span_index.align(src_span)
         if tgt_kind == "timex":
-            tgt_span = _align_relation_timex_span(tgt_span, doc.timex_mentions)
+            tgt_span = timex_span_index.align(tgt_span)
 
         if (src_kind == "event" and src_span not in projected_event_spans) or (tgt_kind == "event" and tgt_span not in projected_event_spans):
             continue
@@ -940,16 +946,16 @@ def build_document_from_neo4j(
         src_span = _span_from_bounds(int(row["a_start"]), int(row["a_end"]), token_index_alignment)
         tgt_span = _span_from_bounds(int(row["b_start"]), int(row["b_end"]), token_index_alignment)
         if src_kind == "event":
-            src_span = _align_relation_event_span(src_span, doc.event_mentions)
+            src_span = event_span_index.align(src_span)
             pass
         if tgt_kind == "event":
-            tgt_span = _align_relation_event_span(tgt_span, doc.event_mentions)
+            tgt_span = event_span_index.align(tgt_span)
             pass
         if src_kind == "timex":
-            src_span = _align_relation_timex_span(src_span, doc.timex_mentions)
+            src_span = timex_span_index.align(src_span)
             pass
         if tgt_kind == "timex":
-            tgt_span = _align_relation_timex_span(tgt_span, doc.timex_mentions)
+            tgt_span = timex_span_index.align(tgt_span)
             pass
         if (src_kind == "event" and src_span not in projected_event_spans) or (tgt_kind == "event" and tgt_span not in projected_event_spans):
             continue
@@ -1007,13 +1013,13 @@ def build_document_from_neo4j(
         src_span = _span_from_bounds(int(row["a_start"]), int(row["a_end"]), token_index_alignment)
         tgt_span = _span_from_bounds(int(row["b_start"]), int(row["b_end"]), token_index_alignment)
         if src_kind == "event":
-            src_span = _align_relation_event_span(src_span, doc.event_mentions)
+            src_span = event_span_index.align(src_span)
         if tgt_kind == "event":
-            tgt_span = _align_relation_event_span(tgt_span, doc.event_mentions)
+            tgt_span = event_span_index.align(tgt_span)
         if src_kind == "timex":
-            src_span = _align_relation_timex_span(src_span, doc.timex_mentions)
+            src_span = timex_span_index.align(src_span)
         if tgt_kind == "timex":
-            tgt_span = _align_relation_timex_span(tgt_span, doc.timex_mentions)
+            tgt_span = timex_span_index.align(tgt_span)
         if (src_kind == "event" or tgt_kind == "event") and not projected_event_spans:
             continue
         rel_kind = str(row.get("rel_kind") or "").strip().lower()
@@ -1098,7 +1104,7 @@ def build_document_from_neo4j(
             LOGGER.debug("Skipping participant (src_kind != entity): labels=%s -> %s", row.get("source_labels"), src_kind)
             continue
         evt_span = _span_from_bounds(int(row["evt_start"]), int(row["evt_end"]), token_index_alignment)
-        evt_span = _align_relation_event_span(evt_span, doc.event_mentions)
+        evt_span = event_span_index.align(evt_span)
         if evt_span not in projected_event_spans:
             LOGGER.debug(
                 "Skipping participant (evt_span not projected): original=%s-%s aligned=%s",
@@ -1108,7 +1114,7 @@ def build_document_from_neo4j(
             )
             continue
         entity_span = _span_from_bounds(int(row["src_start"]), int(row["src_end"]), token_index_alignment)
-        entity_span = _align_relation_entity_span(entity_span, doc.entity_mentions)
+        entity_span = entity_span_index.align(entity_span)
         sem_role = _normalize_sem_role(row.get("sem_role"))
         LOGGER.debug("ADDING has_participant: event=%s entity=%s role=%s", evt_span, entity_span, sem_role)
         doc.relations.add(
@@ -1682,32 +1688,103 @@ def _span_from_bounds(start_tok: int, end_tok: int, alignment: Dict[int, int]) -
     return _sorted_span(range(start_tok, end_tok + 1))
 
 
+def _interval_bounds(spans: Sequence[TokenSpan]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Return ``(start, end)`` arrays holding the token bounds of non-empty spans."""
+    starts = np.fromiter((min(s) for s in spans), dtype=np.int64, count=len(spans))
+    ends = np.fromiter((max(s) for s in spans), dtype=np.int64, count=len(spans))
+    return starts, ends
+
+
+def _interval_overlap_pairs(
+    a_start: "np.ndarray",
+    a_end: "np.ndarray",
+    b_start: "np.ndarray",
+    b_end: "np.ndarray",
+) -> List[Tuple[int, int]]:
+    """Return every ``(i, j)`` whose closed intervals ``a[i]`` and ``b[j]`` overlap.
+
+    Two intervals overlap exactly when one starts inside the other, so each side
+    is sorted by start once and every interval collects the other side's starts
+    falling in its own bounds with ``searchsorted``.  Starts shared by both
+    sides are only claimed by the first sweep, so no pair is reported twice.
+    Cost is ``O((n + m) log(n + m) + k)`` for ``k`` reported pairs.
+    """
+    pairs: List[Tuple[int, int]] = []
+    if not len(a_start) or not len(b_start):
+        return pairs
+    for outer_start, outer_end, inner_start, side, swap in (
+        (a_start, a_end, b_start, "left", False),
+        (b_start, b_end, a_start, "right", True),
+    ):
+        order = np.argsort(inner_start, kind="stable")
+        sorted_start = inner_start[order]
+        lo = np.searchsorted(sorted_start, outer_start, side=side)
+        hi = np.searchsorted(sorted_start, outer_end, side="right")
+        counts = np.maximum(hi - lo, 0)
+        total = int(counts.sum())
+        if not total:
+            continue
+        outer_idx = np.repeat(np.arange(len(outer_start)), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        inner_idx = order[np.repeat(lo, counts) + offsets]
+        if swap:
+            pairs.extend(zip(inner_idx.tolist(), outer_idx.tolist()))
+        else:
+            pairs.extend(zip(outer_idx.tolist(), inner_idx.tolist()))
+    return pairs
+
+
+class _MentionSpanIndex:
+    """Interval index over the mention spans of one kind, used to snap relation endpoints.
+
+    Build it once per document and call :meth:`align` for every relation
+    endpoint; it returns exactly what a linear scan over ``mentions`` would.
+    """
+
+    def __init__(self, mentions: Set[Mention], kinds: Iterable[str]):
+        wanted = set(kinds)
+        # Iteration order is kept so ties resolve to the same span as a linear scan.
+        self._spans: List[TokenSpan] = [m.span for m in mentions if m.kind in wanted] if mentions else []
+        self._members = set(self._spans)
+        positions = [i for i, s in enumerate(self._spans) if s]
+        starts, ends = _interval_bounds([self._spans[i] for i in positions])
+        order = np.argsort(starts, kind="stable")
+        self._positions = np.asarray(positions, dtype=np.int64)[order]
+        self._starts = starts[order]
+        self._ends = ends[order]
+        # Widest mention extent bounds how far left an overlapping start can sit.
+        self._max_extent = int((ends - starts).max()) if len(positions) else 0
+
+    def align(self, span: TokenSpan) -> TokenSpan:
+        """Return the mention span sharing most tokens with ``span`` (first on ties)."""
+        if not span or not self._spans or span in self._members:
+            return span
+        lo = min(span)
+        hi = max(span)
+        left = int(np.searchsorted(self._starts, lo - self._max_extent, side="left"))
+        right = int(np.searchsorted(self._starts, hi, side="right"))
+        window = slice(left, right)
+        hits = self._positions[window][self._ends[window] >= lo]
+        if not len(hits):
+            return span
+        tokens = set(span)
+        best: Optional[TokenSpan] = None
+        best_overlap = 0
+        for pos in sorted(hits.tolist()):
+            overlap = len(tokens.intersection(self._spans[pos]))
+            if overlap > best_overlap:
+                best, best_overlap = self._spans[pos], overlap
+        return span if best is None else best
+
+
 def _align_relation_event_span(span: TokenSpan, mentions: Set[Mention]) -> TokenSpan:
-    if not span or not mentions: return span
-    mention_spans = [m.span for m in mentions if m.kind == "event"]
-    if not mention_spans: return span
-    if span in mention_spans: return span
-    overlapping = [s for s in mention_spans if set(span).intersection(s)]
-    if overlapping: return max(overlapping, key=lambda s: len(set(span).intersection(s)))
-    return span
+    return _MentionSpanIndex(mentions, ("event",)).align(span)
 
 def _align_relation_entity_span(span: TokenSpan, mentions: Set[Mention]) -> TokenSpan:
-    if not span or not mentions: return span
-    mention_spans = [m.span for m in mentions if m.kind == "entity"]
-    if not mention_spans: return span
-    if span in mention_spans: return span
-    overlapping = [s for s in mention_spans if set(span).intersection(s)]
-    if overlapping: return max(overlapping, key=lambda s: len(set(span).intersection(s)))
-    return span
+    return _MentionSpanIndex(mentions, ("entity",)).align(span)
 
 def _align_relation_timex_span(span: TokenSpan, mentions: Set[Mention]) -> TokenSpan:
-    if not span or not mentions: return span
-    mention_spans = [m.span for m in mentions if m.kind in {"timex", "timex3"}]
-    if not mention_spans: return span
-    if span in mention_spans: return span
-    overlapping = [s for s in mention_spans if set(span).intersection(s)]
-    if overlapping: return max(overlapping, key=lambda s: len(set(span).intersection(s)))
-    return span
+    return _MentionSpanIndex(mentions, ("timex", "timex3")).align(span)
 
 
 def _normalize_sem_role(raw: Any) -> str:
@@ -1835,10 +1912,11 @@ def _pair_mentions(
     used_pred: Set[Mention] = set()
 
     if mode == "strict":
+        # Mentions are hashable, so each gold has at most one equal prediction.
+        pred_by_key = {p: p for p in pred}
         for g in sorted(gold, key=lambda x: (x.kind, x.span, x.attrs)):
-            candidates = [p for p in pred if p not in used_pred and g == p]
-            if candidates:
-                best = candidates[0]
+            best = pred_by_key.get(g)
+            if best is not None:
                 matched.add((g, best))
                 used_gold.add(g)
                 used_pred.add(best)
@@ -1852,31 +1930,65 @@ def _pair_mentions(
         #
         # Processing higher tiers first ensures IoU-based matches are never displaced
         # by containment-based matches.
-
-        def _tier_and_score(g: Mention, p: Mention) -> Optional[Tuple]:
+        gold_list = list(gold)
+        pred_list = list(pred)
+        gold_tokens = [set(g.span) for g in gold_list]
+        pred_tokens = [set(p.span) for p in pred_list]
+
+        def _tier_and_score(gi: int, pi: int) -> Optional[Tuple]:
+            g = gold_list[gi]
+            p = pred_list[pi]
             if g.kind != p.kind:
                 return None
-            iou = _span_iou(g.span, p.span)
+            g_set = gold_tokens[gi]
+            p_set = pred_tokens[pi]
+            if not g_set and not p_set:
+                iou = 1.0
+            else:
+                iou = float(len(g_set & p_set)) / float(len(g_set | p_set))
             if g == p:
                 return (3, iou, 0)
             if iou >= overlap_threshold:
                 return (2, iou, 0)
             # Containment for non-CONJ entities (pred ⊆ gold OR gold ⊆ pred).
             if g.kind == "entity" and not _is_conj_mention(g):
-                g_set = set(g.span)
-                p_set = set(p.span)
                 if p_set <= g_set or g_set <= p_set:
                     # Sort by containment IoU descending, then smallest gold span first.
                     return (1, iou, -len(g_set))
             return None
 
-        # Build all candidate pairs with scores.
+        # Candidate pairs.  Every tier needs a shared token once both spans are
+        # non-empty and the threshold is positive, so token intervals are swept
+        # per kind instead of scoring the full gold x pred product.  Pairs with
+        # an empty span (or a non-positive threshold) keep exhaustive pairing.
+        pairs: Set[Tuple[int, int]] = set()
+        kinds = {g.kind for g in gold_list} & {p.kind for p in pred_list}
+        for kind in kinds:
+            g_idx = [i for i, g in enumerate(gold_list) if g.kind == kind]
+            p_idx = [i for i, p in enumerate(pred_list) if p.kind == kind]
+            if not overlap_threshold > 0:
+                pairs.update((gi, pi) for gi in g_idx for pi in p_idx)
+                continue
+            g_full = [i for i in g_idx if gold_list[i].span]
+            p_full = [i for i in p_idx if pred_list[i].span]
+            g_start, g_end = _interval_bounds([gold_list[i].span for i in g_full])
+            p_start, p_end = _interval_bounds([pred_list[i].span for i in p_full])
+            pairs.update(
+                (g_full[gi], p_full[pi])
+                for gi, pi in _interval_overlap_pairs(g_start, g_end, p_start, p_end)
+            )
+            g_empty = [i for i in g_idx if not gold_list[i].span]
+            p_empty = [i for i in p_idx if not pred_list[i].span]
+            pairs.update((gi, pi) for gi in g_empty for pi in p_idx)
+            pairs.update((gi, pi) for gi in g_idx for pi in p_empty)
+
+        # Scored in gold-major iteration order so equal scores keep the order an
+        # exhaustive gold x pred scan would produce under the stable sort below.
         candidates: List[Tuple[Tuple, Mention, Mention]] = []
-        for g in gold:
-            for p in pred:
-                score = _tier_and_score(g, p)
-                if score is not None:
-                    candidates.append((score, g, p))
+        for gi, pi in sorted(pairs):
+            score = _tier_and_score(gi, pi)
+            if score is not None:
+                candidates.append((score, gold_list[gi], pred_list[pi]))
 
         # Assign in descending priority order (highest tier + score first).
         candidates.sort(key=lambda x: x[0], reverse=True)
@@ -2387,18 +2499,21 @@ def evaluate_documents(
     timex_attr = cfg.mention_attr_keys.get("timex", ())
     relation_attr = cfg.relation_attr_keys
 
+    gold_event_index = _MentionSpanIndex(gold_doc.event_mentions, ("event",))
+    gold_entity_index = _MentionSpanIndex(gold_doc.entity_mentions, ("entity",))
+    gold_timex_index = _MentionSpanIndex(gold_doc.timex_mentions, ("timex", "timex3"))
     snapped_relations = set()
     for r in predicted_doc.relations:
         src = r.source_span
         tgt = r.target_span
         
-        if r.source_kind == "entity": src = _align_relation_entity_span(src, gold_doc.entity_mentions)
-        elif r.source_kind == "event": src = _align_relation_event_span(src, gold_doc.event_mentions)
-        elif r.source_kind == "timex": src = _align_relation_timex_span(src, gold_doc.timex_mentions)
+        if r.source_kind == "entity": src = gold_entity_index.align(src)
+        elif r.source_kind == "event": src = gold_event_index.align(src)
+        elif r.source_kind == "timex": src = gold_timex_index.align(src)
 
-        if r.target_kind == "entity": tgt = _align_relation_entity_span(tgt, gold_doc.entity_mentions)
-        elif r.target_kind == "event": tgt = _align_relation_event_span(tgt, gold_doc.event_mentions)
-        elif r.target_kind == "timex": tgt = _align_relation_timex_span(tgt, gold_doc.timex_mentions)
+        if r.target_kind == "entity": tgt = gold_entity_index.align(tgt)
+        elif r.target_kind == "event": tgt = gold_event_index.align(tgt)
+        elif r.target_kind == "timex": tgt = gold_timex_index.align(tgt)
         
         snapped_relations.add(Relation(r.kind, r.source_kind, src, r.target_kind, tgt, r.attrs))
         
@@ -27,6 +27,7 @@ from textgraphx.infrastructure.performance_profiler import (
     PhaseMetrics,
     PhaseProfiler,
     QueryMetrics,
+    RuleCostRecorder,
     get_profiler,
 )
 
@@ -37,6 +38,7 @@ __all__ = [
     "PhaseProfiler",
     "ProgressLogger",
     "QueryMetrics",
+    "RuleCostRecorder",
     "check_dataset_directory",
     "check_external_services",
     "check_http_service",
@@ -3,6 +3,7 @@ REST API for TextGraphX pipeline orchestration.
 Provides HTTP endpoints for triggering runs, checking status, and retrieving results.
 """
 
+import asyncio
 import logging
 import uuid
 from pathlib import Path
@@ -23,8 +24,9 @@ except ImportError:  # pragma: no cover - support script-style execution
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from pydantic import BaseModel
 from textgraphx.evaluation.diagnostics import (
+    RUNTIME_METRIC_SECTIONS,
     get_registered_diagnostics,
-    get_runtime_metrics,
+    get_runtime_diagnostics_cache,
     list_diagnostic_queries,
     run_registered_diagnostic,
 )
@@ -205,21 +207,37 @@ async def get_statistics():
 
 
 @app.get("/diagnostics/runtime", tags=["Analytics"])
-async def get_runtime_diagnostics(totals_only: bool = False):
-    """Return runtime diagnostics aggregated from registered query pack entries."""
-    graph = make_graph_from_config()
-    close_fn = getattr(graph, "close", None)
+async def get_runtime_diagnostics(totals_only: bool = False, refresh: Optional[str] = None):
+    """Return runtime diagnostics aggregated from registered query pack entries.
+
+    Results are cached until a new PhaseRun marker is written. ``refresh``
+    re-runs the given comma-separated sections (``all`` for every section).
+    """
+    if refresh and refresh.strip().lower() == "all":
+        sections = list(RUNTIME_METRIC_SECTIONS)
+    else:
+        sections = [name.strip() for name in (refresh or "").split(",") if name.strip()]
+    unknown = [name for name in sections if name not in RUNTIME_METRIC_SECTIONS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown diagnostics section(s): {', '.join(unknown)}")
+
+    def _collect():
+        graph = make_graph_from_config()
+        close_fn = getattr(graph, "close", None)
+        try:
+            return get_runtime_diagnostics_cache().metrics(graph, refresh=sections)
+        finally:
+            if callable(close_fn):
+                close_fn()
+
     try:
-        payload = get_runtime_metrics(graph)
-        if totals_only and isinstance(payload, dict):
-            return payload.get("totals", {})
-        return payload
+        payload = await asyncio.to_thread(_collect)
     except Exception as e:
         logger.error(f"Failed to compute runtime diagnostics: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        if callable(close_fn):
-            close_fn()
+    if totals_only and isinstance(payload, dict):
+        return payload.get("totals", {})
+    return payload
 
 
 @app.get("/diagnostics/queries", tags=["Analytics"])
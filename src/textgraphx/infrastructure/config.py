@@ -20,6 +20,9 @@ class Neo4jConfig:
     user: str = "neo4j"
     password: str = "password"
     database: Optional[str] = None
+    # Bolt connection pool shared by every graph wrapper in the process.
+    max_connection_pool_size: int = 100
+    connection_acquisition_timeout: float = 60.0
 
 
 @dataclass
@@ -40,12 +43,24 @@ class PathsConfig:
     data_dir: str = "data"
     output_dir: str = "out"
     tmp_dir: str = "/tmp"
+    # Precomputed synset feature table (``textgraphx.tools.build_wordnet_feature_table``);
+    # empty computes WordNet features on demand.
+    wordnet_feature_table: str = ""
 
 
 @dataclass
 class ServicesConfig:
     service_timeout_sec: int = 20
     wsd_url: str = "http://localhost:81/api/model"
+    # Sentences per AMuSE-WSD request and concurrent requests per document.
+    wsd_batch_size: int = 32
+    wsd_max_workers: int = 4
+    # Pooled service clients: keep-alive connections per host, in-flight
+    # requests per service, and retries (jittered exponential backoff).
+    http_pool_size: int = 10
+    http_max_concurrency: int = 8
+    http_retries: int = 2
+    http_backoff_sec: float = 0.5
     # Optional external coreference service.
     # Keep empty to prefer spaCy/pipe-provided coreference clusters.
     # Canonical coref backend: spacy-experimental-coref (see docs/COREF_POLICY.md).
@@ -59,6 +74,15 @@ class ServicesConfig:
     # Empty string disables the nominal SRL extraction pass.
     # Set TEXTGRAPHX_NOM_SRL_URL or nom_srl_url in config.ini to override.
     nom_srl_url: str = "http://localhost:8011/predict_nom"
+    # Persistent SRL/nominal-SRL response store (features.persist_srl_cache).
+    # Empty path means <paths.output_dir>/cache/srl_responses.sqlite; the model
+    # version is part of every key, so bump it when a service model changes.
+    srl_cache_path: str = ""
+    srl_cache_max_entries: int = 200000
+    srl_model_version: str = ""
+    # Files kept in the on-disk TTK/HeidelTime response cache
+    # (features.persist_annotation_cache); least recently used ones are evicted.
+    annotation_cache_max_entries: int = 20000
     llm_url: str = "http://localhost:11434/api/generate"
     dbpedia_sparql_url: str = "https://dbpedia.org/sparql"
     dbpedia_spotlight_url: str = "https://api.dbpedia-spotlight.org/en/annotate"
@@ -77,6 +101,37 @@ class RuntimeConfig:
     tlink_shadow_mode: bool = False
     enable_tlink_xml_seed: bool = False
     enable_cross_document_fusion: bool = False
+    # Refinement only visits AnnotatedText nodes without a ``refined_at`` stamp;
+    # (re)importing a document clears it.
+    incremental_refinement: bool = True
+    # Send per-rule statements as PROFILE so rule metrics include db hits.
+    profile_rule_queries: bool = False
+    # SQLite file that collects per-rule metrics across runs; empty disables.
+    rule_metrics_history: str = ""
+    # Documents processed concurrently by the temporal phase (1 = sequential).
+    temporal_workers: int = 1
+    # Skip corpus files whose content hash is unchanged and restrict later
+    # phases to the new/modified documents listed in the ingestion manifest.
+    incremental_ingestion: bool = False
+    # Document shards run by separate worker processes (1 = unsharded).
+    shards: int = 1
+    # Worker processes for sharded runs; 0 means one per shard.
+    shard_workers: int = 0
+    # Concurrent read sessions used by cached runtime diagnostics
+    # (/diagnostics/runtime); results are reused until a new PhaseRun marker
+    # appears or, when positive, diagnostics_cache_ttl_sec elapses.
+    diagnostics_workers: int = 4
+    diagnostics_cache_ttl_sec: float = 0.0
+    # TLINK inverses/closure/suppression: "memory" reasons per document in
+    # Python and writes back the delta; "cypher" runs the whole-graph queries.
+    tlink_reasoning_engine: str = "memory"
+    # Report documents whose TLINKs are not Allen interval-algebra consistent.
+    tlink_allen_check: bool = False
+    # TLINK cases only visit AnnotatedText nodes without a ``tlinked_at`` stamp;
+    # (re)importing a document, temporal extraction and event enrichment clear it.
+    incremental_tlinks: bool = False
+    # Documents per committed batch when TLINK cases run document-scoped.
+    tlink_docs_per_transaction: int = 10
 
 
 @dataclass
@@ -88,16 +143,27 @@ class FeatureFlags:
     # are skipped. Enable only when running legacy pipelines that still rely on
     # the dynamic label reads.
     fill_numeric_labels: bool = False
+    # Persist TTK/HeidelTime responses under <paths.output_dir>/cache/annotations
+    # so re-runs over unchanged documents skip the temporal service calls.
+    persist_annotation_cache: bool = True
+    # Keep SRL/nominal-SRL responses in a SQLite store (services.srl_cache_path)
+    # behind the in-process LRU so re-runs skip the SRL service calls.
+    persist_srl_cache: bool = True
 
 
 @dataclass
 class IngestionConfig:
-    """Confidence gating thresholds for SRL frame and argument ingestion.
+    """Confidence gating thresholds and write sizing for document ingestion.
 
     Frames with sense_conf below ``frame_confidence_min`` are still stored but
     are tagged ``provisional=True`` so downstream phases can filter them.
     Arguments with confidence below ``argument_confidence_min`` are dropped
     (not persisted) and the count is recorded in the phase completion marker.
+    ``write_batch_size`` caps the rows per ``UNWIND`` statement when a
+    document's sentences and tokens are written in one transaction.
+    ``pipe_batch_size`` / ``pipe_n_process`` are passed to ``nlp.pipe``,
+    ``stream_queue_size`` bounds the documents waiting at each ingestion stage
+    and ``remote_workers`` sizes the remote-services stage.
     """
     # Minimum confidence for a Frame to be treated as non-provisional.
     # Range [0.0, 1.0].  Set to 0.0 to disable gating.
@@ -105,6 +171,25 @@ class IngestionConfig:
     # Minimum confidence for a FrameArgument to be persisted at all.
     # Range [0.0, 1.0].  Set to 0.0 to persist all arguments.
     argument_confidence_min: float = 0.40
+    # Maximum rows per UNWIND statement in the document token writer.
+    write_batch_size: int = 1000
+    # Texts per spaCy ``nlp.pipe`` batch and number of parser processes.
+    pipe_batch_size: int = 8
+    pipe_n_process: int = 1
+    # Parsed documents buffered between the parser and the graph writer.
+    # 0 writes each document inline as it leaves the pipe, without a writer thread.
+    stream_queue_size: int = 2
+    # Threads of the remote-services stage (WSD, nominal SRL, coreference calls).
+    remote_workers: int = 2
+
+
+# Streaming ingestion settings of the ``[ingestion]`` section and their env overrides.
+_INGESTION_STREAM_KEYS = {
+    'pipe_batch_size': 'TEXTGRAPHX_INGEST_PIPE_BATCH_SIZE',
+    'pipe_n_process': 'TEXTGRAPHX_INGEST_N_PROCESS',
+    'stream_queue_size': 'TEXTGRAPHX_INGEST_QUEUE_SIZE',
+    'remote_workers': 'TEXTGRAPHX_INGEST_REMOTE_WORKERS',
+}
 
 
 @dataclass
@@ -181,6 +266,13 @@ def _coerce_naf_sentence_mode(val: Optional[str]) -> str:
     return mode
 
 
+def _coerce_tlink_reasoning_engine(val: Optional[str]) -> str:
+    engine = ("memory" if val is None else str(val)).strip().lower()
+    if engine not in {"memory", "cypher"}:
+        raise ValueError("runtime.tlink_reasoning_engine must be one of: memory/cypher")
+    return engine
+
+
 def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
     """Load configuration using precedence:
       1. explicit path
@@ -236,6 +328,12 @@ def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
                 neo.user = cp.get('neo4j', 'user', fallback=neo.user)
                 neo.password = cp.get('neo4j', 'password', fallback=neo.password)
                 neo.database = cp.get('neo4j', 'database', fallback=neo.database)
+                neo.max_connection_pool_size = cp.getint(
+                    'neo4j', 'max_connection_pool_size', fallback=neo.max_connection_pool_size
+                )
+                neo.connection_acquisition_timeout = cp.getfloat(
+                    'neo4j', 'connection_acquisition_timeout', fallback=neo.connection_acquisition_timeout
+                )
             if cp.has_section('logging'):
                 log.level = cp.get('logging', 'level', fallback=log.level)
                 log.json = _coerce_bool(cp.get('logging', 'json', fallback=str(log.json)))
@@ -247,6 +345,9 @@ def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
                 paths.data_dir = cp.get('paths', 'data_dir', fallback=paths.data_dir)
                 paths.output_dir = cp.get('paths', 'output_dir', fallback=paths.output_dir)
                 paths.tmp_dir = cp.get('paths', 'tmp_dir', fallback=paths.tmp_dir)
+                paths.wordnet_feature_table = cp.get(
+                    'paths', 'wordnet_feature_table', fallback=paths.wordnet_feature_table
+                ).strip()
             if cp.has_section('features'):
                 features.create_refinement_run = _coerce_bool(cp.get('features', 'create_refinement_run', fallback=str(features.create_refinement_run)))
                 features.compute_token_ids = _coerce_bool(cp.get('features', 'compute_token_ids', fallback=str(features.compute_token_ids)))
@@ -256,6 +357,12 @@ def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
                 features.fill_numeric_labels = _coerce_bool(
                     cp.get('features', 'fill_numeric_labels', fallback=str(features.fill_numeric_labels))
                 )
+                features.persist_annotation_cache = _coerce_bool(
+                    cp.get('features', 'persist_annotation_cache', fallback=str(features.persist_annotation_cache))
+                )
+                features.persist_srl_cache = _coerce_bool(
+                    cp.get('features', 'persist_srl_cache', fallback=str(features.persist_srl_cache))
+                )
             if cp.has_section('runtime'):
                 runtime.mode = cp.get('runtime', 'mode', fallback=runtime.mode).strip().lower()
                 runtime.strict_transition_gate = _coerce_optional_bool(
@@ -267,6 +374,25 @@ def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
                 runtime.tlink_shadow_mode = _coerce_bool(
                     cp.get('runtime', 'tlink_shadow_mode', fallback=str(runtime.tlink_shadow_mode))
                 )
+                runtime.tlink_reasoning_engine = _coerce_tlink_reasoning_engine(
+                    cp.get('runtime', 'tlink_reasoning_engine', fallback=runtime.tlink_reasoning_engine)
+                )
+                runtime.tlink_allen_check = _coerce_bool(
+                    cp.get('runtime', 'tlink_allen_check', fallback=str(runtime.tlink_allen_check))
+                )
+                runtime.incremental_tlinks = _coerce_bool(
+                    cp.get('runtime', 'incremental_tlinks', fallback=str(runtime.incremental_tlinks))
+                )
+                try:
+                    runtime.tlink_docs_per_transaction = int(
+                        cp.get(
+                            'runtime',
+                            'tlink_docs_per_transaction',
+                            fallback=str(runtime.tlink_docs_per_transaction),
+                        )
+                    )
+                except Exception:
+                    pass
                 runtime.enable_cross_document_fusion = _coerce_bool(
                     cp.get(
                         'runtime',
@@ -274,6 +400,56 @@ def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
                         fallback=str(runtime.enable_cross_document_fusion),
                     )
                 )
+                runtime.incremental_refinement = _coerce_bool(
+                    cp.get(
+                        'runtime',
+                        'incremental_refinement',
+                        fallback=str(runtime.incremental_refinement),
+                    )
+                )
+                runtime.incremental_ingestion = _coerce_bool(
+                    cp.get(
+                        'runtime',
+                        'incremental_ingestion',
+                        fallback=str(runtime.incremental_ingestion),
+                    )
+                )
+                runtime.profile_rule_queries = _coerce_bool(
+                    cp.get(
+                        'runtime',
+                        'profile_rule_queries',
+                        fallback=str(runtime.profile_rule_queries),
+                    )
+                )
+                runtime.rule_metrics_history = cp.get(
+                    'runtime', 'rule_metrics_history', fallback=runtime.rule_metrics_history
+                ).strip()
+                try:
+                    runtime.temporal_workers = int(
+                        cp.get('runtime', 'temporal_workers', fallback=str(runtime.temporal_workers))
+                    )
+                except Exception:
+                    pass
+                try:
+                    runtime.shards = int(cp.get('runtime', 'shards', fallback=str(runtime.shards)))
+                    runtime.shard_workers = int(
+                        cp.get('runtime', 'shard_workers', fallback=str(runtime.shard_workers))
+                    )
+                except Exception:
+                    pass
+                try:
+                    runtime.diagnostics_workers = int(
+                        cp.get('runtime', 'diagnostics_workers', fallback=str(runtime.diagnostics_workers))
+                    )
+                    runtime.diagnostics_cache_ttl_sec = float(
+                        cp.get(
+                            'runtime',
+                            'diagnostics_cache_ttl_sec',
+                            fallback=str(runtime.diagnostics_cache_ttl_sec),
+                        )
+                    )
+                except Exception:
+                    pass
             if cp.has_section('services'):
                 try:
                     services.service_timeout_sec = int(
@@ -282,11 +458,55 @@ def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
                 except Exception:
                     pass
                 services.wsd_url = cp.get('services', 'wsd_url', fallback=services.wsd_url)
+                try:
+                    services.wsd_batch_size = int(
+                        cp.get('services', 'wsd_batch_size', fallback=str(services.wsd_batch_size))
+                    )
+                    services.wsd_max_workers = int(
+                        cp.get('services', 'wsd_max_workers', fallback=str(services.wsd_max_workers))
+                    )
+                except Exception:
+                    pass
+                try:
+                    services.http_pool_size = int(
+                        cp.get('services', 'http_pool_size', fallback=str(services.http_pool_size))
+                    )
+                    services.http_max_concurrency = int(
+                        cp.get('services', 'http_max_concurrency', fallback=str(services.http_max_concurrency))
+                    )
+                    services.http_retries = int(
+                        cp.get('services', 'http_retries', fallback=str(services.http_retries))
+                    )
+                    services.http_backoff_sec = float(
+                        cp.get('services', 'http_backoff_sec', fallback=str(services.http_backoff_sec))
+                    )
+                except Exception:
+                    pass
                 services.coref_url = cp.get('services', 'coref_url', fallback=services.coref_url)
                 services.temporal_url = cp.get('services', 'temporal_url', fallback=services.temporal_url)
                 services.heideltime_url = cp.get('services', 'heideltime_url', fallback=services.heideltime_url)
                 services.srl_url = cp.get('services', 'srl_url', fallback=services.srl_url)
                 services.nom_srl_url = cp.get('services', 'nom_srl_url', fallback=services.nom_srl_url)
+                services.srl_cache_path = cp.get('services', 'srl_cache_path', fallback=services.srl_cache_path)
+                services.srl_model_version = cp.get(
+                    'services', 'srl_model_version', fallback=services.srl_model_version
+                )
+                try:
+                    services.srl_cache_max_entries = int(
+                        cp.get('services', 'srl_cache_max_entries', fallback=str(services.srl_cache_max_entries))
+                    )
+                except Exception:
+                    pass
+                try:
+                    services.annotation_cache_max_entries = int(
+                        cp.get(
+                            'services',
+                            'annotation_cache_max_entries',
+                            fallback=str(services.annotation_cache_max_entries),
+                        )
+                    )
+                except Exception:
+                    pass
                 services.llm_url = cp.get('services', 'llm_url', fallback=services.llm_url)
                 services.dbpedia_sparql_url = cp.get('services', 'dbpedia_sparql_url', fallback=services.dbpedia_sparql_url)
                 services.dbpedia_spotlight_url = cp.get('services', 'dbpedia_spotlight_url', fallback=services.dbpedia_spotlight_url)
@@ -335,6 +555,12 @@ def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
             neo.user = neo_map.get('user', neo.user)
             neo.password = neo_map.get('password', neo.password)
             neo.database = neo_map.get('database', neo.database)
+            neo.max_connection_pool_size = int(
+                neo_map.get('max_connection_pool_size', neo.max_connection_pool_size)
+            )
+            neo.connection_acquisition_timeout = float(
+                neo_map.get('connection_acquisition_timeout', neo.connection_acquisition_timeout)
+            )
             log_map = tom.get('logging', {})
             log.level = log_map.get('level', log.level)
             log.json = bool(log_map.get('json', log.json))
@@ -346,6 +572,9 @@ def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
             paths.data_dir = paths_map.get('data_dir', paths.data_dir)
             paths.output_dir = paths_map.get('output_dir', paths.output_dir)
             paths.tmp_dir = paths_map.get('tmp_dir', paths.tmp_dir)
+            paths.wordnet_feature_table = str(
+                paths_map.get('wordnet_feature_table', paths.wordnet_feature_table) or ''
+            ).strip()
             feat_map = tom.get('features', {})
             features.create_refinement_run = bool(feat_map.get('create_refinement_run', features.create_refinement_run))
             features.compute_token_ids = bool(feat_map.get('compute_token_ids', features.compute_token_ids))
@@ -355,6 +584,12 @@ def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
             features.fill_numeric_labels = bool(
                 feat_map.get('fill_numeric_labels', features.fill_numeric_labels)
             )
+            features.persist_annotation_cache = bool(
+                feat_map.get('persist_annotation_cache', features.persist_annotation_cache)
+            )
+            features.persist_srl_cache = bool(
+                feat_map.get('persist_srl_cache', features.persist_srl_cache)
+            )
             runtime_map = tom.get('runtime', {})
             runtime.mode = str(runtime_map.get('mode', runtime.mode)).strip().lower()
             if 'strict_transition_gate' in runtime_map:
@@ -371,20 +606,75 @@ def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
                 )
             if 'tlink_shadow_mode' in runtime_map:
                 runtime.tlink_shadow_mode = bool(runtime_map.get('tlink_shadow_mode', runtime.tlink_shadow_mode))
+            if 'tlink_reasoning_engine' in runtime_map:
+                runtime.tlink_reasoning_engine = _coerce_tlink_reasoning_engine(
+                    runtime_map.get('tlink_reasoning_engine')
+                )
+            if 'tlink_allen_check' in runtime_map:
+                runtime.tlink_allen_check = bool(runtime_map.get('tlink_allen_check', runtime.tlink_allen_check))
+            if 'incremental_tlinks' in runtime_map:
+                runtime.incremental_tlinks = bool(runtime_map.get('incremental_tlinks', runtime.incremental_tlinks))
+            if 'tlink_docs_per_transaction' in runtime_map:
+                try:
+                    runtime.tlink_docs_per_transaction = int(runtime_map.get('tlink_docs_per_transaction'))
+                except Exception:
+                    pass
             if 'enable_cross_document_fusion' in runtime_map:
                 runtime.enable_cross_document_fusion = bool(
                     runtime_map.get('enable_cross_document_fusion', runtime.enable_cross_document_fusion)
                 )
+            if 'incremental_refinement' in runtime_map:
+                runtime.incremental_refinement = bool(
+                    runtime_map.get('incremental_refinement', runtime.incremental_refinement)
+                )
+            if 'incremental_ingestion' in runtime_map:
+                runtime.incremental_ingestion = bool(
+                    runtime_map.get('incremental_ingestion', runtime.incremental_ingestion)
+                )
+            if 'profile_rule_queries' in runtime_map:
+                runtime.profile_rule_queries = bool(
+                    runtime_map.get('profile_rule_queries', runtime.profile_rule_queries)
+                )
+            if 'rule_metrics_history' in runtime_map:
+                runtime.rule_metrics_history = str(runtime_map.get('rule_metrics_history') or '').strip()
+            if 'temporal_workers' in runtime_map:
+                try:
+                    runtime.temporal_workers = int(runtime_map.get('temporal_workers'))
+                except Exception:
+                    pass
+            for key in ('shards', 'shard_workers', 'diagnostics_workers'):
+                if key in runtime_map:
+                    try:
+                        setattr(runtime, key, int(runtime_map.get(key)))
+                    except Exception:
+                        pass
+            if 'diagnostics_cache_ttl_sec' in runtime_map:
+                try:
+                    runtime.diagnostics_cache_ttl_sec = float(runtime_map.get('diagnostics_cache_ttl_sec'))
+                except Exception:
+                    pass
             svc_map = tom.get('services', {})
             services.service_timeout_sec = int(
                 svc_map.get('service_timeout_sec', services.service_timeout_sec)
             )
             services.wsd_url = svc_map.get('wsd_url', services.wsd_url)
+            services.wsd_batch_size = int(svc_map.get('wsd_batch_size', services.wsd_batch_size))
+            services.wsd_max_workers = int(svc_map.get('wsd_max_workers', services.wsd_max_workers))
+            services.http_pool_size = int(svc_map.get('http_pool_size', services.http_pool_size))
+            services.http_max_concurrency = int(svc_map.get('http_max_concurrency', services.http_max_concurrency))
+            services.http_retries = int(svc_map.get('http_retries', services.http_retries))
+            services.http_backoff_sec = float(svc_map.get('http_backoff_sec', services.http_backoff_sec))
             services.coref_url = svc_map.get('coref_url', services.coref_url)
             services.temporal_url = svc_map.get('temporal_url', services.temporal_url)
             services.heideltime_url = svc_map.get('heideltime_url', services.heideltime_url)
             services.srl_url = svc_map.get('srl_url', services.srl_url)
             services.nom_srl_url = svc_map.get('nom_srl_url', services.nom_srl_url)
+            services.srl_cache_path = str(svc_map.get('srl_cache_path', services.srl_cache_path))
+            services.srl_cache_max_entries = int(svc_map.get('srl_cache_max_entries', services.srl_cache_max_entries))
+            services.srl_model_version = str(svc_map.get('srl_model_version', services.srl_model_version))
+            services.annotation_cache_max_entries = int(
+                svc_map.get('annotation_cache_max_entries', services.annotation_cache_max_entries)
+            )
             services.llm_url = svc_map.get('llm_url', services.llm_url)
             services.dbpedia_sparql_url = svc_map.get('dbpedia_sparql_url', services.dbpedia_sparql_url)
             services.dbpedia_spotlight_url = svc_map.get('dbpedia_spotlight_url', services.dbpedia_spotlight_url)
@@ -412,6 +702,18 @@ def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
         db = os.getenv('NEO4J_DATABASE')
         if db:
             neo.database = db
+        pool_size = os.getenv('NEO4J_MAX_CONNECTION_POOL_SIZE')
+        if pool_size:
+            try:
+                neo.max_connection_pool_size = int(pool_size)
+            except ValueError:
+                pass
+        acquisition_timeout = os.getenv('NEO4J_CONNECTION_ACQUISITION_TIMEOUT')
+        if acquisition_timeout:
+            try:
+                neo.connection_acquisition_timeout = float(acquisition_timeout)
+            except ValueError:
+                pass
 
         log.level = os.getenv('TEXTGRAPHX_LOG_LEVEL') or log.level
         if os.getenv('TEXTGRAPHX_LOG_JSON') is not None:
@@ -425,6 +727,9 @@ def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
         paths.data_dir = os.getenv('TEXTGRAPHX_DATA_DIR') or paths.data_dir
         paths.output_dir = os.getenv('TEXTGRAPHX_OUTPUT_DIR') or paths.output_dir
         paths.tmp_dir = os.getenv('TEXTGRAPHX_TMP_DIR') or paths.tmp_dir
+        paths.wordnet_feature_table = (
+            os.getenv('TEXTGRAPHX_WORDNET_FEATURE_TABLE') or paths.wordnet_feature_table
+        )
 
         if os.getenv('TEXTGRAPHX_CREATE_REFINEMENT_RUN') is not None:
             features.create_refinement_run = _coerce_bool(os.getenv('TEXTGRAPHX_CREATE_REFINEMENT_RUN'))
@@ -438,6 +743,14 @@ def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
             features.fill_numeric_labels = _coerce_bool(
                 os.getenv('TEXTGRAPHX_FILL_NUMERIC_LABELS')
             )
+        if os.getenv('TEXTGRAPHX_PERSIST_ANNOTATION_CACHE') is not None:
+            features.persist_annotation_cache = _coerce_bool(
+                os.getenv('TEXTGRAPHX_PERSIST_ANNOTATION_CACHE')
+            )
+        if os.getenv('TEXTGRAPHX_PERSIST_SRL_CACHE') is not None:
+            features.persist_srl_cache = _coerce_bool(
+                os.getenv('TEXTGRAPHX_PERSIST_SRL_CACHE')
+            )
 
         runtime.mode = (os.getenv('TEXTGRAPHX_RUNTIME_MODE') or runtime.mode).strip().lower()
         env_strict = os.getenv('TEXTGRAPHX_STRICT_TRANSITION_GATE')
@@ -452,9 +765,59 @@ def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
         env_tlink_shadow = os.getenv('TEXTGRAPHX_TLINK_SHADOW_MODE')
         if env_tlink_shadow is not None:
             runtime.tlink_shadow_mode = _coerce_bool(env_tlink_shadow)
+        env_tlink_engine = os.getenv('TEXTGRAPHX_TLINK_REASONING_ENGINE')
+        if env_tlink_engine is not None:
+            runtime.tlink_reasoning_engine = _coerce_tlink_reasoning_engine(env_tlink_engine)
+        env_tlink_allen_check = os.getenv('TEXTGRAPHX_TLINK_ALLEN_CHECK')
+        if env_tlink_allen_check is not None:
+            runtime.tlink_allen_check = _coerce_bool(env_tlink_allen_check)
+        env_incremental_tlinks = os.getenv('TEXTGRAPHX_INCREMENTAL_TLINKS')
+        if env_incremental_tlinks is not None:
+            runtime.incremental_tlinks = _coerce_bool(env_incremental_tlinks)
+        env_tlink_docs_per_tx = os.getenv('TEXTGRAPHX_TLINK_DOCS_PER_TRANSACTION')
+        if env_tlink_docs_per_tx is not None:
+            try:
+                runtime.tlink_docs_per_transaction = int(env_tlink_docs_per_tx)
+            except Exception:
+                pass
         env_cross_doc_fusion = os.getenv('TEXTGRAPHX_ENABLE_CROSS_DOCUMENT_FUSION')
         if env_cross_doc_fusion is not None:
             runtime.enable_cross_document_fusion = _coerce_bool(env_cross_doc_fusion)
+        env_incremental_refinement = os.getenv('TEXTGRAPHX_INCREMENTAL_REFINEMENT')
+        if env_incremental_refinement is not None:
+            runtime.incremental_refinement = _coerce_bool(env_incremental_refinement)
+        env_incremental_ingestion = os.getenv('TEXTGRAPHX_INCREMENTAL_INGESTION')
+        if env_incremental_ingestion is not None:
+            runtime.incremental_ingestion = _coerce_bool(env_incremental_ingestion)
+        env_profile_rule_queries = os.getenv('TEXTGRAPHX_PROFILE_RULE_QUERIES')
+        if env_profile_rule_queries is not None:
+            runtime.profile_rule_queries = _coerce_bool(env_profile_rule_queries)
+        env_rule_metrics_history = os.getenv('TEXTGRAPHX_RULE_METRICS_HISTORY')
+        if env_rule_metrics_history is not None:
+            runtime.rule_metrics_history = env_rule_metrics_history.strip()
+        env_temporal_workers = os.getenv('TEXTGRAPHX_TEMPORAL_WORKERS')
+        if env_temporal_workers is not None:
+            try:
+                runtime.temporal_workers = int(env_temporal_workers)
+            except Exception:
+                pass
+        for key, env_name in (
+            ('shards', 'TEXTGRAPHX_SHARDS'),
+            ('shard_workers', 'TEXTGRAPHX_SHARD_WORKERS'),
+            ('diagnostics_workers', 'TEXTGRAPHX_DIAGNOSTICS_WORKERS'),
+        ):
+            env_value = os.getenv(env_name)
+            if env_value is not None:
+                try:
+                    setattr(runtime, key, int(env_value))
+                except Exception:
+                    pass
+        env_diagnostics_ttl = os.getenv('TEXTGRAPHX_DIAGNOSTICS_CACHE_TTL_SEC')
+        if env_diagnostics_ttl is not None:
+            try:
+                runtime.diagnostics_cache_ttl_sec = float(env_diagnostics_ttl)
+            except Exception:
+                pass
 
         # Standardised TEXTGRAPHX_* env vars (preferred); legacy names kept for
         # backward compatibility with existing deployments.
@@ -507,6 +870,20 @@ def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
             or os.getenv('NOM_SRL_SERVICE_URL')
             or services.nom_srl_url
         )
+        services.srl_cache_path = os.getenv('TEXTGRAPHX_SRL_CACHE_PATH') or services.srl_cache_path
+        services.srl_model_version = os.getenv('TEXTGRAPHX_SRL_MODEL_VERSION') or services.srl_model_version
+        env_srl_cache_max = os.getenv('TEXTGRAPHX_SRL_CACHE_MAX_ENTRIES')
+        if env_srl_cache_max is not None:
+            try:
+                services.srl_cache_max_entries = int(env_srl_cache_max)
+            except Exception:
+                pass
+        env_annotation_cache_max = os.getenv('TEXTGRAPHX_ANNOTATION_CACHE_MAX_ENTRIES')
+        if env_annotation_cache_max is not None:
+            try:
+                services.annotation_cache_max_entries = int(env_annotation_cache_max)
+            except Exception:
+                pass
         services.llm_url = (
             os.getenv('TEXTGRAPHX_LLM_URL')
             or os.getenv('LLM_API_URL')
@@ -515,6 +892,31 @@ def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
         services.dbpedia_sparql_url = os.getenv('DBPEDIA_SPARQL_URL') or services.dbpedia_sparql_url
         services.dbpedia_spotlight_url = os.getenv('DBPEDIA_SPOTLIGHT_URL') or services.dbpedia_spotlight_url
 
+        env_wsd_batch = os.getenv('TEXTGRAPHX_WSD_BATCH_SIZE')
+        if env_wsd_batch is not None:
+            try:
+                services.wsd_batch_size = int(env_wsd_batch)
+            except Exception:
+                pass
+        env_wsd_workers = os.getenv('TEXTGRAPHX_WSD_MAX_WORKERS')
+        if env_wsd_workers is not None:
+            try:
+                services.wsd_max_workers = int(env_wsd_workers)
+            except Exception:
+                pass
+        for env_name, attr, cast in (
+            ('TEXTGRAPHX_HTTP_POOL_SIZE', 'http_pool_size', int),
+            ('TEXTGRAPHX_HTTP_MAX_CONCURRENCY', 'http_max_concurrency', int),
+            ('TEXTGRAPHX_HTTP_RETRIES', 'http_retries', int),
+            ('TEXTGRAPHX_HTTP_BACKOFF_SEC', 'http_backoff_sec', float),
+        ):
+            env_value = os.getenv(env_name)
+            if env_value is not None:
+                try:
+                    setattr(services, attr, cast(env_value))
+                except Exception:
+                    pass
+
         dbpedia_timeout = os.getenv('DBPEDIA_TIMEOUT_SEC')
         if dbpedia_timeout is not None:
             try:
@@ -574,6 +976,20 @@ def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
                     )
                 except Exception:
                     pass
+                try:
+                    ingestion.write_batch_size = int(
+                        cp_existing.get('ingestion', 'write_batch_size',
+                                        fallback=str(ingestion.write_batch_size))
+                    )
+                except Exception:
+                    pass
+                for key in _INGESTION_STREAM_KEYS:
+                    try:
+                        setattr(ingestion, key, int(
+                            cp_existing.get('ingestion', key, fallback=str(getattr(ingestion, key)))
+                        ))
+                    except Exception:
+                        pass
         else:
             if file_cfg:
                 tom_existing = _read_toml(file_cfg)
@@ -591,6 +1007,17 @@ def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
                         )
                     except Exception:
                         pass
+                    try:
+                        ingestion.write_batch_size = int(
+                            ing_map.get('write_batch_size', ingestion.write_batch_size)
+                        )
+                    except Exception:
+                        pass
+                    for key in _INGESTION_STREAM_KEYS:
+                        try:
+                            setattr(ingestion, key, int(ing_map.get(key, getattr(ingestion, key))))
+                        except Exception:
+                            pass
 
     if allow_env:
         env_frame_min = os.getenv('TEXTGRAPHX_FRAME_CONFIDENCE_MIN')
@@ -605,6 +1032,19 @@ def load_config(path: Optional[str] = None, allow_env: bool = True) -> Config:
                 ingestion.argument_confidence_min = float(env_arg_min)
             except Exception:
                 pass
+        env_write_batch = os.getenv('TEXTGRAPHX_INGEST_WRITE_BATCH_SIZE')
+        if env_write_batch is not None:
+            try:
+                ingestion.write_batch_size = int(env_write_batch)
+            except Exception:
+                pass
+        for key, env_name in _INGESTION_STREAM_KEYS.items():
+            env_value = os.getenv(env_name)
+            if env_value is not None:
+                try:
+                    setattr(ingestion, key, int(env_value))
+                except Exception:
+                    pass
 
     if runtime.mode not in {"production", "testing"}:
         raise ValueError("runtime.mode must be either 'production' or 'testing'")
@@ -635,6 +1075,8 @@ def write_example(path: str, fmt: str = 'toml') -> None:
 uri = bolt://localhost:7687
 user = neo4j
 password = password
+max_connection_pool_size = 100
+connection_acquisition_timeout = 60
 
 [logging]
 level = INFO
@@ -646,22 +1088,48 @@ model = en_core_web_trf
 [paths]
 data_dir = data
 output_dir = out
+wordnet_feature_table =
 
 [features]
 create_refinement_run = true
 compute_token_ids = false
 enable_dbpedia_enrichment = false
 fill_numeric_labels = false
+persist_annotation_cache = true
+persist_srl_cache = true
 
 [runtime]
 mode = production
 strict_transition_gate = auto
 naf_sentence_mode = auto
 tlink_shadow_mode = false
+tlink_reasoning_engine = memory
+tlink_allen_check = false
+incremental_tlinks = false
+tlink_docs_per_transaction = 10
 enable_cross_document_fusion = false
+incremental_refinement = true
+profile_rule_queries = false
+rule_metrics_history =
+temporal_workers = 1
+incremental_ingestion = false
+shards = 1
+shard_workers = 0
+diagnostics_workers = 4
+diagnostics_cache_ttl_sec = 0
 
 [services]
 service_timeout_sec = 20
+wsd_batch_size = 32
+wsd_max_workers = 4
+http_pool_size = 10
+http_max_concurrency = 8
+http_retries = 2
+http_backoff_sec = 0.5
+srl_cache_path =
+srl_cache_max_entries = 200000
+srl_model_version =
+annotation_cache_max_entries = 20000
 dbpedia_sparql_url = https://dbpedia.org/sparql
 dbpedia_spotlight_url = https://api.dbpedia-spotlight.org/en/annotate
 dbpedia_timeout_sec = 8
@@ -669,12 +1137,21 @@ dbpedia_max_entities_per_run = 500
 dbpedia_spotlight_confidence = 0.5
 dbpedia_spotlight_support = 20
 dbpedia_spotlight_min_similarity = 0.8
+
+[ingestion]
+write_batch_size = 1000
+pipe_batch_size = 8
+pipe_n_process = 1
+stream_queue_size = 2
+remote_workers = 2
 """
 
     example_toml = """[neo4j]
 uri = "bolt://localhost:7687"
 user = "neo4j"
 password = "password"
+max_connection_pool_size = 100
+connection_acquisition_timeout = 60
 
 [logging]
 level = "INFO"
@@ -686,22 +1163,48 @@ model = "en_core_web_trf"
 [paths]
 data_dir = "data"
 output_dir = "out"
+wordnet_feature_table = ""
 
 [features]
 create_refinement_run = true
 compute_token_ids = false
 enable_dbpedia_enrichment = false
 fill_numeric_labels = false
+persist_annotation_cache = true
+persist_srl_cache = true
 
 [runtime]
 mode = "production"
 strict_transition_gate = "auto"
 naf_sentence_mode = "auto"
 tlink_shadow_mode = false
+tlink_reasoning_engine = "memory"
+tlink_allen_check = false
+incremental_tlinks = false
+tlink_docs_per_transaction = 10
 enable_cross_document_fusion = false
+incremental_refinement = true
+profile_rule_queries = false
+rule_metrics_history = ""
+temporal_workers = 1
+incremental_ingestion = false
+shards = 1
+shard_workers = 0
+diagnostics_workers = 4
+diagnostics_cache_ttl_sec = 0
 
 [services]
 service_timeout_sec = 20
+wsd_batch_size = 32
+wsd_max_workers = 4
+http_pool_size = 10
+http_max_concurrency = 8
+http_retries = 2
+http_backoff_sec = 0.5
+srl_cache_path = ""
+srl_cache_max_entries = 200000
+srl_model_version = ""
+annotation_cache_max_entries = 20000
 dbpedia_sparql_url = "https://dbpedia.org/sparql"
 dbpedia_spotlight_url = "https://api.dbpedia-spotlight.org/en/annotate"
 dbpedia_timeout_sec = 8
@@ -709,6 +1212,13 @@ dbpedia_max_entities_per_run = 500
 dbpedia_spotlight_confidence = 0.5
 dbpedia_spotlight_support = 20
 dbpedia_spotlight_min_similarity = 0.8
+
+[ingestion]
+write_batch_size = 1000
+pipe_batch_size = 8
+pipe_n_process = 1
+stream_queue_size = 2
+remote_workers = 2
 """
 
     if fmt == 'ini':
@@ -2,6 +2,7 @@
 
 import functools
 import logging
+import threading
 import time
 from contextlib import contextmanager
 from pathlib import Path
@@ -114,7 +115,10 @@ def log_subsection(logger: logging.Logger, section_name: str, level: int = loggi
 
 
 class ProgressLogger:
-    """Helper for logging progress through a process."""
+    """Helper for logging progress through a process.
+
+    ``update`` may be called from several worker threads.
+    """
 
     def __init__(self, logger: logging.Logger, total: int, name: str = "Processing"):
         self.logger = logger
@@ -122,16 +126,18 @@ class ProgressLogger:
         self.name = name
         self.count = 0
         self._last_percent = 0
+        self._lock = threading.Lock()
 
     def update(self, count: int = 1, message: str = ""):
-        self.count += count
-        if self.total > 0:
-            percent = int((self.count / self.total) * 100)
-            if percent >= self._last_percent + 10:
-                self.logger.info(f"  {self.name}: {self.count}/{self.total} ({percent}%)")
-                self._last_percent = percent
-            if message:
-                self.logger.debug(f"    {message}")
+        with self._lock:
+            self.count += count
+            if self.total > 0:
+                percent = int((self.count / self.total) * 100)
+                if percent >= self._last_percent + 10:
+                    self.logger.info(f"  {self.name}: {self.count}/{self.total} ({percent}%)")
+                    self._last_percent = percent
+        if self.total > 0 and message:
+            self.logger.debug(f"    {message}")
 
     def finish(self):
         self.logger.info(f"  {self.name}: {self.count}/{self.total} (100%)")
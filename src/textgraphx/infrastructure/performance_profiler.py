@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import time
 from dataclasses import dataclass, field
@@ -20,6 +21,8 @@ class QueryMetrics:
     cardinality_before: Optional[int] = None
     cardinality_after: Optional[int] = None
     query_plan: Optional[str] = None
+    counters: Dict[str, int] = field(default_factory=dict)
+    db_hits: Optional[int] = None
     timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
     def cardinality_delta(self) -> Optional[int]:
@@ -34,6 +37,8 @@ class QueryMetrics:
             "rows_affected": self.rows_affected,
             "rows_returned": self.rows_returned,
             "cardinality_delta": self.cardinality_delta(),
+            "counters": dict(self.counters),
+            "db_hits": self.db_hits,
             "timestamp": self.timestamp,
         }
 
@@ -74,6 +79,10 @@ class PhaseMetrics:
     def slowest_queries(self, top_n: int = 5) -> List[QueryMetrics]:
         return sorted(self.query_metrics, key=lambda query: query.duration_ms, reverse=True)[:top_n]
 
+    def rule_costs(self) -> List[Dict[str, Any]]:
+        """Aggregate query metrics per name, most expensive (wall time) first."""
+        return aggregate_rule_costs(self.query_metrics)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "phase_name": self.phase_name,
@@ -87,9 +96,38 @@ class PhaseMetrics:
             "cardinality_delta": self.cardinality_delta,
             "peak_cardinality": self.peak_cardinality,
             "slowest_queries": [query.to_dict() for query in self.slowest_queries()],
+            "rule_costs": self.rule_costs(),
         }
 
 
+def aggregate_rule_costs(query_metrics: List[QueryMetrics]) -> List[Dict[str, Any]]:
+    """Sum duration, rows and counters of *query_metrics* per ``query_name``.
+
+    Returns one dict per rule, sorted by total wall time descending.
+    """
+    costs: Dict[str, Dict[str, Any]] = {}
+    for metric in query_metrics:
+        entry = costs.setdefault(
+            metric.query_name,
+            {
+                "rule": metric.query_name,
+                "calls": 0,
+                "duration_ms": 0.0,
+                "rows_affected": 0,
+                "db_hits": None,
+                "counters": {},
+            },
+        )
+        entry["calls"] += 1
+        entry["duration_ms"] += metric.duration_ms
+        entry["rows_affected"] += metric.rows_affected
+        if metric.db_hits is not None:
+            entry["db_hits"] = (entry["db_hits"] or 0) + metric.db_hits
+        for name, value in metric.counters.items():
+            entry["counters"][name] = entry["counters"].get(name, 0) + value
+    return sorted(costs.values(), key=lambda entry: entry["duration_ms"], reverse=True)
+
+
 class PhaseProfiler:
     """Profiles phase execution for bottleneck identification."""
 
@@ -125,20 +163,37 @@ class PhaseProfiler:
         duration_ms: float,
         rows_affected: int = 0,
         rows_returned: int = 0,
-    ) -> None:
-        if self.active_phase is None:
-            return
-
-        metrics = self.phase_metrics[self.active_phase]
+        counters: Optional[Dict[str, int]] = None,
+        db_hits: Optional[int] = None,
+        phase_name: Optional[str] = None,
+    ) -> Optional[QueryMetrics]:
+        """Record one query (or rule) execution.
+
+        The metric goes to *phase_name* when given, otherwise to the active
+        phase; without either it is dropped.
+        """
+        phase_name = phase_name or self.active_phase
+        if phase_name is None:
+            return None
+
+        metrics = self.phase_metrics.get(phase_name)
+        if metrics is None:
+            metrics = self.phase_metrics[phase_name] = PhaseMetrics(
+                phase_name=phase_name,
+                timestamp_start=datetime.now(timezone.utc).isoformat(),
+            )
         query_metric = QueryMetrics(
             query_name=query_name,
             duration_ms=duration_ms,
             rows_affected=rows_affected,
             rows_returned=rows_returned,
+            counters=dict(counters or {}),
+            db_hits=db_hits,
         )
         metrics.query_metrics.append(query_metric)
         metrics.queries_executed += 1
         metrics.total_rows_affected += rows_affected
+        return query_metric
 
     def end_phase(self, graph: Optional[Any] = None) -> PhaseMetrics:
         if self.active_phase is None or self.phase_start_time is None:
@@ -173,10 +228,13 @@ class PhaseProfiler:
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "phases": [],
             "bottlenecks": [],
+            "rules": [],
             "recommendations": [],
         }
         for phase_metrics in self.get_slowest_phases(top_n=10):
             report["phases"].append(phase_metrics.to_dict())
+            for cost in phase_metrics.rule_costs():
+                report["rules"].append(dict(cost, phase=phase_metrics.phase_name))
             slowest = phase_metrics.slowest_queries(top_n=3)
             for query in slowest:
                 if query.duration_ms > 1000:
@@ -204,6 +262,7 @@ class PhaseProfiler:
                         "action": "Check for combinatorial explosion in fusion/matching logic",
                     }
                 )
+        report["rules"].sort(key=lambda entry: entry["duration_ms"], reverse=True)
         return report
 
     def to_json(self) -> str:
@@ -221,6 +280,87 @@ class PhaseProfiler:
         self.phase_cardinality_start = None
 
 
+class RuleCostRecorder:
+    """Times named rules of one phase run and records their graph counters.
+
+    Each :meth:`rule` block is timed and, when *graph* exposes a connection
+    manager (``graph.manager``), the Neo4j update counters of every statement
+    the block ran on the calling thread are attributed to it. With
+    ``profile_queries`` (default: ``runtime.profile_rule_queries``) the
+    statements are sent as ``PROFILE`` so db hits are counted too. Metrics are kept on the recorder (for this run's ``PhaseRun``
+    marker and history row) and forwarded to *profiler* under *phase_name*
+    so they appear in the bottleneck report.
+
+    Examples
+        >>> recorder = RuleCostRecorder("refinement", profiler=PhaseProfiler())
+        >>> with recorder.rule("linking.link_frame_arguments"):
+        ...     pass
+        >>> [cost["rule"] for cost in recorder.summary()]
+        ['linking.link_frame_arguments']
+    """
+
+    def __init__(
+        self,
+        phase_name: str,
+        graph: Optional[Any] = None,
+        profiler: Optional[PhaseProfiler] = None,
+        profile_queries: Optional[bool] = None,
+    ):
+        if profile_queries is None:
+            try:
+                from textgraphx.infrastructure.config import get_config
+
+                profile_queries = bool(get_config().runtime.profile_rule_queries)
+            except Exception:
+                profile_queries = False
+        self.phase_name = phase_name
+        self.graph = graph
+        self.profiler = profiler if profiler is not None else get_profiler()
+        self.profile_queries = profile_queries
+        self.metrics: List[QueryMetrics] = []
+        self.started = time.time()
+
+    def _manager(self):
+        manager = getattr(self.graph, "manager", None)
+        return manager if hasattr(manager, "thread_totals") else None
+
+    @contextlib.contextmanager
+    def rule(self, rule_name: str):
+        manager = self._manager()
+        before = manager.thread_totals() if manager is not None else {}
+        profiling = (
+            manager.profiling(True)
+            if manager is not None and self.profile_queries
+            else contextlib.nullcontext()
+        )
+        start = time.perf_counter()
+        try:
+            with profiling:
+                yield
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000.0
+            after = manager.thread_totals() if manager is not None else {}
+            delta = {name: after[name] - before.get(name, 0) for name in after}
+            db_hits = delta.pop("db_hits", None)
+            counters = {name: value for name, value in delta.items() if value}
+            metric = self.profiler.record_query(
+                rule_name,
+                duration_ms,
+                rows_affected=sum(counters.values()),
+                counters=counters,
+                db_hits=db_hits if self.profile_queries else None,
+                phase_name=self.phase_name,
+            )
+            self.metrics.append(metric)
+
+    def elapsed_seconds(self) -> float:
+        return time.time() - self.started
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Per-rule cost of this run, most expensive first."""
+        return aggregate_rule_costs(self.metrics)
+
+
 _global_profiler = PhaseProfiler()
 
 
@@ -233,5 +373,7 @@ __all__ = [
     "PhaseMetrics",
     "PhaseProfiler",
     "QueryMetrics",
+    "RuleCostRecorder",
+    "aggregate_rule_costs",
     "get_profiler",
 ]
\ No newline at end of file
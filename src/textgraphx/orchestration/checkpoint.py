@@ -1,8 +1,13 @@
+import contextlib
 import json
+import sqlite3
+import threading
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Set
 from dataclasses import dataclass
 
+from textgraphx.reasoning.temporal.time import utc_iso_now
+
 
 @dataclass
 class CheckpointSummary:
@@ -11,9 +16,111 @@ class CheckpointSummary:
     resume_from_phase: Optional[str]
 
 
+class DocumentCheckpointLog:
+    """SQLite log of the documents each phase has completed.
+
+    One row per (dataset, phase, document); writes are committed per call so
+    a crash loses at most the document in flight. Each call opens and closes
+    its own connection.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with contextlib.closing(sqlite3.connect(self.db_path)) as conn, conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS document_checkpoints (
+                        dataset TEXT NOT NULL,
+                        phase TEXT NOT NULL,
+                        doc_id TEXT NOT NULL,
+                        execution_id TEXT,
+                        completed_at TEXT NOT NULL,
+                        PRIMARY KEY (dataset, phase, doc_id)
+                    )
+                    """
+                )
+            self._initialized = True
+        return sqlite3.connect(self.db_path)
+
+    def mark_completed(
+        self, dataset: str, phase: str, doc_ids: Iterable, execution_id: str = ""
+    ) -> int:
+        rows = [(dataset, phase, str(doc_id), execution_id, utc_iso_now()) for doc_id in doc_ids]
+        if not rows:
+            return 0
+        with self._lock, contextlib.closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO document_checkpoints VALUES (?, ?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def completed(self, dataset: str, phase: str) -> Set[str]:
+        with self._lock, contextlib.closing(self._connect()) as conn, conn:
+            rows = conn.execute(
+                "SELECT doc_id FROM document_checkpoints WHERE dataset = ? AND phase = ?",
+                (dataset, phase),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def clear(self, dataset: str, phase: Optional[str] = None) -> int:
+        with self._lock, contextlib.closing(self._connect()) as conn, conn:
+            if phase is None:
+                cursor = conn.execute("DELETE FROM document_checkpoints WHERE dataset = ?", (dataset,))
+            else:
+                cursor = conn.execute(
+                    "DELETE FROM document_checkpoints WHERE dataset = ? AND phase = ?",
+                    (dataset, phase),
+                )
+        return cursor.rowcount
+
+
+@dataclass
+class DocumentCheckpoint:
+    """The (dataset, phase) slice of a :class:`DocumentCheckpointLog` handed to a phase.
+
+    With ``resume`` the phase skips the documents in :meth:`completed`;
+    without it the previous records are cleared by :meth:`begin`.
+    """
+
+    log: DocumentCheckpointLog
+    dataset: str
+    phase: str
+    execution_id: str = ""
+    resume: bool = False
+
+    def begin(self) -> Set[str]:
+        """Start the phase; return the documents it may skip."""
+        if self.resume:
+            return self.log.completed(self.dataset, self.phase)
+        self.log.clear(self.dataset, self.phase)
+        return set()
+
+    def mark_completed(self, doc_ids: Iterable) -> int:
+        return self.log.mark_completed(self.dataset, self.phase, doc_ids, self.execution_id)
+
+
 class CheckpointManager:
     def __init__(self, base_dir: str = "out/checkpoints"):
         self.base_dir = Path(base_dir)
+        self.documents = DocumentCheckpointLog(str(self.base_dir / "documents.sqlite"))
+
+    def document_checkpoint(
+        self, doc_id: str, phase_name: str, execution_id: str = "", resume: bool = False
+    ) -> DocumentCheckpoint:
+        """Return the per-document checkpoint of *phase_name* in run *doc_id*."""
+        return DocumentCheckpoint(
+            log=self.documents,
+            dataset=doc_id,
+            phase=phase_name,
+            execution_id=execution_id,
+            resume=resume,
+        )
 
     def save_checkpoint(
         self,
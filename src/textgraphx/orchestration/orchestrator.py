@@ -14,6 +14,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from .db_interface import ExecutionHistory, ExecutionStatus
 from .checkpoint import CheckpointManager
+from . import sharding
+from textgraphx.adapters.service_client import service_stats
 from textgraphx.infrastructure.config import get_config
 from textgraphx.infrastructure.logging_utils import (
     get_logger, log_section, log_subsection, ProgressLogger
@@ -86,6 +88,8 @@ class PipelineOrchestrator:
         )
         self.start_time = None
         self.phases_executed = []
+        # Set by run_selected: phases skip documents recorded as completed.
+        self.resume_documents = False
         self.runtime_mode = cfg.runtime.mode
         self.strict_transition_gate = (
             cfg.runtime.strict_transition_gate
@@ -323,8 +327,14 @@ class PipelineOrchestrator:
             return True
         return not normalized.issubset(cls.MAINTENANCE_ONLY_PHASES)
 
-    def run_for_review(self, phases: Optional[List[str]] = None) -> Dict[str, object]:
-        """Prepare the graph and run the requested phases for Neo4j review."""
+    def run_for_review(
+        self, phases: Optional[List[str]] = None, shards: Optional[int] = None
+    ) -> Dict[str, object]:
+        """Prepare the graph and run the requested phases for Neo4j review.
+
+        With more than one shard (``shards`` or ``runtime.shards``) the phases
+        run through :meth:`run_sharded`.
+        """
         phases = phases or self.default_phases()
         self._allow_empty_materialization_gate = False
         if self.phases_require_review_preparation(phases):
@@ -338,7 +348,12 @@ class PipelineOrchestrator:
                 "runtime_mode": self.runtime_mode,
                 "review_preparation_skipped": True,
             }
-        self.run_selected(phases)
+        if shards is None:
+            shards = int(getattr(get_config().runtime, "shards", 1) or 1)
+        if shards > 1:
+            self.run_sharded(phases, shards=shards)
+        else:
+            self.run_selected(phases)
         if int(getattr(self.summary, "total_documents", 0) or 0) == 0:
             self._allow_empty_materialization_gate = True
         if self.phases_require_materialization_gate(phases):
@@ -416,7 +431,8 @@ class PipelineOrchestrator:
         
         Args:
             phases: List of phase names to execute.
-            resume_from_checkpoint: If true, skip phases that already have a checkpoint.
+            resume_from_checkpoint: If true, skip phases that already have a checkpoint
+                and, inside the first remaining phase, documents recorded as completed.
             
         Raises:
             Exception: If a phase fails fatally.
@@ -424,6 +440,7 @@ class PipelineOrchestrator:
         with log_section(logger, f"PIPELINE EXECUTION - {len(phases)} phases"):
             self.start_time = time.time()
             started_at = datetime.now().isoformat()
+            self.resume_documents = bool(resume_from_checkpoint)
 
             if resume_from_checkpoint:
                 resume_plan = self.checkpoint_manager.resume_from_checkpoint(
@@ -617,6 +634,8 @@ class PipelineOrchestrator:
 
                 # Item 8: emit per-phase run report
                 run_report.log_summary()
+                for service_name, stats in service_stats().items():
+                    logger.info("Service client %s: %s", service_name, stats)
 
                 self.execution_history.record_execution(
                     execution_id=self.execution_id,
@@ -647,6 +666,251 @@ class PipelineOrchestrator:
                 )
                 raise
 
+    def run_sharded(
+        self,
+        phases: List[str],
+        shards: Optional[int] = None,
+        workers: Optional[int] = None,
+    ) -> None:
+        """Run *phases* with the per-document chain split over document shards.
+
+        The leading shardable phases (ingestion, refinement, temporal, event
+        enrichment) run once per shard in worker processes, each with its own
+        driver. Cross-document fusion, the phase assertions and the remaining
+        corpus-wide phases then run once in this process. Shard outcomes are
+        merged into ``self.summary``, the run report and the checkpoints.
+
+        Args:
+            phases: List of phase names to execute.
+            shards: Number of document shards (default: ``runtime.shards``).
+            workers: Worker processes (default: ``runtime.shard_workers``,
+                0 meaning one per shard).
+
+        Raises:
+            RuntimeError: If a shard or a global step fails.
+        """
+        cfg = get_config()
+        shards = int(shards if shards is not None else getattr(cfg.runtime, "shards", 1) or 1)
+        workers = int(workers if workers is not None else getattr(cfg.runtime, "shard_workers", 0) or 0)
+        shard_phases, global_phases = sharding.split_phases(phases)
+        partitions = sharding.partition_files(self._dataset_files(), shards)
+        if not shard_phases or len(partitions) <= 1:
+            logger.info("Sharded run not applicable (%d shard(s)); running unsharded", len(partitions))
+            return self.run_selected(phases)
+
+        # Without ingestion nothing adds documents to a shard's scope, so the
+        # ids are resolved here; if a file's id cannot be, run unsharded.
+        shard_doc_ids: List[List[str]] = [[] for _ in partitions]
+        if "ingestion" not in shard_phases:
+            resolved = [sharding.resolve_shard_doc_ids([str(path) for path in files]) for files in partitions]
+            if any(doc_ids is None for doc_ids in resolved):
+                logger.warning(
+                    "Cannot resolve document ids of every shard file without ingestion; running unsharded"
+                )
+                return self.run_selected(phases)
+            shard_doc_ids = resolved
+
+        from textgraphx.evaluation.reports import RunReport
+
+        self.start_time = time.time()
+        started_at = datetime.now().isoformat()
+        run_report = RunReport(execution_id=self.execution_id)
+        shard_root = Path(cfg.paths.output_dir) / "shards"
+        specs = [
+            sharding.ShardSpec(
+                index=index,
+                count=len(partitions),
+                files=[str(path) for path in files],
+                phases=list(shard_phases),
+                model_name=self.model_name,
+                output_dir=str(shard_root / f"shard-{index}-of-{len(partitions)}"),
+                execution_id=self.execution_id,
+                doc_ids=shard_doc_ids[index],
+            )
+            for index, files in enumerate(partitions)
+        ]
+
+        with log_section(logger, f"SHARDED EXECUTION - {len(specs)} shards x {len(shard_phases)} phases"):
+            results = sharding.execute_shards(specs, workers)
+            failures = self._merge_shard_results(shard_phases, results, run_report)
+
+            try:
+                if failures:
+                    raise RuntimeError(
+                        f"{len(failures)} of {len(results)} shard(s) failed: " + "; ".join(failures)
+                    )
+                self._run_cross_document_steps(shard_phases, results)
+            except Exception as e:
+                total_duration = time.time() - self.start_time
+                self.summary.total_duration = total_duration
+                run_report.log_summary()
+                self.execution_history.record_execution(
+                    execution_id=self.execution_id,
+                    status=ExecutionStatus.FAILED.value,
+                    total_duration=total_duration,
+                    documents_processed=self.summary.total_documents or 0,
+                    phases=self.phases_executed,
+                    started_at=started_at,
+                    completed_at=datetime.now().isoformat(),
+                    error_message=str(e),
+                )
+                raise
+
+        run_report.log_summary()
+        sharded_documents = self.summary.total_documents or 0
+        sharded_start = self.start_time
+        if global_phases:
+            self.run_selected(global_phases)
+            self.start_time = sharded_start
+        else:
+            self.execution_history.record_execution(
+                execution_id=self.execution_id,
+                status=ExecutionStatus.SUCCESS.value,
+                total_duration=time.time() - self.start_time,
+                documents_processed=sharded_documents,
+                phases=self.phases_executed,
+                started_at=started_at,
+                completed_at=datetime.now().isoformat(),
+                error_message=None,
+            )
+        self.summary.phase_count = len(shard_phases) + len(global_phases)
+        self.summary.total_duration = time.time() - sharded_start
+        self.summary.total_documents = sharded_documents + (
+            sum(self.summary.phases[name].documents_processed for name in global_phases if name in self.summary.phases)
+        )
+
+    def _merge_shard_results(self, shard_phases: List[str], results, run_report) -> List[str]:
+        """Fold shard outcomes into the summary, run report and checkpoints."""
+        failures = []
+        for result in results:
+            if result.error:
+                failures.append(f"shard {result.index}: {result.error}")
+            completed = [
+                name for name in shard_phases
+                if result.phases.get(name, {}).get("status") == "completed"
+            ]
+            duration = sum(float(phase.get("duration") or 0.0) for phase in result.phases.values())
+            for path in result.files:
+                if result.error:
+                    failed_phase = next(
+                        (name for name in shard_phases if name not in completed), shard_phases[-1]
+                    )
+                    run_report.mark_failed(
+                        doc_id=Path(path).name,
+                        filename=path,
+                        failed_phase=failed_phase,
+                        reason=result.error,
+                        phases_completed=completed,
+                        duration_seconds=duration,
+                    )
+                else:
+                    run_report.mark_processed(
+                        doc_id=Path(path).name,
+                        filename=path,
+                        phases_completed=completed,
+                        duration_seconds=duration,
+                    )
+
+        self.summary.phase_count = len(shard_phases)
+        total_documents = 0
+        for name in shard_phases:
+            outcomes = [result.phases[name] for result in results if name in result.phases]
+            if not outcomes:
+                continue
+            failed = [outcome for outcome in outcomes if outcome.get("status") != "completed"]
+            phase_result = PhaseResult(
+                name=name,
+                status="failed" if failed or len(outcomes) < len(results) else "completed",
+                # Shards run concurrently, so the phase took as long as its slowest shard.
+                duration=max(float(outcome.get("duration") or 0.0) for outcome in outcomes),
+                documents_processed=sum(int(outcome.get("documents_processed") or 0) for outcome in outcomes),
+                error="; ".join(str(outcome.get("error")) for outcome in failed) or None,
+                provenance_violations=sum(int(outcome.get("provenance_violations") or 0) for outcome in outcomes),
+            )
+            self.summary.phases[name] = phase_result
+            if phase_result.status == "completed":
+                self.summary.success_count += 1
+                total_documents += phase_result.documents_processed
+                self.phases_executed.append(name)
+                self.checkpoint_manager.save_checkpoint(
+                    doc_id=self._checkpoint_doc_id(),
+                    phase_name=name,
+                    phase_markers=list(self.phases_executed),
+                    properties_snapshot={"provenance_violations": phase_result.provenance_violations},
+                    metadata={
+                        "execution_id": self.execution_id,
+                        "phase_duration_seconds": phase_result.duration,
+                        "documents_processed": phase_result.documents_processed,
+                        "shards": len(results),
+                    },
+                )
+            else:
+                self.summary.failed_count += 1
+        self.summary.total_documents = total_documents
+        self.summary.total_duration = time.time() - self.start_time
+
+        if bool(getattr(get_config().runtime, "incremental_ingestion", False)) and "ingestion" in shard_phases:
+            from textgraphx.pipeline.ingestion.ingestion_manifest import (
+                IngestionManifest,
+                pipeline_version,
+                write_manifest,
+            )
+
+            write_manifest(IngestionManifest(
+                pipeline_version=pipeline_version(self.model_name, get_config().runtime.naf_sentence_mode),
+                changed_doc_ids=[doc_id for result in results for doc_id in result.changed_doc_ids],
+                unchanged_doc_ids=[doc_id for result in results for doc_id in result.unchanged_doc_ids],
+            ))
+        return failures
+
+    def _run_cross_document_steps(self, shard_phases: List[str], results) -> None:
+        """Run fusion and the phase assertions once over the merged graph."""
+        from textgraphx.pipeline.runtime.phase_assertions import PhaseAssertions
+
+        graph = make_graph_from_config()
+        try:
+            if "refinement" in shard_phases and bool(get_config().runtime.enable_cross_document_fusion):
+                from textgraphx.reasoning.fusion import (
+                    fuse_entities_cross_document,
+                    propagate_coreference_identity_cross_document,
+                )
+
+                # Only the shards' documents need linking against the graph.
+                doc_ids = [
+                    int(doc_id) if str(doc_id).isdigit() else doc_id
+                    for result in results
+                    for doc_id in result.doc_ids
+                ]
+                cross_document_links = fuse_entities_cross_document(graph, doc_ids=doc_ids)
+                coref_identity_links = propagate_coreference_identity_cross_document(graph, doc_ids=doc_ids)
+                logger.info(
+                    "Cross-document fusion over %d shard(s): SAME_AS(kb_id)=%s, SAME_AS(coref_identity)=%s",
+                    len(results), cross_document_links, coref_identity_links,
+                )
+
+            assertions = PhaseAssertions(graph, strict_transition_gate=self.strict_transition_gate)
+            for name in shard_phases:
+                check = getattr(assertions, f"after_{name}", None)
+                if check is None or name not in self.summary.phases:
+                    continue
+                passed = check().passed
+                self.summary.phases[name].assertions_passed = passed
+                if self.strict_transition_gate and passed is False:
+                    raise RuntimeError(
+                        "Strict transition gate failed: "
+                        f"phase '{name}' reported assertion failure in testing mode"
+                    )
+                violations = self.summary.phases[name].provenance_violations
+                if self.strict_transition_gate and violations > 0:
+                    raise RuntimeError(
+                        "Strict transition gate failed: "
+                        f"phase '{name}' reported {violations} provenance contract violations"
+                    )
+        finally:
+            close_fn = getattr(graph, "close", None)
+            if callable(close_fn):
+                close_fn()
+
     # Phase execution methods
     def _run_ingestion(self) -> Dict[str, any]:
         """Run the ingestion phase - parse documents using GraphBasedNLP."""
@@ -692,7 +956,13 @@ class PipelineOrchestrator:
             from textgraphx.pipeline.runtime.phase_wrappers import TemporalPhaseWrapper
             
             wrapper = TemporalPhaseWrapper(
-                strict_transition_gate=self.strict_transition_gate
+                strict_transition_gate=self.strict_transition_gate,
+                document_checkpoint=self.checkpoint_manager.document_checkpoint(
+                    self._checkpoint_doc_id(),
+                    "temporal",
+                    execution_id=self.execution_id,
+                    resume=self.resume_documents,
+                ),
             )
             result = wrapper.execute()
             logger.info(f"Temporal phase: {result}")
@@ -709,7 +979,13 @@ class PipelineOrchestrator:
             from textgraphx.pipeline.runtime.phase_wrappers import EventEnrichmentPhaseWrapper
             
             wrapper = EventEnrichmentPhaseWrapper(
-                strict_transition_gate=self.strict_transition_gate
+                strict_transition_gate=self.strict_transition_gate,
+                document_checkpoint=self.checkpoint_manager.document_checkpoint(
+                    self._checkpoint_doc_id(),
+                    "event_enrichment",
+                    execution_id=self.execution_id,
+                    resume=self.resume_documents,
+                ),
             )
             result = wrapper.execute()
             logger.info(f"Event enrichment phase: {result}")
@@ -940,11 +1216,17 @@ def main(argv: Optional[List[str]] = None) -> int:
         nargs="*",
         default=None,
     )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=None,
+        help="Run the per-document phases over N document shards in worker processes (default: runtime.shards).",
+    )
     args = parser.parse_args(argv)
 
     orchestrator = PipelineOrchestrator(directory=args.directory, model_name=args.model_name)
     selected_phases = args.phases if args.phases else orchestrator.default_phases()
-    result = orchestrator.run_for_review(phases=selected_phases)
+    result = orchestrator.run_for_review(phases=selected_phases, shards=args.shards)
     logger.info("Review-run result: %s", result)
     return 0
 
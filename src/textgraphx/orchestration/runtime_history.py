@@ -85,6 +85,24 @@ class ExecutionHistory:
                 )
                 """
             )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS rule_metrics (
+                    run_id TEXT NOT NULL,
+                    phase TEXT NOT NULL,
+                    rule TEXT NOT NULL,
+                    calls INTEGER DEFAULT 0,
+                    duration_ms REAL NOT NULL,
+                    rows_affected INTEGER DEFAULT 0,
+                    db_hits INTEGER,
+                    counters TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS rule_metrics_rule ON rule_metrics (phase, rule)"
+            )
             conn.commit()
 
     def store_execution(self, record: ExecutionRecord) -> bool:
@@ -196,6 +214,77 @@ class ExecutionHistory:
             logger.error("Failed to retrieve statistics: %s", e)
         return {}
 
+    def store_rule_metrics(self, run_id: str, phase: str, rule_costs: List[Dict]) -> int:
+        """Store one phase run's per-rule costs (``RuleCostRecorder.summary()``)."""
+        rows = [
+            (
+                run_id,
+                phase,
+                cost["rule"],
+                int(cost.get("calls", 1)),
+                float(cost.get("duration_ms", 0.0)),
+                int(cost.get("rows_affected", 0)),
+                cost.get("db_hits"),
+                json.dumps(cost.get("counters", {})),
+            )
+            for cost in rule_costs
+        ]
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO rule_metrics (
+                        run_id, phase, rule, calls, duration_ms,
+                        rows_affected, db_hits, counters
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+                conn.commit()
+            return len(rows)
+        except Exception as e:
+            logger.error("Failed to store rule metrics: %s", e)
+        return 0
+
+    def rank_rules(self, limit: int = 20, phase: Optional[str] = None, order_by: str = "total_ms") -> List[Dict]:
+        """Rank rules by cost aggregated over every stored run.
+
+        ``order_by`` is one of ``total_ms``, ``avg_ms``, ``max_ms``,
+        ``rows_affected`` or ``db_hits``.
+        """
+        columns = ("total_ms", "avg_ms", "max_ms", "rows_affected", "db_hits")
+        if order_by not in columns:
+            raise ValueError(f"order_by must be one of {columns}")
+        where = "WHERE phase = ?" if phase else ""
+        params = ([phase] if phase else []) + [limit]
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.execute(
+                    f"""
+                    SELECT
+                        phase,
+                        rule,
+                        COUNT(DISTINCT run_id) AS runs,
+                        SUM(calls) AS calls,
+                        SUM(duration_ms) AS total_ms,
+                        AVG(duration_ms) AS avg_ms,
+                        MAX(duration_ms) AS max_ms,
+                        SUM(rows_affected) AS rows_affected,
+                        SUM(db_hits) AS db_hits
+                    FROM rule_metrics
+                    {where}
+                    GROUP BY phase, rule
+                    ORDER BY {order_by} DESC
+                    LIMIT ?
+                    """,
+                    params,
+                )
+                return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error("Failed to rank rules: %s", e)
+        return []
+
     def delete_old_records(self, days: int = 30) -> int:
         """Delete execution records older than specified days."""
         try:
@@ -207,6 +296,13 @@ class ExecutionHistory:
                     """,
                     (days,),
                 )
+                conn.execute(
+                    """
+                    DELETE FROM rule_metrics
+                    WHERE created_at < datetime('now', '-' || ? || ' days')
+                    """,
+                    (days,),
+                )
                 conn.commit()
                 deleted = cursor.rowcount
                 logger.info("Deleted %s old execution records", deleted)
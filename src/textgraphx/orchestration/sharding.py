@@ -0,0 +1,206 @@
+"""Document-sharded execution of the per-document phase chain.
+
+``PipelineOrchestrator.run_sharded`` splits the dataset into shards and runs
+the leading per-document phases (:data:`SHARDABLE_PHASES`) of every shard in a
+separate worker process. Each worker builds its own orchestrator, Neo4j driver
+and configuration (with ``paths.output_dir`` pointing at
+``<output_dir>/shards/shard-<i>-of-<n>``) and runs the chain inside a
+:func:`~textgraphx.pipeline.runtime.document_scope.document_scope`, so the
+scope-aware phases only touch the shard's documents. Ingestion adds the
+documents it reads to the scope; a chain without ingestion starts from the
+ids the parent resolved from the shard's files (:func:`resolve_shard_doc_ids`). Cross-document work
+(fusion, global phase assertions) and the remaining corpus-wide phases are run
+once by the parent after every shard finished.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Phases whose wrappers can be restricted to a document scope.
+SHARDABLE_PHASES = ("ingestion", "refinement", "temporal", "event_enrichment")
+
+
+@dataclass
+class ShardSpec:
+    """Work order of one shard worker."""
+
+    index: int
+    count: int
+    files: List[str]
+    phases: List[str]
+    model_name: str
+    output_dir: str
+    execution_id: str = ""
+    # Documents the scope starts with. Needed when the chain has no ingestion
+    # phase, since only ingestion adds documents to the scope.
+    doc_ids: List[str] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        return f"shard-{self.index}-of-{self.count}"
+
+
+@dataclass
+class ShardResult:
+    """What a shard worker reports back to the parent orchestrator."""
+
+    index: int
+    files: List[str]
+    phases: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    doc_ids: List[str] = field(default_factory=list)
+    changed_doc_ids: List[Any] = field(default_factory=list)
+    unchanged_doc_ids: List[Any] = field(default_factory=list)
+    error: str = ""
+
+
+def split_phases(phases: Sequence[str]) -> Tuple[List[str], List[str]]:
+    """Split *phases* into the shardable leading chain and the global rest."""
+    phases = list(phases)
+    cut = 0
+    while cut < len(phases) and phases[cut] in SHARDABLE_PHASES:
+        cut += 1
+    return phases[:cut], phases[cut:]
+
+
+def partition_files(files: Sequence[Path], shards: int) -> List[List[Path]]:
+    """Deal *files* round-robin into at most *shards* non-empty shards."""
+    shards = max(1, int(shards))
+    buckets: List[List[Path]] = [[] for _ in range(shards)]
+    for position, path in enumerate(files):
+        buckets[position % shards].append(path)
+    return [bucket for bucket in buckets if bucket]
+
+
+def resolve_shard_doc_ids(files: Sequence[str]) -> Optional[List[str]]:
+    """Return the ``AnnotatedText.id`` of every file, or ``None`` if one is unknowable.
+
+    Ids come from the NAF ``publicId`` like in ingestion. A file without a
+    numeric ``publicId`` got a fallback id that depends on the graph at
+    ingestion time, so it cannot be resolved from the file alone.
+    """
+    import xml.etree.ElementTree as ET
+
+    from textgraphx.text_processing_components.DocumentImporter import resolve_document_id_from_naf_root
+
+    doc_ids: List[str] = []
+    for path in files:
+        try:
+            root = ET.parse(path).getroot()
+        except (ET.ParseError, OSError):
+            logger.warning("Cannot read %s to resolve its document id", path)
+            return None
+        doc_id = resolve_document_id_from_naf_root(root, None)
+        if not isinstance(doc_id, int):
+            return None
+        doc_ids.append(str(doc_id))
+    return doc_ids
+
+
+def build_shard_directory(files: Sequence[str], target: Path) -> Path:
+    """(Re)create *target* holding links to *files*; copies where links fail."""
+    target = Path(target)
+    if target.exists():
+        shutil.rmtree(target)
+    target.mkdir(parents=True)
+    for source in files:
+        source = Path(source)
+        link = target / source.name
+        try:
+            link.symlink_to(source)
+        except OSError:
+            shutil.copy2(source, link)
+    return target
+
+
+def run_shard(spec: ShardSpec) -> ShardResult:
+    """Worker entry point: run ``spec.phases`` over the shard's documents.
+
+    Runs in a fresh (spawned) process, so the configuration, driver and
+    document scope set up here never leak into the parent.
+    """
+    from textgraphx.adapters.srl_response_store import srl_store_path
+    from textgraphx.infrastructure import config as config_module
+
+    # Resolved against the parent's output directory, so every shard shares
+    # one persistent SRL response store.
+    os.environ.setdefault("TEXTGRAPHX_SRL_CACHE_PATH", srl_store_path())
+    os.environ["TEXTGRAPHX_OUTPUT_DIR"] = spec.output_dir
+
+    config_module._CACHED = None
+
+    from textgraphx.orchestration.orchestrator import PipelineOrchestrator
+    from textgraphx.pipeline.ingestion.ingestion_manifest import manifest_path, read_manifest
+    from textgraphx.pipeline.runtime.document_scope import document_scope
+
+    result = ShardResult(index=spec.index, files=list(spec.files))
+    if "ingestion" not in spec.phases and not spec.doc_ids:
+        # An empty scope would make every scope-aware phase a silent no-op.
+        result.error = f"ValueError: shard {spec.name} has no ingestion phase and no document ids"
+        logger.error("Shard %s failed: %s", spec.name, result.error)
+        return result
+    shard_dir = build_shard_directory(spec.files, Path(spec.output_dir) / "dataset")
+    orchestrator = PipelineOrchestrator(directory=str(shard_dir), model_name=spec.model_name)
+    if spec.execution_id:
+        orchestrator.execution_id = f"{spec.execution_id}:{spec.name}"
+        orchestrator.summary.execution_id = orchestrator.execution_id
+    # Assertions inside a shard see the whole (concurrently written) graph;
+    # the parent applies the gate to its global assertions instead.
+    orchestrator.strict_transition_gate = False
+
+    with document_scope(spec.doc_ids) as scope:
+        try:
+            orchestrator.run_selected(list(spec.phases))
+        except Exception as exc:
+            result.error = f"{type(exc).__name__}: {exc}"
+            logger.error("Shard %s failed: %s", spec.name, result.error)
+        result.doc_ids = sorted(scope)
+
+    for name, phase in orchestrator.summary.phases.items():
+        result.phases[name] = {
+            "status": phase.status,
+            "duration": phase.duration,
+            "documents_processed": phase.documents_processed,
+            "provenance_violations": phase.provenance_violations,
+            "error": phase.error,
+        }
+    manifest = read_manifest(manifest_path(spec.output_dir))
+    if manifest is not None:
+        result.changed_doc_ids = list(manifest.changed_doc_ids)
+        result.unchanged_doc_ids = list(manifest.unchanged_doc_ids)
+    return result
+
+
+def execute_shards(specs: Sequence[ShardSpec], workers: int = 0) -> List[ShardResult]:
+    """Run every shard in a spawned worker process; results in shard order."""
+    if not specs:
+        return []
+    workers = int(workers) if workers and int(workers) > 0 else len(specs)
+    workers = min(workers, len(specs))
+    context = multiprocessing.get_context("spawn")
+    results: List[ShardResult] = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [pool.submit(run_shard, spec) for spec in specs]
+        for spec, future in zip(specs, futures):
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                # The worker died before it could report (e.g. a crashed process).
+                logger.error("Shard %s worker crashed: %s", spec.name, exc)
+                results.append(
+                    ShardResult(
+                        index=spec.index,
+                        files=list(spec.files),
+                        error=f"{type(exc).__name__}: {exc}",
+                    )
+                )
+    return results
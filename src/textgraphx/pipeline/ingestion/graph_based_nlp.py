@@ -16,6 +16,14 @@ from spacy.tokens import Doc, Token, Span
 from textgraphx.util.RestCaller import callAllenNlpApi
 from textgraphx.util.GraphDbBase import GraphDBBase
 from textgraphx.pipeline.ingestion.text_processor import TextProcessor
+from textgraphx.pipeline.ingestion.staged_pipeline import Stage, StagedPipeline
+from textgraphx.pipeline.runtime.document_scope import active_document_scope, extend_document_scope
+from textgraphx.pipeline.ingestion.ingestion_manifest import (
+    IngestionManifest,
+    content_hash,
+    pipeline_version,
+    write_manifest,
+)
 import xml.etree.ElementTree as ET
 if not hasattr(spacy, "__path__"):
     try:
@@ -259,15 +267,27 @@ class GraphBasedNLP(GraphDBBase):
     def store_corpus(self, directory):
         
         # Keep ingestion deterministic for reproducible multi-document runs.
-        existing_ids_query = "MATCH (n:AnnotatedText) RETURN n.id AS id"
+        existing_ids_query = "MATCH (n:AnnotatedText) RETURN n.id AS id, n.content_hash AS content_hash"
         existing = self.neo4j_repository.execute_query(query=existing_ids_query, params={})
         used_doc_ids = set()
+        existing_hashes = {}
         for row in existing or []:
             raw_id = row.get("id")
             if isinstance(raw_id, int):
                 used_doc_ids.add(raw_id)
             elif isinstance(raw_id, str) and raw_id.isdigit():
                 used_doc_ids.add(int(raw_id))
+            else:
+                continue
+            existing_hashes[int(raw_id)] = row.get("content_hash")
+
+        # Incremental mode: files whose content hash is unchanged are skipped
+        # and only new/modified documents are handed to downstream phases.
+        incremental = bool(get_config().runtime.incremental_ingestion)
+        version = pipeline_version(self._model_label(), self._naf_sentence_mode)
+        changed_doc_ids = []
+        unchanged_doc_ids = []
+        corpus_doc_ids = []
         
         # Initialize the list of text tuples
         text_tuples = []
@@ -300,6 +320,7 @@ class GraphBasedNLP(GraphDBBase):
                         )
                         resolved_text_id = stable_fallback_id
                     used_doc_ids.add(resolved_text_id)
+                    corpus_doc_ids.append(resolved_text_id)
 
                     # Extract text and normalize it for robust sentence segmentation.
                     text = root[1].text if len(root) > 1 else ""
@@ -315,6 +336,15 @@ class GraphBasedNLP(GraphDBBase):
                     text_file = open(directory+'/'+filename, 'r')
                     data = text_file.read()
                     text_file.close()
+
+                    if incremental:
+                        digest = content_hash(data, version)
+                        if existing_hashes.get(resolved_text_id) == digest:
+                            logger.info("Unchanged document %s (%s); skipping", resolved_text_id, filename)
+                            unchanged_doc_ids.append(resolved_text_id)
+                            continue
+                        if resolved_text_id in existing_hashes:
+                            self._purge_document_layers(resolved_text_id)
                     
                     # Create an annotated text object
                     # # Usage
@@ -329,7 +359,18 @@ class GraphBasedNLP(GraphDBBase):
                     # if document_importer:
                     #     document_importer.import_document()
                     document_importer = MeantimeXMLImporter(resolved_text_id, data, text, self.neo4j_repository)
-                    document_importer.import_document()
+                    imported = document_importer.import_document()
+                    # The importer swallows query errors, so only a returned
+                    # row proves the document was written; otherwise the old
+                    # hash stays and the next run retries it. The new hash is
+                    # only pending until process_text has written the
+                    # document's annotation layers.
+                    if incremental and imported:
+                        self.neo4j_repository.execute_query(
+                            self.CONTENT_HASH_QUERY,
+                            {"id": resolved_text_id, "content_hash": digest, "pipeline_version": version},
+                        )
+                        changed_doc_ids.append(resolved_text_id)
                     #self.__text_processor.create_annotated_text(data, text, text_id)
                     
                 except Exception as e:
@@ -339,9 +380,89 @@ class GraphBasedNLP(GraphDBBase):
                # text_tuples.append(self.__text_processor.get_annotated_text())
         #text_tuples = tuple(self.__text_processor.get_annotated_text())
         text_tuples = tuple(self.neo4j_repository.get_all_annotated_text_docs())
+        if incremental:
+            write_manifest(IngestionManifest(
+                pipeline_version=version,
+                changed_doc_ids=changed_doc_ids,
+                unchanged_doc_ids=unchanged_doc_ids,
+            ))
+            changed = {str(doc_id) for doc_id in changed_doc_ids}
+            text_tuples = tuple(t for t in text_tuples if str(t[1].get("text_id")) in changed)
+        if active_document_scope() is not None:
+            # Document-scoped (sharded) run: only this directory's documents
+            # are processed here and by the scope-aware phases that follow.
+            in_corpus = {str(doc_id) for doc_id in (changed_doc_ids if incremental else corpus_doc_ids)}
+            extend_document_scope(in_corpus)
+            text_tuples = tuple(t for t in text_tuples if str(t[1].get("text_id")) in in_corpus)
         # Return the list of text tuples
         return tuple(text_tuples)
 
+    # Without ``content_hash`` the document counts as changed on the next run,
+    # so one whose processing fails is retried instead of skipped.
+    CONTENT_HASH_QUERY = """
+        MATCH (at:AnnotatedText {id: $id})
+        SET at.pending_content_hash = $content_hash, at.pipeline_version = $pipeline_version
+        REMOVE at.content_hash, at.refined_at, at.tlinked_at
+    """
+
+    COMMIT_CONTENT_HASH_QUERY = """
+        MATCH (at:AnnotatedText {id: $id})
+        WHERE at.pending_content_hash IS NOT NULL
+        SET at.content_hash = at.pending_content_hash
+        REMOVE at.pending_content_hash
+    """
+
+    # Labels of the per-document nodes that carry ``doc_id``; each has a
+    # ``doc_id`` index (schema migrations 0007-0026), so the purge seeks on
+    # the index instead of scanning every node.
+    DOC_ID_LABELS = (
+        "TEvent",
+        "TIMEX",
+        "EventMention",
+        "EntityMention",
+        "TimexMention",
+        "Mention",
+        "Signal",
+        "VALUE",
+        "SRLTimexCandidate",
+    )
+
+    # A modified document is re-ingested from scratch: its sentence/token layer,
+    # the per-document nodes attached to its tokens and the nodes carrying its
+    # doc_id are removed. Shared nodes (lemma Tags, canonical Entities) stay.
+    PURGE_DOCUMENT_QUERIES = (
+        """
+        MATCH (:AnnotatedText {id: $doc_id})-[:CONTAINS_SENTENCE]->(:Sentence)-[:HAS_TOKEN]->(t:TagOccurrence)
+        MATCH (t)--(x)
+        WHERE NOT x:TagOccurrence AND NOT x:Sentence AND NOT x:Tag AND NOT x:Entity AND NOT x:AnnotatedText
+        DETACH DELETE x
+        """,
+        """
+        MATCH (:AnnotatedText {id: $doc_id})-[:CONTAINS_SENTENCE]->(s:Sentence)
+        OPTIONAL MATCH (s)-[:HAS_TOKEN]->(t:TagOccurrence)
+        DETACH DELETE s, t
+        """,
+    ) + tuple(
+        f"""
+        MATCH (n:{label})
+        WHERE n.doc_id IN [$doc_id, toString($doc_id)]
+        DETACH DELETE n
+        """
+        for label in DOC_ID_LABELS
+    )
+
+    def _purge_document_layers(self, doc_id):
+        """Remove the derived graph of a modified document before re-ingesting it."""
+        logger.info("Document %s changed; removing its previous annotation layers", doc_id)
+        for query in self.PURGE_DOCUMENT_QUERIES:
+            self.neo4j_repository.execute_query(query, {"doc_id": doc_id})
+
+    def _model_label(self):
+        meta = getattr(getattr(self, "nlp", None), "meta", None) or {}
+        if meta.get("name"):
+            return f"{meta.get('lang', '')}_{meta['name']}-{meta.get('version', '')}"
+        return "unknown-model"
+
     @staticmethod
     def _stable_fallback_doc_id(filename, used_ids):
         # Use a deterministic integer id derived from filename and avoid collisions.
@@ -357,126 +478,218 @@ class GraphBasedNLP(GraphDBBase):
 
     # Tokenizes and stores the given text tuples
     def process_text(self, text_tuples, text_id, storeTag):
+        """Parse *text_tuples* with spaCy and write every document to the graph.
+
+        Documents are streamed: each one moves on as soon as it leaves
+        ``nlp.pipe`` instead of after the whole corpus is parsed. With
+        ``ingestion.stream_queue_size`` > 0 a :class:`StagedPipeline` runs
+        parse -> remote services (WSD, nominal SRL, coreference; on
+        ``ingestion.remote_workers`` threads) -> graph writes (one thread,
+        document order) behind queues of that size, so inference, HTTP calls
+        and Neo4j I/O overlap while memory stays bounded. Per-stage queue
+        depth and utilisation are kept in ``last_pipeline_stats``.
+
+        Returns:
+            int: The number of documents written.
+        """
         # Check if the Doc object has a text_id extension
         if not Doc.has_extension("text_id"):
             # Set the text_id extension
             Doc.set_extension("text_id", default=None)
 
+        ingestion = get_config().ingestion
+        pipe_kwargs = {"as_tuples": True, "batch_size": max(1, ingestion.pipe_batch_size)}
+        if ingestion.pipe_n_process > 1:
+            pipe_kwargs["n_process"] = ingestion.pipe_n_process
+
         # Pipe the text tuples through the model
-        doc_tuples = self.nlp.pipe(text_tuples, as_tuples=True)
-        
-        # Initialize the list of documents
-        docs = []
-        
-        # Iterate over each document and context
-        for doc, context in doc_tuples:
-            # Set the text_id attribute of the document
-            doc._.text_id = context["text_id"]
-            
-            # Append the document to the list of documents
-            docs.append(doc)
+        doc_tuples = self.nlp.pipe(text_tuples, **pipe_kwargs)
+
+        def _parsed_docs():
+            for doc, context in doc_tuples:
+                # Set the text_id attribute of the document
+                doc._.text_id = context["text_id"]
+                yield doc
+
+        if ingestion.stream_queue_size <= 0:
+            written = 0
+            for doc in _parsed_docs():
+                self._write_document(doc, storeTag)
+                written += 1
+            return written
+
+        pipeline = StagedPipeline([
+            Stage(
+                "remote",
+                lambda doc: (doc, self._prefetch_remote(doc)),
+                workers=ingestion.remote_workers,
+                queue_size=ingestion.stream_queue_size,
+            ),
+            Stage(
+                "write",
+                lambda item: self._write_document(item[0], storeTag, prefetched=item[1]),
+                workers=1,
+                queue_size=ingestion.stream_queue_size,
+            ),
+        ])
+        try:
+            pipeline.run(_parsed_docs())
+        finally:
+            self.last_pipeline_stats = pipeline.stats()
+            logger.info("Ingestion pipeline stages: %s", self.last_pipeline_stats)
+        return self.last_pipeline_stats["write"]["processed"]
+
+    def _write_document(self, doc, storeTag, prefetched=None):
+        """Store *doc*, then commit the content hash ``store_corpus`` left pending."""
+        self._store_document(doc, storeTag, prefetched=prefetched)
+        repository = getattr(self, "neo4j_repository", None)
+        if repository is not None:
+            repository.execute_query(self.COMMIT_CONTENT_HASH_QUERY, {"id": doc._.text_id})
+
+    def _prefetch_remote(self, doc):
+        """Call the remote services for *doc* before its graph writes.
+
+        Returns a dict with the AMuSE-WSD responses (``wsd``), coreference
+        clusters (``coref``) and nominal SRL results (``nominal_srl``). A
+        service that fails here is left out and called again, as before, by
+        :meth:`_store_document`.
+        """
+        text_id = doc._.text_id
+        prefetched = {}
+        sents_list = list(doc.sents)
+        try:
+            fetch_senses = getattr(self.__text_processor.wsd, "fetch_senses", None)
+            if fetch_senses is not None:
+                prefetched["wsd"] = fetch_senses(
+                    [(str(text_id) + "_" + str(i), sent.text) for i, sent in enumerate(sents_list)]
+                )
+        except Exception:
+            logger.debug("WSD prefetch failed for doc %s; deferring to the write stage", text_id, exc_info=True)
+        try:
+            fetch_clusters = getattr(self.__text_processor.coref, "fetch_clusters", None)
+            if fetch_clusters is not None:
+                prefetched["coref"] = fetch_clusters(doc, text_id)
+        except Exception:
+            logger.debug("Coref prefetch failed for doc %s; deferring to the write stage", text_id, exc_info=True)
+        try:
+            prefetched["nominal_srl"] = self._nominal_srl_results(sents_list)
+        except Exception:
+            logger.debug("Nominal SRL prefetch failed for doc %s; deferring to the write stage", text_id, exc_info=True)
+        return prefetched
 
-        # Iterate over each document
-        for doc in docs:
-            # Get the text ID from the document
-            text_id = doc._.text_id
-            
-            # Process the sentences in the document
-            spans = self.__text_processor.process_sentences(doc._.text_id, doc, storeTag, text_id)
+    @staticmethod
+    def _nominal_srl_results(sents_list):
+        from textgraphx.adapters.rest_caller import callNominalSrlApiBatch
+
+        nom_responses = callNominalSrlApiBatch([s.text for s in sents_list])
+        return [
+            (sents_list[i].start, nom_responses[i])
+            for i in range(len(sents_list))
+            if nom_responses[i]
+        ]
 
+    def _store_document(self, doc, storeTag, prefetched=None):
+        """Write one parsed document and run the per-document enrichments.
 
-            # Perform word sense disambiguation
-           # wsd = self.__text_processor.perform_wsd(doc._.text_id)
-            
-            wsd = self.__text_processor.do_wsd(doc._.text_id)
+        *prefetched* holds remote-service results from :meth:`_prefetch_remote`;
+        services missing from it are called here.
+        """
+        prefetched = prefetched or {}
+        # Get the text ID from the document
+        text_id = doc._.text_id
 
-            # Assign synset information to tokens
-            #wn = self.__text_processor.assign_synset_info_to_tokens(doc._.text_id)
-            wn_token_enricher = self.__text_processor.wn_token_enricher.assign_synset_info_to_tokens(text_id)
-            # Process noun chunks
-            noun_chunks = self.__text_processor.process_noun_chunks(doc, text_id)
-            
-            # Process entities
-            nes = self.__text_processor.process_entities(doc, text_id)
-            
-            # Deduplicate named entities
-            #deduplicate = self.__text_processor.deduplicate_named_entities(text_id)
-            deduplicate = self.__text_processor.fuse_entities(text_id)
-            
-            # Perform coreference resolution
-            #coref = self.__text_processor.do_coref2(doc, text_id)
-            coref = self.__text_processor.coref.resolve_coreference(doc, text_id)
+        # Process the sentences in the document
+        spans = self.__text_processor.process_sentences(doc._.text_id, doc, storeTag, text_id)
 
 
-            # Build the entities inferred graph
-            #self.__text_processor.build_entities_inferred_graph(text_id)
-            self.__text_processor.disambiguate_entities(text_id)
+        # Perform word sense disambiguation
+       # wsd = self.__text_processor.perform_wsd(doc._.text_id)
 
+        if "wsd" in prefetched:
+            wsd = self.__text_processor.do_wsd(doc._.text_id, senses=prefetched["wsd"])
+        else:
+            wsd = self.__text_processor.do_wsd(doc._.text_id)
 
-            # Process SRL tags from spacy doc and store them into neo4j
-            #self.__text_processor.process_srl(doc)
-            self.__text_processor.srl_processor.process_srl(doc)
+        # Assign synset information to tokens
+        #wn = self.__text_processor.assign_synset_info_to_tokens(doc._.text_id)
+        wn_token_enricher = self.__text_processor.wn_token_enricher.assign_synset_info_to_tokens(text_id)
+        # Process noun chunks
+        noun_chunks = self.__text_processor.process_noun_chunks(doc, text_id)
 
-            # Optional: nominal SRL via the CogComp microservice. The call is a
-            # no-op when `services.nom_srl_url` is unset (callNominalSrlApiBatch
-            # returns [] of empty dicts in that case), so this block is safe to
-            # leave in by default.
-            try:
-                from textgraphx.adapters.rest_caller import callNominalSrlApiBatch
-                sents_list = list(doc.sents)
-                nom_responses = callNominalSrlApiBatch([s.text for s in sents_list])
-                nom_results = [
-                    (sents_list[i].start, nom_responses[i])
-                    for i in range(len(sents_list))
-                    if nom_responses[i]
-                ]
-                if nom_results:
-                    self.__text_processor.srl_processor.process_nominal_srl(
-                        doc, nom_results,
-                    )
-            except Exception:  # pragma: no cover - service is advisory
-                logger.exception("Nominal SRL pass failed; continuing without it")
+        # Process entities
+        nes = self.__text_processor.process_entities(doc, text_id)
 
-            # Cross-framework frame fusion: create ALIGNS_WITH edges between
-            # PROPBANK (verbal) and NOMBANK (nominal) frames that describe the
-            # same predicate situation.  This is an advisory-tier enrichment;
-            # failures must not abort the document.
-            try:
-                from textgraphx.adapters.srl_frame_aligner import (
-                    run_cross_framework_alignment,
-                )
-                _graph = self.__text_processor.srl_processor.graph
-                _aligned = run_cross_framework_alignment(_graph, text_id)
-                if _aligned:
-                    logger.debug(
-                        "Cross-framework alignment: %d ALIGNS_WITH edges for doc %s",
-                        _aligned, text_id,
-                    )
-            except Exception:  # pragma: no cover - advisory enrichment
-                logger.exception(
-                    "Cross-framework alignment failed for doc %s; continuing", text_id
-                )
-            # Define the rules for relationship extraction
-            rules = [
-                {
-                    'type': 'RECEIVE_PRIZE',
-                    'verbs': ['receive'],
-                    'subjectTypes': ['PERSON', 'NP'],
-                    'objectTypes': ['WORK_OF_ART']
-                }
-            ]
-            
-            # Extract relationships
-            self.__text_processor.extract_relationships(text_id, rules)
-            
-            # Build the relationships inferred graph
-            self.__text_processor.build_relationships_inferred_graph(text_id)
+        # Deduplicate named entities
+        #deduplicate = self.__text_processor.deduplicate_named_entities(text_id)
+        deduplicate = self.__text_processor.fuse_entities(text_id)
+
+        # Perform coreference resolution
+        #coref = self.__text_processor.do_coref2(doc, text_id)
+        if "coref" in prefetched:
+            coref = self.__text_processor.coref.resolve_coreference(doc, text_id, clusters=prefetched["coref"])
+        else:
+            coref = self.__text_processor.coref.resolve_coreference(doc, text_id)
 
 
+        # Build the entities inferred graph
+        #self.__text_processor.build_entities_inferred_graph(text_id)
+        self.__text_processor.disambiguate_entities(text_id)
 
 
+        # Process SRL tags from spacy doc and store them into neo4j
+        #self.__text_processor.process_srl(doc)
+        self.__text_processor.srl_processor.process_srl(doc)
+
+        # Optional: nominal SRL via the CogComp microservice. The call is a
+        # no-op when `services.nom_srl_url` is unset (callNominalSrlApiBatch
+        # returns [] of empty dicts in that case), so this block is safe to
+        # leave in by default.
+        try:
+            if "nominal_srl" in prefetched:
+                nom_results = prefetched["nominal_srl"]
+            else:
+                nom_results = self._nominal_srl_results(list(doc.sents))
+            if nom_results:
+                self.__text_processor.srl_processor.process_nominal_srl(
+                    doc, nom_results,
+                )
+        except Exception:  # pragma: no cover - service is advisory
+            logger.exception("Nominal SRL pass failed; continuing without it")
+
+        # Cross-framework frame fusion: create ALIGNS_WITH edges between
+        # PROPBANK (verbal) and NOMBANK (nominal) frames that describe the
+        # same predicate situation.  This is an advisory-tier enrichment;
+        # failures must not abort the document.
+        try:
+            from textgraphx.adapters.srl_frame_aligner import (
+                run_cross_framework_alignment,
+            )
+            _graph = self.__text_processor.srl_processor.graph
+            _aligned = run_cross_framework_alignment(_graph, text_id)
+            if _aligned:
+                logger.debug(
+                    "Cross-framework alignment: %d ALIGNS_WITH edges for doc %s",
+                    _aligned, text_id,
+                )
+        except Exception:  # pragma: no cover - advisory enrichment
+            logger.exception(
+                "Cross-framework alignment failed for doc %s; continuing", text_id
+            )
+        # Define the rules for relationship extraction
+        rules = [
+            {
+                'type': 'RECEIVE_PRIZE',
+                'verbs': ['receive'],
+                'subjectTypes': ['PERSON', 'NP'],
+                'objectTypes': ['WORK_OF_ART']
+            }
+        ]
 
+        # Extract relationships
+        self.__text_processor.extract_relationships(text_id, rules)
 
+        # Build the relationships inferred graph
+        self.__text_processor.build_relationships_inferred_graph(text_id)
 
     def execute_cypher_query(self, query):
         try:
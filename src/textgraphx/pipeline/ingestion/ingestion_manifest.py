@@ -0,0 +1,117 @@
+"""Content hashes and the changed-document manifest for incremental ingestion.
+
+With ``runtime.incremental_ingestion`` enabled, ``GraphBasedNLP.store_corpus``
+stores a content hash (raw file content plus pipeline/model version) on every
+``AnnotatedText`` and skips files whose hash is unchanged. The hash is stored
+as ``pending_content_hash`` at import and only becomes ``content_hash`` once
+``process_text`` has written the document, so a document whose processing
+fails is picked up again by the next run. The ids of new or
+modified documents are written to a JSON manifest
+(``<paths.output_dir>/ingestion_manifest.json``) so later phases can restrict
+their work to that set with :func:`scope_to_changed_documents`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "ingestion_manifest.json"
+
+
+def pipeline_version(model_name: str, naf_sentence_mode: str = "") -> str:
+    """Return the version string folded into every content hash."""
+    try:
+        from textgraphx import __version__
+    except Exception:
+        __version__ = "unknown"
+    return f"textgraphx-{__version__}/{model_name}/{naf_sentence_mode}"
+
+
+def content_hash(raw_content: str, version: str) -> str:
+    """Return the SHA-256 of *raw_content* combined with the pipeline *version*."""
+    digest = hashlib.sha256()
+    digest.update(version.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update((raw_content or "").encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass
+class IngestionManifest:
+    """Documents written (``changed``) and skipped (``unchanged``) by one ingestion run."""
+
+    pipeline_version: str
+    changed_doc_ids: List[int] = field(default_factory=list)
+    unchanged_doc_ids: List[int] = field(default_factory=list)
+    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+
+def manifest_path(output_dir: Optional[str] = None) -> Path:
+    if output_dir is None:
+        from textgraphx.infrastructure.config import get_config
+
+        output_dir = get_config().paths.output_dir
+    return Path(output_dir) / MANIFEST_FILENAME
+
+
+def write_manifest(manifest: IngestionManifest, path: Optional[Path] = None) -> Path:
+    path = Path(path) if path is not None else manifest_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(asdict(manifest), indent=2), encoding="utf-8")
+    logger.info(
+        "Ingestion manifest %s: %d changed, %d unchanged document(s)",
+        path, len(manifest.changed_doc_ids), len(manifest.unchanged_doc_ids),
+    )
+    return path
+
+
+def read_manifest(path: Optional[Path] = None) -> Optional[IngestionManifest]:
+    path = Path(path) if path is not None else manifest_path()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.warning("Ignoring unreadable ingestion manifest %s", path, exc_info=True)
+        return None
+    return IngestionManifest(
+        pipeline_version=data.get("pipeline_version", ""),
+        changed_doc_ids=list(data.get("changed_doc_ids") or []),
+        unchanged_doc_ids=list(data.get("unchanged_doc_ids") or []),
+        created_at=data.get("created_at", ""),
+    )
+
+
+def changed_document_ids() -> Optional[List[int]]:
+    """Return the changed set of the last incremental ingestion run.
+
+    ``None`` means "no restriction": incremental ingestion is disabled or no
+    manifest has been written yet.
+    """
+    try:
+        from textgraphx.infrastructure.config import get_config
+
+        if not bool(get_config().runtime.incremental_ingestion):
+            return None
+    except Exception:
+        return None
+    manifest = read_manifest()
+    return None if manifest is None else manifest.changed_doc_ids
+
+
+def scope_to_changed_documents(doc_ids: Iterable) -> list:
+    """Keep the members of *doc_ids* in the changed set (all of them when unrestricted)."""
+    doc_ids = list(doc_ids)
+    changed = changed_document_ids()
+    if changed is None:
+        return doc_ids
+    wanted = {str(doc_id) for doc_id in changed}
+    return [doc_id for doc_id in doc_ids if str(doc_id) in wanted]
@@ -0,0 +1,181 @@
+"""Bounded, order-preserving multi-stage pipeline for document ingestion.
+
+``StagedPipeline`` runs a source iterator through a chain of stages. Every
+stage owns a worker pool and a bounded input queue, so a slow stage applies
+back-pressure to the ones before it instead of letting work pile up in memory.
+Items leave every stage in source order, even when the stage has several
+workers, so the last (usually single-worker) stage sees documents in the order
+they were parsed.
+
+The ingestion pipeline uses three stages: spaCy parsing (the source), remote
+services (WSD, nominal SRL, coreference) and graph writes. Per-stage queue
+depth and worker utilisation are available from :meth:`StagedPipeline.stats`.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """One pipeline stage: ``fn(item) -> item`` run by ``workers`` threads."""
+
+    name: str
+    fn: Callable[[Any], Any]
+    workers: int = 1
+    queue_size: int = 2
+
+
+class _StageRuntime:
+    def __init__(self, stage: Stage):
+        self.stage = stage
+        self.workers = max(1, int(stage.workers))
+        self.inbox: queue.Queue = queue.Queue(maxsize=max(1, int(stage.queue_size)))
+        self.lock = threading.Lock()
+        self.processed = 0
+        self.busy_seconds = 0.0
+        self.max_queue_depth = 0
+        # Reorder buffer: results wait here until every earlier item is released.
+        self.pending: Dict[int, Any] = {}
+        self.next_seq = 0
+        self.threads: List[threading.Thread] = []
+
+    def observe_depth(self) -> None:
+        depth = self.inbox.qsize()
+        with self.lock:
+            if depth > self.max_queue_depth:
+                self.max_queue_depth = depth
+
+
+class StagedPipeline:
+    """Run items through *stages* with bounded queues, preserving source order."""
+
+    def __init__(self, stages: Iterable[Stage]):
+        self._stages = [_StageRuntime(stage) for stage in stages]
+        if not self._stages:
+            raise ValueError("StagedPipeline needs at least one stage")
+        self._failure: List[BaseException] = []
+        self._failure_lock = threading.Lock()
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._source_items = 0
+
+    def _fail(self, exc: BaseException) -> None:
+        with self._failure_lock:
+            if not self._failure:
+                self._failure.append(exc)
+
+    def _release(self, index: int, seq: int, item: Any) -> None:
+        """Hand *item* to the next stage once every earlier item has gone."""
+        runtime = self._stages[index]
+        with runtime.lock:
+            runtime.pending[seq] = item
+            ready = []
+            while runtime.next_seq in runtime.pending:
+                ready.append((runtime.next_seq, runtime.pending.pop(runtime.next_seq)))
+                runtime.next_seq += 1
+            # Keep the put under the lock so releases never overtake each other.
+            if index + 1 < len(self._stages):
+                successor = self._stages[index + 1]
+                for ready_seq, ready_item in ready:
+                    successor.inbox.put((ready_seq, ready_item))
+                    successor.observe_depth()
+
+    def _worker(self, index: int) -> None:
+        runtime = self._stages[index]
+        while True:
+            entry = runtime.inbox.get()
+            if entry is _DONE:
+                return
+            seq, item = entry
+            if self._failure:
+                # Drain without working so upstream producers never block.
+                self._release(index, seq, None)
+                continue
+            started = time.perf_counter()
+            try:
+                result = runtime.stage.fn(item)
+            except BaseException as exc:
+                logger.exception("Pipeline stage %r failed", runtime.stage.name)
+                self._fail(exc)
+                result = None
+            elapsed = time.perf_counter() - started
+            with runtime.lock:
+                runtime.processed += 1
+                runtime.busy_seconds += elapsed
+            self._release(index, seq, result)
+
+    def run(self, source: Iterable[Any]) -> int:
+        """Feed every item of *source* through the stages.
+
+        Returns:
+            The number of source items consumed.
+
+        Raises:
+            The first exception raised by a stage, after all workers stopped.
+        """
+        self._started_at = time.perf_counter()
+        for index, runtime in enumerate(self._stages):
+            for n in range(runtime.workers):
+                thread = threading.Thread(
+                    target=self._worker,
+                    args=(index,),
+                    name=f"textgraphx-{runtime.stage.name}-{n}",
+                    daemon=True,
+                )
+                thread.start()
+                runtime.threads.append(thread)
+
+        first = self._stages[0]
+        try:
+            for item in source:
+                if self._failure:
+                    break
+                first.inbox.put((self._source_items, item))
+                first.observe_depth()
+                self._source_items += 1
+        except BaseException as exc:
+            self._fail(exc)
+        finally:
+            # Stop stages front to back: a stage's last results are released
+            # before its successor receives the end-of-input markers.
+            for runtime in self._stages:
+                for _ in runtime.threads:
+                    runtime.inbox.put(_DONE)
+                for thread in runtime.threads:
+                    thread.join()
+            self._finished_at = time.perf_counter()
+
+        if self._failure:
+            raise self._failure[0]
+        return self._source_items
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-stage processed count, busy time, utilisation and queue depth."""
+        if self._started_at is None:
+            wall = 0.0
+        else:
+            wall = (self._finished_at or time.perf_counter()) - self._started_at
+        report = {}
+        for runtime in self._stages:
+            with runtime.lock:
+                capacity = wall * runtime.workers
+                report[runtime.stage.name] = {
+                    "workers": runtime.workers,
+                    "processed": runtime.processed,
+                    "busy_seconds": round(runtime.busy_seconds, 6),
+                    "utilization": round(runtime.busy_seconds / capacity, 4) if capacity > 0 else 0.0,
+                    "queue_depth": runtime.inbox.qsize(),
+                    "max_queue_depth": runtime.max_queue_depth,
+                }
+        return report
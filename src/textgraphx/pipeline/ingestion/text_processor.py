@@ -74,6 +74,7 @@ from functools import reduce  # Import reduce function
 import logging
 from typing import List, Dict
 from textgraphx.text_processing_components.pipeline import component_factory
+from textgraphx.database.connection_manager import Neo4jConnectionManager, shared_manager_for
 import logging
 
 # module logger
@@ -141,32 +142,43 @@ class TextProcessor(object):
         self.entity_processor = components.entity_processor
         self.entity_fuser = components.entity_fuser
         self.entity_disambiguator = components.entity_disambiguator
+        self.document_token_writer = getattr(components, "document_token_writer", None)
+        if self.document_token_writer is None:
+            from textgraphx.text_processing_components.DocumentTokenWriter import DocumentTokenWriter
+            self.document_token_writer = DocumentTokenWriter(
+                self.neo4j_repository,
+                self.tag_occurrence_creator,
+                self.tag_occurrence_dependency_processor,
+            )
         
         # Pluggable stage placeholders for Item 6
         self.tokenizer = None
         self.tagger = None
         self.parser = None
         self.ner = None
-    def do_wsd(self, textId: str) -> None:
+    def do_wsd(self, textId: str, senses=None) -> None:
         """Run word-sense disambiguation for the given document id.
 
         Args:
             textId: Identifier of the AnnotatedText document in Neo4j.
+            senses: Optional AMuSE-WSD responses prefetched by the ingestion
+                pipeline, keyed by sentence id.
         """
-        self.wsd.perform_wsd(textId)
+        if senses is None:
+            self.wsd.perform_wsd(textId)
+        else:
+            self.wsd.perform_wsd(textId, senses=senses)
 
     def process_sentences(self, annotated_text, doc, storeTag, text_id):
-        i = 0
-        for sentence in doc.sents:
-            sentence_id = self.sentence_creator.create_sentence_node(annotated_text, text_id, i, sentence)
-            sentence_id = sentence_id[0]
-            tag_occurrences = self.tag_occurrence_creator.create_tag_occurrences(sentence, text_id, i)
-            self.tag_occurrence_query_executor.execute_tag_occurrence_query(tag_occurrences, sentence_id)
-            tag_occurrences = self.tag_occurrence_dependency_processor.create_tag_occurrence_dependencies(sentence, text_id, i)
-            self.tag_occurrence_dependency_processor.process_dependencies(tag_occurrences)
-            i += 1
-        return tag_occurrences
-    
+        """Write the sentence/token layer of *doc* in a single transaction.
+
+        All Sentence, TagOccurrence, HAS_TOKEN, HAS_NEXT, IS_DEPENDENT (and,
+        when ``storeTag`` is set, HAS_LEMMA) rows are committed together by
+        :class:`DocumentTokenWriter`; a failure rolls the document back and
+        re-raises. Returns the document's dependency rows.
+        """
+        payload = self.document_token_writer.write_document(annotated_text, doc, text_id, store_tag=storeTag)
+        return payload["dependencies"]
 
     def process_entities(self, document_id, nes):
         self.entity_processor.process_entities(document_id,nes)
@@ -687,8 +699,17 @@ def filter_extended_spans(items):
 
 
 class Neo4jRepository:
+    """Execute parameterized Cypher for the ingestion components.
+
+    Queries go through a :class:`Neo4jConnectionManager`: the process-wide one
+    when *driver* is the shared driver, otherwise a private manager around the
+    caller's driver. Either way each thread reuses its own session instead of
+    opening one per query.
+    """
+
     def __init__(self, driver):
         self._driver = driver
+        self._manager = shared_manager_for(driver) or Neo4jConnectionManager(driver, owns_driver=False)
 
     def execute_query3(self, query, params=None):
         with self._driver.session() as session:
@@ -696,39 +717,41 @@ class Neo4jRepository:
             return result
         
     def execute_query(self, query, params):
-        session = None
-        results = []
-
         try:
-            session = self._driver.session()
-            response = session.run(query, params)
-            for item in response:
-                results.append(item)
+            return self._manager.run(query, params)
         except Exception as e:
             logger.exception("Query Failed: %s; query=%s; params=%r", e, query, params)
-        finally:
-            if session is not None:
-                session.close()
-        return results
+            return []
     
 
     def execute_query_with_result_as_key(self, query, params):
-        session = None
-        response = None
-        results = []
-
         try:
-            session = self._driver.session()
-            response =  session.run(query, params)
-            for items in response:
-                item = items["result"]
-                results.append(item)
+            return [items["result"] for items in self._manager.run(query, params)]
         except Exception as e:
             logger.exception("Query Failed: %s", e)
-        finally:
-            if session is not None:
-                session.close()
-        return results
+            return []
+
+    def execute_write_transaction(self, statements):
+        """Run ``(query, params)`` pairs in one explicit write transaction.
+
+        Unlike ``execute_query`` this does not swallow errors: on any failure
+        the transaction is rolled back and the exception re-raised, so either
+        every statement is committed or none is.
+
+        Returns:
+            The number of statements executed.
+        """
+        tx = self._manager.begin_transaction()
+        executed = 0
+        try:
+            for query, params in statements:
+                tx.run(query, params).consume()
+                executed += 1
+            tx.commit()
+        except Exception:
+            tx.rollback()
+            raise
+        return executed
     
     # def get_all_annotated_text_docs(self):
     #     query = "MATCH (n:AnnotatedText) RETURN n.text, n.id, n.creationtime"
@@ -30,6 +30,11 @@ from textgraphx.database.client import make_graph_from_config
 logger = logging.getLogger(__name__)
 
 
+def _scope_params(doc_ids):
+    """Query parameters of the doc-scoped GA variants (empty when unscoped)."""
+    return {} if doc_ids is None else {"doc_ids": list(doc_ids)}
+
+
 class GraphEnhancementsPhase:
     """Post-pipeline graph enhancement pass (pure Cypher, no external services)."""
 
@@ -243,11 +248,20 @@ class GraphEnhancementsPhase:
     # GA-05  Entity salience scoring
     # ------------------------------------------------------------------
 
-    def compute_entity_salience(self):
-        """Set Entity.salience from EVENT_PARTICIPANT and mention count."""
+    def compute_entity_salience(self, doc_ids=None):
+        """Set Entity.salience from EVENT_PARTICIPANT and mention count.
+
+        With ``doc_ids`` only entities mentioned in those documents are updated.
+        """
         logger.debug("compute_entity_salience")
-        query = """
-        MATCH (e:Entity)
+        if doc_ids is None:
+            scope = "MATCH (e:Entity)"
+        else:
+            scope = """
+        MATCH (seed:Mention)-[:REFERS_TO]->(e:Entity)
+        WHERE seed.doc_id IN $doc_ids
+        WITH DISTINCT e"""
+        query = scope + """
         OPTIONAL MATCH (e)<-[:EVENT_PARTICIPANT|PARTICIPANT]-(ev:TEvent)
         WITH e, count(DISTINCT ev) AS event_degree
         OPTIONAL MATCH (e)<-[:REFERS_TO]-(m)
@@ -261,43 +275,57 @@ class GraphEnhancementsPhase:
             e.salience_computed_at = timestamp()
         RETURN count(e) AS updated
         """
-        rows = self.graph.run(query).data()
+        rows = self.graph.run(query, _scope_params(doc_ids)).data()
         return rows[0].get("updated", 0) if rows else 0
 
     # ------------------------------------------------------------------
     # GA-06  Frame ALIGNS_WITH gap fill
     # ------------------------------------------------------------------
 
-    def fill_frame_aligns_with_gaps(self):
-        """Link PropBank and NomBank frames for the same TEvent by shared headLemma."""
+    def fill_frame_aligns_with_gaps(self, doc_ids=None):
+        """Link PropBank and NomBank frames for the same TEvent by shared headLemma.
+
+        Candidates are grouped per event (and so per document) instead of
+        pairing every PropBank frame with every NomBank frame in the graph.
+        With ``doc_ids`` only events of those documents (``TEvent.doc_id``
+        index) are visited.
+        """
         logger.debug("fill_frame_aligns_with_gaps")
-        query = """
-        MATCH (fv:Frame {framework:'PROPBANK'})
-        MATCH (fn:Frame {framework:'NOMBANK'})
-        WHERE fv.headLemma = fn.headLemma
-          AND fv.headLemma IS NOT NULL
+        scope = "MATCH (e:TEvent)" if doc_ids is None else "MATCH (e:TEvent) WHERE e.doc_id IN $doc_ids"
+        query = scope + """
+        MATCH (fv:Frame {framework:'PROPBANK'})-[:FRAME_DESCRIBES_EVENT|DESCRIBES]->(e)
+        WHERE fv.headLemma IS NOT NULL
+        MATCH (fn:Frame {framework:'NOMBANK'})-[:FRAME_DESCRIBES_EVENT|DESCRIBES]->(e)
+        WHERE fn.headLemma = fv.headLemma
           AND NOT EXISTS { MATCH (fv)-[:ALIGNS_WITH]->(fn) }
-        OPTIONAL MATCH (fv)-[:FRAME_DESCRIBES_EVENT|DESCRIBES]->(e:TEvent)
-        OPTIONAL MATCH (fn)-[:FRAME_DESCRIBES_EVENT|DESCRIBES]->(e)
-        WITH fv, fn, e WHERE e IS NOT NULL
+        WITH DISTINCT fv, fn
         MERGE (fv)-[aw:ALIGNS_WITH]->(fn)
         ON CREATE SET aw.source = 'headlemma_colocated',
                       aw.confidence = 0.70,
                       aw.evidence_source = 'graph_enhancements'
         RETURN count(aw) AS created
         """
-        rows = self.graph.run(query).data()
+        rows = self.graph.run(query, _scope_params(doc_ids)).data()
         return rows[0].get("created", 0) if rows else 0
 
     # ------------------------------------------------------------------
     # GA-07  Coreference chain quality signal
     # ------------------------------------------------------------------
 
-    def compute_coref_chain_quality(self):
-        """Set confidence on CorefChain nodes from mention and named-entity anchor counts."""
+    def compute_coref_chain_quality(self, doc_ids=None):
+        """Set confidence on CorefChain nodes from mention and named-entity anchor counts.
+
+        With ``doc_ids`` only chains with a mention in those documents are updated.
+        """
         logger.debug("compute_coref_chain_quality")
-        query = """
-        MATCH (chain:CorefChain)
+        if doc_ids is None:
+            scope = "MATCH (chain:CorefChain)"
+        else:
+            scope = """
+        MATCH (chain:CorefChain)-[:HAS_MENTION]->(seed:Mention)
+        WHERE seed.doc_id IN $doc_ids
+        WITH DISTINCT chain"""
+        query = scope + """
         OPTIONAL MATCH (chain)-[:HAS_MENTION]->(m)
         WITH chain, count(m) AS mention_count
         OPTIONAL MATCH (chain)-[:HAS_MENTION]->(m2)-[:REFERS_TO]->(ne:NamedEntity)
@@ -312,18 +340,28 @@ class GraphEnhancementsPhase:
             END
         RETURN count(chain) AS updated
         """
-        rows = self.graph.run(query).data()
+        rows = self.graph.run(query, _scope_params(doc_ids)).data()
         return rows[0].get("updated", 0) if rows else 0
 
     # ------------------------------------------------------------------
     # GA-08  Sentence root backfill (requires dep property on TagOccurrence)
     # ------------------------------------------------------------------
 
-    def backfill_sentence_roots(self):
-        """Set root_tok_id, root_lemma, root_upos on Sentence nodes from TagOccurrence.dep='ROOT'."""
+    def backfill_sentence_roots(self, doc_ids=None):
+        """Set root_tok_id, root_lemma, root_upos on Sentence nodes from TagOccurrence.dep='ROOT'.
+
+        With ``doc_ids`` only sentences of those documents are visited.
+        """
         logger.debug("backfill_sentence_roots")
-        query = """
-        MATCH (s:Sentence)-[:HAS_TOKEN]->(tok:TagOccurrence)
+        if doc_ids is None:
+            scope = "MATCH (s:Sentence)-[:HAS_TOKEN]->(tok:TagOccurrence)"
+        else:
+            scope = (
+                "MATCH (d:AnnotatedText)-[:CONTAINS_SENTENCE]->(s:Sentence)-[:HAS_TOKEN]->(tok:TagOccurrence)\n"
+                "        WHERE d.id IN $doc_ids"
+            )
+        query = scope + """
+        WITH s, tok
         WHERE tok.dep = 'ROOT'
           AND s.root_tok_id IS NULL
         SET s.root_tok_id = tok.id,
@@ -331,7 +369,7 @@ class GraphEnhancementsPhase:
             s.root_upos = tok.upos
         RETURN count(s) AS updated
         """
-        rows = self.graph.run(query).data()
+        rows = self.graph.run(query, _scope_params(doc_ids)).data()
         return rows[0].get("updated", 0) if rows else 0
 
     # ------------------------------------------------------------------
@@ -539,9 +577,12 @@ class GraphEnhancementsPhase:
     # Orchestration helper
     # ------------------------------------------------------------------
 
-    def run_all(self):
+    def run_all(self, doc_ids=None):
         """Run all graph enhancement algorithms in dependency order.
 
+        ``doc_ids`` restricts the doc-scoped algorithms (GA-05 to GA-08) to
+        those documents.
+
         Returns a dict of algorithm → count-of-changed-nodes/edges.
         """
         results = {}
@@ -562,16 +603,16 @@ class GraphEnhancementsPhase:
         results["ga04_timex_norm"] = self.normalize_timex_duration_values()
 
         # GA-05 — entity salience (after confidence marking)
-        results["ga05_salience"] = self.compute_entity_salience()
+        results["ga05_salience"] = self.compute_entity_salience(doc_ids)
 
         # GA-06 — frame alignment
-        results["ga06_aligns_with"] = self.fill_frame_aligns_with_gaps()
+        results["ga06_aligns_with"] = self.fill_frame_aligns_with_gaps(doc_ids)
 
         # GA-07 — coref quality
-        results["ga07_coref"] = self.compute_coref_chain_quality()
+        results["ga07_coref"] = self.compute_coref_chain_quality(doc_ids)
 
         # GA-08 — sentence roots (no-op if dep property absent)
-        results["ga08_sent_root"] = self.backfill_sentence_roots()
+        results["ga08_sent_root"] = self.backfill_sentence_roots(doc_ids)
 
         # GA-09 — participant mention bridge (±50-token window)
         results["ga09_participant_bridge"] = self.bridge_entity_participant_to_named_entity()
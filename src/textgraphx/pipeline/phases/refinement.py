@@ -36,11 +36,13 @@ from textgraphx.util.RestCaller import callAllenNlpApi
 from textgraphx.util.GraphDbBase import GraphDBBase
 import xml.etree.ElementTree as ET
 # py2neo removed: use bolt-driver wrapper via neo4j_client
+import contextlib
 import logging
 import warnings
 
 from textgraphx.database.client import make_graph_from_config
 from textgraphx.infrastructure.config import get_config
+from textgraphx.infrastructure.performance_profiler import RuleCostRecorder
 from textgraphx.utils.id_utils import make_entity_mention_uid
 
 logger = logging.getLogger(__name__)
@@ -178,18 +180,135 @@ class RefinementPhase():
             for method_name in methods:
                 yield family, method_name
 
-    def run_rule_family(self, family_name):
-        """Execute one refinement rule family by name."""
+    def run_rule_family(self, family_name, doc_ids=None):
+        """Execute one refinement rule family by name.
+
+        When ``doc_ids`` is given every rule query is anchored on those
+        ``AnnotatedText.id`` values for the duration of the family; otherwise
+        the current scope (see :meth:`set_doc_scope`) applies. Each rule is
+        timed as ``<family>.<method>`` on :attr:`rule_cost_recorder`.
+        """
         if family_name not in self.RULE_FAMILIES:
             raise ValueError(f"Unknown refinement rule family: {family_name}")
-        for method_name in self.RULE_FAMILIES[family_name]:
-            logger.info("Running refinement rule [%s]: %s", family_name, method_name)
-            getattr(self, method_name)()
-
-    def run_all_rule_families(self):
+        previous_scope = getattr(self, "_doc_scope", None)
+        if doc_ids is not None:
+            self.set_doc_scope(doc_ids)
+        recorder = getattr(self, "rule_cost_recorder", None)
+        try:
+            for method_name in self.RULE_FAMILIES[family_name]:
+                logger.info("Running refinement rule [%s]: %s", family_name, method_name)
+                timed = (
+                    recorder.rule(f"{family_name}.{method_name}")
+                    if recorder is not None
+                    else contextlib.nullcontext()
+                )
+                with timed:
+                    getattr(self, method_name)()
+        finally:
+            self._doc_scope = previous_scope
+
+    def run_all_rule_families(self, doc_ids=None):
         """Execute all configured refinement rule families in order."""
         for family_name in self.RULE_FAMILIES:
-            self.run_rule_family(family_name)
+            self.run_rule_family(family_name, doc_ids=doc_ids)
+
+    # Anchors prepended to a rule query when refinement is scoped to a set of
+    # documents. Each one binds the rule's own variable to nodes reachable from
+    # the scoped AnnotatedText ids, so the rule body runs unchanged but only
+    # expands from those documents instead of scanning the whole label.
+    _DOC_SCOPE_ANCHORS = {
+        # the rule starts from AnnotatedText itself
+        "doc": """
+            MATCH ({var}:AnnotatedText) WHERE {var}.id IN $doc_ids
+            WITH {var}
+        """,
+        # the rule starts from a TagOccurrence
+        "token": """
+            MATCH (scope_doc:AnnotatedText)-[:CONTAINS_SENTENCE]->(:Sentence)-[:HAS_TOKEN]->({var}:TagOccurrence)
+            WHERE scope_doc.id IN $doc_ids
+            WITH DISTINCT {var}
+        """,
+        # the rule starts from a token-attached span (mention, entity, frame argument, noun chunk)
+        "span": """
+            MATCH (scope_doc:AnnotatedText)-[:CONTAINS_SENTENCE]->(:Sentence)-[:HAS_TOKEN]->(:TagOccurrence)-[:IN_MENTION|IN_FRAME|PARTICIPATES_IN]->({var})
+            WHERE scope_doc.id IN $doc_ids
+            WITH DISTINCT {var}
+        """,
+        # the rule starts from a cross-document Entity referred to by a span
+        "entity": """
+            MATCH (scope_doc:AnnotatedText)-[:CONTAINS_SENTENCE]->(:Sentence)-[:HAS_TOKEN]->(:TagOccurrence)-[:IN_MENTION|IN_FRAME|PARTICIPATES_IN]->()-[:REFERS_TO]->({var}:Entity)
+            WHERE scope_doc.id IN $doc_ids
+            WITH DISTINCT {var}
+        """,
+    }
+
+    def set_doc_scope(self, doc_ids):
+        """Restrict subsequent rule queries to ``AnnotatedText.id in doc_ids``.
+
+        ``None`` restores whole-graph execution. The ids must have the same
+        type as the stored ``AnnotatedText.id`` values.
+        """
+        self._doc_scope = None if doc_ids is None else list(doc_ids)
+
+    def _doc_scoped(self, query, var, anchor="token", params=None):
+        """Return the ``graph.run`` arguments for a rule query.
+
+        Without a document scope the query and parameters are returned as-is.
+        With one, the ``anchor`` pattern binding ``var`` is prepended and
+        ``doc_ids`` is added to the parameters.
+        """
+        doc_ids = getattr(self, "_doc_scope", None)
+        if doc_ids is None:
+            return (query,) if params is None else (query, params)
+        scoped_params = dict(params or {})
+        scoped_params["doc_ids"] = doc_ids
+        return self._DOC_SCOPE_ANCHORS[anchor].format(var=var) + query, scoped_params
+
+    def _write(self, rule, query, params=None):
+        """Run a write-only rule query and accumulate its counters under *rule*.
+
+        Graph objects without ``write()`` (older wrappers, test doubles) fall
+        back to ``run().data()`` and report the row count as ``rows``.
+        """
+        write = getattr(self.graph, "write", None)
+        if write is not None:
+            counters = write(query, params)
+        else:
+            counters = {"rows": len(self.graph.run(query, params).data())}
+        totals = self.__dict__.setdefault("rule_write_counters", {}).setdefault(rule, {})
+        for name, value in counters.items():
+            totals[name] = totals.get(name, 0) + value
+        return counters
+
+    def unrefined_document_ids(self):
+        """Return ids of AnnotatedText nodes not yet covered by a refinement run."""
+        query = """
+            MATCH (d:AnnotatedText)
+            WHERE d.refined_at IS NULL
+            RETURN d.id AS doc_id
+            ORDER BY doc_id
+        """
+        return [row["doc_id"] for row in self.graph.run(query).data()]
+
+    def all_document_ids(self):
+        """Return ids of every AnnotatedText node."""
+        query = """
+            MATCH (d:AnnotatedText)
+            RETURN d.id AS doc_id
+            ORDER BY doc_id
+        """
+        return [row["doc_id"] for row in self.graph.run(query).data()]
+
+    def mark_documents_refined(self, doc_ids, refined_at):
+        """Stamp ``refined_at`` on the given documents after a successful run."""
+        query = """
+            MATCH (d:AnnotatedText)
+            WHERE d.id IN $doc_ids
+            SET d.refined_at = $refined_at
+            RETURN count(d) AS marked
+        """
+        data = self.graph.run(query, {"doc_ids": list(doc_ids), "refined_at": refined_at}).data()
+        return data[0].get("marked", 0) if data else 0
 
     def __init__(self, argv=None):
         # Create a bolt-driver backed compatibility graph object.
@@ -232,8 +351,31 @@ class RefinementPhase():
 
                 return _Result(data)
 
+            def write(self, query, parameters=None):
+                """Run a write-only statement and return its summary counters.
+
+                No records are fetched, so rules that only update the graph
+                do not pay for serializing matched paths over Bolt.
+                """
+                qshort = (query.strip().replace("\n", " ")[:200] + "...") if len(query) > 200 else query.strip()
+                try:
+                    counters = self._graph.write(query, parameters)
+                    self._logger.info("Executed write: %s; counters=%s", qshort, counters)
+                except Exception:
+                    self._logger.exception("Write failed: %s", qshort)
+                    raise
+                return counters
+
+            @property
+            def manager(self):
+                return getattr(self._graph, "manager", None)
+
         # instantiate the wrapped graph and keep legacy attributes
         self.graph = LoggingGraphCompat(_raw_graph, logger)
+        # summary counters of write-only rules, accumulated per rule name
+        self.rule_write_counters = {}
+        # wall time and graph counters per rule run by run_rule_family
+        self.rule_cost_recorder = RuleCostRecorder("refinement", graph=self.graph)
         self.uri = None
         self.username = None
         self.password = None
@@ -351,7 +493,7 @@ class RefinementPhase():
             DELETE r
             RETURN count(ne) AS entities_trimmed
         """
-        data = self.graph.run(query).data()
+        data = self.graph.run(*self._doc_scoped(query, "ne", "span")).data()
         trimmed = data[0].get("entities_trimmed", 0) if data else 0
         logger.info("trim_trailing_punctuation_from_entity_mentions: trimmed %d entity spans", trimmed)
         return ""
@@ -382,7 +524,7 @@ class RefinementPhase():
             SET ne:DiscourseEntity
             RETURN count(DISTINCT ne) AS tagged
         """
-        data = self.graph.run(query).data()
+        data = self.graph.run(*self._doc_scoped(query, "ne", "span")).data()
         tagged_ne = data[0].get("tagged", 0) if data else 0
 
         nominal_query = """
@@ -394,7 +536,7 @@ class RefinementPhase():
             SET em:DiscourseEntity
             RETURN count(DISTINCT em) AS tagged
         """
-        data_nom = self.graph.run(nominal_query).data()
+        data_nom = self.graph.run(*self._doc_scoped(nominal_query, "em", "span")).data()
         tagged_nom = data_nom[0].get("tagged", 0) if data_nom else 0
 
 
@@ -404,7 +546,7 @@ class RefinementPhase():
             SET fa:DiscourseEntity
             RETURN count(DISTINCT fa) AS tagged
         """
-        data_fa = self.graph.run(fa_query).data()
+        data_fa = self.graph.run(*self._doc_scoped(fa_query, "fa", "span")).data()
         tagged_fa = data_fa[0].get("tagged", 0) if data_fa else 0
 
         logger.info(
@@ -427,31 +569,17 @@ class RefinementPhase():
         graph = self.graph
 
         query = """
-            CALL {
-                MATCH (mention:EntityMention)<-[:IN_MENTION]-(subj_tok:TagOccurrence)-[:IS_DEPENDENT {type: 'nsubj'}]->(pred_tok:TagOccurrence)
-                WHERE toLower(coalesce(pred_tok.lemma, pred_tok.text, '')) IN ['be', 'become', 'remain', 'seem', 'appear', 'stay', 'feel']
-                OPTIONAL MATCH (state_tok:TagOccurrence)-[dep:IS_DEPENDENT]->(pred_tok)
-                WHERE dep.type IN ['acomp', 'attr', 'oprd', 'xcomp']
-                  AND (
-                      coalesce(state_tok.upos, '') IN ['ADJ', 'NOUN', 'VERB'] OR
-                      coalesce(state_tok.pos, '') IN ['JJ', 'JJR', 'JJS', 'NN', 'NNS', 'NNP', 'NNPS', 'VBN']
-                  )
-                WITH mention, pred_tok, head(collect(state_tok)) AS state_tok
-                WHERE state_tok IS NOT NULL
-                RETURN mention, pred_tok, state_tok
-                UNION
-                MATCH (mention:NamedEntity)<-[:IN_MENTION]-(subj_tok:TagOccurrence)-[:IS_DEPENDENT {type: 'nsubj'}]->(pred_tok:TagOccurrence)
-                WHERE toLower(coalesce(pred_tok.lemma, pred_tok.text, '')) IN ['be', 'become', 'remain', 'seem', 'appear', 'stay', 'feel']
-                OPTIONAL MATCH (state_tok:TagOccurrence)-[dep:IS_DEPENDENT]->(pred_tok)
-                WHERE dep.type IN ['acomp', 'attr', 'oprd', 'xcomp']
-                  AND (
-                      coalesce(state_tok.upos, '') IN ['ADJ', 'NOUN', 'VERB'] OR
-                      coalesce(state_tok.pos, '') IN ['JJ', 'JJR', 'JJS', 'NN', 'NNS', 'NNP', 'NNPS', 'VBN']
-                  )
-                WITH mention, pred_tok, head(collect(state_tok)) AS state_tok
-                WHERE state_tok IS NOT NULL
-                RETURN mention, pred_tok, state_tok
-            }
+            MATCH (mention)<-[:IN_MENTION]-(subj_tok:TagOccurrence)-[:IS_DEPENDENT {type: 'nsubj'}]->(pred_tok:TagOccurrence)
+            WHERE (mention:EntityMention OR mention:NamedEntity)
+              AND toLower(coalesce(pred_tok.lemma, pred_tok.text, '')) IN ['be', 'become', 'remain', 'seem', 'appear', 'stay', 'feel']
+            OPTIONAL MATCH (state_tok:TagOccurrence)-[dep:IS_DEPENDENT]->(pred_tok)
+            WHERE dep.type IN ['acomp', 'attr', 'oprd', 'xcomp']
+              AND (
+                  coalesce(state_tok.upos, '') IN ['ADJ', 'NOUN', 'VERB'] OR
+                  coalesce(state_tok.pos, '') IN ['JJ', 'JJR', 'JJS', 'NN', 'NNS', 'NNP', 'NNPS', 'VBN']
+              )
+            WITH mention, pred_tok, head(collect(state_tok)) AS state_tok
+            WHERE state_tok IS NOT NULL
             OPTIONAL MATCH (mention)-[:REFERS_TO]->(e:Entity)
             WITH mention, e, pred_tok, state_tok,
                  toLower(coalesce(state_tok.lemma, state_tok.text, '')) AS state_lemma,
@@ -508,7 +636,7 @@ class RefinementPhase():
                 END
             RETURN count(DISTINCT mention) AS mentions_state_annotated
         """
-        data = graph.run(query).data()
+        data = graph.run(*self._doc_scoped(query, "subj_tok", "token")).data()
         annotated = data[0].get("mentions_state_annotated", 0) if data else 0
         logger.info("annotate_entity_state_signals: annotated %d mention-level state hints", annotated)
         return ""
@@ -526,13 +654,8 @@ class RefinementPhase():
         graph = self.graph
 
         query_mentions = """
-            CALL {
-                MATCH (m:EntityMention)
-                RETURN m
-                UNION
-                MATCH (m:NamedEntity)
-                RETURN m
-            }
+            MATCH (m)
+            WHERE m:EntityMention OR m:NamedEntity
             OPTIONAL MATCH (tok:TagOccurrence)-[:IN_MENTION]->(m)
             OPTIONAL MATCH (det_tok:TagOccurrence)-[:IS_DEPENDENT {type: 'det'}]->(tok)
             OPTIONAL MATCH (neg_tok:TagOccurrence)-[:IS_DEPENDENT {type: 'neg'}]->(tok)
@@ -556,7 +679,7 @@ class RefinementPhase():
                 m.entClassSource = 'refinement_specificity_heuristic'
             RETURN count(DISTINCT m) AS mention_count
         """
-        mention_rows = graph.run(query_mentions).data()
+        mention_rows = graph.run(*self._doc_scoped(query_mentions, "m", "span")).data()
         mention_count = mention_rows[0].get("mention_count", 0) if mention_rows else 0
 
         query_entities = """
@@ -578,7 +701,7 @@ class RefinementPhase():
                 e.entClassSource = 'refinement_specificity_heuristic'
             RETURN count(DISTINCT e) AS entity_count
         """
-        entity_rows = graph.run(query_entities).data()
+        entity_rows = graph.run(*self._doc_scoped(query_entities, "e", "entity")).data()
         entity_count = entity_rows[0].get("entity_count", 0) if entity_rows else 0
 
         logger.info(
@@ -709,10 +832,9 @@ class RefinementPhase():
                                 WHEN a.pos IN ['NNS', 'NN'] THEN 'NOMINAL'
                                 WHEN a.pos IN ['NNP', 'NNPS'] THEN 'NAM'
                                 ELSE coalesce(f.syntacticType, 'NAM') END
-                        return p
 
         """
-        data = graph.run(query).data()
+        self._write("get_and_assign_head_info_to_entity_multitoken", *self._doc_scoped(query, "a", "token"))
 
         return ""
 
@@ -737,10 +859,9 @@ class RefinementPhase():
                                 WHEN a.pos IN ['NNP', 'NNPS'] THEN 'NAM'
                                 WHEN a.pos IN ['PRP', 'PRP$'] THEN 'PRO'
                                 ELSE coalesce(c.syntacticType, 'NAM') END
-                        return p
 
         """
-        data = graph.run(query).data()
+        self._write("get_and_assign_head_info_to_entity_singletoken", *self._doc_scoped(query, "a", "token"))
 
         return ""
 
@@ -767,10 +888,9 @@ class RefinementPhase():
                                 WHEN a.pos IN ['NNS', 'NN'] THEN 'NOMINAL'
                                 WHEN a.pos IN ['NNP', 'NNPS'] THEN 'NAM'
                                 ELSE coalesce(f.syntacticType, 'NAM') END
-                        return p     
         
         """
-        data= graph.run(query).data()
+        self._write("get_and_assign_head_info_to_antecedent_multitoken", *self._doc_scoped(query, "a", "token"))
         
         return ""
 
@@ -810,10 +930,9 @@ class RefinementPhase():
                                                         WHEN a.pos IN ['NNP', 'NNPS'] THEN 'NAM'
                                                         WHEN a.pos IN ['PRP', 'PRP$'] THEN 'PRO'
                                                         ELSE coalesce(c.syntacticType, 'NAM') END
-                                                return p     
         
                 """
-                data= graph.run(query).data()
+                self._write("get_and_assign_head_info_to_antecedent_singletoken", *self._doc_scoped(query, "a", "token"))
         
                 return ""
         
@@ -845,10 +964,9 @@ class RefinementPhase():
                                 WHEN a.pos IN ['NNP', 'NNPS'] THEN 'NAM'
                                 WHEN a.pos IN ['NNS', 'NN'] THEN 'NOM'
                                 ELSE coalesce(f.syntactic_type, 'NAM') END
-                        return p     
         
         """
-        data= graph.run(query).data()
+        self._write("get_and_assign_head_info_to_corefmention_multitoken", *self._doc_scoped(query, "a", "token"))
         
         return ""
 
@@ -882,10 +1000,9 @@ class RefinementPhase():
                                 WHEN a.pos IN ['NNP', 'NNPS'] THEN 'NAM'
                                 WHEN a.pos IN ['NNS', 'NN'] THEN 'NOM'
                                 ELSE coalesce(c.syntactic_type, 'NAM') END
-                        return p     
         
         """
-        data= graph.run(query).data()
+        self._write("get_and_assign_head_info_to_corefmention_singletoken", *self._doc_scoped(query, "a", "token"))
         
         return ""
 
@@ -912,10 +1029,9 @@ class RefinementPhase():
                                 WHEN a.pos IN ['NNP', 'NNPS'] THEN 'NAM'
                                 WHEN a.pos IN ['PRP', 'PRP$'] THEN 'PRO'
                                 ELSE coalesce(c.syntacticType, 'NAM') END
-                        return p    
         
         """
-        data= graph.run(query).data()
+        self._write("get_and_assign_head_info_to_frameArgument_singletoken", *self._doc_scoped(query, "c", "span"))
         
         return ""
 
@@ -947,11 +1063,10 @@ class RefinementPhase():
                                                 where not exists ((a)<-[:IS_DEPENDENT]-()--(c)) and not exists ((a)-[:IS_DEPENDENT]->()--(c))
                                                 WITH c, a, p
                                                 set c.head = a.text, c.headTokenIndex = a.tok_index_doc, c.headPos = a.pos
-                                                return p
     
         
                 """
-                data= graph.run(query).data()
+                self._write("get_and_assign_head_info_to_all_frameArgument_singletoken", *self._doc_scoped(query, "c", "span"))
         
                 return ""
 
@@ -998,10 +1113,9 @@ class RefinementPhase():
                                 WHEN a.pos IN ['PRP', 'PRP$'] THEN 'PRO'
                                 WHEN a.pos IN ['RB'] THEN 'ADV'
                                 ELSE coalesce(c.syntacticType, 'NAM') END
-                        return p    
         
         """
-        data= graph.run(query).data()
+        self._write("get_and_assign_head_info_to_temporal_frameArgument_singletoken", *self._doc_scoped(query, "c", "span"))
         
         return ""
 
@@ -1039,10 +1153,9 @@ class RefinementPhase():
                                                         WHEN a.pos IN ['NNP', 'NNPS'] THEN 'NAM'
                                                         WHEN a.pos IN ['PRP', 'PRP$'] THEN 'PRO'
                                                         ELSE coalesce(f.syntacticType, 'NAM') END
-                                                return p    
         
                 """
-                data= graph.run(query).data()
+                self._write("get_and_assign_head_info_to_frameArgument_multitoken", *self._doc_scoped(query, "f", "span"))
         
                 return ""
 
@@ -1069,10 +1182,9 @@ class RefinementPhase():
                         where not exists ((a)<-[:IS_DEPENDENT]-()--(f))
                         WITH f, a, p
                         set f.head = a.text, f.headTokenIndex = a.tok_index_doc, f.headPos = a.pos 
-                        return p    
         
         """
-        data= graph.run(query).data()
+        self._write("get_and_assign_head_info_to_all_frameArgument_multitoken", *self._doc_scoped(query, "a", "token"))
         
         return ""
 
@@ -1089,18 +1201,17 @@ class RefinementPhase():
         graph = self.graph
 
         query = """    
-                        match p= (a:TagOccurrence where a.pos in ['IN'])--
+                        match p= (a:TagOccurrence)--
                         (f:FrameArgument where f.type in ['ARG1', 'ARG0', 'ARG2', 'ARG3', 'ARG4', 'ARGA', 'ARGM-TMP']), q= (a)-[:IS_DEPENDENT]->()--(f)
-                        where not exists ((a)<-[:IS_DEPENDENT]-()--(f))
+                        where a.pos in ['IN'] and not exists ((a)<-[:IS_DEPENDENT]-()--(f))
                         set f.head = a.text, f.headTokenIndex = a.tok_index_doc, f.syntacticType ='IN'
                         with *
                         match (a)-[x:IS_DEPENDENT]->(c) where x.type = 'pobj' 
                         set f.complement = c.text, f.complementIndex = c.tok_index_doc, 
                         f.complementFullText = substring(f.text, size(f.head)+1)
-                        return p    
         
         """
-        data= graph.run(query).data()
+        self._write("get_and_assign_head_info_to_frameArgument_with_preposition", *self._doc_scoped(query, "a", "token"))
         
         return ""
 
@@ -1125,15 +1236,14 @@ class RefinementPhase():
         # so we don't miss eventive constructions due to tagging variation.
         query = """
                         match p= (s:TagOccurrence where s.pos = 'IN')<-[:IS_DEPENDENT {type: 'mark'}]
-                        -(a:TagOccurrence where a.pos in ['VBD','VB','VBG','VBZ','VBN','VBP'])-
+                        -(a:TagOccurrence)-
                         [:IN_FRAME]->(f:FrameArgument where f.type = 'ARGM-TMP'), q= (a)-[:IS_DEPENDENT]->()--(f)
-                        where not exists ((a)<-[:IS_DEPENDENT]-()--(f))
+                        where a.pos in ['VBD','VB','VBG','VBZ','VBN','VBP'] and not exists ((a)<-[:IS_DEPENDENT]-()--(f))
                         WITH f, a, p,s
                         set f.head = a.text, f.headTokenIndex = a.tok_index_doc, f.syntacticType ='EVENTIVE', f.signal = s.text
-                        return p
 
         """
-        data= graph.run(query).data()
+        self._write("get_and_assign_head_info_to_temporal_frameArgument_multitoken_mark", *self._doc_scoped(query, "a", "token"))
 
         return ""
 
@@ -1168,14 +1278,13 @@ class RefinementPhase():
 
                         query = """    
                                                         match p= (f)--(v:TagOccurrence {pos: 'VBG'})<-[l:IS_DEPENDENT {type: 'pcomp'}]-
-                                                        (a:TagOccurrence where a.pos in ['IN'])-[:IN_FRAME]->(f:FrameArgument where f.type = 'ARGM-TMP')
-                                                        where not exists ((a)<-[:IS_DEPENDENT]-()--(f))
+                                                        (a:TagOccurrence)-[:IN_FRAME]->(f:FrameArgument where f.type = 'ARGM-TMP')
+                                                        where a.pos in ['IN'] and not exists ((a)<-[:IS_DEPENDENT]-()--(f))
                                                         WITH f, a, p, v
                                                         set f.head = a.text, f.headTokenIndex = a.tok_index_doc, f.syntacticType ='EVENTIVE', f.signal = a.text, f.complement = v.text
-                                                        return p     
         
                         """
-                        data= graph.run(query).data()
+                        self._write("get_and_assign_head_info_to_temporal_frameArgument_multitoken_pcomp", *self._doc_scoped(query, "a", "token"))
 
                         return ""
 
@@ -1199,14 +1308,13 @@ class RefinementPhase():
 
         query = """    
             match p= (f)--(v:TagOccurrence {pos: 'VBG'})<-[l:IS_DEPENDENT {type: 'pcomp'}]-
-            (a:TagOccurrence where a.pos in ['IN'])-[:IN_FRAME]->(f:FrameArgument)
-            where not exists ((a)<-[:IS_DEPENDENT]-()--(f))
+            (a:TagOccurrence)-[:IN_FRAME]->(f:FrameArgument)
+            where a.pos in ['IN'] and not exists ((a)<-[:IS_DEPENDENT]-()--(f))
             WITH f, a, p, v
             set f.head = a.text, f.headTokenIndex = a.tok_index_doc, f.syntacticType ='EVENTIVE', f.signal = a.text, f.complement = v.text
-            return p    
         
         """
-        data= graph.run(query).data()
+        self._write("get_and_assign_head_info_to_eventive_frameArgument_multitoken_pcomp", *self._doc_scoped(query, "a", "token"))
 
         return ""
 
@@ -1235,13 +1343,12 @@ class RefinementPhase():
         # are picked up.
         query = """
                         match p= (f)--(v:TagOccurrence)<-[l:IS_DEPENDENT {type: 'pobj'}]-
-                        (a:TagOccurrence where a.pos in ['IN', 'VBG'])-[:IN_FRAME]->(f:FrameArgument where f.type = 'ARGM-TMP')
-                        where not exists ((a)<-[:IS_DEPENDENT]-()--(f))
+                        (a:TagOccurrence)-[:IN_FRAME]->(f:FrameArgument where f.type = 'ARGM-TMP')
+                        where a.pos in ['IN', 'VBG'] and not exists ((a)<-[:IS_DEPENDENT]-()--(f))
                         WITH f, a, p, v
                         set f.head = a.text, f.headTokenIndex = a.tok_index_doc, f.syntacticType ='EVENTIVE', f.signal = a.text, f.complement = v.text
-                        return p     
         """
-        data= graph.run(query).data()
+        self._write("get_and_assign_head_info_to_temporal_frameArgument_multitoken_pobj", *self._doc_scoped(query, "a", "token"))
 
         return ""
 
@@ -1273,10 +1380,9 @@ class RefinementPhase():
                         match p= (f:FrameArgument)<-[:IN_FRAME]-(head:TagOccurrence )-[:IN_MENTION|PARTICIPATES_IN]->(ne:NamedEntity)
                         where head.tok_index_doc = f.headTokenIndex and head.tok_index_doc = ne.headTokenIndex
                         merge (f)-[:REFERS_TO]->(ne)
-                        return p     
         
         """
-        data= graph.run(query).data()
+        self._write("link_frameArgument_to_namedEntity_for_nam_nom", *self._doc_scoped(query, "head", "token"))
         
         return ""
 
@@ -1298,10 +1404,9 @@ class RefinementPhase():
                         match p= (f:FrameArgument)<-[:IN_FRAME]-(complementHead:TagOccurrence )-[:IN_MENTION|PARTICIPATES_IN]->(ne:NamedEntity)
                         where complementHead.tok_index_doc = f.complementIndex and complementHead.tok_index_doc = ne.headTokenIndex
                         merge (f)-[:REFERS_TO]->(ne)
-                        return p     
         
         """
-        data= graph.run(query).data()
+        self._write("link_frameArgument_to_namedEntity_for_pobj", *self._doc_scoped(query, "complementHead", "token"))
         
         return ""
 
@@ -1353,7 +1458,7 @@ class RefinementPhase():
             }]->(e)
                         RETURN count(*) AS linked
         """
-        data = graph.run(query).data()
+        data = graph.run(*self._doc_scoped(query, "complementHead", "token")).data()
         
         return ""
     
@@ -1378,10 +1483,9 @@ class RefinementPhase():
                         (crf:CorefMention)--(ant:Antecedent)-[:REFERS_TO]->(ne:NamedEntity)
                         where head.pos in ['PRP','PRP$'] and head.tok_index_doc = f.headTokenIndex and head.tok_index_doc = crf.headTokenIndex
                         merge (f)-[:REFERS_TO]->(ne)
-                        return p     
         
         """
-        data= graph.run(query).data()
+        self._write("link_frameArgument_to_namedEntity_for_pro", *self._doc_scoped(query, "head", "token"))
         
         return ""
 
@@ -1406,8 +1510,9 @@ class RefinementPhase():
 
         query = """
                         MATCH p= (f:FrameArgument where f.type IN ['ARG0','ARG1','ARG2','ARG3','ARG4'] and f.syntacticType <> 'PRO')
-                        -[:IN_FRAME]-(h:TagOccurrence where NOT (h.pos IN ['IN']))
-                        WHERE f.headTokenIndex = h.tok_index_doc
+                        -[:IN_FRAME]-(h:TagOccurrence)
+                        WHERE NOT (h.pos IN ['IN'])
+                         AND f.headTokenIndex = h.tok_index_doc
                          AND NOT EXISTS ((h)-[]-(:NamedEntity {headTokenIndex: h.tok_index_doc}))
                         OPTIONAL MATCH (d:AnnotatedText)-[:CONTAINS_SENTENCE]->(:Sentence)-[:HAS_TOKEN]->(h)
                         WITH p, f, h, d,
@@ -1430,9 +1535,8 @@ class RefinementPhase():
                            e.source_frame_argument_id = f.id,
                            e.provenance_rule_id = 'refinement.link_frameArgument_to_new_entity'
                         MERGE (f)-[:REFERS_TO]->(e)
-                        RETURN p
         """
-        data= graph.run(query).data()
+        self._write("link_frameArgument_to_new_entity", *self._doc_scoped(query, "h", "token"))
         
         return ""
 
@@ -1452,10 +1556,9 @@ class RefinementPhase():
                         match p= (f:Antecedent)<-[:IN_MENTION]-(head:TagOccurrence )-[:IN_MENTION]->(ne:NamedEntity)
                         where head.tok_index_doc = f.headTokenIndex and head.tok_index_doc = ne.headTokenIndex
                         merge (f)-[:REFERS_TO]->(ne)
-                        return p    
         
         """
-        data= graph.run(query).data()
+        self._write("link_antecedent_to_namedEntity", *self._doc_scoped(query, "head", "token"))
         
         return ""
 
@@ -1499,7 +1602,7 @@ class RefinementPhase():
                         return count(ne) as tagged
         
         """
-        data = graph.run(query).data()
+        data = graph.run(*self._doc_scoped(query, "ne", "span")).data()
         tagged = data[0].get("tagged", 0) if data else 0
         logger.warning(
             "tag_numeric_entities: applied legacy :NUMERIC label to %d NamedEntity nodes; this path remains transitional during VALUE migration",
@@ -1546,7 +1649,7 @@ class RefinementPhase():
                         return count(ne) as tagged
         
         """
-        data = graph.run(query).data()
+        data = graph.run(*self._doc_scoped(query, "ne", "span")).data()
         tagged = data[0].get("tagged", 0) if data else 0
         logger.warning(
             "tag_value_entities: applied transitional :VALUE label to %d NamedEntity nodes before canonical VALUE materialization",
@@ -1596,7 +1699,7 @@ class RefinementPhase():
                         MERGE (ne)-[:REFERS_TO]->(v)
                         RETURN count(DISTINCT v) AS values_materialized
         """
-        graph.run(query_materialize).data()
+        graph.run(*self._doc_scoped(query_materialize, "ne", "span")).data()
 
         # Let FrameArguments resolve directly to VALUE nodes when they currently
         # resolve through NamedEntity mentions.
@@ -1605,7 +1708,7 @@ class RefinementPhase():
                         MERGE (fa)-[:REFERS_TO]->(v)
                         RETURN count(DISTINCT fa) AS frame_args_linked
         """
-        graph.run(query_link_fa).data()
+        graph.run(*self._doc_scoped(query_link_fa, "fa", "span")).data()
 
         # Propagate event participant edges so VALUE appears as a first-class
         # participant source in the evaluation graph.
@@ -1619,7 +1722,7 @@ class RefinementPhase():
                             vp.confidence = coalesce(vp.confidence, 1.0)
                         RETURN count(DISTINCT vp) AS value_participants_linked
         """
-        graph.run(query_participants).data()
+        graph.run(*self._doc_scoped(query_participants, "fa", "span")).data()
 
         # VALUE label on NamedEntity was historically used as a convenience
         # tag. Remove it to avoid mixed semantics now that canonical VALUE
@@ -1630,7 +1733,7 @@ class RefinementPhase():
                 SET ne.value_tagged = true
                 RETURN count(ne) AS cleaned
         """
-        graph.run(query_cleanup_legacy_label).data()
+        graph.run(*self._doc_scoped(query_cleanup_legacy_label, "ne", "span")).data()
 
         return ""
 
@@ -1678,10 +1781,9 @@ class RefinementPhase():
                         set ne1.kb_id = ne2.kb_id, ne1.description = ne2.description, ne1.normal_term = ne2.normal_term, ne1.url_wikidata = ne2.url_wikidata,ne1.type = ne2.type
                         detach delete e1
                         merge (ne1)-[:REFERS_TO]->(e2)
-                        return p    
         
         """
-        data= graph.run(query).data()
+        self._write("detect_correct_NEL_result_for_having_kb_id", query)
         
         return ""
 
@@ -1708,10 +1810,9 @@ class RefinementPhase():
                         set ne1.kb_id = ne2.kb_id, ne1.spacyType = ne1.type, ne1.type = ne2.type, ne1.description = ne2.description, ne1.normal_term = ne2.normal_term, ne1.url_wikidata = ne2.url_wikidata
                         detach delete e1
                         merge (ne1)-[:REFERS_TO]->(e2)
-                        return p    
         
         """
-        data= graph.run(query).data()
+        self._write("detect_correct_NEL_result_for_missing_kb_id", *self._doc_scoped(query, "t1", "token"))
         return ""
          
 
@@ -1782,10 +1883,9 @@ class RefinementPhase():
                                         match (fa)-[r:REFERS_TO]->(ne:NamedEntity)
                                         where ne.type in ['CARDINAL', 'QUANTITY', 'PERCENT', 'MONEY', 'ORDINAL']
                     delete r
-                    return p    
         
         """
-        data= graph.run(query).data()
+        self._write("detect_quantified_entities_from_frameArgument", *self._doc_scoped(query, "head", "token"))
         
         return ""
 
@@ -1831,7 +1931,7 @@ class RefinementPhase():
                     end_char,
                     'nom_mention_fa_' + toString(doc_id) + '_' + toString(start_tok) + '_' + toString(end_tok) AS mention_id
         """
-        rows = graph.run(candidate_query).data()
+        rows = graph.run(*self._doc_scoped(candidate_query, "fa", "span")).data()
         self._merge_nominal_entity_mentions(
             rows=rows,
             mention_source="fa",
@@ -1969,10 +2069,12 @@ class RefinementPhase():
                       'nom_mention_nc_' + toString(doc_id) + '_' + toString(min_tok) + '_' + toString(max_tok) AS mention_id,
                       filter_reason
         """
-        all_rows = graph.run(
+        all_rows = graph.run(*self._doc_scoped(
             candidate_query,
+            "nc",
+            "span",
             {"strict_nominal_filters": bool(strict_nominal_filters)},
-        ).data()
+        )).data()
         kept_rows = [row for row in all_rows if row.get("filter_reason") == "keep"]
 
         dropped_by_reason = {}
@@ -2094,7 +2196,7 @@ class RefinementPhase():
                  }]->(resolved_entity)
                  RETURN count(*) AS linked
         """
-        graph.run(query).data()
+        graph.run(*self._doc_scoped(query, "fa", "span")).data()
 
         return ""
 
@@ -2155,7 +2257,7 @@ class RefinementPhase():
                          END)
                  RETURN count(DISTINCT em) AS nominals_resolved
         """
-        graph.run(query).data()
+        graph.run(*self._doc_scoped(query, "em", "span")).data()
 
         return ""
 
@@ -2312,7 +2414,7 @@ class RefinementPhase():
                          OR ((core_arg_hits > 0) AND eventive_confidence >= 0.40)
                  RETURN count(DISTINCT em) AS nominals_profiled
         """
-        graph.run(query).data()
+        graph.run(*self._doc_scoped(query, "em", "span")).data()
 
         eval_span_query = """
                  MATCH (em:EntityMention:NominalMention)
@@ -2352,7 +2454,7 @@ class RefinementPhase():
                      e.nominalEvalEndTok = coalesce(e.nominalEvalEndTok, final_end)
                  RETURN count(DISTINCT em) AS nominals_eval_spans
         """
-        graph.run(eval_span_query).data()
+        graph.run(*self._doc_scoped(eval_span_query, "em", "span")).data()
 
         return ""
 
@@ -2372,10 +2474,9 @@ class RefinementPhase():
         query = """    
                         match p = (fa:FrameArgument)-[:REFERS_TO]->(ne:NamedEntity)-[:REFERS_TO]-(e:Entity)
                         merge (fa)-[:REFERS_TO]-(e)
-                        return p     
         
         """
-        data= graph.run(query).data()
+        self._write("link_frameArgument_to_entity_via_named_entity", *self._doc_scoped(query, "fa", "span"))
         
         return ""
 
@@ -2408,7 +2509,7 @@ class RefinementPhase():
             DELETE r
             RETURN count(*) AS deleted
         """
-        data = graph.run(query).data()
+        data = graph.run(*self._doc_scoped(query, "fa", "span")).data()
         deleted = data[0].get("deleted", 0) if data else 0
         logger.info(
             "cleanup_intermediate_frameargument_refers_to: removed %d intermediate FA→NamedEntity edges",
@@ -2455,7 +2556,7 @@ class RefinementPhase():
             )
             RETURN count(f) AS linked
         """
-        data = graph.run(query).data()
+        data = graph.run(*self._doc_scoped(query, "t", "token")).data()
         linked = data[0].get("linked", 0) if data else 0
         logger.debug("link_frameArgument_to_numeric_entities: linked %d frame arguments", linked)
         return ""
@@ -2508,7 +2609,7 @@ class RefinementPhase():
                 ne.syntacticType  = new_syntacticType
             RETURN count(ne) AS updated
         """
-        data = graph.run(query).data()
+        data = graph.run(*self._doc_scoped(query, "ne", "span")).data()
         updated = data[0].get("updated", 0) if data else 0
         logger.info("assign_meantime_syntactic_types: updated %d NamedEntity nodes", updated)
         return ""
@@ -2561,7 +2662,7 @@ class RefinementPhase():
             MERGE (head_tok)-[:IN_MENTION]->(em)
             RETURN count(DISTINCT em) AS created
         """
-        data = graph.run(query).data()
+        data = graph.run(*self._doc_scoped(query, "doc", "doc")).data()
         created = data[0].get("created", 0) if data else 0
         logger.info("materialize_predicate_nominal_mentions: created %d mentions", created)
         return ""
@@ -2608,7 +2709,7 @@ class RefinementPhase():
             MERGE (head_tok)-[:IN_MENTION]->(em)
             RETURN count(DISTINCT em) AS created
         """
-        data = graph.run(query).data()
+        data = graph.run(*self._doc_scoped(query, "doc", "doc")).data()
         created = data[0].get("created", 0) if data else 0
         logger.info("materialize_appositive_mentions: created %d mentions", created)
         return ""
@@ -2660,7 +2761,7 @@ class RefinementPhase():
         """
         total = 0
         for dep_type in ("nsubj", "dobj", "nsubjpass"):
-            data = graph.run(query, {"dep_type": dep_type}).data()
+            data = graph.run(*self._doc_scoped(query, "doc", "doc", {"dep_type": dep_type})).data()
             n = data[0].get("created", 0) if data else 0
             total += n
             logger.debug("materialize_event_argument_mentions dep=%s created=%d", dep_type, n)
@@ -2739,7 +2840,7 @@ class RefinementPhase():
             FOREACH (tt IN toks | MERGE (tt)-[:IN_MENTION]->(em))
             RETURN count(DISTINCT em) AS created
         """
-        data = graph.run(query, {"punct_pos": self._PUNCT_POS}).data()
+        data = graph.run(*self._doc_scoped(query, "doc", "doc", {"punct_pos": self._PUNCT_POS})).data()
         created = data[0].get("created", 0) if data else 0
         logger.info("materialize_wider_appositive_mentions: created %d wider APP mentions", created)
         return ""
@@ -2795,7 +2896,7 @@ class RefinementPhase():
             FOREACH (tt IN toks | MERGE (tt)-[:IN_MENTION]->(em))
             RETURN count(DISTINCT em) AS created
         """
-        data = graph.run(query, {"punct_pos": self._PUNCT_POS}).data()
+        data = graph.run(*self._doc_scoped(query, "head_tok", "token", {"punct_pos": self._PUNCT_POS})).data()
         created = data[0].get("created", 0) if data else 0
         logger.info("materialize_wider_conjunction_mentions: created %d wider CONJ mentions", created)
         return ""
@@ -2812,7 +2913,7 @@ class RefinementPhase():
         WHERE dep.type = 'neg'
         SET e.polarity = "NEG"
         """
-        self.graph.run(query)
+        self._write("project_event_polarity", *self._doc_scoped(query, "head", "token"))
 
     def project_event_tense_aspect(self):
         """Set event tense based on dependency graph auxiliaries."""
@@ -2832,7 +2933,7 @@ class RefinementPhase():
             WHEN any(w IN aux_words WHERE w IN ['has', 'have', 'had']) THEN 'PERFECTIVE'
             ELSE coalesce(e.aspect, 'NONE') END
         """
-        self.graph.run(query)
+        self._write("project_event_tense_aspect", *self._doc_scoped(query, "head", "token"))
 
     def trim_determiners_from_mentions(self):
         """Remove determiner tokens from the boundaries of Mentions.
@@ -2853,7 +2954,7 @@ class RefinementPhase():
         AND (m.headTokenIndex IS NULL OR t.tok_index_doc <> m.headTokenIndex)
         DELETE r
         """
-        self.graph.run(query)
+        self._write("trim_determiners_from_mentions", *self._doc_scoped(query, "m", "span"))
 
     def trim_punctuation_from_mentions(self):
         """Remove trailing/leading punctuation tokens from the boundaries of Mentions.
@@ -2873,7 +2974,7 @@ class RefinementPhase():
         AND (m.headTokenIndex IS NULL OR t.tok_index_doc <> m.headTokenIndex)
         DELETE r
         """
-        self.graph.run(query)
+        self._write("trim_punctuation_from_mentions", *self._doc_scoped(query, "m", "span"))
 
     def update_mention_span_boundaries(self):
         """Recompute the startIndex, endIndex, and string value of all Mentions."""
@@ -2892,7 +2993,7 @@ class RefinementPhase():
             m.span = [x IN tokens | x.tok_index_doc],
             m.value = reduce(s = '', x IN tokens | CASE WHEN s = '' THEN x.text ELSE s + ' ' + x.text END)
         """
-        self.graph.run(query)
+        self._write("update_mention_span_boundaries", *self._doc_scoped(query, "m", "span"))
 
     def promote_nominal_events(self):
         """Promote nominals that act as Frame heads into EventMentions."""
@@ -2914,7 +3015,7 @@ class RefinementPhase():
         MERGE (t)-[:IN_MENTION]->(ev)
         MERGE (f)-[:MENTIONS]->(ev)
         """
-        self.graph.run(query)
+        self._write("promote_nominal_events", *self._doc_scoped(query, "t", "token"))
 
     def coerce_role_based_types(self):
         """Refine generic EntityMentions serving as LOC or TMP frame arguments."""
@@ -2931,7 +3032,7 @@ class RefinementPhase():
             SET m:Timex
         )
         """
-        self.graph.run(query)
+        self._write("coerce_role_based_types", *self._doc_scoped(query, "fa", "span"))
 
 
 if __name__ == '__main__':
@@ -11,6 +11,7 @@ import os
 import sys
 import warnings
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
 
 import requests
 
@@ -25,11 +26,17 @@ if __name__ == '__main__' and __package__ is None:
         sys.path.insert(0, repo_root)
 
 from textgraphx.infrastructure.config import get_config
+from textgraphx.adapters.annotation_cache import get_annotation_cache, normalize_dct
+from textgraphx.adapters.service_client import get_service_client
 from textgraphx.database.client import make_graph_from_config
 from textgraphx.reasoning.contracts import normalize_event_attr
 
 logger = logging.getLogger(__name__)
 
+# Documents whose text/DCT payload stays cached per phase instance. A
+# document's passes run back to back, so a few recent ones are enough.
+_DOC_PAYLOAD_CACHE_MAX = 32
+
 _EVENTIVE_NOMINAL_ALLOWLIST = {
     "crisis",
     "tie",
@@ -165,6 +172,7 @@ class TemporalPhase:
         self.heideltime_url = getattr(services, "heideltime_url", None)
         if not self.heideltime_url:
             self.heideltime_url = "http://localhost:5000/annotate"
+        self._doc_payloads = OrderedDict()
 
     def __getattr__(self, name):
         from textgraphx.reasoning.temporal.legacy_compat import LEGACY_METHODS
@@ -180,6 +188,13 @@ class TemporalPhase:
         return [row["doc_id"] for row in rows if row.get("doc_id") is not None]
 
     def get_doc_text_and_dct(self, doc_id):
+        # Text and DCT are immutable for the lifetime of a phase run, so each
+        # document is read once even though several passes need its payload.
+        payloads = self.__dict__.setdefault("_doc_payloads", OrderedDict())
+        if doc_id in payloads:
+            payloads.move_to_end(doc_id)
+            return dict(payloads[doc_id])
+
         query = """
         MATCH (a:AnnotatedText {id: toInteger($doc_id)})
         RETURN a.text AS text,
@@ -189,7 +204,11 @@ class TemporalPhase:
         if not rows:
             return {"text": "", "dct": ""}
         row = rows[0]
-        return {"text": row.get("text") or "", "dct": row.get("dct") or ""}
+        payload = {"text": row.get("text") or "", "dct": row.get("dct") or ""}
+        payloads[doc_id] = payload
+        while len(payloads) > _DOC_PAYLOAD_CACHE_MAX:
+            payloads.popitem(last=False)
+        return dict(payload)
 
     def callTtkService(self, parameters):
         dct = parameters.get("dct")
@@ -198,17 +217,19 @@ class TemporalPhase:
             logger.warning("callTtkService: missing dct/text payload")
             return ""
 
-        normalized_dct = str(dct).split("T")[0].replace("-", "")
-        data = {"input": text, "dct": normalized_dct}
-        headers = {"Content-type": "application/json", "Accept": "text/plain"}
+        normalized_dct = normalize_dct(dct)
 
-        try:
-            response = requests.post(self.temporal_url, json=data, headers=headers, timeout=20)
-            response.raise_for_status()
-            return response.text
-        except requests.RequestException as exc:
-            logger.warning("callTtkService failed: %s", exc)
-            return ""
+        def _fetch():
+            data = {"input": text, "dct": normalized_dct}
+            headers = {"Content-type": "application/json", "Accept": "text/plain"}
+            try:
+                response = get_service_client("ttk").post(self.temporal_url, json=data, headers=headers, timeout=20)
+                return response.text
+            except requests.RequestException as exc:
+                logger.warning("callTtkService failed: %s", exc)
+                return ""
+
+        return get_annotation_cache().get_or_fetch(self.temporal_url, text, normalized_dct, _fetch)
 
     def _get_ttk_xml(self, doc_id):
         return self.callTtkService(self.get_doc_text_and_dct(doc_id))
@@ -276,19 +297,20 @@ class TemporalPhase:
             logger.warning("callHeidelTimeService: missing text payload")
             return ""
 
-        payload = {"input": text}
-        if dct:
-            # HeidelTime requires YYYY-MM-DD; strip any time component
-            payload["dct"] = str(dct).split("T")[0]
-        headers = {"Content-type": "application/json", "Accept": "text/plain"}
+        def _fetch():
+            payload = {"input": text}
+            if dct:
+                # HeidelTime requires YYYY-MM-DD; strip any time component
+                payload["dct"] = str(dct).split("T")[0]
+            headers = {"Content-type": "application/json", "Accept": "text/plain"}
+            try:
+                response = get_service_client("heideltime").post(self.heideltime_url, json=payload, headers=headers, timeout=20)
+                return response.text
+            except requests.RequestException as exc:
+                logger.warning("callHeidelTimeService failed: %s", exc)
+                return ""
 
-        try:
-            response = requests.post(self.heideltime_url, json=payload, headers=headers, timeout=20)
-            response.raise_for_status()
-            return response.text
-        except requests.RequestException as exc:
-            logger.warning("callHeidelTimeService failed: %s", exc)
-            return ""
+        return get_annotation_cache().get_or_fetch(self.heideltime_url, text, dct, _fetch)
 
     def materialize_timexes(self, doc_id):
         logger.debug("materialize_timexes %s", doc_id)
@@ -7,6 +7,7 @@ instance.
 """
 
 import logging
+import re
 import sys
 import os
 
@@ -17,12 +18,14 @@ if __package__ is None and __name__ == '__main__':
     if repo_root not in sys.path:
         sys.path.insert(0, repo_root)
 
+from textgraphx.adapters.annotation_cache import get_annotation_cache, normalize_dct
+from textgraphx.adapters.service_client import get_service_client
 from textgraphx.database.client import make_graph_from_config
 from textgraphx.reasoning.contracts import count_endpoint_violations
 from textgraphx.reasoning.temporal.constraints import solve_tlink_constraints
+from textgraphx.reasoning.temporal.engine import TlinkReasoningEngine
 from textgraphx.reasoning.temporal.timeml_relations import CANONICAL_TLINK_RELTYPES
 import xml.etree.ElementTree as ET
-import requests
 import json
 
 logger = logging.getLogger(__name__)
@@ -44,7 +47,9 @@ class TlinksRecognizer:
     def _run_query(self, query, parameters=None):
         """Run a Cypher query via the configured graph, log a short preview and row count.
 
-        Returns the list from `.data()` or [] on error.
+        Returns the list from `.data()` or [] on error. While a document scope
+        is set, failures are also recorded (see :meth:`doc_scope_failures`) so
+        the caller does not stamp documents whose cases did not run.
         """
         qshort = (query.strip().replace("\n", " ")[:200] + "...") if len(query) > 200 else query.strip()
         try:
@@ -53,6 +58,8 @@ class TlinksRecognizer:
             return result
         except Exception:
             logger.exception("Query failed: %s", qshort)
+            if getattr(self, "_doc_scope", None) is not None:
+                self._doc_scope_failures.append(qshort)
             return []
 
     def get_annotated_text(self):
@@ -64,10 +71,110 @@ class TlinksRecognizer:
             logger.exception("Failed to fetch annotated text ids; returning empty list")
             return []
 
+    # Anchors prepended to a case query when the cases are scoped to a set of
+    # documents. Each one binds the case's own starting variable to the nodes
+    # of the document being processed (``scope_doc_id``), so the case body runs
+    # unchanged but only expands from that document.
+    _DOC_SCOPE_ANCHORS = {
+        # the case starts from AnnotatedText itself
+        "doc": """
+            MATCH ({var}:AnnotatedText) WHERE {var}.id = scope_doc_id
+            WITH {var}
+        """,
+        # the case starts from (or pivots on) a TEvent
+        "event": """
+            MATCH ({var}:TEvent) WHERE {var}.doc_id = scope_doc_id
+            WITH {var}
+        """,
+        # the case starts from a TIMEX
+        "timex": """
+            MATCH ({var}:TIMEX) WHERE {var}.doc_id = scope_doc_id
+            WITH {var}
+        """,
+    }
+
+    # Each scoped case runs as one statement: the document ids are unwound and
+    # the anchored case body is committed per batch of documents, returning
+    # only the case's count column.
+    _DOC_SCOPE_BATCH = """
+        UNWIND $doc_ids AS scope_doc_id
+        CALL {{
+            WITH scope_doc_id
+            {anchor}
+            {body}
+        }} IN TRANSACTIONS OF {docs_per_transaction} ROWS
+        RETURN sum({column}) AS {column}
+    """
+
+    _CASE_COUNT_COLUMN = re.compile(r"RETURN\s+count\([^)]*\)\s+AS\s+(\w+)\s*$")
+
+    DEFAULT_DOCS_PER_TRANSACTION = 10
+
+    def set_doc_scope(self, doc_ids, docs_per_transaction=None):
+        """Restrict subsequent case queries to documents with ``AnnotatedText.id in doc_ids``.
+
+        ``None`` restores whole-graph execution. The ids must have the same
+        type as the stored ``AnnotatedText.id`` / ``TEvent.doc_id`` values.
+        ``docs_per_transaction`` bounds how many documents each committed
+        batch covers. Setting the scope clears the recorded query failures.
+        """
+        self._doc_scope = None if doc_ids is None else list(doc_ids)
+        self._doc_scope_failures = []
+        self._docs_per_transaction = max(1, int(docs_per_transaction or self.DEFAULT_DOCS_PER_TRANSACTION))
+
+    def doc_scope_failures(self):
+        """Return previews of the queries that failed since the scope was set."""
+        return list(getattr(self, "_doc_scope_failures", []))
+
+    def _doc_scoped(self, query, var, anchor="event", params=None):
+        """Return the ``_run_query`` arguments for a case query.
+
+        Without a document scope the query and parameters are returned as-is.
+        With one, the case body is anchored on ``var`` and wrapped in the
+        per-document ``CALL { } IN TRANSACTIONS`` batch; the body must end
+        with ``RETURN count(...) AS <column>``.
+        """
+        doc_ids = getattr(self, "_doc_scope", None)
+        if doc_ids is None:
+            return (query,) if params is None else (query, params)
+        match = self._CASE_COUNT_COLUMN.search(query.strip())
+        if match is None:
+            raise ValueError("Document-scoped TLINK cases must end with RETURN count(...) AS <column>")
+        scoped_query = self._DOC_SCOPE_BATCH.format(
+            anchor=self._DOC_SCOPE_ANCHORS[anchor].format(var=var),
+            body=query,
+            docs_per_transaction=getattr(self, "_docs_per_transaction", self.DEFAULT_DOCS_PER_TRANSACTION),
+            column=match.group(1),
+        )
+        scoped_params = dict(params or {})
+        scoped_params["doc_ids"] = doc_ids
+        return scoped_query, scoped_params
+
+    def untlinked_document_ids(self):
+        """Return ids of AnnotatedText nodes the TLINK cases have not covered yet."""
+        query = """
+            MATCH (d:AnnotatedText)
+            WHERE d.tlinked_at IS NULL
+            RETURN d.id AS doc_id
+            ORDER BY doc_id
+        """
+        return [row["doc_id"] for row in self.graph.run(query).data()]
+
+    def mark_documents_tlinked(self, doc_ids, tlinked_at):
+        """Stamp ``tlinked_at`` on the given documents after a successful run."""
+        query = """
+            MATCH (d:AnnotatedText)
+            WHERE d.id IN $doc_ids
+            SET d.tlinked_at = $tlinked_at
+            RETURN count(d) AS marked
+        """
+        data = self.graph.run(query, {"doc_ids": list(doc_ids), "tlinked_at": tlinked_at}).data()
+        return data[0].get("marked", 0) if data else 0
+
     def create_tlinks_case1(self):
         logger.debug("create_tlinks_case1")
         query = """
-            MATCH p= (e1:TEvent)-[:FRAME_DESCRIBES_EVENT|DESCRIBES]-(f1:Frame)<-[:HAS_FRAME_ARGUMENT|PARTICIPANT]-(fa:FrameArgument {type: 'ARGM-TMP'})
+            MATCH (e1:TEvent)-[:FRAME_DESCRIBES_EVENT|DESCRIBES]-(f1:Frame)<-[:HAS_FRAME_ARGUMENT|PARTICIPANT]-(fa:FrameArgument {type: 'ARGM-TMP'})
                 <-[:IN_FRAME]-(et:TagOccurrence)-[:IN_FRAME]->(f2:Frame)-[:FRAME_DESCRIBES_EVENT|DESCRIBES]-(e2:TEvent)
             WHERE fa.headTokenIndex = et.tok_index_doc AND fa.signal = 'after'
               AND coalesce(e1.is_timeml_core, true) = true
@@ -81,14 +188,14 @@ class TlinksRecognizer:
             MERGE (e1)-[tl:TLINK]-(e2)
             ON CREATE SET tl.relType = 'AFTER', tl.source = 't2g', tl.confidence = 0.90, tl.rule_id = 'case1_after_eventive', tl.evidence_source = 'tlinks_recognizer'
             ON MATCH SET tl.relType = 'AFTER', tl.confidence = coalesce(tl.confidence, 0.90), tl.rule_id = coalesce(tl.rule_id, 'case1_after_eventive'), tl.evidence_source = coalesce(tl.evidence_source, 'tlinks_recognizer')
-            RETURN p
+            RETURN count(DISTINCT tl) AS touched
         """
-        return self._run_query(query)
+        return self._run_query(*self._doc_scoped(query, "e1"))
 
     def create_tlinks_case2(self):
         logger.debug("create_tlinks_case2")
         query = """
-            MATCH p= (e1:TEvent)-[:FRAME_DESCRIBES_EVENT|DESCRIBES]-(f1:Frame)<-[:HAS_FRAME_ARGUMENT|PARTICIPANT]-(fa:FrameArgument {type: 'ARGM-TMP'})
+            MATCH (e1:TEvent)-[:FRAME_DESCRIBES_EVENT|DESCRIBES]-(f1:Frame)<-[:HAS_FRAME_ARGUMENT|PARTICIPANT]-(fa:FrameArgument {type: 'ARGM-TMP'})
                 <-[:IN_FRAME]-(et:TagOccurrence {pos: 'VBG'})-[:IN_FRAME]->(f2:Frame)-[:FRAME_DESCRIBES_EVENT|DESCRIBES]-(e2:TEvent)
             WHERE fa.complement = et.text AND fa.syntacticType = 'EVENTIVE'
               AND coalesce(e1.is_timeml_core, true) = true
@@ -106,13 +213,13 @@ class TlinksRecognizer:
                     WHEN fa.signal IN ['before'] THEN 'BEFORE'
                     ELSE coalesce(tl.relType, 'VAGUE')
                 END
-            RETURN p
+            RETURN count(DISTINCT tl) AS touched
         """
-        return self._run_query(query)
+        return self._run_query(*self._doc_scoped(query, "e1"))
 
     def create_tlinks_case3(self):
         logger.debug("create_tlinks_case3")
-        query = """ MATCH p= (e1:TEvent)-[:FRAME_DESCRIBES_EVENT|DESCRIBES]-(f1:Frame)<-[:HAS_FRAME_ARGUMENT|PARTICIPANT]-(fa:FrameArgument where fa.type = 'ARGM-TMP')
+        query = """ MATCH (e1:TEvent)-[:FRAME_DESCRIBES_EVENT|DESCRIBES]-(f1:Frame)<-[:HAS_FRAME_ARGUMENT|PARTICIPANT]-(fa:FrameArgument where fa.type = 'ARGM-TMP')
                 <-[:IN_FRAME]-(et:TagOccurrence where et.pos = 'VBG')-[:IN_FRAME]->(f2:Frame)-[:FRAME_DESCRIBES_EVENT|DESCRIBES]-(e2:TEvent)
                     where fa.headTokenIndex = et.tok_index_doc and fa.syntacticType = 'EVENTIVE'
                     and coalesce(e1.is_timeml_core, true) = true
@@ -131,9 +238,9 @@ class TlinksRecognizer:
                         WHEN fa.signal in ['following'] THEN 'AFTER'
                         ELSE coalesce(tl.relType, 'VAGUE')
                     END
-                    RETURN p
+                    RETURN count(DISTINCT tl) AS touched
         """
-        return self._run_query(query)
+        return self._run_query(*self._doc_scoped(query, "e1"))
 
     def create_tlinks_case4(self):
         logger.debug("create_tlinks_case4")
@@ -164,7 +271,7 @@ class TlinksRecognizer:
                 tlink.confidence = 0.88, tlink.rule_id = 'case4_timex_head_match', tlink.evidence_source = 'tlinks_recognizer'
             RETURN count(tlink) AS touched
         """
-        return self._run_query(query)
+        return self._run_query(*self._doc_scoped(query, "e"))
 
     def create_tlinks_case5(self):
         logger.debug("create_tlinks_case5")
@@ -212,11 +319,11 @@ class TlinksRecognizer:
                 END
             RETURN count(tlink) AS touched
         """
-        return self._run_query(query)
+        return self._run_query(*self._doc_scoped(query, "e"))
 
     def create_tlinks_case6(self):
         logger.debug("create_tlinks_case6")
-        query = """ MATCH p = (e:TEvent)<-[:TRIGGERS]-(t:TagOccurrence)<-[:HAS_TOKEN]-(s:Sentence)<-[:CONTAINS_SENTENCE]-(ann:AnnotatedText)-[:CREATED_ON]->(dct)
+        query = """ MATCH (e:TEvent)<-[:TRIGGERS]-(t:TagOccurrence)<-[:HAS_TOKEN]-(s:Sentence)<-[:CONTAINS_SENTENCE]-(ann:AnnotatedText)-[:CREATED_ON]->(dct)
                 WHERE dct:TIMEX OR dct:Timex3
                 AND coalesce(e.is_timeml_core, true) = true
                 AND coalesce(e.low_confidence, false) = false
@@ -236,9 +343,9 @@ class TlinksRecognizer:
                         ELSE coalesce(tlink.relType, 'VAGUE')
                     END
 
-                    RETURN p
+                    RETURN count(DISTINCT tlink) AS touched
         """
-        return self._run_query(query)
+        return self._run_query(*self._doc_scoped(query, "ann", "doc"))
 
     def create_tlinks_case7(self):
         logger.debug("create_tlinks_case7")
@@ -272,7 +379,7 @@ class TlinksRecognizer:
             END
         RETURN count(tl) AS created
         """
-        return self._run_query(query)
+        return self._run_query(*self._doc_scoped(query, "e_main"))
 
     def create_tlinks_case8(self):
         """DISABLED — NewsReader Subtask 1 explicitly prohibits linking non-verbal events to DCT.
@@ -341,7 +448,7 @@ class TlinksRecognizer:
                 tl.evidence_source  = coalesce(tl.evidence_source, 'tlinks_recognizer')
             RETURN count(tl) AS created
         """
-        return self._run_query(query)
+        return self._run_query(*self._doc_scoped(query, "e"))
 
     def create_tlinks_case10(self):
         """D3 — Link NOMBANK-promoted nominal events to SRL-derived ARGM-TMP candidates.
@@ -390,7 +497,7 @@ class TlinksRecognizer:
                 tl.evidence_source  = coalesce(tl.evidence_source, 'tlinks_recognizer')
             RETURN count(tl) AS created
         """
-        return self._run_query(query)
+        return self._run_query(*self._doc_scoped(query, "e"))
 
     def create_tlinks_case11(self):
         """D4 — Link canonical TEvents to their SRL time-anchor via HAS_TIME_ANCHOR (Step 11).
@@ -440,7 +547,7 @@ class TlinksRecognizer:
                 tl.evidence_source  = coalesce(tl.evidence_source, 'tlinks_recognizer')
             RETURN count(tl) AS created
         """
-        return self._run_query(query)
+        return self._run_query(*self._doc_scoped(query, "e"))
 
     # ===================================================================
     # Cases 12-18: Enhanced extraction grounded in NewsReader guidelines
@@ -525,7 +632,7 @@ class TlinksRecognizer:
                 tl.evidence_source  = coalesce(tl.evidence_source, 'tlinks_recognizer')
             RETURN count(tl) AS created
         """
-        return self._run_query(query)
+        return self._run_query(*self._doc_scoped(query, "e_src"))
 
     def create_tlinks_case13(self):
         """Case 13 — Infer TLINK from CLINK edges (NewsReader §10.3).
@@ -722,7 +829,7 @@ class TlinksRecognizer:
                 tl.evidence_source  = coalesce(tl.evidence_source, 'tlinks_recognizer')
             RETURN count(tl) AS created
         """
-        return self._run_query(query)
+        return self._run_query(*self._doc_scoped(query, "e"))
 
     def create_tlinks_case16(self):
         """Case 16 — Cross-sentence consecutive main event chain (NewsReader Subtask 2).
@@ -809,7 +916,7 @@ class TlinksRecognizer:
                 tl.evidence_source  = coalesce(tl.evidence_source, 'tlinks_recognizer')
             RETURN count(tl) AS created
         """
-        return self._run_query(query)
+        return self._run_query(*self._doc_scoped(query, "ann", "doc"))
 
     def create_tlinks_case17(self):
         """Case 17 — TIMEX–TIMEX temporal links (NewsReader Subtask 5).
@@ -852,7 +959,7 @@ class TlinksRecognizer:
                 tl.evidence_source  = coalesce(tl.evidence_source, 'tlinks_recognizer')
             RETURN count(tl) AS created
         """
-        r17a = self._run_query(query_17a)
+        r17a = self._run_query(*self._doc_scoped(query_17a, "t1", "timex"))
 
         # Sub-case 17b: DURATION IS_INCLUDED in DATE/SET (same sentence)
         # "for 3 months in 2010" → (3 months) IS_INCLUDED (2010)
@@ -885,7 +992,7 @@ class TlinksRecognizer:
                 tl.evidence_source  = coalesce(tl.evidence_source, 'tlinks_recognizer')
             RETURN count(tl) AS created
         """
-        r17b = self._run_query(query_17b)
+        r17b = self._run_query(*self._doc_scoped(query_17b, "ann", "doc"))
         return r17a, r17b
 
     def create_tlinks_case18(self):
@@ -973,7 +1080,7 @@ class TlinksRecognizer:
                 tl.signalText       = coalesce(tl.signalText, sig_text)
             RETURN count(tl) AS created
         """
-        results = self._run_query(query)
+        results = self._run_query(*self._doc_scoped(query, "e1"))
 
         # Also expand Cases 1-3 signal matching via fa.signal property for additional conjunctions
         query_fa_signal = """
@@ -1029,7 +1136,7 @@ class TlinksRecognizer:
                 tl.signalText       = coalesce(tl.signalText, sig)
             RETURN count(tl) AS created
         """
-        results_b = self._run_query(query_fa_signal)
+        results_b = self._run_query(*self._doc_scoped(query_fa_signal, "e1"))
         return results, results_b
 
     def create_tlinks_case20(self):
@@ -1106,7 +1213,7 @@ class TlinksRecognizer:
                 tl.evidence_source  = coalesce(tl.evidence_source, 'tlinks_recognizer')
             RETURN count(tl) AS created
         """
-        results_20a = self._run_query(query_20a)
+        results_20a = self._run_query(*self._doc_scoped(query_20a, "e"))
         created_20a = results_20a[0].get("created", 0) if results_20a else 0
 
         # --- 20b: DCT INCLUDES unanchored events ---
@@ -1139,7 +1246,7 @@ class TlinksRecognizer:
                 tl.evidence_source  = coalesce(tl.evidence_source, 'tlinks_recognizer')
             RETURN count(tl) AS created
         """
-        results_20b = self._run_query(query_20b)
+        results_20b = self._run_query(*self._doc_scoped(query_20b, "ann", "doc"))
         created_20b = results_20b[0].get("created", 0) if results_20b else 0
 
         logger.info(
@@ -1258,7 +1365,7 @@ class TlinksRecognizer:
                 tl_inv.evidence_source  = coalesce(tl_inv.evidence_source, 'tlinks_recognizer')
             RETURN count(tl_inv) AS created
         """
-        results = self._run_query(query)
+        results = self._run_query(*self._doc_scoped(query, "ann", "doc"))
         created = results[0].get("created", 0) if results else 0
         logger.info("create_tlinks_case22: dateline-includes/simultaneous=%d", created)
         return results
@@ -1393,10 +1500,10 @@ class TlinksRecognizer:
             RETURN count(tl) AS created
         """
 
-        r_a_after = self._run_query(query_a_after)
-        r_a_before = self._run_query(query_a_before)
-        r_b_after = self._run_query(query_b_after)
-        r_b_before = self._run_query(query_b_before)
+        r_a_after = self._run_query(*self._doc_scoped(query_a_after, "e1"))
+        r_a_before = self._run_query(*self._doc_scoped(query_a_before, "e1"))
+        r_b_after = self._run_query(*self._doc_scoped(query_b_after, "e_main"))
+        r_b_before = self._run_query(*self._doc_scoped(query_b_before, "e_main"))
         c_a_after = r_a_after[0].get("created", 0) if r_a_after else 0
         c_a_before = r_a_before[0].get("created", 0) if r_a_before else 0
         c_b_after = r_b_after[0].get("created", 0) if r_b_after else 0
@@ -1453,7 +1560,7 @@ class TlinksRecognizer:
                 tl.evidence_source = 'tlinks_recognizer'
             RETURN count(tl) AS created
         """
-        rows = self._run_query(query)
+        rows = self._run_query(*self._doc_scoped(query, "e"))
         created = rows[0].get("created", 0) if rows else 0
         logger.info("create_tlinks_case24: created=%d advmod IS_INCLUDED edges", created)
         return rows
@@ -1549,7 +1656,9 @@ class TlinksRecognizer:
 
             RETURN count(tl_inv) AS created
         """
-        results = self._run_query(query, parameters={"reporting_verbs": _REPORTING_VERBS})
+        results = self._run_query(
+            *self._doc_scoped(query, "ann", "doc", params={"reporting_verbs": _REPORTING_VERBS})
+        )
         created = results[0].get("created", 0) if results else 0
         logger.info("create_tlinks_case25: reporting-verb dateline-includes=%d", created)
         return results
@@ -1629,7 +1738,7 @@ class TlinksRecognizer:
 
             RETURN count(tl_inv) AS created
         """
-        results = self._run_query(query)
+        results = self._run_query(*self._doc_scoped(query, "e"))
         created = results[0].get("created", 0) if results else 0
         logger.info("create_tlinks_case26: nominal-dep-is-included=%d", created)
         return results
@@ -1673,7 +1782,7 @@ class TlinksRecognizer:
                 tlink.evidence_source  = 'tlinks_recognizer'
             RETURN count(tlink) AS touched
         """
-        results = self._run_query(query)
+        results = self._run_query(*self._doc_scoped(query, "e"))
         touched = results[0].get("touched", 0) if results else 0
         logger.info("create_tlinks_case27: npadvmod-last-week=%d", touched)
         return results
@@ -1952,6 +2061,32 @@ class TlinksRecognizer:
         )
         return summary
 
+    def apply_tlink_reasoning(self, shadow_only: bool = False, allen_check: bool = False, doc_ids=None):
+        """Run inverses, closure, constraint solving and suppression per document in memory.
+
+        Equivalent to materialize_tlink_inverses, apply_tlink_transitive_closure,
+        apply_constraint_solver and suppress_tlink_conflicts in that order, but
+        each document's TLINKs are loaded once and only the delta is written
+        back (see ``reasoning.temporal.engine``). ``doc_ids`` defaults to every
+        AnnotatedText.
+        """
+        if doc_ids is None:
+            doc_ids = self.get_annotated_text()
+        engine = TlinkReasoningEngine(self.graph, shadow_only=shadow_only, allen_check=allen_check)
+        summary = engine.run(doc_ids)
+        logger.info(
+            "apply_tlink_reasoning: documents=%d case19_inverses=%d closure_created=%d "
+            "inverse_created=%d bidirectional_conflicts=%d contradictions=%d shadow_only=%s",
+            summary["documents"],
+            summary["case19_inverses"],
+            summary["closure_created"],
+            summary["inverse_created"],
+            summary["bidirectional_conflicts"],
+            summary["contradictions"],
+            shadow_only,
+        )
+        return summary
+
     def enforce_tlink_anchor_consistency(self, shadow_only: bool = False):
         """Validate TLINK anchors and optionally suppress inconsistent links.
 
@@ -2036,7 +2171,13 @@ class TlinksRecognizer:
     def get_doc_text_and_dct(self, doc_id):
         """Retrieve document text and creation time from AnnotatedText node."""
         logger.debug("get_doc_text_and_dct for doc_id=%s", doc_id)
-        query = "MATCH (n:AnnotatedText) WHERE n.id = toInteger($doc_id) RETURN n.text AS text, n.creationtime AS dct"
+        # Same DCT resolution as TemporalPhase so both phases share one
+        # annotation-cache entry per document.
+        query = """
+            MATCH (n:AnnotatedText) WHERE n.id = toInteger($doc_id)
+            RETURN n.text AS text,
+                   coalesce(n.dct, n.creationtime, n.documentCreationTime) AS dct
+        """
         try:
             data = self.graph.run(query, parameters={"doc_id": doc_id}).data()
             if data:
@@ -2049,21 +2190,35 @@ class TlinksRecognizer:
         return {"input": "", "dct": ""}
 
     def callTtkService(self, parameters):
-        """Call TTK service and return XML response body."""
+        """Call TTK service and return XML response body.
+
+        Responses are served from the shared annotation cache, so the XML
+        produced during the temporal phase is reused here instead of
+        re-annotating the document.
+        """
         logger.debug("callTtkService with dct=%s", parameters.get("dct"))
+        text = parameters.get("input") or ""
+        dct = normalize_dct(parameters.get("dct"))
         try:
             from textgraphx.infrastructure.config import get_config
 
             cfg = get_config()
             ttk_url = cfg.services.temporal_url
-            response = requests.post(ttk_url, json=parameters, timeout=30)
-            response.raise_for_status()
-            logger.info("TTK service returned status %d", response.status_code)
-            return response.text
         except Exception:
             logger.exception("TTK service call failed")
             return ""
 
+        def _fetch():
+            try:
+                response = get_service_client("ttk").post(ttk_url, json={"input": text, "dct": dct}, timeout=30)
+                logger.info("TTK service returned status %d", response.status_code)
+                return response.text
+            except Exception:
+                logger.exception("TTK service call failed")
+                return ""
+
+        return get_annotation_cache().get_or_fetch(ttk_url, text, dct, _fetch)
+
     def _get_ttk_xml(self, doc_id):
         """Get TTK XML output for a document."""
         logger.debug("_get_ttk_xml for doc_id=%s", doc_id)
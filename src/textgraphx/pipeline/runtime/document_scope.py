@@ -0,0 +1,65 @@
+"""Process-wide document scope for document-restricted phase execution.
+
+Phase wrappers normally work over every document in the graph. A sharded
+orchestrator worker enters :func:`document_scope` before running its phase
+chain; ``GraphBasedNLP.store_corpus`` adds the documents it reads from the
+shard directory to the active scope, and the refinement, temporal and
+event-enrichment wrappers restrict their work to it with
+:func:`restrict_to_scope`. Cross-document steps are skipped inside a scope and
+run once by the orchestrator after every shard finished.
+
+:func:`restrict_to_scope` also applies the changed set of the last incremental
+ingestion run (see :mod:`textgraphx.pipeline.ingestion.ingestion_manifest`).
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, Set
+
+_lock = threading.Lock()
+_active_scope: Optional[Set[str]] = None
+
+
+@contextmanager
+def document_scope(doc_ids: Iterable = ()) -> Iterator[Set[str]]:
+    """Restrict scope-aware phases to *doc_ids* (and documents added later)."""
+    global _active_scope
+    with _lock:
+        previous = _active_scope
+        _active_scope = {str(doc_id) for doc_id in doc_ids}
+        scope = _active_scope
+    try:
+        yield scope
+    finally:
+        with _lock:
+            _active_scope = previous
+
+
+def active_document_scope() -> Optional[Set[str]]:
+    """Return a copy of the active scope, or ``None`` when phases are unrestricted."""
+    with _lock:
+        return None if _active_scope is None else set(_active_scope)
+
+
+def extend_document_scope(doc_ids: Iterable) -> None:
+    """Add *doc_ids* to the active scope; a no-op when no scope is active."""
+    with _lock:
+        if _active_scope is not None:
+            _active_scope.update(str(doc_id) for doc_id in doc_ids)
+
+
+def restrict_to_scope(doc_ids: Iterable, changed_only: bool = True) -> list:
+    """Keep the members of *doc_ids* inside the active scope.
+
+    With *changed_only* the changed set of the last incremental ingestion run
+    is applied too.
+    """
+    from textgraphx.pipeline.ingestion.ingestion_manifest import scope_to_changed_documents
+
+    doc_ids = scope_to_changed_documents(doc_ids) if changed_only else list(doc_ids)
+    scope = active_document_scope()
+    if scope is None:
+        return doc_ids
+    return [doc_id for doc_id in doc_ids if str(doc_id) in scope]
@@ -8,19 +8,20 @@ Public surface
 --------------
 * ``PhaseThresholds``   – dataclass holding per-phase minimum counts.
 * ``AssertionResult``   – dataclass returned by every check method.
-* ``PhaseAssertions``   – one method per phase; queries Neo4j.
+* ``PhaseAssertions``   – one method per phase; one planned Neo4j query each.
 * ``record_phase_run``  – write a ``PhaseRun`` marker node to the graph.
 """
 
 from __future__ import annotations
 
+import json
 import logging
 from dataclasses import dataclass, field
 from math import inf
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from textgraphx.reasoning.temporal.time import utc_iso_now
-from textgraphx.reasoning.contracts import count_endpoint_violations
+from textgraphx.reasoning.contracts import endpoint_violation_condition
 from textgraphx.reasoning.provenance import validate_inferred_relationship_provenance
 
 logger = logging.getLogger(__name__)
@@ -151,6 +152,149 @@ class AssertionResult:
             logger.warning(err)
 
 
+# ---------------------------------------------------------------------------
+# Assertion planner
+# ---------------------------------------------------------------------------
+#
+# The counts behind a phase's checks are grouped by the label or relationship
+# type they scan. Each group becomes one ``CALL {}`` subquery that computes all
+# of its counts in a single pass (conditional counts use ``count(CASE ...)``),
+# and all groups of a phase are sent as one query. A group that only counts a
+# whole label or relationship type is still answered from the count store; in
+# an unscoped run a label or relationship group's plain total goes into its
+# own ``CALL {}`` for the same reason, next to the subquery that computes the
+# group's conditional counts.
+# With a document scope, a group starts from the nodes of the scoped
+# documents (indexed ``doc_id`` or the document's tokens) instead of scanning
+# the whole label; relationship groups start from their document-owned
+# endpoint.
+
+
+@dataclass(frozen=True)
+class _Tally:
+    """One named count of a scan group: ``count(var)``, optionally conditional."""
+
+    key: str
+    var: str
+    condition: Optional[str] = None
+    distinct: bool = False
+
+    def expression(self) -> str:
+        distinct = "DISTINCT " if self.distinct else ""
+        if self.condition is None:
+            return f"count({distinct}{self.var})"
+        return f"count({distinct}CASE WHEN {self.condition} THEN {self.var} END)"
+
+
+@dataclass(frozen=True)
+class _ScanGroup:
+    """Tallies computed over one MATCH; *scoped_match* replaces it in doc-scoped runs."""
+
+    match: str
+    scoped_match: str
+    tallies: Tuple[_Tally, ...]
+    params: Dict[str, Any] = field(default_factory=dict)
+    # *match* is a bare label or relationship-type pattern whose plain
+    # ``count`` the count store answers.
+    count_store: bool = False
+
+    def split_totals(self) -> List[Tuple[_Tally, ...]]:
+        """Return the tallies to compute per subquery in an unscoped run."""
+        if not self.count_store:
+            return [self.tallies]
+        totals = tuple(t for t in self.tallies if t.condition is None and not t.distinct)
+        rest = tuple(t for t in self.tallies if t not in totals)
+        return [part for part in (totals, rest) if part]
+
+
+_DOC_TOKENS = (
+    "MATCH (scope_doc:AnnotatedText)-[:CONTAINS_SENTENCE]->(:Sentence)-[:HAS_TOKEN]->"
+)
+
+
+def _scope_nodes(var: str, doc_id_labels: Sequence[str] = (), span_labels: Sequence[str] = ()) -> str:
+    """Return clauses binding *var* to the nodes of the scoped documents.
+
+    Nodes of *doc_id_labels* are found through their indexed ``doc_id``; span
+    nodes of *span_labels* through the document's tokens.
+    """
+    branches = [f"MATCH ({var}:{label}) WHERE {var}.doc_id IN $doc_ids" for label in doc_id_labels]
+    if len(span_labels) == 1:
+        branches.append(
+            f"{_DOC_TOKENS}(:TagOccurrence)-[:IN_MENTION|IN_FRAME|PARTICIPATES_IN]->({var}:{span_labels[0]}) "
+            "WHERE scope_doc.id IN $doc_ids"
+        )
+    elif span_labels:
+        label_test = " OR ".join(f"{var}:{label}" for label in span_labels)
+        branches.append(
+            f"{_DOC_TOKENS}(:TagOccurrence)-[:IN_MENTION|IN_FRAME|PARTICIPATES_IN]->({var}) "
+            f"WHERE scope_doc.id IN $doc_ids AND ({label_test})"
+        )
+    if len(branches) == 1:
+        return f"{branches[0]}\nWITH DISTINCT {var}"
+    union = "\n  UNION\n  ".join(f"{branch} RETURN {var}" for branch in branches)
+    return f"CALL {{\n  {union}\n}}"
+
+
+def _scope_tokens(var: str) -> str:
+    """Return clauses binding *var* to the tokens of the scoped documents."""
+    return f"{_DOC_TOKENS}({var}:TagOccurrence) WHERE scope_doc.id IN $doc_ids"
+
+
+# REFERS_TO edges start at mentions (doc_id) or at token-attached spans.
+_REFERS_TO_SCOPE = _scope_nodes(
+    "s",
+    doc_id_labels=("EntityMention", "EventMention", "TimexMention"),
+    span_labels=("NamedEntity", "FrameArgument", "Antecedent"),
+)
+
+
+def _node_group(var: str, label: str, scope: str, *tallies: _Tally) -> _ScanGroup:
+    return _ScanGroup(match=f"MATCH ({var}:{label})", scoped_match=scope, tallies=tallies, count_store=True)
+
+
+def _relationship_group(
+    rel_type: str,
+    scope: str,
+    *tallies: _Tally,
+    endpoint_key: Optional[str] = None,
+) -> _ScanGroup:
+    """Scan ``(s)-[r:rel_type]->(t)``; *endpoint_key* adds the endpoint-contract count.
+
+    *scope* binds ``s`` or ``t`` to the scoped documents.
+    """
+    match = f"MATCH (s)-[r:{rel_type}]->(t)"
+    params: Dict[str, Any] = {}
+    if endpoint_key is not None:
+        condition = endpoint_violation_condition(rel_type)
+        if condition is None:
+            tallies += (_Tally(endpoint_key, "r", "false"),)
+        else:
+            predicate, params = condition
+            tallies += (_Tally(endpoint_key, "r", predicate),)
+    return _ScanGroup(
+        match=match, scoped_match=f"{scope}\n{match}", tallies=tallies, params=params, count_store=True
+    )
+
+
+def _doc_scope_values(doc_ids: Iterable) -> List[Any]:
+    """Return *doc_ids* as strings and, when numeric, ints so either stored type matches."""
+    values: List[Any] = []
+    for doc_id in doc_ids:
+        text = str(doc_id).strip()
+        values.append(text)
+        if text.lstrip("-").isdigit():
+            values.append(int(text))
+    return list(dict.fromkeys(values))
+
+
+_CONTRADICTORY_TLINK_PAIRS = (
+    "[['BEFORE', 'AFTER'], ['AFTER', 'BEFORE'], ['INCLUDES', 'IS_INCLUDED'], "
+    "['IS_INCLUDED', 'INCLUDES'], ['BEGINS', 'BEGUN_BY'], ['BEGUN_BY', 'BEGINS'], "
+    "['ENDS', 'ENDED_BY'], ['ENDED_BY', 'ENDS']]"
+)
+
+
 # ---------------------------------------------------------------------------
 # Phase assertions
 # ---------------------------------------------------------------------------
@@ -173,6 +317,14 @@ class PhaseAssertions:
         When ``True``, canonical transition telemetry checks in
         ``after_event_enrichment`` are promoted from warning-only signals
         to assertion failures when legacy edges outnumber canonical edges.
+    doc_ids :
+        Restrict the counts to these documents (``AnnotatedText.id`` /
+        ``doc_id`` values), e.g. the documents of an incremental run.
+        ``None`` (default) checks the whole graph. Provenance contract checks
+        always cover the whole graph.
+
+    Each ``after_*`` method sends its counts as one planned query (see the
+    assertion planner above).
     """
 
     def __init__(
@@ -182,22 +334,42 @@ class PhaseAssertions:
         hard_fail: bool = False,
         strict_transition_gate: bool = False,
         enforce_provenance_contracts: bool = False,
+        doc_ids: Optional[Iterable] = None,
     ) -> None:
         self._graph = graph
         self._thresholds = thresholds or PhaseThresholds()
         self._hard_fail = hard_fail
         self._strict_transition_gate = strict_transition_gate
         self._enforce_provenance_contracts = enforce_provenance_contracts
+        self._doc_ids = None if doc_ids is None else _doc_scope_values(doc_ids)
 
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _count(self, cypher: str, params: Optional[Dict] = None) -> int:
-        rows = self._graph.run(cypher, params or {}).data()
-        if rows:
-            return rows[0].get("c", 0)
-        return 0
+    def _plan_query(self, groups: Sequence[_ScanGroup]) -> Tuple[str, Dict[str, Any], List[str]]:
+        """Return the combined query, its parameters and its result columns."""
+        scoped = self._doc_ids is not None
+        subqueries: List[str] = []
+        params: Dict[str, Any] = {}
+        keys: List[str] = []
+        for group in groups:
+            match = group.scoped_match if scoped else group.match
+            for tallies in [group.tallies] if scoped else group.split_totals():
+                returns = ", ".join(f"{tally.expression()} AS {tally.key}" for tally in tallies)
+                subqueries.append(f"CALL {{\n{match}\nRETURN {returns}\n}}")
+            params.update(group.params)
+            keys.extend(tally.key for tally in group.tallies)
+        if scoped:
+            params["doc_ids"] = self._doc_ids
+        return "\n".join(subqueries) + "\nRETURN " + ", ".join(keys), params, keys
+
+    def _run_plan(self, *groups: _ScanGroup) -> Dict[str, int]:
+        """Run *groups* as one query and return every tally by key."""
+        query, params, keys = self._plan_query(groups)
+        rows = self._graph.run(query, params).data()
+        row = rows[0] if rows else {}
+        return {key: int(row.get(key, 0) or 0) for key in keys}
 
     def _finalize(self, result: AssertionResult) -> AssertionResult:
         result.log_summary()
@@ -260,21 +432,23 @@ class PhaseAssertions:
         t = self._thresholds
         result = AssertionResult(phase="ingestion", passed=True)
 
-        result.add_check(
-            "AnnotatedText nodes",
-            self._count("MATCH (n:AnnotatedText) RETURN count(n) AS c"),
-            t.min_annotated_text,
-        )
-        result.add_check(
-            "Sentence nodes",
-            self._count("MATCH (n:Sentence) RETURN count(n) AS c"),
-            t.min_sentences,
-        )
-        result.add_check(
-            "TagOccurrence nodes",
-            self._count("MATCH (n:TagOccurrence) RETURN count(n) AS c"),
-            t.min_tag_occurrences,
+        counts = self._run_plan(
+            _ScanGroup(
+                match="MATCH (n:AnnotatedText)",
+                scoped_match="MATCH (n:AnnotatedText) WHERE n.id IN $doc_ids",
+                tallies=(_Tally("annotated_text", "n"),),
+            ),
+            _ScanGroup(
+                match="MATCH (n:Sentence)",
+                scoped_match="MATCH (scope_doc:AnnotatedText)-[:CONTAINS_SENTENCE]->(n:Sentence) "
+                "WHERE scope_doc.id IN $doc_ids",
+                tallies=(_Tally("sentences", "n"),),
+            ),
+            _node_group("n", "TagOccurrence", _scope_tokens("n"), _Tally("tag_occurrences", "n")),
         )
+        result.add_check("AnnotatedText nodes", counts["annotated_text"], t.min_annotated_text)
+        result.add_check("Sentence nodes", counts["sentences"], t.min_sentences)
+        result.add_check("TagOccurrence nodes", counts["tag_occurrences"], t.min_tag_occurrences)
 
         return self._finalize(result)
 
@@ -283,89 +457,87 @@ class PhaseAssertions:
         t = self._thresholds
         result = AssertionResult(phase="refinement", passed=True)
 
-        result.add_check(
-            "NamedEntity nodes with head assigned",
-            self._count(
-                "MATCH (n:NamedEntity) WHERE n.head IS NOT NULL RETURN count(n) AS c"
+        counts = self._run_plan(
+            _node_group(
+                "ne", "NamedEntity", _scope_nodes("ne", span_labels=("NamedEntity",)),
+                _Tally("named_entities_with_head", "ne", "ne.head IS NOT NULL"),
+                _Tally(
+                    "named_entities_missing_token_identity",
+                    "ne",
+                    "ne.token_id IS NULL OR ne.token_start IS NULL OR ne.token_end IS NULL",
+                ),
             ),
-            t.min_named_entities_with_head,
-        )
-        result.add_check(
-            "REFERS_TO relationships",
-            self._count(
-                "MATCH ()-[r:REFERS_TO]->() RETURN count(r) AS c"
+            _relationship_group(
+                "REFERS_TO", _REFERS_TO_SCOPE,
+                _Tally("refers_to", "r"),
+                endpoint_key="refers_to_endpoint_violations",
+            ),
+            _relationship_group(
+                "HAS_LEMMA", _scope_tokens("s"),
+                _Tally("has_lemma", "r"),
+                endpoint_key="has_lemma_endpoint_violations",
+            ),
+            _node_group(
+                "em", "EntityMention",
+                _scope_nodes("em", doc_id_labels=("EntityMention",), span_labels=("EntityMention",)),
+                _Tally(
+                    "nominal_semantic_heads",
+                    "em",
+                    "em.nominalSemanticHead IS NOT NULL OR em.nominalSemanticHeadTokenIndex IS NOT NULL",
+                ),
+                _Tally(
+                    "entity_mentions_missing_refers_to",
+                    "em",
+                    "NOT EXISTS { MATCH (em)-[:REFERS_TO]->(:Entity) }",
+                ),
+                _Tally(
+                    "entity_mentions_missing_identity",
+                    "em",
+                    "em.doc_id IS NULL OR em.start_tok IS NULL OR em.end_tok IS NULL",
+                ),
             ),
-            t.min_refers_to_rels,
         )
+
         result.add_check(
-            "HAS_LEMMA relationships",
-            self._count(
-                "MATCH ()-[r:HAS_LEMMA]->() RETURN count(r) AS c"
-            ),
-            t.min_has_lemma_rels,
+            "NamedEntity nodes with head assigned",
+            counts["named_entities_with_head"],
+            t.min_named_entities_with_head,
         )
+        result.add_check("REFERS_TO relationships", counts["refers_to"], t.min_refers_to_rels)
+        result.add_check("HAS_LEMMA relationships", counts["has_lemma"], t.min_has_lemma_rels)
         result.add_check(
             "EntityMention nodes with nominal semantic head",
-            self._count(
-                """
-                MATCH (m:EntityMention)
-                WHERE m.nominalSemanticHead IS NOT NULL
-                   OR m.nominalSemanticHeadTokenIndex IS NOT NULL
-                RETURN count(m) AS c
-                """
-            ),
+            counts["nominal_semantic_heads"],
             t.min_nominal_semantic_heads,
         )
         self._add_upper_bound_check(
             result,
             label="Endpoint contract violations (REFERS_TO)",
-            actual=count_endpoint_violations(self._graph, "REFERS_TO"),
+            actual=counts["refers_to_endpoint_violations"],
             maximum=t.max_refinement_endpoint_contract_violations,
         )
         self._add_upper_bound_check(
             result,
             label="Endpoint contract violations (HAS_LEMMA)",
-            actual=count_endpoint_violations(self._graph, "HAS_LEMMA"),
+            actual=counts["has_lemma_endpoint_violations"],
             maximum=t.max_refinement_endpoint_contract_violations,
         )
         self._add_upper_bound_check(
             result,
             label="EntityMention nodes missing REFERS_TO->Entity",
-            actual=self._count(
-                """
-                MATCH (em:EntityMention)
-                WHERE NOT EXISTS { MATCH (em)-[:REFERS_TO]->(:Entity) }
-                RETURN count(em) AS c
-                """
-            ),
+            actual=counts["entity_mentions_missing_refers_to"],
             maximum=t.max_entity_mentions_missing_refers_to_entity,
         )
         self._add_upper_bound_check(
             result,
             label="NamedEntity nodes missing token identity fields",
-            actual=self._count(
-                """
-                MATCH (ne:NamedEntity)
-                WHERE ne.token_id IS NULL
-                   OR ne.token_start IS NULL
-                   OR ne.token_end IS NULL
-                RETURN count(ne) AS c
-                """
-            ),
+            actual=counts["named_entities_missing_token_identity"],
             maximum=t.max_named_entities_missing_token_identity,
         )
         self._add_upper_bound_check(
             result,
             label="EntityMention nodes missing doc/span identity fields",
-            actual=self._count(
-                """
-                MATCH (em:EntityMention)
-                WHERE em.doc_id IS NULL
-                   OR em.start_tok IS NULL
-                   OR em.end_tok IS NULL
-                RETURN count(em) AS c
-                """
-            ),
+            actual=counts["entity_mentions_missing_identity"],
             maximum=t.max_entity_mentions_missing_identity_fields,
         )
 
@@ -376,75 +548,62 @@ class PhaseAssertions:
         t = self._thresholds
         result = AssertionResult(phase="temporal", passed=True)
 
-        result.add_check(
-            "TEvent nodes",
-            self._count("MATCH (n:TEvent) RETURN count(n) AS c"),
-            t.min_tevents,
-        )
-        result.add_check(
-            "TIMEX nodes",
-            self._count("MATCH (n:TIMEX) RETURN count(n) AS c"),
-            t.min_timex,
-        )
-        result.add_check(
-            "Signal nodes",
-            self._count("MATCH (n:Signal) RETURN count(n) AS c"),
-            t.min_signals,
+        counts = self._run_plan(
+            _node_group(
+                "e", "TEvent", _scope_nodes("e", doc_id_labels=("TEvent",)),
+                _Tally("tevents", "e"),
+                _Tally(
+                    "tevents_missing_timeml_core",
+                    "e",
+                    "e.eid IS NULL OR e.tense IS NULL OR e.aspect IS NULL "
+                    "OR e.polarity IS NULL OR e.pos IS NULL",
+                ),
+            ),
+            _node_group(
+                "x", "TIMEX", _scope_nodes("x", doc_id_labels=("TIMEX",)),
+                _Tally("timex", "x"),
+                _Tally("timex_missing_timeml_core", "x", "x.tid IS NULL OR x.type IS NULL OR x.value IS NULL"),
+            ),
+            _node_group(
+                "sg", "Signal", _scope_nodes("sg", doc_id_labels=("Signal",)),
+                _Tally("signals", "sg"),
+                _Tally(
+                    "signals_missing_text_span",
+                    "sg",
+                    "sg.text IS NULL OR sg.start_tok IS NULL OR sg.end_tok IS NULL",
+                ),
+            ),
+            _relationship_group(
+                "TLINK", _scope_nodes("s", doc_id_labels=("TEvent", "TIMEX")),
+                _Tally("tlinks_missing_reltype_canonical", "r", "r.relTypeCanonical IS NULL"),
+            ),
         )
+
+        result.add_check("TEvent nodes", counts["tevents"], t.min_tevents)
+        result.add_check("TIMEX nodes", counts["timex"], t.min_timex)
+        result.add_check("Signal nodes", counts["signals"], t.min_signals)
         self._add_upper_bound_check(
             result,
             label="TEvent nodes missing core TimeML fields",
-            actual=self._count(
-                """
-                MATCH (e:TEvent)
-                WHERE e.eid IS NULL
-                   OR e.tense IS NULL
-                   OR e.aspect IS NULL
-                   OR e.polarity IS NULL
-                   OR e.pos IS NULL
-                RETURN count(e) AS c
-                """
-            ),
+            actual=counts["tevents_missing_timeml_core"],
             maximum=t.max_tevents_missing_timeml_core,
         )
         self._add_upper_bound_check(
             result,
             label="TIMEX nodes missing core TimeML fields",
-            actual=self._count(
-                """
-                MATCH (x:TIMEX)
-                WHERE x.tid IS NULL
-                   OR x.type IS NULL
-                   OR x.value IS NULL
-                RETURN count(x) AS c
-                """
-            ),
+            actual=counts["timex_missing_timeml_core"],
             maximum=t.max_timex_missing_timeml_core,
         )
         self._add_upper_bound_check(
             result,
             label="Signal nodes missing text/span fields",
-            actual=self._count(
-                """
-                MATCH (s:Signal)
-                WHERE s.text IS NULL
-                   OR s.start_tok IS NULL
-                   OR s.end_tok IS NULL
-                RETURN count(s) AS c
-                """
-            ),
+            actual=counts["signals_missing_text_span"],
             maximum=t.max_signals_missing_text_span,
         )
         self._add_upper_bound_check(
             result,
             label="TLINK relationships missing relTypeCanonical",
-            actual=self._count(
-                """
-                MATCH ()-[r:TLINK]->()
-                WHERE r.relTypeCanonical IS NULL
-                RETURN count(r) AS c
-                """
-            ),
+            actual=counts["tlinks_missing_reltype_canonical"],
             maximum=t.max_tlinks_missing_reltype_canonical,
         )
         if self._enforce_provenance_contracts:
@@ -461,20 +620,123 @@ class PhaseAssertions:
         t = self._thresholds
         result = AssertionResult(phase="event_enrichment", passed=True)
 
-        legacy_describes = self._count("MATCH ()-[r:DESCRIBES]->() RETURN count(r) AS c")
-        canonical_describes = self._count(
-            "MATCH ()-[r:FRAME_DESCRIBES_EVENT]->() RETURN count(r) AS c"
-        )
-        legacy_participant = self._count(
-            """
-            MATCH ()-[r:PARTICIPANT]->(t)
-            WHERE t:TEvent OR t:EventMention
-            RETURN count(r) AS c
-            """
-        )
-        canonical_participant = self._count(
-            "MATCH ()-[r:EVENT_PARTICIPANT]->() RETURN count(r) AS c"
+        frame_scope = _scope_nodes("s", span_labels=("Frame",))
+        event_target_scope = _scope_nodes("t", doc_id_labels=("TEvent", "EventMention"))
+        counts = self._run_plan(
+            _relationship_group("DESCRIBES", frame_scope, _Tally("describes", "r")),
+            _relationship_group(
+                "FRAME_DESCRIBES_EVENT", frame_scope,
+                _Tally("frame_describes_event", "r"),
+                endpoint_key="frame_describes_event_endpoint_violations",
+            ),
+            _relationship_group(
+                "PARTICIPANT", event_target_scope,
+                _Tally("participant", "r", "t:TEvent OR t:EventMention"),
+            ),
+            _relationship_group(
+                "EVENT_PARTICIPANT", event_target_scope,
+                _Tally("event_participant", "r"),
+                endpoint_key="event_participant_endpoint_violations",
+            ),
+            _relationship_group(
+                "HAS_FRAME_ARGUMENT", _scope_nodes("s", span_labels=("FrameArgument",)),
+                _Tally("has_frame_argument", "r"),
+                endpoint_key="has_frame_argument_endpoint_violations",
+            ),
+            _relationship_group(
+                "CLINK", _scope_nodes("s", doc_id_labels=("TEvent",)),
+                _Tally("clink", "r"),
+                endpoint_key="clink_endpoint_violations",
+            ),
+            _relationship_group(
+                "SLINK", _scope_nodes("s", doc_id_labels=("TEvent",)),
+                _Tally("slink", "r"),
+                endpoint_key="slink_endpoint_violations",
+            ),
+            _relationship_group("INSTANTIATES", frame_scope, endpoint_key="instantiates_endpoint_violations"),
+            _relationship_group("REFERS_TO", _REFERS_TO_SCOPE, endpoint_key="refers_to_endpoint_violations"),
+            _relationship_group("MODIFIES", event_target_scope, endpoint_key="modifies_endpoint_violations"),
+            _relationship_group("AFFECTS", event_target_scope, endpoint_key="affects_endpoint_violations"),
+            _node_group(
+                "em", "EventMention", _scope_nodes("em", doc_id_labels=("EventMention",)),
+                _Tally(
+                    "event_mentions_missing_refers_to",
+                    "em",
+                    "NOT EXISTS { MATCH (em)-[:REFERS_TO]->(:TEvent) }",
+                ),
+                _Tally(
+                    "event_mentions_missing_token_identity",
+                    "em",
+                    "em.token_id IS NULL OR em.token_start IS NULL OR em.token_end IS NULL",
+                ),
+                _Tally(
+                    "event_mentions_missing_factuality",
+                    "em",
+                    "em.factuality IS NULL OR trim(toString(em.factuality)) = ''",
+                ),
+                _Tally(
+                    "event_mentions_missing_factuality_attribution",
+                    "em",
+                    "em.factuality IS NOT NULL AND trim(toString(em.factuality)) <> '' AND ("
+                    "em.factualitySource IS NULL OR trim(toString(em.factualitySource)) = '' "
+                    "OR em.factualityConfidence IS NULL)",
+                ),
+            ),
+            _node_group(
+                "f", "Frame", _scope_nodes("f", span_labels=("Frame",)),
+                _Tally(
+                    "frames_missing_instantiates",
+                    "f",
+                    "EXISTS { MATCH (f)-[:FRAME_DESCRIBES_EVENT|DESCRIBES]->(:TEvent) } "
+                    "AND NOT EXISTS { MATCH (f)-[:INSTANTIATES]->(:EventMention) }",
+                    distinct=True,
+                ),
+            ),
+            _ScanGroup(
+                match="MATCH (em:EventMention)-[:REFERS_TO]->(te:TEvent)",
+                scoped_match=_scope_nodes("em", doc_id_labels=("EventMention",))
+                + "\nMATCH (em:EventMention)-[:REFERS_TO]->(te:TEvent)",
+                tallies=(
+                    _Tally(
+                        "tevents_missing_factuality",
+                        "te",
+                        "em.factuality IS NOT NULL AND trim(toString(em.factuality)) <> '' "
+                        "AND (te.factuality IS NULL OR trim(toString(te.factuality)) = '')",
+                        distinct=True,
+                    ),
+                    _Tally(
+                        "factuality_alignment_violations",
+                        "te",
+                        "em.factuality IS NOT NULL AND trim(toString(em.factuality)) <> '' "
+                        "AND te.factuality IS NOT NULL AND trim(toString(te.factuality)) <> '' "
+                        "AND toUpper(toString(em.factuality)) <> toUpper(toString(te.factuality)) "
+                        "AND coalesce(te.factualityConflictFlag, false) = false",
+                    ),
+                ),
+            ),
+            _ScanGroup(
+                match="MATCH (tok:TagOccurrence)-[:PARTICIPATES_IN]->(target)",
+                scoped_match=_scope_tokens("tok") + "\nMATCH (tok)-[:PARTICIPATES_IN]->(target)",
+                tallies=(
+                    _Tally(
+                        "participation_in_frame_missing",
+                        "target",
+                        "target:Frame OR target:FrameArgument "
+                        "AND NOT EXISTS { MATCH (tok)-[:IN_FRAME]->(target) }",
+                    ),
+                    _Tally(
+                        "participation_in_mention_missing",
+                        "target",
+                        "target:NamedEntity OR target:NounChunk OR target:CorefMention OR target:Antecedent "
+                        "AND NOT EXISTS { MATCH (tok)-[:IN_MENTION]->(target) }",
+                    ),
+                ),
+            ),
         )
+        legacy_describes = counts["describes"]
+        canonical_describes = counts["frame_describes_event"]
+        legacy_participant = counts["participant"]
+        canonical_participant = counts["event_participant"]
 
         result.add_check(
             "DESCRIBES relationships (Frame->TEvent)",
@@ -491,9 +753,7 @@ class PhaseAssertions:
             canonical_describes,
             t.min_frame_describes_event_rels,
         )
-        has_frame_arguments = self._count(
-            "MATCH ()-[r:HAS_FRAME_ARGUMENT]->() RETURN count(r) AS c"
-        )
+        has_frame_arguments = counts["has_frame_argument"]
         result.add_check(
             "HAS_FRAME_ARGUMENT relationships",
             has_frame_arguments,
@@ -585,198 +845,114 @@ class PhaseAssertions:
                     f"({legacy_participant} > {canonical_participant})"
                 )
                 result.passed = False
-        result.add_check(
-            "CLINK relationships",
-            self._count("MATCH ()-[r:CLINK]->() RETURN count(r) AS c"),
-            t.min_clink_rels,
-        )
-        result.add_check(
-            "SLINK relationships",
-            self._count("MATCH ()-[r:SLINK]->() RETURN count(r) AS c"),
-            t.min_slink_rels,
-        )
+        result.add_check("CLINK relationships", counts["clink"], t.min_clink_rels)
+        result.add_check("SLINK relationships", counts["slink"], t.min_slink_rels)
         self._add_upper_bound_check(
             result,
             label="Endpoint contract violations (EVENT_PARTICIPANT)",
-            actual=count_endpoint_violations(self._graph, "EVENT_PARTICIPANT"),
+            actual=counts["event_participant_endpoint_violations"],
             maximum=t.max_event_endpoint_contract_violations,
         )
         self._add_upper_bound_check(
             result,
             label="Endpoint contract violations (INSTANTIATES)",
-            actual=count_endpoint_violations(self._graph, "INSTANTIATES"),
+            actual=counts["instantiates_endpoint_violations"],
             maximum=t.max_event_endpoint_contract_violations,
         )
         self._add_upper_bound_check(
             result,
             label="Endpoint contract violations (HAS_FRAME_ARGUMENT)",
-            actual=count_endpoint_violations(self._graph, "HAS_FRAME_ARGUMENT"),
+            actual=counts["has_frame_argument_endpoint_violations"],
             maximum=t.max_event_endpoint_contract_violations,
         )
         self._add_upper_bound_check(
             result,
             label="Endpoint contract violations (FRAME_DESCRIBES_EVENT)",
-            actual=count_endpoint_violations(self._graph, "FRAME_DESCRIBES_EVENT"),
+            actual=counts["frame_describes_event_endpoint_violations"],
             maximum=t.max_event_endpoint_contract_violations,
         )
         self._add_upper_bound_check(
             result,
             label="Endpoint contract violations (REFERS_TO)",
-            actual=count_endpoint_violations(self._graph, "REFERS_TO"),
+            actual=counts["refers_to_endpoint_violations"],
             maximum=t.max_event_endpoint_contract_violations,
         )
         self._add_upper_bound_check(
             result,
             label="Endpoint contract violations (MODIFIES)",
-            actual=count_endpoint_violations(self._graph, "MODIFIES"),
+            actual=counts["modifies_endpoint_violations"],
             maximum=t.max_event_endpoint_contract_violations,
         )
         self._add_upper_bound_check(
             result,
             label="Endpoint contract violations (AFFECTS)",
-            actual=count_endpoint_violations(self._graph, "AFFECTS"),
+            actual=counts["affects_endpoint_violations"],
             maximum=t.max_event_endpoint_contract_violations,
         )
         self._add_upper_bound_check(
             result,
             label="Endpoint contract violations (CLINK)",
-            actual=count_endpoint_violations(self._graph, "CLINK"),
+            actual=counts["clink_endpoint_violations"],
             maximum=t.max_event_endpoint_contract_violations,
         )
         self._add_upper_bound_check(
             result,
             label="Endpoint contract violations (SLINK)",
-            actual=count_endpoint_violations(self._graph, "SLINK"),
+            actual=counts["slink_endpoint_violations"],
             maximum=t.max_event_endpoint_contract_violations,
         )
         self._add_upper_bound_check(
             result,
             label="EventMention nodes missing REFERS_TO->TEvent",
-            actual=self._count(
-                """
-                MATCH (em:EventMention)
-                WHERE NOT EXISTS { MATCH (em)-[:REFERS_TO]->(:TEvent) }
-                RETURN count(em) AS c
-                """
-            ),
+            actual=counts["event_mentions_missing_refers_to"],
             maximum=t.max_event_mentions_missing_refers_to_tevent,
         )
         self._add_upper_bound_check(
             result,
             label="Frame nodes with described events missing INSTANTIATES->EventMention",
-            actual=self._count(
-                """
-                MATCH (f:Frame)
-                WHERE EXISTS { MATCH (f)-[:FRAME_DESCRIBES_EVENT|DESCRIBES]->(:TEvent) }
-                  AND NOT EXISTS { MATCH (f)-[:INSTANTIATES]->(:EventMention) }
-                RETURN count(DISTINCT f) AS c
-                """
-            ),
+            actual=counts["frames_missing_instantiates"],
             maximum=t.max_frames_missing_instantiates_eventmention,
         )
         self._add_upper_bound_check(
             result,
             label="EventMention nodes missing token identity fields",
-            actual=self._count(
-                """
-                MATCH (em:EventMention)
-                WHERE em.token_id IS NULL
-                   OR em.token_start IS NULL
-                   OR em.token_end IS NULL
-                RETURN count(em) AS c
-                """
-            ),
+            actual=counts["event_mentions_missing_token_identity"],
             maximum=t.max_event_mentions_missing_token_identity,
         )
         self._add_upper_bound_check(
             result,
             label="EventMention nodes missing factuality",
-            actual=self._count(
-                """
-                MATCH (em:EventMention)
-                WHERE em.factuality IS NULL
-                   OR trim(toString(em.factuality)) = ''
-                RETURN count(em) AS c
-                """
-            ),
+            actual=counts["event_mentions_missing_factuality"],
             maximum=t.max_event_mentions_missing_factuality,
         )
         self._add_upper_bound_check(
             result,
             label="EventMention factuality records missing attribution",
-            actual=self._count(
-                """
-                MATCH (em:EventMention)
-                WHERE em.factuality IS NOT NULL
-                  AND trim(toString(em.factuality)) <> ''
-                  AND (
-                      em.factualitySource IS NULL
-                      OR trim(toString(em.factualitySource)) = ''
-                      OR em.factualityConfidence IS NULL
-                  )
-                RETURN count(em) AS c
-                """
-            ),
+            actual=counts["event_mentions_missing_factuality_attribution"],
             maximum=t.max_event_mentions_missing_factuality_attribution,
         )
         self._add_upper_bound_check(
             result,
             label="TEvent nodes missing factuality after mention sync",
-            actual=self._count(
-                """
-                MATCH (em:EventMention)-[:REFERS_TO]->(te:TEvent)
-                WHERE em.factuality IS NOT NULL
-                  AND trim(toString(em.factuality)) <> ''
-                  AND (
-                      te.factuality IS NULL
-                      OR trim(toString(te.factuality)) = ''
-                  )
-                RETURN count(DISTINCT te) AS c
-                """
-            ),
+            actual=counts["tevents_missing_factuality"],
             maximum=t.max_tevents_missing_factuality,
         )
         self._add_upper_bound_check(
             result,
             label="EventMention/TEvent factuality alignment violations",
-            actual=self._count(
-                """
-                MATCH (em:EventMention)-[:REFERS_TO]->(te:TEvent)
-                WHERE em.factuality IS NOT NULL
-                  AND trim(toString(em.factuality)) <> ''
-                  AND te.factuality IS NOT NULL
-                  AND trim(toString(te.factuality)) <> ''
-                  AND toUpper(toString(em.factuality)) <> toUpper(toString(te.factuality))
-                  AND coalesce(te.factualityConflictFlag, false) = false
-                RETURN count(*) AS c
-                """
-            ),
+            actual=counts["factuality_alignment_violations"],
             maximum=t.max_factuality_alignment_violations,
         )
         self._add_upper_bound_check(
             result,
             label="TagOccurrence links missing IN_FRAME alias",
-            actual=self._count(
-                """
-                MATCH (tok:TagOccurrence)-[:PARTICIPATES_IN]->(target)
-                WHERE target:Frame OR target:FrameArgument
-                  AND NOT EXISTS { MATCH (tok)-[:IN_FRAME]->(target) }
-                RETURN count(*) AS c
-                """
-            ),
+            actual=counts["participation_in_frame_missing"],
             maximum=t.max_participation_in_frame_missing,
         )
         self._add_upper_bound_check(
             result,
             label="TagOccurrence links missing IN_MENTION alias",
-            actual=self._count(
-                """
-                MATCH (tok:TagOccurrence)-[:PARTICIPATES_IN]->(target)
-                WHERE target:NamedEntity OR target:NounChunk OR target:CorefMention OR target:Antecedent
-                  AND NOT EXISTS { MATCH (tok)-[:IN_MENTION]->(target) }
-                RETURN count(*) AS c
-                """
-            ),
+            actual=counts["participation_in_mention_missing"],
             maximum=t.max_participation_in_mention_missing,
         )
         if self._enforce_provenance_contracts:
@@ -818,11 +994,30 @@ class PhaseAssertions:
         t = self._thresholds
         result = AssertionResult(phase="tlinks", passed=True)
 
-        result.add_check(
-            "TLINK relationships",
-            self._count("MATCH ()-[r:TLINK]->() RETURN count(r) AS c"),
-            t.min_tlink_rels,
+        counts = self._run_plan(
+            _relationship_group(
+                "TLINK", _scope_nodes("s", doc_id_labels=("TEvent", "TIMEX")),
+                _Tally("tlinks", "r"),
+                endpoint_key="tlink_endpoint_violations",
+            ),
+            _ScanGroup(
+                match="MATCH (a)-[r1:TLINK]->(b), (a)-[r2:TLINK]->(b)\nWHERE elementId(r1) < elementId(r2)",
+                scoped_match=_scope_nodes("a", doc_id_labels=("TEvent", "TIMEX"))
+                + "\nMATCH (a)-[r1:TLINK]->(b), (a)-[r2:TLINK]->(b)\nWHERE elementId(r1) < elementId(r2)",
+                tallies=(
+                    _Tally(
+                        "contradictory_tlink_pairs",
+                        "r1",
+                        "coalesce(r1.suppressed, false) = false AND coalesce(r2.suppressed, false) = false "
+                        "AND [coalesce(r1.relTypeCanonical, r1.relType, 'VAGUE'), "
+                        "coalesce(r2.relTypeCanonical, r2.relType, 'VAGUE')] IN "
+                        + _CONTRADICTORY_TLINK_PAIRS,
+                    ),
+                ),
+            ),
         )
+
+        result.add_check("TLINK relationships", counts["tlinks"], t.min_tlink_rels)
         self._add_upper_bound_check(
             result,
             label="Cost-model: TLINK relationships upper bound",
@@ -832,31 +1027,13 @@ class PhaseAssertions:
         self._add_upper_bound_check(
             result,
             label="Unsuppressed contradictory TLINK pairs",
-            actual=self._count(
-                """
-                MATCH (a)-[r1:TLINK]->(b), (a)-[r2:TLINK]->(b)
-                WHERE elementId(r1) < elementId(r2)
-                  AND coalesce(r1.suppressed, false) = false
-                  AND coalesce(r2.suppressed, false) = false
-                WITH coalesce(r1.relTypeCanonical, r1.relType, 'VAGUE') AS rel1,
-                     coalesce(r2.relTypeCanonical, r2.relType, 'VAGUE') AS rel2
-                WHERE (rel1 = 'BEFORE' AND rel2 = 'AFTER')
-                   OR (rel1 = 'AFTER' AND rel2 = 'BEFORE')
-                   OR (rel1 = 'INCLUDES' AND rel2 = 'IS_INCLUDED')
-                   OR (rel1 = 'IS_INCLUDED' AND rel2 = 'INCLUDES')
-                   OR (rel1 = 'BEGINS' AND rel2 = 'BEGUN_BY')
-                   OR (rel1 = 'BEGUN_BY' AND rel2 = 'BEGINS')
-                   OR (rel1 = 'ENDS' AND rel2 = 'ENDED_BY')
-                   OR (rel1 = 'ENDED_BY' AND rel2 = 'ENDS')
-                RETURN count(*) AS c
-                """
-            ),
+            actual=counts["contradictory_tlink_pairs"],
             maximum=t.max_tlink_consistency_violations,
         )
         self._add_upper_bound_check(
             result,
             label="Endpoint contract violations (TLINK)",
-            actual=count_endpoint_violations(self._graph, "TLINK"),
+            actual=counts["tlink_endpoint_violations"],
             maximum=t.max_tlink_endpoint_contract_violations,
         )
         if self._enforce_provenance_contracts:
@@ -880,7 +1057,8 @@ def record_phase_run(
     duration_seconds: float,
     documents_processed: int = 0,
     metadata: Optional[Dict[str, Any]] = None,
-) -> None:
+    rule_costs: Optional[List[Dict[str, Any]]] = None,
+) -> Optional[str]:
     """Write a ``PhaseRun`` marker node to Neo4j for restart visibility.
 
     The node is MERGE-d by a timestamp-based ID so repeated calls produce
@@ -899,6 +1077,13 @@ def record_phase_run(
         Number of documents handled (0 when unknown).
     metadata :
         Any extra key/value pairs to store on the marker node.
+    rule_costs :
+        Per-rule cost of the run (``RuleCostRecorder.summary()``), stored as
+        ``rule_costs_json`` with the slowest rule in ``slowest_rule``.
+
+    Returns
+    -------
+    The marker id, or ``None`` when the write failed.
     """
     try:
         run_id = utc_iso_now()
@@ -910,6 +1095,10 @@ def record_phase_run(
         }
         if metadata:
             props.update({f"meta_{k}": str(v) for k, v in metadata.items()})
+        if rule_costs:
+            props["rules_profiled"] = len(rule_costs)
+            props["slowest_rule"] = rule_costs[0]["rule"]
+            props["rule_costs_json"] = json.dumps(rule_costs)
 
         cypher = """
         MERGE (r:PhaseRun {id: $id})
@@ -924,7 +1113,9 @@ def record_phase_run(
             duration_seconds,
             documents_processed,
         )
+        return run_id
     except Exception:
         logger.exception(
             "Failed to write PhaseRun marker for '%s' (non-fatal)", phase_name
         )
+        return None
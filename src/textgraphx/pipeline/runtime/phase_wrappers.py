@@ -32,6 +32,88 @@ def _provenance_violations_from_assertion(assertion_result) -> int:
     )
 
 
+def _tlink_case_count(result) -> int:
+    """Sum the count columns a ``create_tlinks_caseN`` call returned.
+
+    Cases return a list of count rows, or a tuple of such lists when they run
+    several sub-queries.
+    """
+    if isinstance(result, tuple):
+        return sum(_tlink_case_count(part) for part in result)
+    total = 0
+    for row in result or []:
+        if isinstance(row, dict):
+            total += sum(int(value) for value in row.values() if isinstance(value, (int, float)))
+    return total
+
+
+def _clear_tlinked_stamps(graph, doc_ids) -> None:
+    """Remove ``tlinked_at`` from documents a phase rewrites.
+
+    Incremental TLINK runs skip stamped documents, so a document whose
+    events or timexes change must lose its stamp to be linked again.
+    """
+    ids = set()
+    for doc_id in doc_ids:
+        ids.add(doc_id)
+        if isinstance(doc_id, str) and doc_id.strip().isdigit():
+            ids.add(int(doc_id))
+    if not ids:
+        return
+    graph.run(
+        """
+        MATCH (d:AnnotatedText)
+        WHERE d.id IN $doc_ids AND d.tlinked_at IS NOT NULL
+        REMOVE d.tlinked_at
+        """,
+        {"doc_ids": list(ids)},
+    )
+
+
+def _rule_cost_recorder(phase_name: str, owner) -> "RuleCostRecorder":
+    """Return the rule-cost recorder attached to *owner*, creating one if needed."""
+    from textgraphx.infrastructure.performance_profiler import RuleCostRecorder
+
+    recorder = getattr(owner, "rule_cost_recorder", None)
+    if not isinstance(recorder, RuleCostRecorder) or recorder.phase_name != phase_name:
+        recorder = RuleCostRecorder(phase_name, graph=getattr(owner, "graph", None))
+        owner.rule_cost_recorder = recorder
+    return recorder
+
+
+def _record_rule_costs(recorder, graph, documents_processed: int = 0) -> Optional[str]:
+    """Write the ``PhaseRun`` marker for *recorder*'s run, with its per-rule costs.
+
+    When ``runtime.rule_metrics_history`` names a SQLite file the costs are
+    also appended there, so ``textgraphx.tools.rule_costs`` can rank rules
+    across runs.
+    """
+    from textgraphx.pipeline.runtime.phase_assertions import record_phase_run
+
+    rule_costs = recorder.summary()
+    run_id = record_phase_run(
+        graph,
+        recorder.phase_name,
+        duration_seconds=recorder.elapsed_seconds(),
+        documents_processed=documents_processed,
+        rule_costs=rule_costs,
+    )
+    try:
+        from textgraphx.infrastructure.config import get_config
+
+        history_path = get_config().runtime.rule_metrics_history
+    except Exception:
+        history_path = ""
+    if history_path and rule_costs:
+        from textgraphx.orchestration.runtime_history import ExecutionHistory
+        from textgraphx.reasoning.temporal.time import utc_iso_now
+
+        ExecutionHistory(history_path).store_rule_metrics(
+            run_id or utc_iso_now(), recorder.phase_name, rule_costs
+        )
+    return run_id
+
+
 def _phase_thresholds_for_mode(phase_name: str):
     """Build phase assertion thresholds based on runtime mode.
 
@@ -548,6 +630,44 @@ class RefinementPhaseWrapper:
                 with log_subsection(self.logger, "Initializing RefinementPhase"):
                     refiner = RefinementPhase(argv=[])
                     self.logger.debug("RefinementPhase initialized")
+                rule_costs = _rule_cost_recorder("refinement", refiner)
+
+                # Incremental mode: only documents not yet stamped by a
+                # previous refinement run are visited by the rule queries.
+                from textgraphx.infrastructure.config import get_config
+
+                from textgraphx.pipeline.runtime.document_scope import active_document_scope, restrict_to_scope
+
+                scoped_doc_ids = None
+                document_scope = active_document_scope()
+                if bool(get_config().runtime.incremental_refinement):
+                    scoped_doc_ids = restrict_to_scope(refiner.unrefined_document_ids(), changed_only=False)
+                    self.logger.info(
+                        "Incremental refinement scoped to %d unrefined document(s)",
+                        len(scoped_doc_ids),
+                    )
+                elif document_scope is not None:
+                    scoped_doc_ids = restrict_to_scope(refiner.all_document_ids(), changed_only=False)
+                    self.logger.info("Refinement scoped to %d document(s)", len(scoped_doc_ids))
+                if scoped_doc_ids is not None and not scoped_doc_ids:
+                    # Nothing to refine: no rules, fusion, assertions or
+                    # rule-cost marker (an empty scope must not turn into a
+                    # graph-wide run).
+                    self.logger.info("No documents to refine; skipping refinement")
+                    return {
+                        "status": "success",
+                        "entities_refined": 0,
+                        "cross_sentence_links": 0,
+                        "cross_document_links": 0,
+                        "coref_identity_links": 0,
+                        "cross_document_fusion_enabled": False,
+                        "documents_refined": 0,
+                        "rule_write_counters": {},
+                        "rule_costs": {},
+                        "assertions_passed": None,
+                    }
+                if scoped_doc_ids is not None:
+                    refiner.set_doc_scope(scoped_doc_ids)
                 
                 # Run refinement steps with detailed logging
                 refinement_steps = [
@@ -564,7 +684,8 @@ class RefinementPhaseWrapper:
                 
                 for step_name, step_func in refinement_steps:
                     with log_subsection(self.logger, step_name):
-                        step_func()
+                        with rule_costs.rule(f"head_assignment.{getattr(step_func, '__name__', step_name)}"):
+                            step_func()
                         self.logger.debug(f"✓ Completed: {step_name}")
 
                 with log_subsection(self.logger, "Linking entities to semantic frames"):
@@ -610,17 +731,24 @@ class RefinementPhaseWrapper:
                         fuse_entities_cross_document,
                         propagate_coreference_identity_cross_document,
                     )
-                    from textgraphx.infrastructure.config import get_config
-
+                    # Inside a document scope (a sharded worker) cross-document
+                    # fusion is left to the orchestrator, which runs it once.
                     enable_cross_document_fusion = bool(
                         get_config().runtime.enable_cross_document_fusion
-                    )
-                    cross_sentence_links = fuse_entities_cross_sentence(refiner.graph)
+                    ) and document_scope is None
+                    with rule_costs.rule("fusion.fuse_entities_cross_sentence"):
+                        cross_sentence_links = fuse_entities_cross_sentence(refiner.graph)
                     if enable_cross_document_fusion:
-                        cross_document_links = fuse_entities_cross_document(refiner.graph)
-                        coref_identity_links = propagate_coreference_identity_cross_document(
-                            refiner.graph
-                        )
+                        # Incremental refinement only links the newly refined
+                        # documents against the rest of the graph.
+                        with rule_costs.rule("fusion.fuse_entities_cross_document"):
+                            cross_document_links = fuse_entities_cross_document(
+                                refiner.graph, doc_ids=scoped_doc_ids
+                            )
+                        with rule_costs.rule("fusion.propagate_coreference_identity_cross_document"):
+                            coref_identity_links = propagate_coreference_identity_cross_document(
+                                refiner.graph, doc_ids=scoped_doc_ids
+                            )
                     self.logger.info(
                         "Fusion links created: CO_OCCURS_WITH=%s, SAME_AS(kb_id)=%s, SAME_AS(coref_identity)=%s (cross-doc enabled=%s)",
                         cross_sentence_links,
@@ -631,16 +759,24 @@ class RefinementPhaseWrapper:
                 
                 self.logger.info("All refinement steps completed successfully")
 
+                documents_refined = None
+                if scoped_doc_ids is not None:
+                    from textgraphx.reasoning.temporal.time import utc_iso_now
+
+                    refiner.set_doc_scope(None)
+                    documents_refined = refiner.mark_documents_refined(scoped_doc_ids, utc_iso_now())
+
                 # Phase assertions (Item 5) and run marker (Item 7)
                 assertions_passed = None
                 try:
-                    from textgraphx.pipeline.runtime.phase_assertions import PhaseAssertions, record_phase_run
+                    from textgraphx.pipeline.runtime.phase_assertions import PhaseAssertions
                     assertion_result = PhaseAssertions(
                         refiner.graph,
                         strict_transition_gate=self.strict_transition_gate,
+                        doc_ids=scoped_doc_ids,
                     ).after_refinement()
                     assertions_passed = assertion_result.passed
-                    record_phase_run(refiner.graph, "refinement", duration_seconds=0.0)
+                    _record_rule_costs(rule_costs, refiner.graph, documents_processed=documents_refined or 0)
                 except Exception:
                     self.logger.debug("Phase assertions/marker unavailable", exc_info=True)
 
@@ -651,6 +787,9 @@ class RefinementPhaseWrapper:
                     "cross_document_links": cross_document_links,
                     "coref_identity_links": coref_identity_links,
                     "cross_document_fusion_enabled": enable_cross_document_fusion,
+                    "documents_refined": documents_refined,
+                    "rule_write_counters": dict(getattr(refiner, "rule_write_counters", {})),
+                    "rule_costs": rule_costs.summary(),
                     "assertions_passed": assertions_passed,
                 }
                 
@@ -665,8 +804,11 @@ class RefinementPhaseWrapper:
 class TemporalPhaseWrapper:
     """Wrapper for TemporalPhase temporal entity extraction."""
     
-    def __init__(self, strict_transition_gate: bool = False):
+    def __init__(self, strict_transition_gate: bool = False, document_checkpoint=None):
         self.strict_transition_gate = strict_transition_gate
+        # Optional orchestration.checkpoint.DocumentCheckpoint: completed
+        # documents are recorded there and skipped when resuming.
+        self.document_checkpoint = document_checkpoint
         self.temporal_entities = 0
         self.logger = get_logger(f"{__name__}.TemporalPhase")
         self.logger.info("Initialized TemporalPhaseWrapper")
@@ -680,6 +822,111 @@ class TemporalPhaseWrapper:
             return stripped
         return value
     
+    @staticmethod
+    def _temporal_workers() -> int:
+        try:
+            from textgraphx.infrastructure.config import get_config
+
+            return max(1, int(get_config().runtime.temporal_workers))
+        except Exception:
+            return 1
+
+    def _process_document(self, temporal, doc_id, progress):
+        """Run every temporal step for one document, in order.
+
+        Returns ``None`` on success or a ``(doc_id, message)`` failure tuple.
+        """
+        self.logger.debug(f"Processing document: {doc_id}")
+
+        try:
+            temporal.create_DCT_node(doc_id)
+            progress.update(1, f"Created DCT node for {doc_id}")
+
+            temporal.materialize_tevents(doc_id)
+            progress.update(1, f"Created temporal events for {doc_id}")
+
+            temporal.materialize_signals(doc_id)
+            progress.update(1, f"Created temporal signals for {doc_id}")
+
+            temporal.materialize_timexes_fallback(doc_id)
+            progress.update(1, f"Created temporal expressions for {doc_id}")
+
+            # Phase D1: promote ARGM-TMP spans not covered by HeidelTime
+            # to SRLTimexCandidate nodes so downstream TLINK rules can
+            # anchor nominal and verbal events to temporal expressions.
+            try:
+                temporal.promote_argm_tmp_to_timex_candidates(doc_id)
+            except AttributeError:
+                self.logger.debug(
+                    "promote_argm_tmp_to_timex_candidates not available on this TemporalPhase instance"
+                )
+            progress.update(1, f"Promoted ARGM-TMP TIMEX candidates for {doc_id}")
+
+            # Phase D1b (Step 10): anchor SRLTimexCandidate nodes back to
+            # their owning canonical TEvent via HAS_TIME_ANCHOR so TLINK
+            # inference can use them as nominal temporal anchors.
+            try:
+                temporal.anchor_srl_timex_candidates_to_events(doc_id)
+            except AttributeError:
+                self.logger.debug(
+                    "anchor_srl_timex_candidates_to_events not available on this TemporalPhase instance"
+                )
+            progress.update(1, f"Anchored SRL TIMEX candidates to events for {doc_id}")
+
+            temporal.materialize_glinks(doc_id)
+            progress.update(1, f"Created grammatical links for {doc_id}")
+
+            self.logger.debug(f"✓ Completed temporal processing for {doc_id}")
+            if self.document_checkpoint is not None:
+                self.document_checkpoint.mark_completed([doc_id])
+        except Exception as doc_error:
+            self.logger.error(
+                f"Error processing document {doc_id}: {type(doc_error).__name__}: {doc_error}",
+                exc_info=False
+            )
+            return (doc_id, f"{type(doc_error).__name__}: {doc_error}")
+        return None
+
+    def _process_documents_concurrently(self, phase_cls, doc_ids, workers, progress):
+        """Process *doc_ids* on *workers* threads; return failures in *doc_ids* order.
+
+        Each worker builds its own ``phase_cls`` instance, so it has its own
+        graph wrapper and (through the shared connection manager) its own
+        Neo4j sessions, and closes them when the queue is drained. A
+        document's steps always run in order on one worker; documents run
+        concurrently, which overlaps the TTK/HeidelTime round-trips.
+        """
+        import queue
+        from concurrent.futures import ThreadPoolExecutor
+
+        pending = queue.Queue()
+        for doc_id in doc_ids:
+            pending.put(doc_id)
+
+        def _worker():
+            failures = []
+            temporal = phase_cls(argv=[])
+            try:
+                while True:
+                    try:
+                        doc_id = pending.get_nowait()
+                    except queue.Empty:
+                        return failures
+                    failure = self._process_document(temporal, doc_id, progress)
+                    if failure is not None:
+                        failures.append(failure)
+            finally:
+                close_fn = getattr(getattr(temporal, "graph", None), "close", None)
+                if callable(close_fn):
+                    close_fn()
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="temporal") as pool:
+            futures = [pool.submit(_worker) for _ in range(workers)]
+            failures = [failure for future in futures for failure in future.result()]
+
+        position = {doc_id: index for index, doc_id in enumerate(doc_ids)}
+        return sorted(failures, key=lambda failure: position[failure[0]])
+
     def execute(self) -> Dict[str, Any]:
         """Execute TemporalPhase for temporal extraction."""
         with log_section(self.logger, "TEMPORAL PHASE - Temporal Entity & Relation Extraction"):
@@ -701,6 +948,7 @@ class TemporalPhaseWrapper:
                 with log_subsection(self.logger, "Retrieving annotated text"):
                     annotated = temporal.get_annotated_text()
                     document_ids = set()
+                    assertion_doc_ids = None
                     
                     if annotated:
                         self.logger.info(f"Retrieved annotated text ({len(annotated)} items)")
@@ -713,6 +961,27 @@ class TemporalPhaseWrapper:
                                 document_ids.add(self._normalize_doc_id(item))
                     else:
                         self.logger.warning("No annotated text found")
+
+                    from textgraphx.pipeline.runtime.document_scope import restrict_to_scope
+
+                    scoped = set(restrict_to_scope(document_ids))
+                    if len(scoped) != len(document_ids):
+                        self.logger.info(
+                            "Restricting temporal extraction to %d of %d documents (document scope / changed set)",
+                            len(scoped), len(document_ids),
+                        )
+                        document_ids = scoped
+                        assertion_doc_ids = scoped or None
+
+                    if self.document_checkpoint is not None:
+                        done = self.document_checkpoint.begin()
+                        if done:
+                            remaining = {doc_id for doc_id in document_ids if str(doc_id) not in done}
+                            self.logger.info(
+                                "Resuming temporal extraction: skipping %d document(s) completed earlier",
+                                len(document_ids) - len(remaining),
+                            )
+                            document_ids = remaining
                     
                     self.logger.info(f"Identified {len(document_ids)} unique documents")
                 
@@ -720,59 +989,23 @@ class TemporalPhaseWrapper:
                 if document_ids:
                     with log_subsection(self.logger, f"Processing temporal extraction for {len(document_ids)} documents"):
                         progress = ProgressLogger(self.logger, len(document_ids) * 6, "Temporal Operations")
-                        doc_failures = []
-                        
-                        for doc_id in sorted(
+                        ordered_doc_ids = sorted(
                             document_ids,
                             key=lambda v: (0, v) if isinstance(v, int) else (1, str(v)),
-                        ):
-                            self.logger.debug(f"Processing document: {doc_id}")
-                            
-                            try:
-                                temporal.create_DCT_node(doc_id)
-                                progress.update(1, f"Created DCT node for {doc_id}")
-                                
-                                temporal.materialize_tevents(doc_id)
-                                progress.update(1, f"Created temporal events for {doc_id}")
-
-                                temporal.materialize_signals(doc_id)
-                                progress.update(1, f"Created temporal signals for {doc_id}")
-                                
-                                temporal.materialize_timexes_fallback(doc_id)
-                                progress.update(1, f"Created temporal expressions for {doc_id}")
-
-                                # Phase D1: promote ARGM-TMP spans not covered by HeidelTime
-                                # to SRLTimexCandidate nodes so downstream TLINK rules can
-                                # anchor nominal and verbal events to temporal expressions.
-                                try:
-                                    temporal.promote_argm_tmp_to_timex_candidates(doc_id)
-                                except AttributeError:
-                                    self.logger.debug(
-                                        "promote_argm_tmp_to_timex_candidates not available on this TemporalPhase instance"
-                                    )
-                                progress.update(1, f"Promoted ARGM-TMP TIMEX candidates for {doc_id}")
-
-                                # Phase D1b (Step 10): anchor SRLTimexCandidate nodes back to
-                                # their owning canonical TEvent via HAS_TIME_ANCHOR so TLINK
-                                # inference can use them as nominal temporal anchors.
-                                try:
-                                    temporal.anchor_srl_timex_candidates_to_events(doc_id)
-                                except AttributeError:
-                                    self.logger.debug(
-                                        "anchor_srl_timex_candidates_to_events not available on this TemporalPhase instance"
-                                    )
-                                progress.update(1, f"Anchored SRL TIMEX candidates to events for {doc_id}")
-
-                                temporal.materialize_glinks(doc_id)
-                                progress.update(1, f"Created grammatical links for {doc_id}")
-
-                                self.logger.debug(f"✓ Completed temporal processing for {doc_id}")
-                            except Exception as doc_error:
-                                doc_failures.append((doc_id, f"{type(doc_error).__name__}: {doc_error}"))
-                                self.logger.error(
-                                    f"Error processing document {doc_id}: {type(doc_error).__name__}: {doc_error}",
-                                    exc_info=False
-                                )
+                        )
+                        _clear_tlinked_stamps(temporal.graph, ordered_doc_ids)
+                        workers = min(self._temporal_workers(), len(ordered_doc_ids))
+                        if workers > 1:
+                            self.logger.info("Running temporal extraction with %d workers", workers)
+                            doc_failures = self._process_documents_concurrently(
+                                TemporalPhase, ordered_doc_ids, workers, progress
+                            )
+                        else:
+                            doc_failures = []
+                            for doc_id in ordered_doc_ids:
+                                failure = self._process_document(temporal, doc_id, progress)
+                                if failure is not None:
+                                    doc_failures.append(failure)
                         
                         progress.finish()
                         if doc_failures:
@@ -782,6 +1015,12 @@ class TemporalPhaseWrapper:
                             )
                 
                 self.logger.info("Temporal extraction completed successfully")
+                try:
+                    from textgraphx.adapters.annotation_cache import get_annotation_cache
+
+                    self.logger.info("Temporal annotation cache: %s", get_annotation_cache().stats())
+                except Exception:
+                    self.logger.debug("Annotation cache stats unavailable", exc_info=True)
 
                 # Phase assertions (Item 5) and run marker (Item 7)
                 assertions_passed = None
@@ -804,6 +1043,7 @@ class TemporalPhaseWrapper:
                         thresholds=_phase_thresholds_for_mode("temporal"),
                         strict_transition_gate=self.strict_transition_gate,
                         enforce_provenance_contracts=True,
+                        doc_ids=assertion_doc_ids,
                     ).after_temporal()
                     assertions_passed = assertion_result.passed
                     provenance_violations = _provenance_violations_from_assertion(assertion_result)
@@ -834,8 +1074,13 @@ class TemporalPhaseWrapper:
 class EventEnrichmentPhaseWrapper:
     """Wrapper for EventEnrichmentPhase semantic enrichment."""
     
-    def __init__(self, strict_transition_gate: bool = False):
+    def __init__(self, strict_transition_gate: bool = False, document_checkpoint=None):
         self.strict_transition_gate = strict_transition_gate
+        # Optional orchestration.checkpoint.DocumentCheckpoint: documents whose
+        # EventMentions were created are recorded there and skipped when
+        # resuming. The enrichment steps after that loop run graph-wide and
+        # always run again.
+        self.document_checkpoint = document_checkpoint
         self.events_enriched = 0
         self.logger = get_logger(f"{__name__}.EventEnrichmentPhase")
         self.logger.info("Initialized EventEnrichmentPhaseWrapper")
@@ -851,6 +1096,7 @@ class EventEnrichmentPhaseWrapper:
                 with log_subsection(self.logger, "Initializing EventEnrichmentPhase"):
                     enricher = EventEnrichmentPhase(argv=[])
                     self.logger.debug("EventEnrichmentPhase initialized")
+                rule_costs = _rule_cost_recorder("event_enrichment", enricher)
                 
                 # Create EventMention nodes first — must precede all frame/participant steps
                 with log_subsection(self.logger, "Creating EventMention nodes"):
@@ -862,9 +1108,27 @@ class EventEnrichmentPhaseWrapper:
                         for row in doc_id_rows
                         if row.get("doc_id") is not None
                     ]
+                    from textgraphx.pipeline.runtime.document_scope import restrict_to_scope
+
+                    all_doc_count = len(doc_ids)
+                    doc_ids = restrict_to_scope(doc_ids)
+                    assertion_doc_ids = doc_ids if 0 < len(doc_ids) < all_doc_count else None
+                    _clear_tlinked_stamps(enricher.graph, doc_ids)
+                    pending_doc_ids = doc_ids
+                    if self.document_checkpoint is not None:
+                        done = self.document_checkpoint.begin()
+                        if done:
+                            pending_doc_ids = [doc_id for doc_id in doc_ids if doc_id not in done]
+                            self.logger.info(
+                                "Resuming EventMention creation: skipping %d document(s) completed earlier",
+                                len(doc_ids) - len(pending_doc_ids),
+                            )
                     total_mentions = 0
-                    for doc_id in doc_ids:
-                        total_mentions += enricher.create_event_mentions(doc_id)
+                    with rule_costs.rule("create_event_mentions"):
+                        for doc_id in pending_doc_ids:
+                            total_mentions += enricher.create_event_mentions(doc_id)
+                            if self.document_checkpoint is not None:
+                                self.document_checkpoint.mark_completed([doc_id])
                     self.logger.info(
                         "Created %d EventMention nodes across %d documents",
                         total_mentions,
@@ -878,6 +1142,8 @@ class EventEnrichmentPhaseWrapper:
                 with log_subsection(self.logger, "Morphological projection onto EventMentions"):
                     from textgraphx.pipeline.phases.refinement import RefinementPhase
                     refiner_for_morph = RefinementPhase(argv=[])
+                    # attribute these rule families to this phase's run
+                    refiner_for_morph.rule_cost_recorder = rule_costs
                     refiner_for_morph.run_rule_family("morphological_projection")
                     self.logger.debug("✓ Completed: morphological_projection family")
 
@@ -891,7 +1157,8 @@ class EventEnrichmentPhaseWrapper:
                 # Default tense/aspect backfill: ensure EventMention nodes without
                 # tense/aspect carry explicit 'NONE' (required by MEANTIME gold standard)
                 # rather than NULL (which evaluators treat as a type mismatch).
-                with log_subsection(self.logger, "Default tense/aspect/polarity backfill"):
+                with log_subsection(self.logger, "Default tense/aspect/polarity backfill"), \
+                        rule_costs.rule("default_tense_aspect_backfill"):
                     enricher.graph.run("""
                         MATCH (em:EventMention)
                         WHERE em.tense IS NULL AND em.pos IN ['NOUN','NN','NNS','NNP','NNPS']
@@ -926,7 +1193,8 @@ class EventEnrichmentPhaseWrapper:
                 
                 for step_name, step_func in enrichment_steps:
                     with log_subsection(self.logger, step_name):
-                        step_func()
+                        with rule_costs.rule(getattr(step_func, "__name__", step_name)):
+                            step_func()
                         self.logger.debug(f"✓ Completed: {step_name}")
                 
                 self.logger.info("Event enrichment completed successfully")
@@ -935,7 +1203,7 @@ class EventEnrichmentPhaseWrapper:
                 assertions_passed = None
                 provenance_violations = 0
                 try:
-                    from textgraphx.pipeline.runtime.phase_assertions import PhaseAssertions, record_phase_run
+                    from textgraphx.pipeline.runtime.phase_assertions import PhaseAssertions
                     from textgraphx.reasoning.provenance import stamp_inferred_relationships
                     stamp_inferred_relationships(
                         enricher.graph,
@@ -1051,10 +1319,11 @@ class EventEnrichmentPhaseWrapper:
                         thresholds=_phase_thresholds_for_mode("event_enrichment"),
                         strict_transition_gate=self.strict_transition_gate,
                         enforce_provenance_contracts=True,
+                        doc_ids=assertion_doc_ids,
                     ).after_event_enrichment()
                     assertions_passed = assertion_result.passed
                     provenance_violations = _provenance_violations_from_assertion(assertion_result)
-                    record_phase_run(enricher.graph, "event_enrichment", duration_seconds=0.0)
+                    _record_rule_costs(rule_costs, enricher.graph, documents_processed=len(doc_ids))
                 except Exception:
                     self.logger.debug("Phase assertions/marker unavailable", exc_info=True)
 
@@ -1064,6 +1333,7 @@ class EventEnrichmentPhaseWrapper:
                     "assertions_passed": assertions_passed,
                     "provenance_violations": provenance_violations,
                     "endpoint_violations": endpoint_violations,
+                    "rule_costs": rule_costs.summary(),
                 }
                 
             except Exception as e:
@@ -1624,6 +1894,34 @@ class TlinksRecognizerWrapper:
                 with log_subsection(self.logger, "Initializing TlinksRecognizer"):
                     recognizer = TlinksRecognizer(argv=[])
                     self.logger.debug("TlinksRecognizer initialized")
+                rule_costs = _rule_cost_recorder("tlinks", recognizer)
+
+                # Incremental mode: the TLINK cases and the per-document
+                # reasoning only visit documents not yet stamped by a previous
+                # TLINK run; a document scope restricts them the same way.
+                tlink_doc_ids = None
+                try:
+                    from textgraphx.infrastructure.config import get_config
+                    from textgraphx.pipeline.runtime.document_scope import active_document_scope, restrict_to_scope
+
+                    runtime_cfg = get_config().runtime
+                    if bool(getattr(runtime_cfg, "incremental_tlinks", False)):
+                        tlink_doc_ids = restrict_to_scope(recognizer.untlinked_document_ids(), changed_only=False)
+                        self.logger.info(
+                            "Incremental TLINK recognition scoped to %d untlinked document(s)",
+                            len(tlink_doc_ids),
+                        )
+                    elif active_document_scope() is not None:
+                        tlink_doc_ids = restrict_to_scope(recognizer.get_annotated_text(), changed_only=False)
+                        self.logger.info("TLINK recognition scoped to %d document(s)", len(tlink_doc_ids))
+                    if tlink_doc_ids is not None:
+                        recognizer.set_doc_scope(
+                            tlink_doc_ids,
+                            docs_per_transaction=getattr(runtime_cfg, "tlink_docs_per_transaction", None),
+                        )
+                except Exception:
+                    self.logger.debug("Runtime config unavailable for incremental_tlinks", exc_info=True)
+
                 enable_tlink_xml_seed = False
                 try:
                     from textgraphx.infrastructure.config import get_config
@@ -1638,12 +1936,13 @@ class TlinksRecognizerWrapper:
                     )
 
                 xml_docs_processed = 0
+                xml_failed_doc_ids = set()
                 xml_e2e_runs = 0
                 xml_e2t_runs = 0
                 xml_t2t_runs = 0
                 if enable_tlink_xml_seed:
                     with log_subsection(self.logger, "TTK XML-derived TLINK extraction (E2E/E2T/T2T)"):
-                        doc_ids = recognizer.get_annotated_text()
+                        doc_ids = tlink_doc_ids if tlink_doc_ids is not None else recognizer.get_annotated_text()
                         self.logger.debug("Found %d documents for XML-derived TLINK extraction", len(doc_ids))
                         for doc_id in doc_ids:
                             try:
@@ -1653,6 +1952,7 @@ class TlinksRecognizerWrapper:
                                 xml_e2t_runs += 1
                                 xml_docs_processed += 1
                             except Exception:
+                                xml_failed_doc_ids.add(doc_id)
                                 self.logger.debug(
                                     "XML-derived TLINK extraction failed for doc_id=%s (continuing)",
                                     doc_id,
@@ -1669,10 +1969,15 @@ class TlinksRecognizerWrapper:
                     self.logger.debug("Skipping XML-derived TLINK extraction (enable_tlink_xml_seed=false)")
 
                 tlink_shadow_mode = False
+                tlink_reasoning_engine = "memory"
+                tlink_allen_check = False
                 try:
                     from textgraphx.infrastructure.config import get_config
 
-                    tlink_shadow_mode = bool(get_config().runtime.tlink_shadow_mode)
+                    runtime_cfg = get_config().runtime
+                    tlink_shadow_mode = bool(runtime_cfg.tlink_shadow_mode)
+                    tlink_reasoning_engine = str(getattr(runtime_cfg, "tlink_reasoning_engine", "memory"))
+                    tlink_allen_check = bool(getattr(runtime_cfg, "tlink_allen_check", False))
                 except Exception:
                     self.logger.debug("Runtime config unavailable for tlink_shadow_mode", exc_info=True)
                 
@@ -1705,62 +2010,103 @@ class TlinksRecognizerWrapper:
                     (27, recognizer.create_tlinks_case27, "Case 27: npadvmod Last-Week IS_INCLUDED"),
                 ]
                 
+                case_counts = {}
+                if tlink_doc_ids is not None and not tlink_doc_ids:
+                    self.logger.info("No documents to process; skipping TLINK recognition cases")
+                    tlink_cases = []
                 self.logger.info(f"Starting {len(tlink_cases)} TLINK recognition cases")
                 
                 for case_num, case_func, case_desc in tlink_cases:
                     with log_subsection(self.logger, case_desc):
-                        case_func()
-                        self.logger.debug(f"✓ Completed: Case {case_num}")
+                        with rule_costs.rule(f"case{case_num}"):
+                            case_counts[case_num] = _tlink_case_count(case_func())
+                        self.logger.debug(f"✓ Completed: Case {case_num} ({case_counts[case_num]} TLINKs touched)")
 
                 with log_subsection(self.logger, "Normalize TLINK relation inventory"):
-                    recognizer.normalize_tlink_reltypes()
+                    with rule_costs.rule("normalize_tlink_reltypes"):
+                        recognizer.normalize_tlink_reltypes()
                     self.logger.debug("✓ Completed: TLINK relType normalization")
 
-                with log_subsection(self.logger, "Materialize TimeML inverse TLINKs"):
-                    inverse_total = recognizer.materialize_tlink_inverses()
-                    self.logger.debug(
-                        "✓ Completed: TLINK inverse materialization (%d edges)",
-                        inverse_total,
-                    )
+                suppressed_tlinks = 0
+                shadow_conflicts = 0
+                allen_inconsistent_documents = []
+                if tlink_reasoning_engine == "cypher":
+                    with log_subsection(self.logger, "Materialize TimeML inverse TLINKs"):
+                        with rule_costs.rule("materialize_tlink_inverses"):
+                            inverse_total = recognizer.materialize_tlink_inverses()
+                        self.logger.debug(
+                            "✓ Completed: TLINK inverse materialization (%d edges)",
+                            inverse_total,
+                        )
 
-                with log_subsection(self.logger, "Apply TLINK transitive closure"):
-                    closure_created = recognizer.apply_tlink_transitive_closure()
-                    self.logger.debug(
-                        "✓ Completed: TLINK transitive closure (%d created)",
-                        closure_created,
-                    )
+                    with log_subsection(self.logger, "Apply TLINK transitive closure"):
+                        with rule_costs.rule("apply_tlink_transitive_closure"):
+                            closure_created = recognizer.apply_tlink_transitive_closure()
+                        self.logger.debug(
+                            "✓ Completed: TLINK transitive closure (%d created)",
+                            closure_created,
+                        )
 
-                with log_subsection(self.logger, "Apply TLINK constraint solver"):
-                    constraint_summary = recognizer.apply_constraint_solver(
-                        shadow_only=tlink_shadow_mode
-                    )
-                    self.logger.debug(
-                        "✓ Completed: TLINK constraint solver (inverse_created=%d, bidirectional_conflicts=%d)",
-                        constraint_summary.get("inverse_created", 0),
-                        constraint_summary.get("bidirectional_conflicts", 0),
-                    )
+                    with log_subsection(self.logger, "Apply TLINK constraint solver"):
+                        with rule_costs.rule("apply_constraint_solver"):
+                            constraint_summary = recognizer.apply_constraint_solver(
+                                shadow_only=tlink_shadow_mode
+                            )
+                        self.logger.debug(
+                            "✓ Completed: TLINK constraint solver (inverse_created=%d, bidirectional_conflicts=%d)",
+                            constraint_summary.get("inverse_created", 0),
+                            constraint_summary.get("bidirectional_conflicts", 0),
+                        )
 
-                suppressed_tlinks = 0
-                shadow_conflicts = 0
-                with log_subsection(self.logger, "Suppress contradictory TLINKs"):
-                    suppression_rows = recognizer.suppress_tlink_conflicts(shadow_only=tlink_shadow_mode)
-                    if suppression_rows:
+                    with log_subsection(self.logger, "Suppress contradictory TLINKs"):
+                        with rule_costs.rule("suppress_tlink_conflicts"):
+                            suppression_rows = recognizer.suppress_tlink_conflicts(shadow_only=tlink_shadow_mode)
+                        if suppression_rows:
+                            if tlink_shadow_mode:
+                                shadow_conflicts = suppression_rows[0].get("would_suppress", 0)
+                            else:
+                                suppressed_tlinks = suppression_rows[0].get("suppressed", 0)
                         if tlink_shadow_mode:
-                            shadow_conflicts = suppression_rows[0].get("would_suppress", 0)
+                            self.logger.debug(
+                                "✓ Completed: TLINK shadow consistency scan (%d potential suppressions)",
+                                shadow_conflicts,
+                            )
                         else:
-                            suppressed_tlinks = suppression_rows[0].get("suppressed", 0)
-                    if tlink_shadow_mode:
+                            self.logger.debug("✓ Completed: TLINK conflict suppression (%d suppressed)", suppressed_tlinks)
+                else:
+                    with log_subsection(self.logger, "In-memory TLINK reasoning (inverses, closure, constraints, suppression)"):
+                        with rule_costs.rule("apply_tlink_reasoning"):
+                            reasoning_summary = recognizer.apply_tlink_reasoning(
+                                shadow_only=tlink_shadow_mode,
+                                allen_check=tlink_allen_check,
+                                doc_ids=tlink_doc_ids,
+                            )
+                        closure_created = reasoning_summary["closure_created"]
+                        constraint_summary = {
+                            "inverse_created": reasoning_summary["inverse_created"],
+                            "bidirectional_conflicts": reasoning_summary["bidirectional_conflicts"],
+                        }
+                        if tlink_shadow_mode:
+                            shadow_conflicts = reasoning_summary["contradictions"]
+                        else:
+                            suppressed_tlinks = reasoning_summary["contradictions"]
+                        allen_inconsistent_documents = reasoning_summary["allen_inconsistent_documents"]
                         self.logger.debug(
-                            "✓ Completed: TLINK shadow consistency scan (%d potential suppressions)",
-                            shadow_conflicts,
+                            "✓ Completed: in-memory TLINK reasoning over %d documents "
+                            "(case19=%d closure=%d inverse=%d bidirectional=%d contradictions=%d)",
+                            reasoning_summary["documents"],
+                            reasoning_summary["case19_inverses"],
+                            closure_created,
+                            reasoning_summary["inverse_created"],
+                            reasoning_summary["bidirectional_conflicts"],
+                            reasoning_summary["contradictions"],
                         )
-                    else:
-                        self.logger.debug("✓ Completed: TLINK conflict suppression (%d suppressed)", suppressed_tlinks)
 
                 anchor_suppressed_tlinks = 0
                 anchor_shadow_inconsistencies = 0
                 with log_subsection(self.logger, "Validate TLINK anchor consistency"):
-                    anchor_rows = recognizer.enforce_tlink_anchor_consistency(shadow_only=tlink_shadow_mode)
+                    with rule_costs.rule("enforce_tlink_anchor_consistency"):
+                        anchor_rows = recognizer.enforce_tlink_anchor_consistency(shadow_only=tlink_shadow_mode)
                     if anchor_rows:
                         if tlink_shadow_mode:
                             anchor_shadow_inconsistencies = anchor_rows[0].get("inconsistent_count", 0)
@@ -1778,7 +2124,8 @@ class TlinksRecognizerWrapper:
                         )
 
                 with log_subsection(self.logger, "Validate TLINK endpoint contract"):
-                    endpoint_violations = recognizer.endpoint_contract_violations()
+                    with rule_costs.rule("endpoint_contract_violations"):
+                        endpoint_violations = recognizer.endpoint_contract_violations()
                     self.logger.debug(
                         "✓ Completed: TLINK endpoint contract validation (%d violations)",
                         endpoint_violations,
@@ -1786,11 +2133,34 @@ class TlinksRecognizerWrapper:
                 
                 self.logger.info("TLINK recognition completed successfully")
 
+                # Only documents whose cases all ran are stamped. A failed
+                # scoped case covers every document in the scope, so none of
+                # them are stamped and the next run retries them.
+                documents_tlinked = None
+                case_failures = []
+                if tlink_doc_ids is not None:
+                    from textgraphx.reasoning.temporal.time import utc_iso_now
+
+                    case_failures = recognizer.doc_scope_failures()
+                    recognizer.set_doc_scope(None)
+                    if case_failures:
+                        self.logger.warning(
+                            "%d TLINK case query(ies) failed; leaving %d document(s) unstamped for retry",
+                            len(case_failures),
+                            len(tlink_doc_ids),
+                        )
+                        documents_tlinked = 0
+                    else:
+                        stamp_ids = [doc_id for doc_id in tlink_doc_ids if doc_id not in xml_failed_doc_ids]
+                        documents_tlinked = (
+                            recognizer.mark_documents_tlinked(stamp_ids, utc_iso_now()) if stamp_ids else 0
+                        )
+
                 # Phase assertions (Item 5) and run marker (Item 7)
                 assertions_passed = None
                 provenance_violations = 0
                 try:
-                    from textgraphx.pipeline.runtime.phase_assertions import PhaseAssertions, record_phase_run
+                    from textgraphx.pipeline.runtime.phase_assertions import PhaseAssertions
                     from textgraphx.reasoning.provenance import stamp_inferred_relationships
                     stamp_inferred_relationships(
                         recognizer.graph,
@@ -1807,10 +2177,11 @@ class TlinksRecognizerWrapper:
                         thresholds=_phase_thresholds_for_mode("tlinks"),
                         strict_transition_gate=self.strict_transition_gate,
                         enforce_provenance_contracts=True,
+                        doc_ids=tlink_doc_ids or None,
                     ).after_tlinks()
                     assertions_passed = assertion_result.passed
                     provenance_violations = _provenance_violations_from_assertion(assertion_result)
-                    record_phase_run(recognizer.graph, "tlinks", duration_seconds=0.0)
+                    _record_rule_costs(rule_costs, recognizer.graph, documents_processed=documents_tlinked or 0)
                 except Exception:
                     self.logger.debug("Phase assertions/marker unavailable", exc_info=True)
 
@@ -1828,10 +2199,16 @@ class TlinksRecognizerWrapper:
                     "suppressed_tlinks": suppressed_tlinks,
                     "anchor_suppressed_tlinks": anchor_suppressed_tlinks,
                     "tlink_shadow_mode": tlink_shadow_mode,
+                    "tlink_reasoning_engine": tlink_reasoning_engine,
+                    "case_counts": case_counts,
+                    "documents_tlinked": documents_tlinked,
+                    "case_failures": len(case_failures),
+                    "allen_inconsistent_documents": allen_inconsistent_documents,
                     "shadow_conflicts": shadow_conflicts,
                     "anchor_shadow_inconsistencies": anchor_shadow_inconsistencies,
                     "endpoint_violations": endpoint_violations,
                     "assertions_passed": assertions_passed,
+                    "rule_costs": rule_costs.summary(),
                     "provenance_violations": provenance_violations,
                 }
                 
@@ -1864,6 +2241,18 @@ class GraphEnhancementsPhaseWrapper:
 
                 results = {}
 
+                # GA-05..GA-08 are per-document; after an incremental ingestion
+                # run (or inside a document scope) they only revisit the
+                # changed documents.
+                from textgraphx.pipeline.ingestion.ingestion_manifest import changed_document_ids
+                from textgraphx.pipeline.runtime.document_scope import active_document_scope, restrict_to_scope
+
+                doc_ids = None
+                if changed_document_ids() is not None or active_document_scope() is not None:
+                    doc_rows = enhancer.graph.run("MATCH (d:AnnotatedText) RETURN d.id AS doc_id").data()
+                    doc_ids = restrict_to_scope(row["doc_id"] for row in doc_rows)
+                    self.logger.info("Graph enhancements scoped to %d document(s)", len(doc_ids))
+
                 # GA-01: DISABLED — purge any previously-created transitive TLINKs.
                 # GA-01 generated BEFORE/AFTER chains that are not in MEANTIME gold,
                 # producing large FP counts with no TP benefit.
@@ -1893,22 +2282,22 @@ class GraphEnhancementsPhaseWrapper:
 
                 # GA-05: Entity salience
                 with log_subsection(self.logger, "GA-05 Entity salience scoring"):
-                    results["ga05_salience"] = enhancer.compute_entity_salience()
+                    results["ga05_salience"] = enhancer.compute_entity_salience(doc_ids)
                     self.logger.info("✓ GA-05 Entity salience computed: %d entities", results["ga05_salience"])
 
                 # GA-06: Frame ALIGNS_WITH gap fill
                 with log_subsection(self.logger, "GA-06 Frame ALIGNS_WITH gap fill"):
-                    results["ga06_aligns_with"] = enhancer.fill_frame_aligns_with_gaps()
+                    results["ga06_aligns_with"] = enhancer.fill_frame_aligns_with_gaps(doc_ids)
                     self.logger.info("✓ GA-06 Frame ALIGNS_WITH edges created: %d", results["ga06_aligns_with"])
 
                 # GA-07: Coreference chain quality
                 with log_subsection(self.logger, "GA-07 Coreference chain quality signal"):
-                    results["ga07_coref"] = enhancer.compute_coref_chain_quality()
+                    results["ga07_coref"] = enhancer.compute_coref_chain_quality(doc_ids)
                     self.logger.info("✓ GA-07 CorefChain quality computed: %d chains", results["ga07_coref"])
 
                 # GA-08: Sentence root backfill (no-op when dep property absent)
                 with log_subsection(self.logger, "GA-08 Sentence root backfill"):
-                    results["ga08_sent_root"] = enhancer.backfill_sentence_roots()
+                    results["ga08_sent_root"] = enhancer.backfill_sentence_roots(doc_ids)
                     self.logger.info("✓ GA-08 Sentence roots backfilled: %d", results["ga08_sent_root"])
 
                 # GA-09: Participant mention bridge (±50-token window)
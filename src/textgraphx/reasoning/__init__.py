@@ -18,6 +18,7 @@ from textgraphx.reasoning.confidence import (
 from textgraphx.reasoning.contracts import (
     canonical_event_attribute_vocabulary,
     count_endpoint_violations,
+    endpoint_violation_condition,
     load_ontology_contract,
     normalize_event_attr,
     relation_endpoint_contract,
@@ -46,6 +47,7 @@ __all__ = [
     "compute_evidence_weighted_confidence",
     "count_endpoint_violations",
     "decide_conflict",
+    "endpoint_violation_condition",
     "fuse_entities_cross_document",
     "fuse_entities_cross_sentence",
     "load_ontology_contract",
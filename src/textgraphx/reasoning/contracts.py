@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 _ONT_CACHE: Optional[Dict[str, Any]] = None
 
@@ -66,55 +66,69 @@ def _count_query(graph: Any, query: str, params: Dict[str, Any]) -> int:
     return int(rows[0].get("c", 0)) if rows else 0
 
 
-def count_endpoint_violations(graph: Any, rel_type: str) -> int:
-    """Count relationships that violate ontology endpoint typing contract."""
+def endpoint_violation_condition(
+    rel_type: str,
+    source: str = "s",
+    target: str = "t",
+) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Return ``(predicate, params)`` matching *rel_type* edges that break their contract.
+
+    The predicate is written over the *source* and *target* node variables.
+    Parameter names are prefixed with the lower-cased relation type so the
+    predicates of several relation types can share one query. Returns ``None``
+    when the relation type has no usable endpoint contract.
+    """
     contract = relation_endpoint_contract().get(rel_type)
     if not contract:
-        return 0
+        return None
+    prefix = rel_type.lower()
 
     if "allowed_pairs" in contract:
-        allowed_pairs = contract.get("allowed_pairs", [])
-        if not allowed_pairs:
-            return 0
         pair_clauses = []
         params: Dict[str, Any] = {}
-        for idx, pair in enumerate(allowed_pairs):
+        for idx, pair in enumerate(contract.get("allowed_pairs", [])):
             if not isinstance(pair, list) or len(pair) != 2:
                 continue
-            src_key = f"src_{idx}"
-            dst_key = f"dst_{idx}"
+            src_key = f"{prefix}_src_{idx}"
+            dst_key = f"{prefix}_dst_{idx}"
             params[src_key] = str(pair[0])
             params[dst_key] = str(pair[1])
             pair_clauses.append(
-                f"(any(lbl IN labels(s) WHERE lbl = ${src_key}) AND any(lbl IN labels(t) WHERE lbl = ${dst_key}))"
+                f"(any(lbl IN labels({source}) WHERE lbl = ${src_key}) "
+                f"AND any(lbl IN labels({target}) WHERE lbl = ${dst_key}))"
             )
         if not pair_clauses:
-            return 0
-
-        query = f"""
-        MATCH (s)-[r:{rel_type}]->(t)
-        WHERE NOT ({' OR '.join(pair_clauses)})
-        RETURN count(r) AS c
-        """
-        return _count_query(graph, query, params)
+            return None
+        return f"NOT ({' OR '.join(pair_clauses)})", params
 
     sources = list(contract.get("sources", []))
     targets = list(contract.get("targets", []))
     if not sources or not targets:
-        return 0
+        return None
+    predicate = (
+        f"(NOT any(lbl IN labels({source}) WHERE lbl IN ${prefix}_sources) "
+        f"OR NOT any(lbl IN labels({target}) WHERE lbl IN ${prefix}_targets))"
+    )
+    return predicate, {f"{prefix}_sources": sources, f"{prefix}_targets": targets}
 
+
+def count_endpoint_violations(graph: Any, rel_type: str) -> int:
+    """Count relationships that violate ontology endpoint typing contract."""
+    condition = endpoint_violation_condition(rel_type)
+    if condition is None:
+        return 0
+    predicate, params = condition
     query = f"""
     MATCH (s)-[r:{rel_type}]->(t)
-    WHERE NOT any(lbl IN labels(s) WHERE lbl IN $sources)
-       OR NOT any(lbl IN labels(t) WHERE lbl IN $targets)
+    WHERE {predicate}
     RETURN count(r) AS c
     """
-    return _count_query(graph, query, {"sources": sources, "targets": targets})
-
+    return _count_query(graph, query, params)
 
 __all__ = [
     "canonical_event_attribute_vocabulary",
     "count_endpoint_violations",
+    "endpoint_violation_condition",
     "load_ontology_contract",
     "normalize_event_attr",
     "relation_endpoint_contract",
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Iterable, List, Optional
 
 
 def _validate_confidence(confidence: float) -> None:
@@ -50,30 +50,48 @@ def fuse_entities_cross_sentence(
     return int(rows[0].get("c", 0)) if rows else 0
 
 
+def _doc_id_list(doc_ids: Optional[Iterable]) -> Optional[List]:
+    return None if doc_ids is None else [doc_id for doc_id in doc_ids]
+
+
 def fuse_entities_cross_document(
     graph,
     confidence: float = 0.8,
     evidence_source: str = "refinement_phase",
     rule_id: str = "cross_document_same_kbid_v1",
     require_type_compatibility: bool = True,
+    doc_ids: Optional[Iterable] = None,
 ) -> int:
     """Create `SAME_AS` links for entities that share stable external identity.
 
     Current baseline uses non-empty `kb_id` equality across distinct documents.
+    Entities are grouped by `kb_id` (looked up through the `Entity(kb_id)`
+    index) and only pairs within a group are compared. With `doc_ids` only
+    the groups of entities mentioned in those documents are visited, which
+    links newly ingested documents against the existing graph.
     """
     _validate_confidence(confidence)
 
     query = """
-    MATCH (d1:AnnotatedText)-[:CONTAINS_SENTENCE]->(:Sentence)-[:HAS_TOKEN]->(:TagOccurrence)
-            -[:IN_MENTION]->(:NamedEntity)-[:REFERS_TO]->(e1:Entity)
-    MATCH (d2:AnnotatedText)-[:CONTAINS_SENTENCE]->(:Sentence)-[:HAS_TOKEN]->(:TagOccurrence)
-            -[:IN_MENTION]->(:NamedEntity)-[:REFERS_TO]->(e2:Entity)
-    WHERE d1.id <> d2.id
-      AND e1 <> e2
-      AND elementId(e1) < elementId(e2)
-      AND e1.kb_id IS NOT NULL
-      AND e1.kb_id <> ""
-      AND e1.kb_id = e2.kb_id
+    OPTIONAL MATCH (seed_doc:AnnotatedText)-[:CONTAINS_SENTENCE]->(:Sentence)-[:HAS_TOKEN]->(:TagOccurrence)
+            -[:IN_MENTION]->(:NamedEntity)-[:REFERS_TO]->(seed:Entity)
+    WHERE seed_doc.id IN $doc_ids
+    WITH collect(DISTINCT seed.kb_id) AS seed_kb_ids
+    MATCH (e:Entity)
+    WHERE e.kb_id IS NOT NULL
+      AND e.kb_id <> ""
+      AND ($doc_ids IS NULL OR e.kb_id IN seed_kb_ids)
+    MATCH (d:AnnotatedText)-[:CONTAINS_SENTENCE]->(:Sentence)-[:HAS_TOKEN]->(:TagOccurrence)
+            -[:IN_MENTION]->(:NamedEntity)-[:REFERS_TO]->(e)
+    WITH e, collect(DISTINCT d.id) AS docs
+    WITH e.kb_id AS kb_id, collect({entity: e, docs: docs}) AS members
+    WHERE size(members) > 1
+    UNWIND range(0, size(members) - 2) AS i
+    UNWIND range(i + 1, size(members) - 1) AS j
+    WITH CASE WHEN elementId(members[i].entity) < elementId(members[j].entity)
+              THEN [members[i], members[j]] ELSE [members[j], members[i]] END AS pair
+    WITH pair[0].entity AS e1, pair[1].entity AS e2, pair[0].docs AS docs1, pair[1].docs AS docs2
+    WHERE any(x IN docs1 WHERE any(y IN docs2 WHERE x <> y))
       AND (
             $require_type_compatibility = false
             OR coalesce(e1.type, "") = ""
@@ -96,11 +114,87 @@ def fuse_entities_cross_document(
             "evidence_source": evidence_source,
             "rule_id": rule_id,
             "require_type_compatibility": bool(require_type_compatibility),
+            "doc_ids": _doc_id_list(doc_ids),
         },
     ).data()
     return int(rows[0].get("c", 0)) if rows else 0
 
 
+# Identity key of a coref-derived mention; seed and candidate mentions must use
+# the same expression. Every pass stores it on the mentions it reads as
+# ``coref_identity_key`` (indexed per label by migration 0029, which also
+# backfills it), so incremental passes can seek mentions by key.
+_COREF_IDENTITY_KEY = "toLower(trim(coalesce({m}.head, {m}.normal_term, {m}.value, {m}.text, '')))"
+
+_COREF_SEED_KEYS_QUERY = """
+MATCH (seed_doc:AnnotatedText)-[:CONTAINS_SENTENCE]->(:Sentence)-[:HAS_TOKEN]->(:TagOccurrence)
+            -[:IN_MENTION]->(seed)-[:REFERS_TO]->(:Entity)
+WHERE seed_doc.id IN $doc_ids
+  AND (seed:NamedEntity OR seed:CorefMention OR seed:Antecedent)
+WITH DISTINCT seed
+SET seed.coref_identity_key = {seed_key}
+WITH DISTINCT seed.coref_identity_key AS k
+WHERE k <> '' AND size(k) >= $min_key_length
+RETURN collect(k) AS keys
+""".format(seed_key=_COREF_IDENTITY_KEY.format(m="seed"))
+
+# Whole-graph pass: every coref-derived mention of every document.
+_COREF_ALL_MENTIONS = """
+MATCH (d:AnnotatedText)-[:CONTAINS_SENTENCE]->(:Sentence)-[:HAS_TOKEN]->(:TagOccurrence)
+            -[:IN_MENTION]->(m)-[:REFERS_TO]->(e:Entity)
+WHERE (m:NamedEntity OR m:CorefMention OR m:Antecedent)
+WITH DISTINCT d, e, m
+SET m.coref_identity_key = {key}
+WITH d, e, m.coref_identity_key AS k
+WHERE k <> ''
+  AND size(k) >= $min_key_length
+""".format(key=_COREF_IDENTITY_KEY.format(m="m"))
+
+# Incremental pass: mentions carrying one of the seed documents' keys are
+# found through the ``coref_identity_key`` indexes and expanded to their
+# documents, so the cost follows the seed keys, not the corpus.
+_COREF_KEYED_MENTIONS = """
+CALL {
+    MATCH (m:NamedEntity) WHERE m.coref_identity_key IN $keys RETURN m
+    UNION
+    MATCH (m:CorefMention) WHERE m.coref_identity_key IN $keys RETURN m
+    UNION
+    MATCH (m:Antecedent) WHERE m.coref_identity_key IN $keys RETURN m
+}
+MATCH (d:AnnotatedText)-[:CONTAINS_SENTENCE]->(:Sentence)-[:HAS_TOKEN]->(:TagOccurrence)
+            -[:IN_MENTION]->(m)-[:REFERS_TO]->(e:Entity)
+WITH d, e, m.coref_identity_key AS k
+"""
+
+_COREF_IDENTITY_LINKS = """
+WITH k, e, collect(DISTINCT d.id) AS docs
+WITH k, collect({entity: e, docs: docs}) AS members
+WHERE size(members) > 1
+UNWIND range(0, size(members) - 2) AS i
+UNWIND range(i + 1, size(members) - 1) AS j
+WITH k, CASE WHEN elementId(members[i].entity) < elementId(members[j].entity)
+             THEN [members[i], members[j]] ELSE [members[j], members[i]] END AS pair
+WITH k, pair[0].entity AS e1, pair[1].entity AS e2, pair[0].docs AS docs1, pair[1].docs AS docs2
+WHERE any(x IN docs1 WHERE any(y IN docs2 WHERE x <> y))
+  AND (coalesce(e1.kb_id, '') = '' OR coalesce(e2.kb_id, '') = '')
+  AND (
+        $require_type_compatibility = false
+        OR coalesce(e1.type, '') = ''
+        OR coalesce(e2.type, '') = ''
+        OR toUpper(coalesce(e1.type, '')) = toUpper(coalesce(e2.type, ''))
+    )
+MERGE (e1)-[r:SAME_AS]->(e2)
+ON CREATE SET
+  r.confidence = $confidence,
+  r.evidence_source = $evidence_source,
+  r.rule_id = $rule_id,
+  r.identity_key = k,
+  r.type_compatibility_required = $require_type_compatibility,
+  r.created_at = datetime()
+RETURN count(r) AS c
+"""
+
+
 def propagate_coreference_identity_cross_document(
     graph,
     confidence: float = 0.72,
@@ -108,6 +202,7 @@ def propagate_coreference_identity_cross_document(
     rule_id: str = "cross_document_coref_identity_v1",
     require_type_compatibility: bool = True,
     min_key_length: int = 3,
+    doc_ids: Optional[Iterable] = None,
 ) -> int:
     """Create `SAME_AS` links across documents using coref-derived identity keys.
 
@@ -115,53 +210,35 @@ def propagate_coreference_identity_cross_document(
     heads/surface forms from coreference artifacts where a stable external id is
     unavailable. It is intentionally conservative and only links entities across
     distinct documents.
+
+    Entities are grouped by identity key in one pass over the mentions and
+    only pairs within a group are compared. The key is stored on each mention
+    read as ``coref_identity_key``. With `doc_ids` the keys of those
+    documents are computed first and the mentions carrying one of them are
+    looked up through the ``coref_identity_key`` indexes, so an incremental
+    run does not walk the whole corpus. Mentions of documents that were never
+    fused get their key from migration 0029 or a whole-graph run.
     """
     _validate_confidence(confidence)
 
-    query = """
-    MATCH (d1:AnnotatedText)-[:CONTAINS_SENTENCE]->(:Sentence)-[:HAS_TOKEN]->(:TagOccurrence)
-                -[:IN_MENTION]->(m1)-[:REFERS_TO]->(e1:Entity)
-    MATCH (d2:AnnotatedText)-[:CONTAINS_SENTENCE]->(:Sentence)-[:HAS_TOKEN]->(:TagOccurrence)
-                -[:IN_MENTION]->(m2)-[:REFERS_TO]->(e2:Entity)
-    WHERE d1.id <> d2.id
-      AND e1 <> e2
-      AND elementId(e1) < elementId(e2)
-      AND (m1:NamedEntity OR m1:CorefMention OR m1:Antecedent)
-      AND (m2:NamedEntity OR m2:CorefMention OR m2:Antecedent)
-    WITH e1, e2,
-         toLower(trim(coalesce(m1.head, m1.normal_term, m1.value, m1.text, ''))) AS k1,
-         toLower(trim(coalesce(m2.head, m2.normal_term, m2.value, m2.text, ''))) AS k2
-    WHERE k1 <> ''
-      AND k2 <> ''
-      AND k1 = k2
-      AND size(k1) >= $min_key_length
-      AND (coalesce(e1.kb_id, '') = '' OR coalesce(e2.kb_id, '') = '')
-      AND (
-            $require_type_compatibility = false
-            OR coalesce(e1.type, '') = ''
-            OR coalesce(e2.type, '') = ''
-            OR toUpper(coalesce(e1.type, '')) = toUpper(coalesce(e2.type, ''))
-        )
-    MERGE (e1)-[r:SAME_AS]->(e2)
-    ON CREATE SET
-      r.confidence = $confidence,
-      r.evidence_source = $evidence_source,
-      r.rule_id = $rule_id,
-      r.identity_key = k1,
-      r.type_compatibility_required = $require_type_compatibility,
-      r.created_at = datetime()
-    RETURN count(r) AS c
-    """
-    rows = graph.run(
-        query,
-        {
-            "confidence": confidence,
-            "evidence_source": evidence_source,
-            "rule_id": rule_id,
-            "require_type_compatibility": bool(require_type_compatibility),
-            "min_key_length": max(1, int(min_key_length)),
-        },
-    ).data()
+    params = {
+        "confidence": confidence,
+        "evidence_source": evidence_source,
+        "rule_id": rule_id,
+        "require_type_compatibility": bool(require_type_compatibility),
+        "min_key_length": max(1, int(min_key_length)),
+        "doc_ids": _doc_id_list(doc_ids),
+    }
+    if params["doc_ids"] is None:
+        query = _COREF_ALL_MENTIONS + _COREF_IDENTITY_LINKS
+    else:
+        seed_rows = graph.run(_COREF_SEED_KEYS_QUERY, params).data()
+        keys = list(seed_rows[0].get("keys") or []) if seed_rows else []
+        if not keys:
+            return 0
+        params["keys"] = keys
+        query = _COREF_KEYED_MENTIONS + _COREF_IDENTITY_LINKS
+    rows = graph.run(query, params).data()
     return int(rows[0].get("c", 0)) if rows else 0
 
 
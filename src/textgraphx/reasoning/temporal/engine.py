@@ -0,0 +1,630 @@
+"""In-memory TLINK reasoning over one document's TLINK subgraph at a time.
+
+The Cypher passes of ``TlinksRecognizer`` (case-19 inverse materialization,
+IDENTITY closure, the constraint solver and contradiction suppression) each
+self-join every TLINK in the graph, so their cost grows quadratically with the
+corpus. ``TlinkReasoningEngine`` loads one document's TLINKs into a
+:class:`DocumentTlinkGraph` (integer node indexes, per-node adjacency lists),
+runs the same rules in memory and writes back only the delta, i.e. new edges
+and changed properties, in one statement per document.
+
+The rules and their order match the Cypher passes they replace:
+
+1. case-19 TimeML inverses (``materialize_tlink_inverses``);
+2. IDENTITY-composition closure, iterated to a fixpoint instead of a fixed
+   number of rounds (``apply_tlink_transitive_closure``);
+3. inverse consistency and bidirectional same-relation suppression
+   (``solve_tlink_constraints``);
+4. same-direction contradiction suppression (``suppress_tlink_conflicts``).
+
+Ties between equally confident edges go to the edge with the smaller element
+id, and edges created in memory rank after loaded ones. With ``allen_check``
+each document's unsuppressed TLINKs are also checked for Allen
+interval-algebra consistency (path consistency); inconsistent documents are
+reported, not modified.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from textgraphx.reasoning.temporal.constraints import INVERSE_REL_MAP
+from textgraphx.reasoning.temporal.timeml_relations import CANONICAL_TLINK_RELTYPES
+
+logger = logging.getLogger(__name__)
+
+# Case 19 inverts containment, aspectual and immediate-precedence relations
+# only; BEFORE/AFTER keep the direction TTK assigned.
+CASE19_INVERSES: Dict[str, str] = {
+    "IS_INCLUDED": "INCLUDES",
+    "INCLUDES": "IS_INCLUDED",
+    "BEGUN_BY": "BEGINS",
+    "BEGINS": "BEGUN_BY",
+    "ENDED_BY": "ENDS",
+    "ENDS": "ENDED_BY",
+    "IAFTER": "IBEFORE",
+    "IBEFORE": "IAFTER",
+}
+_CASE19_SKIPPED_RULES = frozenset({"transitive_closure", "inverse_consistency"})
+_BIDIRECTIONAL_CONFLICT_RELS = frozenset(
+    {"BEFORE", "AFTER", "INCLUDES", "IS_INCLUDED", "BEGINS", "BEGUN_BY", "ENDS", "ENDED_BY"}
+)
+_CONTRADICTORY_RELS = frozenset(
+    {
+        ("BEFORE", "AFTER"),
+        ("AFTER", "BEFORE"),
+        ("INCLUDES", "IS_INCLUDED"),
+        ("IS_INCLUDED", "INCLUDES"),
+        ("BEGINS", "BEGUN_BY"),
+        ("BEGUN_BY", "BEGINS"),
+        ("ENDS", "ENDED_BY"),
+        ("ENDED_BY", "ENDS"),
+    }
+)
+_CANONICAL = frozenset(CANONICAL_TLINK_RELTYPES)
+
+SUMMARY_KEYS = (
+    "case19_inverses",
+    "closure_created",
+    "inverse_created",
+    "bidirectional_conflicts",
+    "contradictions",
+    "allen_inconsistent",
+)
+
+# ---------------------------------------------------------------------------
+# Allen interval algebra
+# ---------------------------------------------------------------------------
+# Basic relations ordered so that the converse of relation i is 12 - i.
+ALLEN_RELATIONS = ("b", "m", "o", "s", "d", "f", "e", "fi", "di", "si", "oi", "mi", "bi")
+_ALLEN_INDEX = {name: idx for idx, name in enumerate(ALLEN_RELATIONS)}
+_ALLEN_ALL = (1 << len(ALLEN_RELATIONS)) - 1
+
+
+def _allen_mask(*names: str) -> int:
+    mask = 0
+    for name in names:
+        mask |= 1 << _ALLEN_INDEX[name]
+    return mask
+
+
+# TimeML relation -> admissible Allen relations. Containment relations are
+# kept disjunctive so that loosely annotated links are not reported as
+# inconsistent; VAGUE (and anything unlisted) does not constrain.
+TLINK_ALLEN_RELATIONS: Dict[str, int] = {
+    "BEFORE": _allen_mask("b"),
+    "AFTER": _allen_mask("bi"),
+    "IBEFORE": _allen_mask("m"),
+    "IAFTER": _allen_mask("mi"),
+    "BEGINS": _allen_mask("s"),
+    "BEGUN_BY": _allen_mask("si"),
+    "ENDS": _allen_mask("f"),
+    "ENDED_BY": _allen_mask("fi"),
+    "IS_INCLUDED": _allen_mask("s", "d", "f"),
+    "INCLUDES": _allen_mask("si", "di", "fi"),
+    "DURING": _allen_mask("s", "d", "f", "e"),
+    "DURING_INV": _allen_mask("si", "di", "fi", "e"),
+    "SIMULTANEOUS": _allen_mask("e"),
+    "IDENTITY": _allen_mask("e"),
+}
+
+
+def _basic_allen_relation(x: Tuple[int, int], y: Tuple[int, int]) -> int:
+    (x1, x2), (y1, y2) = x, y
+    if x2 < y1:
+        name = "b"
+    elif x2 == y1:
+        name = "m"
+    elif y2 < x1:
+        name = "bi"
+    elif y2 == x1:
+        name = "mi"
+    elif x1 == y1:
+        name = "e" if x2 == y2 else ("s" if x2 < y2 else "si")
+    elif x2 == y2:
+        name = "f" if x1 > y1 else "fi"
+    elif y1 < x1 and x2 < y2:
+        name = "d"
+    elif x1 < y1 and y2 < x2:
+        name = "di"
+    else:
+        name = "o" if x1 < y1 else "oi"
+    return _ALLEN_INDEX[name]
+
+
+@lru_cache(maxsize=None)
+def allen_composition_table() -> Tuple[Tuple[int, ...], ...]:
+    """Return the 13x13 Allen composition table as relation bitmasks.
+
+    Derived by enumerating every ordering of three intervals' endpoints;
+    six points suffice to realise all of them.
+    """
+    intervals = [(start, end) for start in range(6) for end in range(start + 1, 6)]
+    table = [[0] * len(ALLEN_RELATIONS) for _ in ALLEN_RELATIONS]
+    for x, y, z in itertools.product(intervals, repeat=3):
+        table[_basic_allen_relation(x, y)][_basic_allen_relation(y, z)] |= 1 << _basic_allen_relation(x, z)
+    return tuple(tuple(row) for row in table)
+
+
+def _allen_converse(mask: int) -> int:
+    converse = 0
+    for idx in range(len(ALLEN_RELATIONS)):
+        if mask & (1 << idx):
+            converse |= 1 << (len(ALLEN_RELATIONS) - 1 - idx)
+    return converse
+
+
+@lru_cache(maxsize=4096)
+def _allen_compose(first: int, second: int) -> int:
+    table = allen_composition_table()
+    result = 0
+    for i in range(len(ALLEN_RELATIONS)):
+        if first & (1 << i):
+            for j in range(len(ALLEN_RELATIONS)):
+                if second & (1 << j):
+                    result |= table[i][j]
+                    if result == _ALLEN_ALL:
+                        return result
+    return result
+
+
+def allen_path_consistent(constraints: Dict[Tuple[int, int], int]) -> bool:
+    """Return ``False`` when path consistency empties any constraint.
+
+    *constraints* maps ``(i, j)`` node pairs to Allen relation bitmasks; pairs
+    without an entry are unconstrained.
+    """
+    network: Dict[Tuple[int, int], int] = {}
+    for (i, j), mask in constraints.items():
+        if i == j:
+            if not mask & _allen_mask("e"):
+                return False
+            continue
+        mask &= network.get((i, j), _ALLEN_ALL)
+        if not mask:
+            return False
+        network[(i, j)] = mask
+        network[(j, i)] = _allen_converse(mask)
+
+    nodes = sorted({i for i, _ in network})
+    queue = list(network)
+    queued = set(queue)
+    while queue:
+        i, j = queue.pop()
+        queued.discard((i, j))
+        r_ij = network.get((i, j), _ALLEN_ALL)
+        if r_ij == _ALLEN_ALL:
+            continue
+        for k in nodes:
+            if k == i or k == j:
+                continue
+            for a, b, derived in (
+                (i, k, _allen_compose(r_ij, network.get((j, k), _ALLEN_ALL))),
+                (k, j, _allen_compose(network.get((k, i), _ALLEN_ALL), r_ij)),
+            ):
+                current = network.get((a, b), _ALLEN_ALL)
+                narrowed = current & derived
+                if narrowed == current:
+                    continue
+                if not narrowed:
+                    return False
+                network[(a, b)] = narrowed
+                network[(b, a)] = _allen_converse(narrowed)
+                if (a, b) not in queued:
+                    queue.append((a, b))
+                    queued.add((a, b))
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Per-document TLINK graph
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class TlinkEdge:
+    """One TLINK of a :class:`DocumentTlinkGraph`; ``src``/``dst`` are node indexes."""
+
+    src: int
+    dst: int
+    props: Dict[str, Any]
+    position: int = 0
+    element_id: Optional[str] = None
+    changes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def rel(self) -> str:
+        return self.props.get("relTypeCanonical") or self.props.get("relType") or "VAGUE"
+
+    @property
+    def suppressed(self) -> bool:
+        return bool(self.props.get("suppressed"))
+
+    def confidence(self, default: float) -> float:
+        value = self.props.get("confidence")
+        return default if value is None else float(value)
+
+    def set(self, **props: Any) -> None:
+        self.props.update(props)
+        self.changes.update(props)
+
+
+class DocumentTlinkGraph:
+    """TLINKs of one document indexed by integer node ids."""
+
+    def __init__(self, doc_id: Any = None, stamp: Optional[int] = None):
+        self.doc_id = doc_id
+        self.stamp = int(time.time() * 1000) if stamp is None else stamp
+        self.node_ids: List[str] = []
+        self._node_index: Dict[str, int] = {}
+        self.edges: List[TlinkEdge] = []
+        self.out: List[List[int]] = []
+        self._pairs: Dict[Tuple[int, int], List[int]] = {}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]], doc_id: Any = None) -> "DocumentTlinkGraph":
+        """Build a graph from ``{src, dst, id, props}`` rows (element ids)."""
+        doc = cls(doc_id)
+        for row in rows:
+            doc._add(doc.node(row["src"]), doc.node(row["dst"]), dict(row.get("props") or {}), row.get("id"))
+        return doc
+
+    def node(self, element_id: str) -> int:
+        idx = self._node_index.get(element_id)
+        if idx is None:
+            idx = len(self.node_ids)
+            self._node_index[element_id] = idx
+            self.node_ids.append(element_id)
+            self.out.append([])
+        return idx
+
+    def _add(self, src: int, dst: int, props: Dict[str, Any], element_id: Optional[str]) -> TlinkEdge:
+        edge = TlinkEdge(src, dst, props, position=len(self.edges), element_id=element_id)
+        self.edges.append(edge)
+        self.out[src].append(edge.position)
+        self._pairs.setdefault((src, dst), []).append(edge.position)
+        return edge
+
+    def create(self, src: int, dst: int, **props: Any) -> TlinkEdge:
+        """Add a new TLINK; all of its properties are part of the delta."""
+        edge = self._add(src, dst, dict(props), None)
+        edge.changes.update(props)
+        return edge
+
+    def between(self, src: int, dst: int) -> List[TlinkEdge]:
+        return [self.edges[idx] for idx in self._pairs.get((src, dst), ())]
+
+    def _has_rel_type(self, src: int, dst: int, rel_type: str) -> bool:
+        return any(edge.props.get("relType") == rel_type for edge in self.between(src, dst))
+
+    @staticmethod
+    def _order_key(edge: TlinkEdge) -> Tuple[int, str, int]:
+        if edge.element_id is not None:
+            return (0, edge.element_id, 0)
+        return (1, "", edge.position)
+
+    def _loser_winner(self, first: TlinkEdge, second: TlinkEdge) -> Tuple[TlinkEdge, TlinkEdge]:
+        """Lower confidence loses; ties go to the edge that orders first."""
+        c1, c2 = first.confidence(0.0), second.confidence(0.0)
+        if c1 > c2:
+            return second, first
+        if c2 > c1:
+            return first, second
+        if self._order_key(first) < self._order_key(second):
+            return second, first
+        return first, second
+
+    # -- rules ---------------------------------------------------------------
+
+    def materialize_case19_inverses(self) -> int:
+        """Write case-19 TimeML inverses; return how many edges were created."""
+        created = 0
+        for forward, inverse in CASE19_INVERSES.items():
+            sources = [
+                edge
+                for edge in self.edges
+                if edge.rel == forward
+                and not edge.suppressed
+                and (edge.props.get("rule_id") or "") not in _CASE19_SKIPPED_RULES
+            ]
+            for edge in sources:
+                confidence = edge.confidence(0.5)
+                existing = self.between(edge.dst, edge.src)
+                if not existing:
+                    self.create(
+                        edge.dst,
+                        edge.src,
+                        relType=inverse,
+                        relTypeCanonical=inverse,
+                        confidence=confidence,
+                        source=edge.props.get("source") or "t2g",
+                        evidence_source=edge.props.get("evidence_source") or "tlinks_recognizer",
+                        rule_id="case19_timeml_inverse",
+                        derivedFrom=forward,
+                    )
+                    created += 1
+                    continue
+                for inv in existing:
+                    if inv.confidence(0.0) < confidence:
+                        inv.set(relType=inverse, relTypeCanonical=inverse, confidence=confidence)
+                    if inv.props.get("rule_id") is None:
+                        inv.set(rule_id="case19_timeml_inverse")
+                    if inv.props.get("derivedFrom") is None:
+                        inv.set(derivedFrom=forward)
+        return created
+
+    def close_identity(self, max_rounds: Optional[int] = None) -> int:
+        """Compose IDENTITY chains (``IDENTITY + X -> X``) until nothing new appears."""
+        created = 0
+        round_idx = 0
+        while max_rounds is None or round_idx < max_rounds:
+            round_idx += 1
+            limit = len(self.edges)
+            new_edges = 0
+            for first in self.edges[:limit]:
+                if first.suppressed:
+                    continue
+                for idx in self.out[first.dst]:
+                    if idx >= limit:
+                        break
+                    second = self.edges[idx]
+                    if second.suppressed or second.dst == first.src:
+                        continue
+                    if first.rel == "IDENTITY" and second.rel in _CANONICAL:
+                        inferred = second.rel
+                    elif second.rel == "IDENTITY" and first.rel in _CANONICAL:
+                        inferred = first.rel
+                    else:
+                        continue
+                    if self._has_rel_type(first.src, second.dst, inferred):
+                        continue
+                    self.create(
+                        first.src,
+                        second.dst,
+                        relType=inferred,
+                        relTypeCanonical=inferred,
+                        source="closure",
+                        rule_id="transitive_closure",
+                        evidence_source="tlinks_recognizer",
+                        confidence=round((first.confidence(0.0) + second.confidence(0.0)) / 2.0, 3),
+                        closureRound=round_idx,
+                        createdByClosure=True,
+                    )
+                    new_edges += 1
+            created += new_edges
+            if new_edges == 0:
+                break
+        return created
+
+    def materialize_inverse_consistency(self) -> int:
+        """Add the missing inverse of every ``INVERSE_REL_MAP`` relation."""
+        created = 0
+        for edge in list(self.edges):
+            inverse = INVERSE_REL_MAP.get(edge.rel)
+            if edge.suppressed or inverse is None or self._has_rel_type(edge.dst, edge.src, inverse):
+                continue
+            self.create(
+                edge.dst,
+                edge.src,
+                relType=inverse,
+                relTypeCanonical=inverse,
+                source="constraint_solver",
+                rule_id="inverse_consistency",
+                evidence_source="tlinks_constraint_solver",
+                confidence=edge.confidence(0.0),
+                createdByConstraintSolver=True,
+                createdAt=self.stamp,
+            )
+            created += 1
+        return created
+
+    def suppress_bidirectional_conflicts(self, shadow_only: bool = False) -> int:
+        """Suppress the weaker of ``a-[X]->b`` / ``b-[X]->a`` for asymmetric X."""
+        losers: Dict[int, TlinkEdge] = {}
+        for first in self.edges:
+            if first.suppressed or first.rel not in _BIDIRECTIONAL_CONFLICT_RELS:
+                continue
+            for second in self.between(first.dst, first.src):
+                if (
+                    second.suppressed
+                    or second.rel != first.rel
+                    or not self._order_key(first) < self._order_key(second)
+                ):
+                    continue
+                loser, _ = self._loser_winner(first, second)
+                losers[loser.position] = loser
+        if not shadow_only:
+            for loser in losers.values():
+                loser.set(
+                    suppressed=True,
+                    suppressedBy="tlink_constraint_solver",
+                    suppressedAt=self.stamp,
+                    suppressionReason="bidirectional_same_rel_conflict",
+                )
+        return len(losers)
+
+    def suppress_contradictions(self, shadow_only: bool = False) -> int:
+        """Suppress the weaker of two contradictory TLINKs on the same directed pair."""
+        decisions: Dict[int, Tuple[TlinkEdge, TlinkEdge]] = {}
+        for positions in self._pairs.values():
+            live = sorted(
+                (self.edges[idx] for idx in positions if not self.edges[idx].suppressed),
+                key=self._order_key,
+            )
+            for first, second in itertools.combinations(live, 2):
+                if (first.rel, second.rel) not in _CONTRADICTORY_RELS:
+                    continue
+                loser, winner = self._loser_winner(first, second)
+                decisions.setdefault(loser.position, (loser, winner))
+        if not shadow_only:
+            for loser, winner in decisions.values():
+                loser.set(
+                    suppressed=True,
+                    suppressedBy="tlink_consistency_filter",
+                    suppressedAt=self.stamp,
+                    suppressionPolicy="confidence_then_id_tiebreak",
+                    suppressedAgainstRelType=winner.rel,
+                    suppressionReason=f"contradiction:{loser.rel}_vs_{winner.rel}",
+                )
+        return len(decisions)
+
+    def allen_consistent(self) -> bool:
+        """Check the unsuppressed TLINKs for Allen interval-algebra consistency."""
+        constraints: Dict[Tuple[int, int], int] = {}
+        for edge in self.edges:
+            mask = TLINK_ALLEN_RELATIONS.get(edge.rel)
+            if edge.suppressed or mask is None:
+                continue
+            key = (edge.src, edge.dst)
+            if key not in constraints and (edge.dst, edge.src) in constraints:
+                key, mask = (edge.dst, edge.src), _allen_converse(mask)
+            constraints[key] = constraints.get(key, _ALLEN_ALL) & mask
+        return allen_path_consistent(constraints)
+
+    def reason(
+        self,
+        shadow_only: bool = False,
+        allen_check: bool = False,
+        max_closure_rounds: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """Apply every rule in pipeline order and return per-rule counts."""
+        summary = dict.fromkeys(SUMMARY_KEYS, 0)
+        summary["case19_inverses"] = self.materialize_case19_inverses()
+        summary["closure_created"] = self.close_identity(max_closure_rounds)
+        summary["inverse_created"] = self.materialize_inverse_consistency()
+        summary["bidirectional_conflicts"] = self.suppress_bidirectional_conflicts(shadow_only)
+        summary["contradictions"] = self.suppress_contradictions(shadow_only)
+        if allen_check and not self.allen_consistent():
+            summary["allen_inconsistent"] = 1
+        return summary
+
+    def delta(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Return ``(creates, updates)`` rows for :data:`_WRITE_DELTA`."""
+        creates: List[Dict[str, Any]] = []
+        updates: List[Dict[str, Any]] = []
+        for edge in self.edges:
+            if edge.element_id is None:
+                creates.append(
+                    {"src": self.node_ids[edge.src], "dst": self.node_ids[edge.dst], "props": edge.changes}
+                )
+            elif edge.changes:
+                updates.append({"id": edge.element_id, "props": edge.changes})
+        return creates, updates
+
+
+# ---------------------------------------------------------------------------
+# Graph I/O
+# ---------------------------------------------------------------------------
+_LOAD_DOCUMENT = """
+CALL {
+    MATCH (n:TEvent) WHERE n.doc_id IN $doc_ids RETURN n
+    UNION
+    MATCH (n:TIMEX) WHERE n.doc_id IN $doc_ids RETURN n
+}
+MATCH (n)-[r:TLINK]-()
+WITH DISTINCT r
+MATCH (a)-[r]->(b)
+RETURN elementId(a) AS src, elementId(b) AS dst, elementId(r) AS id,
+       r {.relType, .relTypeCanonical, .confidence, .suppressed, .rule_id,
+          .source, .evidence_source, .derivedFrom} AS props
+ORDER BY id
+"""
+
+_WRITE_DELTA = """
+CALL {
+    UNWIND $creates AS row
+    MATCH (a) WHERE elementId(a) = row.src
+    MATCH (b) WHERE elementId(b) = row.dst
+    CREATE (a)-[r:TLINK]->(b)
+    SET r = row.props
+    RETURN count(r) AS created
+}
+CALL {
+    UNWIND $updates AS row
+    MATCH ()-[r:TLINK]->() WHERE elementId(r) = row.id
+    SET r += row.props
+    RETURN count(r) AS updated
+}
+RETURN created, updated
+"""
+
+
+def _doc_id_values(doc_id: Any) -> List[Any]:
+    """Match *doc_id* whether endpoints store it as a string or an int."""
+    values: List[Any] = [str(doc_id)]
+    try:
+        values.append(int(str(doc_id).strip()))
+    except ValueError:
+        pass
+    return values
+
+
+class TlinkReasoningEngine:
+    """Run :meth:`DocumentTlinkGraph.reason` document by document against a graph."""
+
+    def __init__(
+        self,
+        graph: Any,
+        shadow_only: bool = False,
+        allen_check: bool = False,
+        max_closure_rounds: Optional[int] = None,
+    ):
+        self.graph = graph
+        self.shadow_only = shadow_only
+        self.allen_check = allen_check
+        self.max_closure_rounds = max_closure_rounds
+
+    def load(self, doc_id: Any) -> DocumentTlinkGraph:
+        rows = self.graph.run(_LOAD_DOCUMENT, {"doc_ids": _doc_id_values(doc_id)}).data()
+        return DocumentTlinkGraph.from_rows(rows, doc_id=doc_id)
+
+    def write(self, doc: DocumentTlinkGraph) -> Tuple[int, int]:
+        """Write *doc*'s delta; return ``(created, updated)``."""
+        creates, updates = doc.delta()
+        if not creates and not updates:
+            return 0, 0
+        rows = self.graph.run(_WRITE_DELTA, {"creates": creates, "updates": updates}).data()
+        row = rows[0] if rows else {}
+        return int(row.get("created", 0) or 0), int(row.get("updated", 0) or 0)
+
+    def run(self, doc_ids: Iterable[Any]) -> Dict[str, Any]:
+        """Reason over every document in *doc_ids* and return summed counts."""
+        totals: Dict[str, Any] = dict.fromkeys(SUMMARY_KEYS, 0)
+        totals.update(documents=0, edges_created=0, edges_updated=0, allen_inconsistent_documents=[])
+        for doc_id in doc_ids:
+            if doc_id is None:
+                continue
+            doc = self.load(doc_id)
+            summary = doc.reason(
+                shadow_only=self.shadow_only,
+                allen_check=self.allen_check,
+                max_closure_rounds=self.max_closure_rounds,
+            )
+            created, updated = self.write(doc)
+            for key in SUMMARY_KEYS:
+                totals[key] += summary[key]
+            if summary["allen_inconsistent"]:
+                totals["allen_inconsistent_documents"].append(doc_id)
+                logger.warning("TLINKs of document %s are not Allen-consistent", doc_id)
+            totals["documents"] += 1
+            totals["edges_created"] += created
+            totals["edges_updated"] += updated
+        return totals
+
+
+__all__ = [
+    "ALLEN_RELATIONS",
+    "CASE19_INVERSES",
+    "DocumentTlinkGraph",
+    "SUMMARY_KEYS",
+    "TLINK_ALLEN_RELATIONS",
+    "TlinkEdge",
+    "TlinkReasoningEngine",
+    "allen_composition_table",
+    "allen_path_consistent",
+]
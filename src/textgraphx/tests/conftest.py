@@ -42,6 +42,29 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(skip_marker)
 
 
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_srl_response_store(tmp_path_factory):
+    """Point the persistent SRL response store at a per-session temp file.
+
+    Otherwise responses cached under ``out/cache`` by one run are served to
+    tests of the next run instead of their mocked service replies.
+    """
+    from textgraphx.adapters.srl_response_store import reset_srl_response_store
+    from textgraphx.infrastructure import config as config_module
+
+    patcher = pytest.MonkeyPatch()
+    patcher.setenv(
+        "TEXTGRAPHX_SRL_CACHE_PATH",
+        str(tmp_path_factory.mktemp("srl_cache") / "srl_responses.sqlite"),
+    )
+    config_module._CACHED = None
+    reset_srl_response_store()
+    yield
+    patcher.undo()
+    config_module._CACHED = None
+    reset_srl_response_store()
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Convert Neo4j connection failures into skips when the server is unreachable.
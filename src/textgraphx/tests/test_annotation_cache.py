@@ -0,0 +1,152 @@
+"""Tests for the shared TTK/HeidelTime annotation cache."""
+
+import types
+import unittest.mock as mock
+
+import pytest
+
+from textgraphx.adapters import annotation_cache
+from textgraphx.adapters.annotation_cache import AnnotationCache, normalize_dct
+
+
+@pytest.fixture
+def shared_cache(tmp_path, monkeypatch):
+    cache = AnnotationCache(cache_dir=str(tmp_path / "annotations"))
+    monkeypatch.setattr(annotation_cache, "_annotation_cache", cache)
+    return cache
+
+
+@pytest.mark.unit
+def test_normalize_dct__strips_time_and_dashes():
+    assert normalize_dct("2020-01-02T10:00:00") == "20200102"
+    assert normalize_dct("20200102") == "20200102"
+    assert normalize_dct(None) == ""
+
+
+@pytest.mark.unit
+def test_key__equivalent_dct_forms_share_entry():
+    assert AnnotationCache.key("u", "text", "2020-01-02") == AnnotationCache.key("u", "text", "20200102")
+    assert AnnotationCache.key("u", "text", "2020-01-02") != AnnotationCache.key("v", "text", "2020-01-02")
+    assert AnnotationCache.key("u", "text", "2020-01-02") != AnnotationCache.key("u", "other", "2020-01-02")
+
+
+@pytest.mark.unit
+def test_get_or_fetch__fetches_once_per_key():
+    cache = AnnotationCache()
+    fetch = mock.Mock(return_value="<xml/>")
+
+    assert cache.get_or_fetch("u", "t", "2020-01-01", fetch) == "<xml/>"
+    assert cache.get_or_fetch("u", "t", "2020-01-01", fetch) == "<xml/>"
+
+    assert fetch.call_count == 1
+    assert cache.stats()["memory_hits"] == 1
+
+
+@pytest.mark.unit
+def test_get_or_fetch__empty_response_is_not_cached():
+    cache = AnnotationCache()
+    fetch = mock.Mock(side_effect=["", "<xml/>"])
+
+    assert cache.get_or_fetch("u", "t", "", fetch) == ""
+    assert cache.get_or_fetch("u", "t", "", fetch) == "<xml/>"
+    assert fetch.call_count == 2
+
+
+@pytest.mark.unit
+def test_lru__evicts_oldest_entry():
+    cache = AnnotationCache(maxsize=2)
+    cache.set("u", "a", "", "A")
+    cache.set("u", "b", "", "B")
+    cache.get("u", "a", "")
+    cache.set("u", "c", "", "C")
+
+    assert cache.get("u", "b", "") is None
+    assert cache.get("u", "a", "") == "A"
+    assert cache.get("u", "c", "") == "C"
+
+
+@pytest.mark.integration
+def test_disk_tier__survives_a_new_cache_instance(tmp_path):
+    first = AnnotationCache(cache_dir=str(tmp_path))
+    first.set("u", "doc text", "2020-01-01", "<TimeML/>")
+
+    second = AnnotationCache(cache_dir=str(tmp_path))
+    assert second.get("u", "doc text", "2020-01-01") == "<TimeML/>"
+    assert second.stats()["disk_hits"] == 1
+
+
+@pytest.mark.integration
+def test_temporal_and_tlinks__share_one_ttk_round_trip(shared_cache, monkeypatch):
+    from textgraphx.pipeline.phases import temporal as temporal_module
+    from textgraphx.pipeline.phases import tlinks_recognizer as tlinks_module
+
+    cfg = types.SimpleNamespace(services=types.SimpleNamespace(temporal_url="http://ttk/annotate"))
+    monkeypatch.setattr("textgraphx.infrastructure.config.get_config", lambda: cfg)
+
+    response = mock.Mock(status_code=200, text="<TimeML>ok</TimeML>")
+    response.raise_for_status = mock.Mock()
+    post = mock.Mock(return_value=response)
+    monkeypatch.setattr(temporal_module.requests.Session, "post", post)
+
+    phase = temporal_module.TemporalPhase.__new__(temporal_module.TemporalPhase)
+    phase.temporal_url = "http://ttk/annotate"
+    recognizer = tlinks_module.TlinksRecognizer.__new__(tlinks_module.TlinksRecognizer)
+
+    first = phase.callTtkService({"text": "Markets fell.", "dct": "2020-01-01T00:00:00"})
+    second = phase.callTtkService({"text": "Markets fell.", "dct": "2020-01-01"})
+    third = recognizer.callTtkService({"input": "Markets fell.", "dct": "2020-01-01"})
+
+    assert first == second == third == "<TimeML>ok</TimeML>"
+    assert post.call_count == 1
+
+
+@pytest.mark.unit
+def test_temporal_phase__reads_doc_payload_once_per_document():
+    from textgraphx.pipeline.phases.temporal import TemporalPhase
+
+    graph = mock.Mock()
+    graph.run.return_value.data.return_value = [{"text": "x", "dct": "2020-01-01"}]
+    phase = TemporalPhase.__new__(TemporalPhase)
+    phase.graph = graph
+
+    assert phase.get_doc_text_and_dct(7) == {"text": "x", "dct": "2020-01-01"}
+    assert phase.get_doc_text_and_dct(7) == {"text": "x", "dct": "2020-01-01"}
+    assert graph.run.call_count == 1
+
+
+@pytest.mark.integration
+def test_disk_tier__evicts_least_recently_used_files(tmp_path, monkeypatch):
+    import os
+
+    monkeypatch.setattr(annotation_cache, "_EVICTION_CHECK_EVERY", 1)
+    cache = AnnotationCache(cache_dir=str(tmp_path), max_disk_entries=2)
+    for age, text in enumerate(["a", "b"]):
+        cache.set("u", text, "", text.upper())
+        path = cache._path(cache.key("u", text, ""))
+        os.utime(path, (1000 + age, 1000 + age))
+    # A disk hit refreshes "a", so "b" is the least recently used file.
+    AnnotationCache(cache_dir=str(tmp_path)).get("u", "a", "")
+    cache.set("u", "c", "", "C")
+
+    fresh = AnnotationCache(cache_dir=str(tmp_path))
+    assert fresh.get("u", "b", "") is None
+    assert fresh.get("u", "a", "") == "A"
+    assert fresh.get("u", "c", "") == "C"
+    assert cache.stats()["disk_evictions"] == 1
+
+
+@pytest.mark.unit
+def test_temporal_phase__doc_payload_cache_is_bounded(monkeypatch):
+    from textgraphx.pipeline.phases import temporal as temporal_module
+
+    monkeypatch.setattr(temporal_module, "_DOC_PAYLOAD_CACHE_MAX", 2)
+    graph = mock.Mock()
+    graph.run.return_value.data.return_value = [{"text": "x", "dct": "2020-01-01"}]
+    phase = temporal_module.TemporalPhase.__new__(temporal_module.TemporalPhase)
+    phase.graph = graph
+
+    for doc_id in (1, 2, 1, 3):
+        phase.get_doc_text_and_dct(doc_id)
+
+    assert list(phase._doc_payloads) == [1, 3]
+    assert graph.run.call_count == 3
@@ -126,16 +126,31 @@ def test_get_runtime_diagnostics_supports_totals_only(monkeypatch):
     api = _load_api_module(monkeypatch)
     graph = _FakeGraph()
     monkeypatch.setattr(api, "make_graph_from_config", lambda: graph)
-    monkeypatch.setattr(
-        api,
-        "get_runtime_metrics",
-        lambda _graph: {"totals": {"assertion_violation_count": 3}, "phase_execution_summary": []},
-    )
+    calls = []
+
+    class _FakeCache:
+        def metrics(self, _graph, refresh=None):
+            calls.append(list(refresh))
+            return {"totals": {"assertion_violation_count": 3}, "phase_execution_summary": []}
+
+    monkeypatch.setattr(api, "get_runtime_diagnostics_cache", lambda: _FakeCache())
 
     payload = asyncio.run(api.get_runtime_diagnostics(totals_only=True))
+    asyncio.run(api.get_runtime_diagnostics(refresh="entity_density, orphaned_nodes_detection"))
 
     assert payload == {"assertion_violation_count": 3}
     assert graph.closed is True
+    assert calls == [[], ["entity_density", "orphaned_nodes_detection"]]
+
+
+def test_get_runtime_diagnostics_rejects_unknown_refresh_section(monkeypatch):
+    api = _load_api_module(monkeypatch)
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(api.get_runtime_diagnostics(refresh="entity_density,not_a_section"))
+
+    assert excinfo.value.status_code == 400
+    assert "not_a_section" in excinfo.value.detail
 
 
 def test_get_runtime_diagnostic_query_returns_named_rows(monkeypatch):
@@ -75,3 +75,51 @@ def test_resume_skips_completed_phases(tmp_path):
     assert summary.completed_phases == ["ingestion", "refinement"]
     assert summary.remaining_phases == ["temporal", "event_enrichment", "tlinks"]
     assert summary.resume_from_phase == "temporal"
+
+
+def test_document_checkpoint_records_and_resumes_documents(tmp_path):
+    manager = CheckpointManager(base_dir=str(tmp_path / "checkpoints"))
+
+    fresh = manager.document_checkpoint("dataset::x", "temporal", execution_id="run-1")
+    assert fresh.begin() == set()
+    fresh.mark_completed([1, "2"])
+    manager.document_checkpoint("dataset::x", "tlinks").mark_completed([1])
+
+    resumed = manager.document_checkpoint("dataset::x", "temporal", resume=True)
+    assert resumed.begin() == {"1", "2"}
+    assert (tmp_path / "checkpoints" / "documents.sqlite").exists()
+
+    # A run that does not resume starts the phase from scratch.
+    assert manager.document_checkpoint("dataset::x", "temporal").begin() == set()
+    assert manager.documents.completed("dataset::x", "temporal") == set()
+    assert manager.documents.completed("dataset::x", "tlinks") == {"1"}
+
+
+def test_document_checkpoint_log_closes_every_connection(tmp_path, monkeypatch):
+    import sqlite3
+
+    from textgraphx.orchestration import checkpoint
+
+    opened = []
+    real_connect = sqlite3.connect
+
+    class _TrackedConnection(sqlite3.Connection):
+        closed = False
+
+        def close(self):
+            self.closed = True
+            super().close()
+
+    def _connect(path):
+        conn = real_connect(path, factory=_TrackedConnection)
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(checkpoint.sqlite3, "connect", _connect)
+    log = checkpoint.DocumentCheckpointLog(str(tmp_path / "documents.sqlite"))
+
+    log.mark_completed("d", "p", [1, 2])
+    assert log.completed("d", "p") == {"1", "2"}
+    assert log.clear("d") == 2
+
+    assert opened and all(conn.closed for conn in opened)
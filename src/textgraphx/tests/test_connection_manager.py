@@ -0,0 +1,199 @@
+"""Tests for the process-wide Neo4j connection manager."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from neo4j.exceptions import ClientError, ServiceUnavailable, TransientError
+
+from textgraphx.database import connection_manager
+from textgraphx.database.client import BoltGraphCompat
+from textgraphx.database.connection_manager import READ, WRITE, Neo4jConnectionManager
+
+
+def _driver():
+    driver = MagicMock()
+    driver.session.side_effect = lambda **kwargs: MagicMock(name=f"session-{kwargs.get('default_access_mode')}")
+    return driver
+
+
+@pytest.mark.unit
+def test_session__reused_within_a_thread_and_split_by_access_mode():
+    manager = Neo4jConnectionManager(_driver())
+
+    assert manager.session(WRITE) is manager.session(WRITE)
+    assert manager.session(READ) is not manager.session(WRITE)
+    assert manager.metrics()["sessions_opened"] == 2
+
+
+@pytest.mark.unit
+def test_session__never_shared_across_threads():
+    manager = Neo4jConnectionManager(_driver())
+    seen = []
+    barrier = threading.Barrier(3)
+
+    def worker():
+        seen.append(manager.session())
+        barrier.wait()
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(session) for session in seen}) == 3
+    assert manager.metrics()["active_threads"] == 3
+
+
+@pytest.mark.unit
+def test_run__replaces_broken_session_and_retries_once():
+    driver = MagicMock()
+    broken, healthy = MagicMock(), MagicMock()
+    broken.run.side_effect = ServiceUnavailable("connection reset")
+    healthy.run.return_value = iter(["row"])
+    driver.session.side_effect = [broken, healthy]
+    manager = Neo4jConnectionManager(driver)
+
+    assert manager.run("RETURN 1") == ["row"]
+    broken.close.assert_called_once()
+    assert manager.metrics()["session_resets"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "error, mode",
+    [
+        (ClientError("syntax error"), READ),
+        (RuntimeError("unexpected"), WRITE),
+        (TransientError("deadlock"), WRITE),
+    ],
+)
+def test_run__non_retryable_errors_propagate_on_first_attempt(error, mode):
+    driver = MagicMock()
+    session = driver.session.return_value
+    session.run.side_effect = error
+    manager = Neo4jConnectionManager(driver)
+
+    with pytest.raises(type(error)):
+        manager.run("CREATE (n)", mode=mode)
+    assert session.run.call_count == 1
+    assert manager.metrics()["session_resets"] == 0
+
+
+@pytest.mark.unit
+def test_run__transient_read_errors_are_retried():
+    driver = MagicMock()
+    busy, healthy = MagicMock(), MagicMock()
+    busy.run.side_effect = TransientError("deadlock")
+    healthy.run.return_value = iter(["row"])
+    driver.session.side_effect = [busy, healthy]
+    manager = Neo4jConnectionManager(driver)
+
+    assert manager.run("MATCH (n) RETURN n", mode=READ) == ["row"]
+
+
+@pytest.mark.unit
+def test_make_graph_from_config__explicit_path_uses_private_driver(monkeypatch, tmp_path):
+    from textgraphx.database import client
+
+    for name in ("NEO4J_URI", "NEO4J_USER", "NEO4J_USERNAME", "NEO4J_PASSWORD"):
+        monkeypatch.delenv(name, raising=False)
+    config_path = tmp_path / "other.ini"
+    config_path.write_text("[neo4j]\nuri = bolt://other:7687\nuser = u\npassword = p\n")
+    opened = []
+    monkeypatch.setattr(client.GraphDatabase, "driver", lambda uri, **kwargs: opened.append(uri) or _driver())
+    monkeypatch.setattr(client, "get_connection_manager", lambda: pytest.fail("shared manager used"))
+
+    graph = client.make_graph_from_config(str(config_path))
+
+    assert opened == ["bolt://other:7687"]
+    assert graph.manager is not None
+    graph.close()
+
+
+@pytest.mark.unit
+def test_read_and_write_transactions_use_routed_sessions():
+    manager = Neo4jConnectionManager(_driver())
+    manager.session(READ).execute_read.return_value = "r"
+    manager.session(WRITE).execute_write.return_value = "w"
+    work = MagicMock()
+
+    assert manager.read_transaction(work) == "r"
+    assert manager.write_transaction(work) == "w"
+    metrics = manager.metrics()
+    assert metrics["read_transactions"] == 1
+    assert metrics["write_transactions"] == 1
+
+
+@pytest.mark.unit
+def test_close__driver_closed_only_when_owned():
+    owned, borrowed = _driver(), _driver()
+    Neo4jConnectionManager(owned).close()
+    Neo4jConnectionManager(borrowed, owns_driver=False).close()
+
+    owned.close.assert_called_once()
+    borrowed.close.assert_not_called()
+
+
+@pytest.mark.unit
+def test_bolt_graph_compat__shared_manager_survives_wrapper_close(monkeypatch):
+    driver = _driver()
+    manager = Neo4jConnectionManager(driver)
+    monkeypatch.setattr(connection_manager, "_manager", manager)
+
+    first = BoltGraphCompat(manager=manager)
+    second = BoltGraphCompat(manager=manager)
+    first.close()
+
+    assert connection_manager.shared_manager_for(driver) is manager
+    second.run("RETURN 1")
+    driver.close.assert_not_called()
+
+
+@pytest.mark.unit
+def test_graph_write__returns_summary_counters_without_fetching_records():
+    driver = MagicMock()
+    result = driver.session.return_value.run.return_value
+    result.consume.return_value.counters = MagicMock(
+        nodes_created=0, nodes_deleted=0, relationships_created=2, relationships_deleted=0,
+        properties_set=5, labels_added=1, labels_removed=0,
+    )
+
+    counters = BoltGraphCompat(driver).write("MATCH (n) SET n.x = 1", {"a": 1})
+
+    assert counters["properties_set"] == 5
+    assert counters["relationships_created"] == 2
+    assert counters["labels_added"] == 1
+    result.consume.assert_called_once()
+    result.__iter__.assert_not_called()
+
+
+@pytest.mark.unit
+def test_thread_totals__accumulate_counters_and_profiled_db_hits():
+    driver = MagicMock()
+    session = driver.session.return_value
+    result = session.run.return_value
+    result.__iter__.return_value = iter([])
+    summary = result.consume.return_value
+    summary.counters = MagicMock(
+        nodes_created=1, nodes_deleted=0, relationships_created=3, relationships_deleted=0,
+        properties_set=0, labels_added=0, labels_removed=0,
+    )
+    summary.profile = {"dbHits": 4, "children": [{"dbHits": 6, "children": []}]}
+    manager = Neo4jConnectionManager(driver)
+
+    manager.run("MATCH (n) RETURN n")
+    with manager.profiling():
+        manager.consume("MATCH (n) SET n.x = 1")
+    manager.run("EXPLAIN MATCH (n) RETURN n")
+
+    queries = [call.args[0] for call in session.run.call_args_list]
+    assert queries[0] == "MATCH (n) RETURN n"
+    assert queries[1] == "PROFILE MATCH (n) SET n.x = 1"
+    assert queries[2] == "EXPLAIN MATCH (n) RETURN n"
+    totals = manager.thread_totals()
+    assert totals["relationships_created"] == 9
+    assert totals["nodes_created"] == 3
+    # the summary mock reports a plan every time; only the sum matters here
+    assert totals["db_hits"] == 30
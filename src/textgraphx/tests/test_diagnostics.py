@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from unittest.mock import MagicMock
 from textgraphx.queries.query_pack import load_query
 
@@ -32,6 +33,9 @@ from textgraphx.evaluation.diagnostics import (
     query_referential_integrity_violations,
     query_temporal_anchor_connectivity_gaps,
     query_tlink_reciprocal_cycle_signals,
+    DIAGNOSTIC_QUERY_REGISTRY,
+    RUNTIME_METRIC_SECTIONS,
+    RuntimeDiagnosticsCache,
 )
 
 
@@ -389,3 +393,76 @@ def test_get_runtime_metrics_aggregates_totals_from_queries():
     assert payload["entity_density"][0]["document_id"] == 42
     assert payload["tlink_reciprocal_cycle_signals"][0]["rel_type"] == "BEFORE"
     assert payload["temporal_anchor_connectivity_gaps"][0]["document_id"] == 42
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def data(self):
+        return self._rows
+
+
+class _SectionGraph:
+    """Answers each registered diagnostic with one row naming its section."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stamp_rows = [{"last_run": "2026-01-01T00:00:00Z", "run_count": 3}]
+        self.reads = []
+        self.runs = []
+        self.manager = MagicMock()
+        self._sections = {
+            load_query(entry.query_pack_name): name for name, entry in DIAGNOSTIC_QUERY_REGISTRY.items()
+        }
+
+    def run(self, query, params=None):
+        if "PhaseRun" in query and "last_run" in query:
+            return _Result(self.stamp_rows)
+        with self.lock:
+            self.runs.append(self._sections[query])
+        return _Result([{"section": self._sections[query]}])
+
+    def read(self, query, params=None):
+        with self.lock:
+            self.reads.append((self._sections[query], threading.current_thread().name))
+        return _Result([{"section": self._sections[query]}])
+
+
+def test_get_runtime_metrics_runs_sections_concurrently_on_read_sessions():
+    graph = _SectionGraph()
+
+    sequential = get_runtime_metrics(graph)
+    concurrent = get_runtime_metrics(graph, workers=4)
+
+    assert concurrent == sequential
+    assert graph.runs == list(RUNTIME_METRIC_SECTIONS)
+    assert sorted(name for name, _ in graph.reads) == sorted(RUNTIME_METRIC_SECTIONS)
+    assert {thread for _, thread in graph.reads} <= {f"diagnostics_{i}" for i in range(4)}
+    assert graph.manager.release_thread_sessions.call_count == 4
+
+
+def test_runtime_diagnostics_cache_reuses_sections_until_graph_version_changes():
+    graph = _SectionGraph()
+    cache = RuntimeDiagnosticsCache(workers=2)
+
+    first = cache.metrics(graph)
+    second = cache.metrics(graph)
+
+    assert first["refreshed_sections"] == list(RUNTIME_METRIC_SECTIONS)
+    assert second["refreshed_sections"] == []
+    assert second["entity_density"] == [{"section": "entity_density"}]
+    assert second["graph_version"] == "2026-01-01T00:00:00Z#3"
+    assert len(graph.reads) == len(RUNTIME_METRIC_SECTIONS)
+
+    refreshed = cache.metrics(graph, refresh=["entity_density", "orphaned_nodes_detection"])
+    assert refreshed["refreshed_sections"] == ["orphaned_nodes_detection", "entity_density"]
+
+    graph.stamp_rows = [{"last_run": "2026-01-02T00:00:00Z", "run_count": 4}]
+    assert cache.metrics(graph)["refreshed_sections"] == list(RUNTIME_METRIC_SECTIONS)
+    assert cache.stats()["hits"] == 2 * len(RUNTIME_METRIC_SECTIONS) - 2
+
+
+def test_runtime_diagnostics_cache_rejects_unknown_sections():
+    with pytest.raises(KeyError):
+        RuntimeDiagnosticsCache().metrics(_SectionGraph(), refresh=["not_a_section"])
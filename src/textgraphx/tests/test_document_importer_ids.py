@@ -1,6 +1,9 @@
 from xml.etree import ElementTree as ET
 
-from textgraphx.text_processing_components.DocumentImporter import resolve_document_id_from_naf_root
+from textgraphx.text_processing_components.DocumentImporter import (
+    MeantimeXMLImporter,
+    resolve_document_id_from_naf_root,
+)
 
 
 def test_resolve_document_id_from_naf_root_prefers_numeric_public_id():
@@ -30,4 +33,10 @@ def test_resolve_document_id_from_naf_root_falls_back_when_public_id_non_numeric
         </NAF>"""
     )
 
-    assert resolve_document_id_from_naf_root(root, 11) == 11
\ No newline at end of file
+    assert resolve_document_id_from_naf_root(root, 11) == 11
+
+
+def test_meantime_import_clears_incremental_phase_stamps():
+    query = MeantimeXMLImporter(1, "<NAF/>", "text", None).get_query()
+
+    assert "REMOVE at.refined_at, at.tlinked_at" in query
@@ -0,0 +1,142 @@
+"""Tests for the single-transaction document token writer."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from textgraphx.text_processing_components.DocumentTokenWriter import DocumentTokenWriter
+from textgraphx.text_processing_components.TagOccurrenceDependencyProcessor import (
+    TagOccurrenceDependencyProcessor,
+)
+
+_STOP = {"the", "."}
+
+
+class _RecordingRepo:
+    def __init__(self):
+        self.transactions = []
+
+    def execute_write_transaction(self, statements):
+        self.transactions.append(list(statements))
+        return len(self.transactions[-1])
+
+
+class _TagOccurrenceCreator:
+    """Minimal stand-in for TagOccurrenceCreator that needs no spaCy vocab."""
+
+    def create_tag_occurrences(self, sentence, text_id, sentence_id):
+        return [
+            {
+                "id": f"{text_id}_{sentence_id}_{tok.idx}",
+                "text": tok.text,
+                "lemma": tok.text.lower(),
+                "is_stop": tok.text.lower() in _STOP,
+            }
+            for tok in sentence
+        ]
+
+
+class _Sentence(list):
+    @property
+    def text(self):
+        return " ".join(tok.text for tok in self)
+
+
+def _doc(text):
+    """Build a Doc-like object: sentences split on '.', tokens on whitespace."""
+    sents, offset = [], 0
+    for chunk in text.split(". "):
+        words = chunk.rstrip(".").split() + ["."]
+        sentence = _Sentence()
+        for word in words:
+            sentence.append(SimpleNamespace(text=word, idx=offset, dep_="dep"))
+            offset += len(word) + 1
+        for tok in sentence:
+            tok.head = sentence[0]
+        sents.append(sentence)
+    return SimpleNamespace(sents=sents, tokens=[tok for s in sents for tok in s])
+
+
+def _writer(repo, batch_size=None):
+    return DocumentTokenWriter(
+        repo, _TagOccurrenceCreator(), TagOccurrenceDependencyProcessor(repo), batch_size=batch_size,
+    )
+
+
+def _repository_cls():
+    try:
+        from textgraphx.pipeline.ingestion.text_processor import Neo4jRepository
+    except ImportError as exc:  # optional NLP service deps missing
+        pytest.skip(f"text_processor not importable: {exc}")
+    return Neo4jRepository
+
+
+@pytest.mark.unit
+def test_build_payload__covers_every_sentence_and_token():
+    doc = _doc("Markets fell. Oil rose sharply.")
+    payload = _writer(_RecordingRepo()).build_payload(doc, 7)
+
+    assert [row["id"] for row in payload["sentences"]] == ["7_0", "7_1"]
+    assert len(payload["tokens"]) == len(doc.tokens)
+    assert payload["tokens"][0]["token"]["id"] == "7_0_0"
+    # HAS_NEXT stays within a sentence: (3 - 1) + (4 - 1)
+    assert len(payload["next"]) == 5
+    assert {row["sentence_id"] for row in payload["next"]} == {"7_0", "7_1"}
+    assert len(payload["dependencies"]) == len(doc.tokens)
+    assert payload["lemmas"] == []
+
+
+@pytest.mark.unit
+def test_build_payload__lemmas_only_for_non_stop_tokens_when_store_tag():
+    doc = _doc("The market fell.")
+    payload = _writer(_RecordingRepo()).build_payload(doc, 1, store_tag=True)
+
+    assert [row["id"] for row in payload["lemmas"]] == ["1_0_4", "1_0_11"]
+
+
+@pytest.mark.unit
+def test_write_document__one_transaction_with_bounded_batches():
+    repo = _RecordingRepo()
+    doc = _doc("Markets fell. Oil rose sharply.")
+
+    _writer(repo, batch_size=2).write_document("7", doc, 7)
+
+    assert len(repo.transactions) == 1
+    statements = repo.transactions[0]
+    assert all(len(params["rows"]) <= 2 for _, params in statements)
+    sentence_stmts = [p for q, p in statements if "MERGE (sentence:Sentence" in q]
+    assert len(sentence_stmts) == 1 and sentence_stmts[0]["ann_id"] == "7"
+    token_rows = sum(len(p["rows"]) for q, p in statements if "MERGE (sentence)-[:HAS_TOKEN]" in q)
+    assert token_rows == len(doc.tokens)
+    # nodes are written before the edges that match them
+    kinds = [q for q, _ in statements]
+    first_token = next(i for i, q in enumerate(kinds) if "HAS_TOKEN" in q)
+    first_dep = next(i for i, q in enumerate(kinds) if "IS_DEPENDENT" in q)
+    assert first_token < first_dep
+
+
+@pytest.mark.unit
+def test_execute_write_transaction__rolls_back_and_reraises():
+    Neo4jRepository = _repository_cls()
+    tx = MagicMock()
+    tx.run.side_effect = [MagicMock(), RuntimeError("boom")]
+    driver = MagicMock()
+    driver.session.return_value.begin_transaction.return_value = tx
+
+    with pytest.raises(RuntimeError):
+        Neo4jRepository(driver).execute_write_transaction([("Q1", {}), ("Q2", {}), ("Q3", {})])
+
+    tx.rollback.assert_called_once()
+    tx.commit.assert_not_called()
+
+
+@pytest.mark.unit
+def test_execute_write_transaction__commits_once():
+    Neo4jRepository = _repository_cls()
+    driver = MagicMock()
+    tx = driver.session.return_value.begin_transaction.return_value
+
+    assert Neo4jRepository(driver).execute_write_transaction([("Q1", {}), ("Q2", {})]) == 2
+    tx.commit.assert_called_once()
+    tx.rollback.assert_not_called()
@@ -1,8 +1,11 @@
-"""Compatibility tests for the moved EventEnrichmentPhase module."""
+"""Compatibility tests for the moved EventEnrichmentPhase module and its wrapper."""
 
 import importlib
 import sys
 import types
+from unittest.mock import MagicMock
+
+import pytest
 
 
 def _install_event_enrichment_import_stubs(monkeypatch):
@@ -49,4 +52,43 @@ def test_event_enrichment_module_aliases_canonical_module(monkeypatch):
     legacy_module = importlib.import_module("textgraphx.pipeline.phases.event_enrichment")
 
     assert legacy_module is canonical_module
-    assert legacy_module.EventEnrichmentPhase is canonical_module.EventEnrichmentPhase
\ No newline at end of file
+    assert legacy_module.EventEnrichmentPhase is canonical_module.EventEnrichmentPhase
+
+
+@pytest.mark.unit
+def test_event_enrichment_resume_skips_checkpointed_documents(monkeypatch, tmp_path):
+    from textgraphx.orchestration.checkpoint import CheckpointManager
+    from textgraphx.pipeline.runtime.phase_wrappers import EventEnrichmentPhaseWrapper
+
+    created = []
+    state = {"resumed": False}
+
+    def create_event_mentions(doc_id):
+        if doc_id == "3" and not state["resumed"]:
+            raise ValueError("write failed")
+        created.append(doc_id)
+        return 1
+
+    enricher = MagicMock()
+    enricher.graph.run.return_value.data.return_value = [{"doc_id": 1}, {"doc_id": 2}, {"doc_id": 3}]
+    enricher.create_event_mentions.side_effect = create_event_mentions
+    enrichment_module = types.ModuleType("textgraphx.EventEnrichmentPhase")
+    enrichment_module.EventEnrichmentPhase = lambda argv=None: enricher
+    refinement_module = types.ModuleType("textgraphx.pipeline.phases.refinement")
+    refinement_module.RefinementPhase = lambda argv=None: MagicMock()
+    monkeypatch.setitem(sys.modules, "textgraphx.EventEnrichmentPhase", enrichment_module)
+    monkeypatch.setitem(sys.modules, "textgraphx.pipeline.phases.refinement", refinement_module)
+    manager = CheckpointManager(base_dir=str(tmp_path / "checkpoints"))
+
+    with pytest.raises(ValueError, match="write failed"):
+        EventEnrichmentPhaseWrapper(
+            document_checkpoint=manager.document_checkpoint("dataset::d", "event_enrichment")
+        ).execute()
+    assert created == ["1", "2"]
+
+    state["resumed"] = True
+    EventEnrichmentPhaseWrapper(
+        document_checkpoint=manager.document_checkpoint("dataset::d", "event_enrichment", resume=True)
+    ).execute()
+    assert created == ["1", "2", "3"]
+    assert manager.documents.completed("dataset::d", "event_enrichment") == {"1", "2", "3"}
@@ -102,6 +102,58 @@ class TestFusionUtilities:
         assert params["require_type_compatibility"] is False
         assert params["min_key_length"] == 4
 
+    def test_cross_document_groups_by_kb_id_instead_of_pairing_documents(self):
+        from textgraphx.reasoning.fusion import fuse_entities_cross_document
+
+        graph = MagicMock()
+        graph.run.return_value.data.return_value = [{"c": 0}]
+
+        fuse_entities_cross_document(graph)
+
+        query, params = graph.run.call_args[0]
+        assert "d2:AnnotatedText" not in query
+        assert "collect({entity: e, docs: docs})" in query
+        assert params["doc_ids"] is None
+
+    def test_cross_document_can_be_restricted_to_new_documents(self):
+        from textgraphx.reasoning.fusion import (
+            fuse_entities_cross_document,
+            propagate_coreference_identity_cross_document,
+        )
+
+        graph = MagicMock()
+        graph.run.return_value.data.return_value = [{"c": 1}]
+
+        fuse_entities_cross_document(graph, doc_ids=(7, 8))
+        assert graph.run.call_args[0][1]["doc_ids"] == [7, 8]
+        propagate_coreference_identity_cross_document(graph, doc_ids=[])
+        assert graph.run.call_args[0][1]["doc_ids"] == []
+
+    def test_coref_identity_scoped_run_only_expands_seed_keys(self):
+        from textgraphx.reasoning.fusion import propagate_coreference_identity_cross_document
+
+        graph = MagicMock()
+        graph.run.return_value.data.side_effect = [[{"keys": ["acme corp"]}], [{"c": 2}]]
+
+        assert propagate_coreference_identity_cross_document(graph, doc_ids=[7]) == 2
+
+        (seed_query, seed_params), (link_query, link_params) = [c[0] for c in graph.run.call_args_list]
+        assert "seed_doc.id IN $doc_ids" in seed_query and seed_params["doc_ids"] == [7]
+        assert "SET seed.coref_identity_key" in seed_query
+        assert "MATCH (m:NamedEntity) WHERE m.coref_identity_key IN $keys" in link_query
+        assert "WHERE (m:NamedEntity OR" not in link_query
+        assert link_params["keys"] == ["acme corp"]
+        assert "seed_keys" not in link_query
+
+    def test_coref_identity_scoped_run_stops_without_seed_keys(self):
+        from textgraphx.reasoning.fusion import propagate_coreference_identity_cross_document
+
+        graph = MagicMock()
+        graph.run.return_value.data.return_value = [{"keys": []}]
+
+        assert propagate_coreference_identity_cross_document(graph, doc_ids=[7]) == 0
+        graph.run.assert_called_once()
+
 
 @pytest.mark.regression
 class TestFusionContracts:
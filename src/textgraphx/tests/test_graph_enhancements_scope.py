@@ -0,0 +1,59 @@
+"""Tests for the doc-scoped GraphEnhancementsPhase algorithms."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from textgraphx.pipeline.phases.graph_enhancements import GraphEnhancementsPhase
+
+pytestmark = [pytest.mark.unit]
+
+SCOPED_METHODS = (
+    "compute_entity_salience",
+    "fill_frame_aligns_with_gaps",
+    "compute_coref_chain_quality",
+    "backfill_sentence_roots",
+)
+
+
+def _phase():
+    phase = GraphEnhancementsPhase.__new__(GraphEnhancementsPhase)
+    phase.graph = MagicMock()
+    phase.graph.run.return_value.data.return_value = [
+        {"updated": 2, "created": 2}
+    ]
+    return phase
+
+
+@pytest.mark.parametrize("method", SCOPED_METHODS)
+def test_doc_scoped_variant_filters_by_doc_ids(method):
+    phase = _phase()
+
+    assert getattr(phase, method)(doc_ids=(3, 4)) == 2
+
+    query, params = phase.graph.run.call_args[0]
+    assert "IN $doc_ids" in query
+    assert params == {"doc_ids": [3, 4]}
+
+
+@pytest.mark.parametrize("method", SCOPED_METHODS)
+def test_unscoped_variant_visits_whole_graph(method):
+    phase = _phase()
+
+    getattr(phase, method)()
+
+    query, params = phase.graph.run.call_args[0]
+    assert "$doc_ids" not in query
+    assert params == {}
+
+
+def test_frame_alignment_is_anchored_on_shared_event():
+    phase = _phase()
+
+    phase.fill_frame_aligns_with_gaps(doc_ids=[1])
+
+    query = phase.graph.run.call_args[0][0]
+    assert "MATCH (e:TEvent) WHERE e.doc_id IN $doc_ids" in query
+    assert "(fv:Frame {framework:'PROPBANK'})-[:FRAME_DESCRIBES_EVENT|DESCRIBES]->(e)" in query
+    assert "(fn:Frame {framework:'NOMBANK'})-[:FRAME_DESCRIBES_EVENT|DESCRIBES]->(e)" in query
+    assert "OPTIONAL MATCH" not in query
@@ -107,3 +107,210 @@ def test_graphbased_nlp_module_aliases_canonical_module(monkeypatch):
 
     assert legacy_module is canonical_module
     assert legacy_module.GraphBasedNLP is canonical_module.GraphBasedNLP
+
+
+def _streaming_nlp(monkeypatch, stream_queue_size, fail_on=None):
+    _install_graphbased_nlp_stubs(monkeypatch)
+    sys.modules.pop("textgraphx.pipeline.ingestion.graph_based_nlp", None)
+    module = importlib.import_module("textgraphx.pipeline.ingestion.graph_based_nlp")
+
+    ingestion = SimpleNamespace(
+        pipe_batch_size=4, pipe_n_process=1, stream_queue_size=stream_queue_size, remote_workers=2
+    )
+    monkeypatch.setattr(module, "get_config", lambda: SimpleNamespace(ingestion=ingestion))
+    monkeypatch.setattr(module, "Doc", SimpleNamespace(has_extension=lambda name: True))
+
+    events = []
+
+    class _Pipe:
+        def pipe(self, texts, **kwargs):
+            events.append(("pipe_kwargs", kwargs))
+            for text, context in texts:
+                events.append(("parsed", context["text_id"]))
+                yield SimpleNamespace(_=SimpleNamespace(text_id=None), text=text), context
+
+    nlp = module.GraphBasedNLP.__new__(module.GraphBasedNLP)
+    nlp.nlp = _Pipe()
+
+    def _store(doc, store_tag, prefetched=None):
+        if doc._.text_id == fail_on:
+            raise RuntimeError("write failed")
+        events.append(("written", doc._.text_id))
+        if prefetched is not None:
+            events.append(("prefetched", prefetched["text_id"]))
+
+    nlp._store_document = _store
+    nlp._prefetch_remote = lambda doc: {"text_id": doc._.text_id}
+    return nlp, events
+
+
+def test_process_text_writes_each_document_as_it_is_parsed(monkeypatch):
+    nlp, events = _streaming_nlp(monkeypatch, stream_queue_size=0)
+
+    written = nlp.process_text([("a", {"text_id": 1}), ("b", {"text_id": 2})], text_id=1, storeTag=False)
+
+    assert written == 2
+    assert events[0] == ("pipe_kwargs", {"as_tuples": True, "batch_size": 4})
+    assert events[1:] == [("parsed", 1), ("written", 1), ("parsed", 2), ("written", 2)]
+
+
+def test_process_text_runs_remote_and_write_stages_in_document_order(monkeypatch):
+    nlp, events = _streaming_nlp(monkeypatch, stream_queue_size=1)
+    texts = [(str(i), {"text_id": i}) for i in range(5)]
+
+    written = nlp.process_text(texts, text_id=1, storeTag=False)
+
+    assert written == 5
+    assert [e[1] for e in events if e[0] == "written"] == [0, 1, 2, 3, 4]
+    assert [e[1] for e in events if e[0] == "prefetched"] == [0, 1, 2, 3, 4]
+    assert nlp.last_pipeline_stats["remote"]["workers"] == 2
+    assert nlp.last_pipeline_stats["write"]["processed"] == 5
+
+
+def test_process_text_reraises_writer_failure(monkeypatch):
+    import pytest
+
+    nlp, events = _streaming_nlp(monkeypatch, stream_queue_size=2, fail_on=1)
+
+    with pytest.raises(RuntimeError, match="write failed"):
+        nlp.process_text([(str(i), {"text_id": i}) for i in range(4)], text_id=1, storeTag=False)
+    assert ("written", 0) in events
+    assert ("written", 2) not in events
+
+
+def _run_store_corpus(monkeypatch, tmp_path, import_rows=None):
+    _install_graphbased_nlp_stubs(monkeypatch)
+    sys.modules.pop("textgraphx.pipeline.ingestion.graph_based_nlp", None)
+    module = importlib.import_module("textgraphx.pipeline.ingestion.graph_based_nlp")
+
+    for name in ("a.xml", "b.xml"):
+        (tmp_path / name).write_text(f"<NAF><nafHeader/><raw>{name}</raw></NAF>")
+    ids = {"a.xml": 1, "b.xml": 2}
+    monkeypatch.setattr(
+        module, "resolve_document_id_from_naf_root",
+        lambda root, fallback: ids[root[1].text],
+    )
+    monkeypatch.setattr(
+        module, "get_config",
+        lambda: SimpleNamespace(runtime=SimpleNamespace(incremental_ingestion=True)),
+    )
+    monkeypatch.setattr(module, "normalize_naf_raw_text", lambda text, mode=None: text)
+    manifests = []
+    monkeypatch.setattr(module, "write_manifest", manifests.append)
+
+    imported = []
+
+    class _Importer:
+        def __init__(self, doc_id, data, text, repository):
+            self.doc_id = doc_id
+
+        def import_document(self):
+            imported.append(self.doc_id)
+            return [{"id": self.doc_id}] if import_rows is None else import_rows
+
+    monkeypatch.setattr(module, "MeantimeXMLImporter", _Importer)
+
+    nlp = module.GraphBasedNLP.__new__(module.GraphBasedNLP)
+    nlp.nlp = SimpleNamespace(meta={"lang": "en", "name": "core_web_sm", "version": "3.8.0"})
+    nlp._naf_sentence_mode = "auto"
+    version = module.pipeline_version(nlp._model_label(), "auto")
+    unchanged_hash = module.content_hash((tmp_path / "a.xml").read_text(), version)
+
+    queries = []
+
+    class _Repository:
+        def execute_query(self, query, params):
+            queries.append((query, params))
+            if "RETURN n.id AS id, n.content_hash" in query:
+                return [{"id": 1, "content_hash": unchanged_hash}, {"id": 2, "content_hash": "stale"}]
+            return []
+
+        def get_all_annotated_text_docs(self):
+            return [("a", {"text_id": 1}), ("b", {"text_id": 2})]
+
+    nlp.neo4j_repository = _Repository()
+
+    text_tuples = nlp.store_corpus(str(tmp_path))
+    return module, imported, manifests, queries, text_tuples
+
+
+def test_store_corpus_skips_unchanged_files_and_writes_manifest(monkeypatch, tmp_path):
+    module, imported, manifests, queries, text_tuples = _run_store_corpus(monkeypatch, tmp_path)
+
+    assert imported == [2]
+    assert text_tuples == (("b", {"text_id": 2}),)
+    assert manifests[0].changed_doc_ids == [2]
+    assert manifests[0].unchanged_doc_ids == [1]
+    purged = [params["doc_id"] for query, params in queries if "DETACH DELETE" in query]
+    assert purged == [2] * len(module.GraphBasedNLP.PURGE_DOCUMENT_QUERIES)
+    assert all("MATCH (n)\n" not in query for query in module.GraphBasedNLP.PURGE_DOCUMENT_QUERIES)
+    hashed = [params for query, params in queries if "SET at.pending_content_hash" in query]
+    assert hashed[0]["id"] == 2 and hashed[0]["content_hash"] != "stale"
+
+
+def test_store_corpus_keeps_old_hash_when_import_fails(monkeypatch, tmp_path):
+    _, imported, manifests, queries, _ = _run_store_corpus(monkeypatch, tmp_path, import_rows=[])
+
+    assert imported == [2]
+    assert manifests[0].changed_doc_ids == []
+    assert not [params for query, params in queries if "SET at.pending_content_hash" in query]
+
+
+class _HashRepository:
+    """Keeps the ``AnnotatedText`` hash properties the incremental queries touch."""
+
+    def __init__(self, module):
+        self.module = module
+        self.docs = {}
+
+    def execute_query(self, query, params):
+        if "RETURN n.id AS id, n.content_hash" in query:
+            return [{"id": doc_id, "content_hash": props.get("content_hash")} for doc_id, props in self.docs.items()]
+        if query == self.module.GraphBasedNLP.CONTENT_HASH_QUERY:
+            props = self.docs.setdefault(params["id"], {})
+            props.pop("content_hash", None)
+            props["pending_content_hash"] = params["content_hash"]
+        elif query == self.module.GraphBasedNLP.COMMIT_CONTENT_HASH_QUERY:
+            props = self.docs.get(params["id"], {})
+            if "pending_content_hash" in props:
+                props["content_hash"] = props.pop("pending_content_hash")
+        return []
+
+    def get_all_annotated_text_docs(self):
+        return [(str(doc_id), {"text_id": doc_id}) for doc_id in sorted(self.docs)]
+
+
+def test_store_corpus_retries_document_whose_processing_failed(monkeypatch, tmp_path):
+    import pytest
+
+    nlp, events = _streaming_nlp(monkeypatch, stream_queue_size=0, fail_on=1)
+    module = sys.modules["textgraphx.pipeline.ingestion.graph_based_nlp"]
+    (tmp_path / "a.xml").write_text("<NAF><nafHeader/><raw>a</raw></NAF>")
+    monkeypatch.setattr(module, "resolve_document_id_from_naf_root", lambda root, fallback: 1)
+    ingestion = SimpleNamespace(pipe_batch_size=4, pipe_n_process=1, stream_queue_size=0, remote_workers=1)
+    monkeypatch.setattr(
+        module, "get_config",
+        lambda: SimpleNamespace(runtime=SimpleNamespace(incremental_ingestion=True), ingestion=ingestion),
+    )
+    monkeypatch.setattr(module, "normalize_naf_raw_text", lambda text, mode=None: text)
+    manifests = []
+    monkeypatch.setattr(module, "write_manifest", manifests.append)
+    monkeypatch.setattr(
+        module, "MeantimeXMLImporter",
+        lambda doc_id, data, text, repository: SimpleNamespace(import_document=lambda: [{"id": doc_id}]),
+    )
+    nlp.nlp.meta = {"lang": "en", "name": "core_web_sm", "version": "3.8.0"}
+    nlp._naf_sentence_mode = "auto"
+    nlp.neo4j_repository = _HashRepository(module)
+
+    with pytest.raises(RuntimeError, match="write failed"):
+        nlp.process_text(nlp.store_corpus(str(tmp_path)), text_id=1, storeTag=False)
+    assert "content_hash" not in nlp.neo4j_repository.docs[1]
+
+    nlp._store_document = lambda doc, store_tag, prefetched=None: events.append(("written", doc._.text_id))
+    assert nlp.process_text(nlp.store_corpus(str(tmp_path)), text_id=1, storeTag=False) == 1
+    assert manifests[1].changed_doc_ids == [1]
+    assert "content_hash" in nlp.neo4j_repository.docs[1]
+
+    assert nlp.store_corpus(str(tmp_path)) == ()
+    assert manifests[2].unchanged_doc_ids == [1]
@@ -0,0 +1,67 @@
+"""Tests for content hashing and the incremental ingestion manifest."""
+
+import pytest
+
+from textgraphx.pipeline.ingestion import ingestion_manifest as manifest_mod
+from textgraphx.pipeline.ingestion.ingestion_manifest import (
+    IngestionManifest,
+    content_hash,
+    read_manifest,
+    scope_to_changed_documents,
+    write_manifest,
+)
+
+
+@pytest.fixture
+def incremental_config(monkeypatch, tmp_path):
+    import textgraphx.infrastructure.config as cfg
+
+    monkeypatch.setenv("TEXTGRAPHX_INCREMENTAL_INGESTION", "true")
+    monkeypatch.setenv("TEXTGRAPHX_OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(cfg, "_CACHED", None)
+    yield tmp_path
+    cfg._CACHED = None
+
+
+@pytest.mark.unit
+def test_content_hash_changes_with_content_and_pipeline_version():
+    base = content_hash("<NAF>text</NAF>", "textgraphx-0.1.0/en_core_web_trf-3.8/auto")
+
+    assert base == content_hash("<NAF>text</NAF>", "textgraphx-0.1.0/en_core_web_trf-3.8/auto")
+    assert base != content_hash("<NAF>text!</NAF>", "textgraphx-0.1.0/en_core_web_trf-3.8/auto")
+    assert base != content_hash("<NAF>text</NAF>", "textgraphx-0.1.0/en_core_web_sm-3.8/auto")
+
+
+@pytest.mark.unit
+def test_manifest_round_trip(tmp_path):
+    path = write_manifest(
+        IngestionManifest(pipeline_version="v1", changed_doc_ids=[3, 7], unchanged_doc_ids=[1]),
+        tmp_path / "nested" / "manifest.json",
+    )
+
+    loaded = read_manifest(path)
+    assert loaded.changed_doc_ids == [3, 7]
+    assert loaded.unchanged_doc_ids == [1]
+    assert loaded.pipeline_version == "v1"
+    assert read_manifest(tmp_path / "absent.json") is None
+
+
+@pytest.mark.unit
+def test_scope_is_unrestricted_without_incremental_ingestion(monkeypatch):
+    import textgraphx.infrastructure.config as cfg
+
+    monkeypatch.delenv("TEXTGRAPHX_INCREMENTAL_INGESTION", raising=False)
+    monkeypatch.setattr(cfg, "_CACHED", None)
+
+    assert scope_to_changed_documents([1, 2, 3]) == [1, 2, 3]
+    cfg._CACHED = None
+
+
+@pytest.mark.unit
+def test_scope_keeps_only_changed_documents(incremental_config):
+    assert scope_to_changed_documents([1, 2]) == [1, 2]  # no manifest yet
+
+    write_manifest(IngestionManifest(pipeline_version="v1", changed_doc_ids=[2], unchanged_doc_ids=[1]))
+
+    assert manifest_mod.manifest_path() == incremental_config / "ingestion_manifest.json"
+    assert scope_to_changed_documents([1, "2", 3]) == ["2"]
@@ -0,0 +1,157 @@
+"""Indexed mention pairing and relation snapping must match the exhaustive scan."""
+
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from textgraphx.evaluation.meantime_evaluator import (
+    Mention,
+    _align_relation_entity_span,
+    _align_relation_event_span,
+    _align_relation_timex_span,
+    _interval_overlap_pairs,
+    _is_conj_mention,
+    _MentionSpanIndex,
+    _pair_mentions,
+    _span_iou,
+)
+
+pytestmark = [pytest.mark.unit]
+
+
+def _reference_pair_mentions(gold, pred, mode, overlap_threshold):
+    matched, used_gold, used_pred = set(), set(), set()
+    if mode == "strict":
+        for g in sorted(gold, key=lambda x: (x.kind, x.span, x.attrs)):
+            candidates = [p for p in pred if p not in used_pred and g == p]
+            if candidates:
+                matched.add((g, candidates[0]))
+                used_gold.add(g)
+                used_pred.add(candidates[0])
+    else:
+        def _score(g, p):
+            if g.kind != p.kind:
+                return None
+            iou = _span_iou(g.span, p.span)
+            if g == p:
+                return (3, iou, 0)
+            if iou >= overlap_threshold:
+                return (2, iou, 0)
+            if g.kind == "entity" and not _is_conj_mention(g):
+                g_set, p_set = set(g.span), set(p.span)
+                if p_set <= g_set or g_set <= p_set:
+                    return (1, iou, -len(g_set))
+            return None
+
+        candidates = []
+        for g in gold:
+            for p in pred:
+                score = _score(g, p)
+                if score is not None:
+                    candidates.append((score, g, p))
+        candidates.sort(key=lambda x: x[0], reverse=True)
+        for _, g, p in candidates:
+            if g in used_gold or p in used_pred:
+                continue
+            matched.add((g, p))
+            used_gold.add(g)
+            used_pred.add(p)
+    return matched, {g for g in gold if g not in used_gold}, {p for p in pred if p not in used_pred}
+
+
+def _reference_align(span, mentions, kinds):
+    if not span or not mentions:
+        return span
+    mention_spans = [m.span for m in mentions if m.kind in kinds]
+    if not mention_spans or span in mention_spans:
+        return span
+    overlapping = [s for s in mention_spans if set(span).intersection(s)]
+    if overlapping:
+        return max(overlapping, key=lambda s: len(set(span).intersection(s)))
+    return span
+
+
+def _random_span(rng):
+    roll = rng.random()
+    if roll < 0.05:
+        return ()
+    start = rng.randrange(0, 60)
+    length = rng.randrange(1, 6)
+    tokens = range(start, start + length)
+    if roll < 0.2:
+        # Discontinuous span: the interval overlaps more than the tokens do.
+        tokens = [t for t in tokens if t % 2 == 0] or [start]
+    return tuple(sorted(set(tokens)))
+
+
+def _random_mentions(rng, count):
+    mentions = set()
+    for _ in range(count):
+        kind = rng.choice(["entity", "entity", "event", "timex"])
+        attrs = ()
+        if kind == "entity":
+            attrs = (("syntactic_type", rng.choice(["NAM", "NOM", "CONJ", "PRO"])),)
+        mentions.add(Mention(kind=kind, span=_random_span(rng), attrs=attrs))
+    return mentions
+
+
+@pytest.mark.parametrize("seed", range(25))
+@pytest.mark.parametrize("threshold", [0.0, 0.3, 0.5, 1.0])
+def test_relaxed_pairing_matches_exhaustive_scan(seed, threshold):
+    rng = random.Random(seed)
+    gold = _random_mentions(rng, 40)
+    pred = _random_mentions(rng, 40) | set(rng.sample(sorted(gold, key=repr), 10))
+
+    assert _pair_mentions(gold, pred, "relaxed", threshold) == _reference_pair_mentions(
+        gold, pred, "relaxed", threshold
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_strict_pairing_matches_exhaustive_scan(seed):
+    rng = random.Random(seed)
+    gold = _random_mentions(rng, 30)
+    pred = _random_mentions(rng, 30) | set(rng.sample(sorted(gold, key=repr), 12))
+
+    assert _pair_mentions(gold, pred, "strict", 0.5) == _reference_pair_mentions(gold, pred, "strict", 0.5)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_relation_span_alignment_matches_linear_scan(seed):
+    rng = random.Random(seed)
+    mentions = _random_mentions(rng, 50) | {Mention(kind="timex3", span=_random_span(rng))}
+    index = _MentionSpanIndex(mentions, ("event",))
+
+    for _ in range(100):
+        span = _random_span(rng)
+        assert _align_relation_event_span(span, mentions) == _reference_align(span, mentions, {"event"})
+        assert _align_relation_entity_span(span, mentions) == _reference_align(span, mentions, {"entity"})
+        assert _align_relation_timex_span(span, mentions) == _reference_align(span, mentions, {"timex", "timex3"})
+        assert index.align(span) == _reference_align(span, mentions, {"event"})
+
+
+def test_interval_overlap_pairs_reports_each_overlap_once():
+    a = [(0, 2), (5, 5), (7, 9), (3, 3)]
+    b = [(2, 4), (5, 8), (0, 0), (10, 12), (7, 7)]
+    a_start, a_end = (np.array(col) for col in zip(*a))
+    b_start, b_end = (np.array(col) for col in zip(*b))
+
+    pairs = _interval_overlap_pairs(a_start, a_end, b_start, b_end)
+
+    expected = {
+        (i, j) for i, (s1, e1) in enumerate(a) for j, (s2, e2) in enumerate(b) if s1 <= e2 and s2 <= e1
+    }
+    assert sorted(pairs) == sorted(expected)
+    assert _interval_overlap_pairs(a_start, a_end, np.array([], dtype=int), np.array([], dtype=int)) == []
+
+
+def test_index_annotations_resolve():
+    from typing import get_type_hints
+
+    hints = get_type_hints(_MentionSpanIndex.__init__)
+
+    assert set(hints) == {"mentions", "kinds"}
+    assert get_type_hints(_pair_mentions)["gold"] is not None
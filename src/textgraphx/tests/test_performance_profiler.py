@@ -12,7 +12,7 @@ from datetime import datetime, timezone
 import pytest
 
 from textgraphx.infrastructure.performance_profiler import (
-    QueryMetrics, PhaseMetrics, PhaseProfiler, get_profiler
+    QueryMetrics, PhaseMetrics, PhaseProfiler, RuleCostRecorder, get_profiler
 )
 
 
@@ -285,6 +285,109 @@ class TestPhaseProfiler:
         assert metrics.total_rows_affected == 10
 
 
+class _CountingManager:
+    """Stand-in for Neo4jConnectionManager's per-thread statement totals."""
+
+    def __init__(self):
+        self.totals = {}
+        self.profiled = []
+
+    def thread_totals(self):
+        return dict(self.totals)
+
+    def profiling(self, enabled=True):
+        manager = self
+
+        class _Block:
+            def __enter__(self):
+                manager.profiled.append(enabled)
+
+            def __exit__(self, *exc):
+                return False
+
+        return _Block()
+
+    def add(self, **counts):
+        for name, value in counts.items():
+            self.totals[name] = self.totals.get(name, 0) + value
+
+
+class TestRuleCostRecorder:
+    """Tests for per-rule timing and counter attribution."""
+
+    def _recorder(self, manager=None, profile_queries=False):
+        graph = MagicMock(spec=["manager"])
+        graph.manager = manager
+        return RuleCostRecorder(
+            "refinement", graph=graph, profiler=PhaseProfiler(), profile_queries=profile_queries
+        )
+
+    def test_rule_records_counter_delta_into_profiler_phase(self):
+        manager = _CountingManager()
+        manager.add(properties_set=100)
+        recorder = self._recorder(manager)
+
+        with recorder.rule("linking.link_frame_arguments"):
+            manager.add(properties_set=7, relationships_created=2)
+
+        metrics = recorder.profiler.get_phase_metrics("refinement")
+        assert metrics.queries_executed == 1
+        metric = metrics.query_metrics[0]
+        assert metric.query_name == "linking.link_frame_arguments"
+        assert metric.counters == {"properties_set": 7, "relationships_created": 2}
+        assert metric.rows_affected == 9
+        assert metric.db_hits is None
+
+    def test_db_hits_only_when_profiling(self):
+        manager = _CountingManager()
+        recorder = self._recorder(manager, profile_queries=True)
+
+        with recorder.rule("case1"):
+            manager.add(db_hits=420, relationships_created=1)
+
+        assert manager.profiled == [True]
+        assert recorder.metrics[0].db_hits == 420
+        assert "db_hits" not in recorder.metrics[0].counters
+
+    def test_summary_aggregates_and_ranks_by_duration(self):
+        recorder = self._recorder()
+        recorder.metrics = [
+            QueryMetrics("fast", 1.0, rows_affected=1, counters={"properties_set": 1}),
+            QueryMetrics("slow", 30.0),
+            QueryMetrics("fast", 2.0, rows_affected=2, counters={"properties_set": 2}),
+        ]
+
+        summary = recorder.summary()
+
+        assert [cost["rule"] for cost in summary] == ["slow", "fast"]
+        assert summary[1]["calls"] == 2
+        assert summary[1]["rows_affected"] == 3
+        assert summary[1]["counters"] == {"properties_set": 3}
+
+    def test_rule_without_manager_still_times_and_reraises(self):
+        recorder = self._recorder()
+
+        with pytest.raises(ValueError):
+            with recorder.rule("broken_rule"):
+                raise ValueError("boom")
+
+        assert recorder.metrics[0].query_name == "broken_rule"
+        assert recorder.metrics[0].counters == {}
+
+    def test_bottleneck_report_ranks_rules_across_phases(self):
+        profiler = PhaseProfiler()
+        profiler.record_query("case3", 900.0, phase_name="tlinks")
+        profiler.record_query("linking.x", 1200.0, rows_affected=4, phase_name="refinement")
+
+        report = profiler.get_bottleneck_report()
+
+        assert [(rule["phase"], rule["rule"]) for rule in report["rules"]] == [
+            ("refinement", "linking.x"),
+            ("tlinks", "case3"),
+        ]
+        assert report["bottlenecks"][0]["query"] == "linking.x"
+
+
 class TestGlobalProfilerInstance:
     """Tests for the global profiler singleton."""
     
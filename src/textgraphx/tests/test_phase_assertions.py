@@ -3,6 +3,9 @@
 All tests use a mock graph so no real Neo4j connection is required.
 """
 
+import json
+import re
+
 import pytest
 from unittest.mock import MagicMock, call, patch
 
@@ -24,10 +27,25 @@ from textgraphx.pipeline.runtime.phase_assertions import (
 # ---------------------------------------------------------------------------
 
 
-def _make_graph(count: int = 5) -> MagicMock:
-    """Return a mock graph whose .run().data() always returns [{'c': count}]."""
+def _plan_run(count: int = 5, **columns):
+    """Return a ``graph.run`` side effect answering every planned column.
+
+    Each ``AS <alias>`` of the query is answered with ``count`` unless
+    *columns* gives the alias its own value.
+    """
+
+    def run(query, *args, **kwargs):
+        aliases = re.findall(r"\bAS (\w+)", query)
+        row = {alias: columns.get(alias, count) for alias in aliases}
+        return MagicMock(data=MagicMock(return_value=[row]))
+
+    return run
+
+
+def _make_graph(count: int = 5, **columns) -> MagicMock:
+    """Return a mock graph whose every planned count evaluates to *count*."""
     graph = MagicMock()
-    graph.run.return_value.data.return_value = [{"c": count}]
+    graph.run.side_effect = _plan_run(count, **columns)
     return graph
 
 
@@ -271,68 +289,14 @@ class TestPhaseAssertions:
         assert all(c["actual"] == 0 for c in result.checks)
 
     def test_strict_transition_gate_fails_when_legacy_edges_dominate(self):
-        graph = MagicMock()
-        graph.run.side_effect = [
-            MagicMock(data=MagicMock(return_value=[{"c": 5}])),  # DESCRIBES
-            MagicMock(data=MagicMock(return_value=[{"c": 2}])),  # FRAME_DESCRIBES_EVENT
-            MagicMock(data=MagicMock(return_value=[{"c": 6}])),  # PARTICIPANT
-            MagicMock(data=MagicMock(return_value=[{"c": 3}])),  # EVENT_PARTICIPANT
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # HAS_FRAME_ARGUMENT
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # CLINK
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # SLINK
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # endpoint EVENT_PARTICIPANT
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # endpoint INSTANTIATES
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # endpoint HAS_FRAME_ARGUMENT
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # endpoint FRAME_DESCRIBES_EVENT
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # endpoint REFERS_TO
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # endpoint MODIFIES
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # endpoint AFFECTS
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # endpoint CLINK
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # endpoint SLINK
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # EventMention missing REFERS_TO
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # Frame missing INSTANTIATES
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # EventMention missing token identity
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # factuality missing on EventMention
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # factuality attribution missing
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # factuality missing on TEvent
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # factuality alignment violations
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # participation IN_FRAME alias missing
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # participation IN_MENTION alias missing
-        ]
+        graph = _make_graph(0, describes=5, frame_describes_event=2, participant=6, event_participant=3)
         pa = PhaseAssertions(graph, strict_transition_gate=True)
         result = pa.after_event_enrichment()
         assert result.passed is False
         assert any("strict transition gate failed" in err for err in result.errors)
 
     def test_strict_transition_gate_passes_when_canonical_edges_dominate(self):
-        graph = MagicMock()
-        graph.run.side_effect = [
-            MagicMock(data=MagicMock(return_value=[{"c": 1}])),  # DESCRIBES
-            MagicMock(data=MagicMock(return_value=[{"c": 3}])),  # FRAME_DESCRIBES_EVENT
-            MagicMock(data=MagicMock(return_value=[{"c": 1}])),  # PARTICIPANT
-            MagicMock(data=MagicMock(return_value=[{"c": 4}])),  # EVENT_PARTICIPANT
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # HAS_FRAME_ARGUMENT
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # CLINK
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # SLINK
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # endpoint EVENT_PARTICIPANT
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # endpoint INSTANTIATES
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # endpoint HAS_FRAME_ARGUMENT
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # endpoint FRAME_DESCRIBES_EVENT
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # endpoint REFERS_TO
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # endpoint MODIFIES
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # endpoint AFFECTS
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # endpoint CLINK
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # endpoint SLINK
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # EventMention missing REFERS_TO
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # Frame missing INSTANTIATES
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # EventMention missing token identity
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # factuality missing on EventMention
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # factuality attribution missing
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # factuality missing on TEvent
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # factuality alignment violations
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # participation IN_FRAME alias missing
-            MagicMock(data=MagicMock(return_value=[{"c": 0}])),  # participation IN_MENTION alias missing
-        ]
+        graph = _make_graph(0, describes=1, frame_describes_event=3, participant=1, event_participant=4)
         pa = PhaseAssertions(graph, strict_transition_gate=True)
         result = pa.after_event_enrichment()
         assert result.passed is True
@@ -412,6 +376,78 @@ class TestPhaseAssertions:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.unit
+class TestAssertionPlanner:
+    @pytest.mark.parametrize(
+        "method",
+        ["after_ingestion", "after_refinement", "after_temporal", "after_event_enrichment", "after_tlinks"],
+    )
+    def test_each_phase_runs_one_aggregated_query(self, method):
+        graph = _make_graph(count=0)
+        getattr(PhaseAssertions(graph), method)()
+        assert graph.run.call_count == 1
+        query = graph.run.call_args[0][0]
+        assert "CALL {" in query
+        assert "$doc_ids" not in query
+        assert "doc_ids" not in graph.run.call_args[0][1]
+
+    def test_checks_sharing_a_scan_are_tallied_together(self):
+        graph = _make_graph(count=0)
+        PhaseAssertions(graph).after_temporal()
+        query = graph.run.call_args[0][0]
+        assert "CALL {\nMATCH (e:TEvent)\nRETURN count(CASE WHEN e.eid IS NULL" in query
+        assert query.count("[r:TLINK]") == 1
+
+    def test_unscoped_totals_get_their_own_count_store_subquery(self):
+        graph = _make_graph(count=0)
+        PhaseAssertions(graph).after_temporal()
+        query = graph.run.call_args[0][0]
+        assert "CALL {\nMATCH (e:TEvent)\nRETURN count(e) AS tevents\n}" in query
+        assert "CALL {\nMATCH (x:TIMEX)\nRETURN count(x) AS timex\n}" in query
+        assert query.count("MATCH (e:TEvent)") == 2
+
+    def test_scoped_totals_share_the_scoped_scan(self):
+        graph = _make_graph(count=0)
+        PhaseAssertions(graph, doc_ids=[1]).after_temporal()
+        query = graph.run.call_args[0][0]
+        assert query.count("MATCH (e:TEvent) WHERE e.doc_id IN $doc_ids") == 1
+        assert "RETURN count(e) AS tevents, count(CASE WHEN e.eid IS NULL" in query
+
+    def test_columns_map_back_to_checks(self):
+        graph = _make_graph(count=0, tevents=4, timex=2, tevents_missing_timeml_core=1)
+        result = PhaseAssertions(graph).after_temporal()
+        actual = {c["label"]: c["actual"] for c in result.checks}
+        assert actual["TEvent nodes"] == 4
+        assert actual["TIMEX nodes"] == 2
+        assert actual["TEvent nodes missing core TimeML fields"] == 1
+        assert actual["Signal nodes"] == 0
+
+    def test_doc_scope_restricts_every_group(self):
+        graph = _make_graph(count=0)
+        PhaseAssertions(graph, doc_ids=["12", "a"]).after_tlinks()
+        query, params = graph.run.call_args[0]
+        assert params["doc_ids"] == ["12", 12, "a"]
+        assert "MATCH (s:TEvent) WHERE s.doc_id IN $doc_ids" in query
+        assert "MATCH (s:TIMEX) WHERE s.doc_id IN $doc_ids" in query
+        assert "MATCH ()-[r:TLINK]->()" not in query
+
+    def test_empty_doc_scope_is_still_scoped(self):
+        graph = _make_graph(count=0)
+        PhaseAssertions(graph, doc_ids=[]).after_ingestion()
+        query, params = graph.run.call_args[0]
+        assert params["doc_ids"] == []
+        assert "$doc_ids" in query
+
+    def test_endpoint_violation_condition_prefixes_params(self):
+        from textgraphx.reasoning.contracts import endpoint_violation_condition
+
+        predicate, params = endpoint_violation_condition("TLINK", source="a", target="b")
+        assert params
+        assert all(key.startswith("tlink_") for key in params)
+        assert "labels(a)" in predicate and "labels(b)" in predicate
+        assert endpoint_violation_condition("NOT_A_RELATION") is None
+
+
 @pytest.mark.unit
 class TestRecordPhaseRun:
     def test_writes_phase_run_node(self):
@@ -448,3 +484,19 @@ class TestRecordPhaseRun:
         record_phase_run(graph, "refinement", duration_seconds=1.23456789)
         params = graph.run.call_args[0][1]
         assert params["props"]["duration_seconds"] == 1.235
+
+    def test_rule_costs_are_stored_as_json(self):
+        graph = MagicMock()
+        graph.run.return_value.data.return_value = []
+        costs = [
+            {"rule": "case3", "calls": 1, "duration_ms": 90.0, "rows_affected": 2, "db_hits": None,
+             "counters": {"relationships_created": 2}},
+            {"rule": "case1", "calls": 1, "duration_ms": 5.0, "rows_affected": 0, "db_hits": None,
+             "counters": {}},
+        ]
+        run_id = record_phase_run(graph, "tlinks", duration_seconds=1.0, rule_costs=costs)
+        props = graph.run.call_args[0][1]["props"]
+        assert run_id == graph.run.call_args[0][1]["id"]
+        assert props["rules_profiled"] == 2
+        assert props["slowest_rule"] == "case3"
+        assert json.loads(props["rule_costs_json"]) == costs
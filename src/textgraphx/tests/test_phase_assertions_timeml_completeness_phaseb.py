@@ -26,7 +26,14 @@ def test_after_temporal_fails_when_missing_counts_exceed_thresholds():
     from textgraphx.pipeline.runtime.phase_assertions import PhaseAssertions, PhaseThresholds
 
     graph = MagicMock()
-    graph.run.return_value.data.return_value = [{"c": 2}]
+    graph.run.return_value.data.return_value = [
+        {
+            "tevents_missing_timeml_core": 2,
+            "timex_missing_timeml_core": 2,
+            "signals_missing_text_span": 2,
+            "tlinks_missing_reltype_canonical": 2,
+        }
+    ]
 
     thresholds = PhaseThresholds(
         max_tevents_missing_timeml_core=0,
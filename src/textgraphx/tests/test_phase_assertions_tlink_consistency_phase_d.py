@@ -22,7 +22,7 @@ def test_after_tlinks_fails_when_consistency_violations_exceed_threshold():
     from textgraphx.pipeline.runtime.phase_assertions import PhaseAssertions, PhaseThresholds
 
     graph = MagicMock()
-    graph.run.return_value.data.return_value = [{"c": 1}]
+    graph.run.return_value.data.return_value = [{"contradictory_tlink_pairs": 1}]
 
     thresholds = PhaseThresholds(max_tlink_consistency_violations=0)
     result = PhaseAssertions(graph, thresholds=thresholds).after_tlinks()
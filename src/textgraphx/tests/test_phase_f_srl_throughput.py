@@ -25,6 +25,20 @@ import pytest
 # Helpers
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(autouse=True)
+def _memory_only_srl_cache(monkeypatch):
+    """Keep these tests on the in-process LRU (no persistent SRL store)."""
+    from textgraphx.adapters.srl_response_store import reset_srl_response_store
+    from textgraphx.infrastructure import config as config_module
+
+    monkeypatch.setenv("TEXTGRAPHX_PERSIST_SRL_CACHE", "false")
+    config_module._CACHED = None
+    reset_srl_response_store()
+    yield
+    config_module._CACHED = None
+    reset_srl_response_store()
+
+
 def _make_config(srl_url="http://srl:8010/predict", nom_srl_url="http://nom:8011/predict_nom", timeout=5):
     cfg = types.SimpleNamespace(
         services=types.SimpleNamespace(
@@ -97,6 +111,35 @@ def test_lru_cache__update_existing_key_no_growth():
     assert c.get("http://svc", "sent") == {"v": 2}
 
 
+@pytest.mark.unit
+def test_lru_cache__concurrent_get_set_keeps_bounded_consistent_state():
+    import threading
+
+    from textgraphx.adapters.rest_caller import _LruCache
+    c = _LruCache(maxsize=8)
+    errors = []
+
+    def worker(offset):
+        try:
+            for i in range(2000):
+                key = f"sent{(i + offset) % 32}"
+                c.set("http://svc", key, {"i": i})
+                c.get("http://svc", key)
+        except Exception as exc:  # pragma: no cover - only on a race
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(c._store) <= 8
+    stats = c.stats()
+    assert stats["memory_hits"] + stats["misses"] == 8 * 2000
+
+
 # ---------------------------------------------------------------------------
 # _CircuitBreaker tests
 # ---------------------------------------------------------------------------
@@ -170,7 +213,7 @@ def test_callAllenNlpApi__cache_hit_bypasses_requests(monkeypatch):
     monkeypatch.setattr(rc, "get_config", lambda: _make_config())
     rc._srl_cache.set("http://srl:8010/predict", "test sentence", {"verbs": [{"tags": ["B-V"]}]})
     post_mock = mock.MagicMock()
-    monkeypatch.setattr(rc.requests, "post", post_mock)
+    monkeypatch.setattr(rc.requests.Session, "post", post_mock)
     result = rc.callAllenNlpApi("semantic-role-labeling", "test sentence")
     post_mock.assert_not_called()
     assert result == {"verbs": [{"tags": ["B-V"]}]}
@@ -185,7 +228,7 @@ def test_callAllenNlpApi__circuit_open_returns_empty(monkeypatch):
     for _ in range(rc._CB_FAILURE_THRESHOLD):
         rc._circuit_breaker.record_failure(url)
     post_mock = mock.MagicMock()
-    monkeypatch.setattr(rc.requests, "post", post_mock)
+    monkeypatch.setattr(rc.requests.Session, "post", post_mock)
     result = rc.callAllenNlpApi("semantic-role-labeling", "new sentence xyz")
     post_mock.assert_not_called()
     assert result == {}
@@ -205,7 +248,7 @@ def test_callAllenNlpApi__successful_response_populates_cache(monkeypatch):
     mock_resp = mock.MagicMock()
     mock_resp.raise_for_status.return_value = None
     mock_resp.text = '{"verbs": [{"frame": "run.01", "tags": ["B-V"]}]}'
-    monkeypatch.setattr(rc.requests, "post", lambda *a, **kw: mock_resp)
+    monkeypatch.setattr(rc.requests.Session, "post", lambda *a, **kw: mock_resp)
     result = rc.callAllenNlpApi("semantic-role-labeling", sentence)
     assert result == resp_data
     assert rc._srl_cache.get(url, sentence) == resp_data
@@ -222,7 +265,8 @@ def test_callAllenNlpApi__failure_records_circuit_breaker(monkeypatch):
     initial_failures = rc._circuit_breaker._failures.get(url, 0)
     def raise_error(*a, **kw):
         raise req_lib.exceptions.ConnectionError("down")
-    monkeypatch.setattr(rc.requests, "post", raise_error)
+    monkeypatch.setattr(rc.requests.Session, "post", raise_error)
+    monkeypatch.setattr(rc.get_service_client("srl"), "retries", 0)
     result = rc.callAllenNlpApi("semantic-role-labeling", sentence)
     assert result == {}
     assert rc._circuit_breaker._failures.get(url, 0) > initial_failures
@@ -247,7 +291,7 @@ def test_callNominalSrlApi__cache_hit_bypasses_requests(monkeypatch):
     sentence = "cached nominal sentence"
     rc._srl_cache.set(url, sentence, {"frames": [{"predicate": "attack"}]})
     post_mock = mock.MagicMock()
-    monkeypatch.setattr(rc.requests, "post", post_mock)
+    monkeypatch.setattr(rc.requests.Session, "post", post_mock)
     result = rc.callNominalSrlApi(sentence)
     post_mock.assert_not_called()
     assert result == {"frames": [{"predicate": "attack"}]}
@@ -263,7 +307,7 @@ def test_callNominalSrlApi__circuit_open_returns_empty(monkeypatch):
     for _ in range(rc._CB_FAILURE_THRESHOLD):
         rc._circuit_breaker.record_failure(url)
     post_mock = mock.MagicMock()
-    monkeypatch.setattr(rc.requests, "post", post_mock)
+    monkeypatch.setattr(rc.requests.Session, "post", post_mock)
     result = rc.callNominalSrlApi(sentence)
     post_mock.assert_not_called()
     assert result == {}
@@ -0,0 +1,113 @@
+"""Tests for document-scoped execution of refinement rule families."""
+
+import pytest
+
+pytest.importorskip("spacy", reason="spaCy required for RefinementPhase import")
+
+from textgraphx.pipeline.phases.refinement import RefinementPhase
+
+
+class _RecordingGraph:
+    def __init__(self, rows=None):
+        self.calls = []
+        self._rows = rows or []
+
+    def run(self, query, params=None):
+        self.calls.append((query, params))
+        rows = self._rows
+
+        class _Result:
+            def data(self):
+                return rows
+
+        return _Result()
+
+    def write(self, query, params=None):
+        self.calls.append((query, params))
+        return {"properties_set": 1}
+
+
+def _phase(graph):
+    phase = RefinementPhase.__new__(RefinementPhase)
+    phase.graph = graph
+    return phase
+
+
+@pytest.mark.unit
+def test_unscoped_rule_runs_query_unchanged():
+    graph = _RecordingGraph()
+    _phase(graph).get_and_assign_head_info_to_entity_multitoken()
+
+    assert len(graph.calls) == 1
+    query, params = graph.calls[0]
+    assert params is None
+    assert "$doc_ids" not in query
+
+
+@pytest.mark.unit
+def test_run_rule_family_anchors_every_query_on_doc_ids():
+    graph = _RecordingGraph()
+    phase = _phase(graph)
+
+    phase.run_rule_family("head_assignment", doc_ids=[3, 5])
+
+    assert len(graph.calls) == len(phase.RULE_FAMILIES["head_assignment"])
+    for query, params in graph.calls:
+        assert "scope_doc.id IN $doc_ids" in query
+        assert params["doc_ids"] == [3, 5]
+    assert getattr(phase, "_doc_scope", None) is None
+
+
+@pytest.mark.unit
+def test_run_all_rule_families_scopes_every_rule_query():
+    graph = _RecordingGraph()
+    phase = _phase(graph)
+
+    phase.run_all_rule_families(doc_ids=[7])
+
+    assert graph.calls
+    for query, params in graph.calls:
+        assert params and params["doc_ids"] == [7], query[:120]
+        assert "$doc_ids" in query
+
+
+@pytest.mark.unit
+def test_doc_scoped_keeps_rule_parameters():
+    phase = _phase(_RecordingGraph())
+    phase.set_doc_scope(["d1"])
+
+    query, params = phase._doc_scoped("MATCH (doc)-->(x) RETURN x", "doc", "doc", {"dep_type": "nsubj"})
+
+    assert query.lstrip().startswith("MATCH (doc:AnnotatedText) WHERE doc.id IN $doc_ids")
+    assert params == {"dep_type": "nsubj", "doc_ids": ["d1"]}
+
+
+@pytest.mark.unit
+def test_unrefined_and_mark_documents_refined():
+    graph = _RecordingGraph(rows=[{"doc_id": 1}, {"doc_id": 2}])
+    phase = _phase(graph)
+
+    assert phase.unrefined_document_ids() == [1, 2]
+    assert "d.refined_at IS NULL" in graph.calls[0][0]
+
+    graph._rows = [{"marked": 2}]
+    assert phase.mark_documents_refined([1, 2], "2026-01-01T00:00:00Z") == 2
+    assert graph.calls[1][1] == {"doc_ids": [1, 2], "refined_at": "2026-01-01T00:00:00Z"}
+
+
+@pytest.mark.unit
+def test_run_rule_family_times_each_rule_on_the_recorder():
+    from textgraphx.infrastructure.performance_profiler import PhaseProfiler, RuleCostRecorder
+
+    graph = _RecordingGraph()
+    phase = _phase(graph)
+    phase.rule_cost_recorder = RuleCostRecorder(
+        "refinement", graph=graph, profiler=PhaseProfiler(), profile_queries=False
+    )
+
+    phase.run_rule_family("head_assignment")
+
+    names = [metric.query_name for metric in phase.rule_cost_recorder.metrics]
+    assert names == [f"head_assignment.{name}" for name in phase.RULE_FAMILIES["head_assignment"]]
+    metrics = phase.rule_cost_recorder.profiler.get_phase_metrics("refinement")
+    assert metrics.queries_executed == len(names)
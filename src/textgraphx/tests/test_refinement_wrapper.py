@@ -0,0 +1,60 @@
+"""Unit tests for RefinementPhaseWrapper document scoping."""
+
+import sys
+import types
+from unittest.mock import MagicMock
+
+import pytest
+
+from textgraphx.infrastructure import config as config_module
+
+pytestmark = [pytest.mark.unit]
+
+
+@pytest.fixture
+def refiner(monkeypatch, tmp_path):
+    monkeypatch.setenv("TEXTGRAPHX_OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setenv("TEXTGRAPHX_INCREMENTAL_REFINEMENT", "true")
+    monkeypatch.setenv("TEXTGRAPHX_ENABLE_CROSS_DOCUMENT_FUSION", "false")
+    config_module._CACHED = None
+
+    refiner = MagicMock()
+    refiner.unrefined_document_ids.return_value = []
+    fake_module = types.ModuleType("textgraphx.pipeline.phases.refinement")
+    fake_module.RefinementPhase = lambda argv=None: refiner
+    monkeypatch.setitem(sys.modules, "textgraphx.pipeline.phases.refinement", fake_module)
+
+    from textgraphx.pipeline.runtime import phase_assertions
+
+    assertions = MagicMock()
+    monkeypatch.setattr(phase_assertions, "PhaseAssertions", assertions)
+    refiner.assertions = assertions
+    yield refiner
+    config_module._CACHED = None
+
+
+def test_empty_incremental_scope_skips_refinement_work(refiner, monkeypatch):
+    from textgraphx.pipeline.runtime import phase_wrappers
+    from textgraphx.pipeline.runtime.phase_wrappers import RefinementPhaseWrapper
+
+    record_rule_costs = MagicMock()
+    monkeypatch.setattr(phase_wrappers, "_record_rule_costs", record_rule_costs)
+
+    result = RefinementPhaseWrapper().execute()
+
+    refiner.assertions.assert_not_called()
+    record_rule_costs.assert_not_called()
+    refiner.run_rule_family.assert_not_called()
+    refiner.graph.run.assert_not_called()
+    assert result["assertions_passed"] is None
+    assert result["documents_refined"] == 0
+
+
+def test_incremental_scope_is_passed_to_assertions(refiner):
+    from textgraphx.pipeline.runtime.phase_wrappers import RefinementPhaseWrapper
+
+    refiner.unrefined_document_ids.return_value = [4, 9]
+
+    RefinementPhaseWrapper().execute()
+
+    assert refiner.assertions.call_args.kwargs["doc_ids"] == [4, 9]
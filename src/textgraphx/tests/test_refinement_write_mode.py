@@ -0,0 +1,67 @@
+"""Tests for write-mode execution of refinement update rules."""
+
+import re
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("spacy", reason="spaCy required for RefinementPhase import")
+
+from textgraphx.pipeline.phases.refinement import RefinementPhase
+
+
+class _WriteOnlyGraph:
+    def __init__(self):
+        self.writes = []
+
+    def run(self, query, params=None):  # pragma: no cover - must not be called
+        raise AssertionError("update rules must not fetch rows")
+
+    def write(self, query, params=None):
+        self.writes.append((query, params))
+        return {"properties_set": 3, "relationships_created": 1}
+
+
+def _phase(graph):
+    phase = RefinementPhase.__new__(RefinementPhase)
+    phase.graph = graph
+    return phase
+
+
+@pytest.mark.unit
+def test_update_rules_use_write_and_accumulate_counters_per_rule():
+    graph = _WriteOnlyGraph()
+    phase = _phase(graph)
+
+    phase.get_and_assign_head_info_to_entity_multitoken()
+    phase.get_and_assign_head_info_to_entity_multitoken()
+    phase.link_antecedent_to_namedEntity()
+
+    assert len(graph.writes) == 3
+    assert phase.rule_write_counters["get_and_assign_head_info_to_entity_multitoken"] == {
+        "properties_set": 6,
+        "relationships_created": 2,
+    }
+    assert phase.rule_write_counters["link_antecedent_to_namedEntity"]["properties_set"] == 3
+
+
+@pytest.mark.unit
+def test_write_falls_back_to_row_count_for_graphs_without_write():
+    class _RunOnlyGraph:
+        def run(self, query, params=None):
+            class _Result:
+                def data(self):
+                    return [{}, {}]
+
+            return _Result()
+
+    phase = _phase(_RunOnlyGraph())
+
+    assert phase._write("rule", "MATCH (n) SET n.x = 1") == {"rows": 2}
+
+
+@pytest.mark.regression
+def test_refinement_rules_no_longer_return_matched_paths():
+    source = (Path(__file__).parent.parent / "pipeline/phases/refinement.py").read_text()
+
+    assert not re.search(r"^\s*return p\s*$", source, re.M | re.I)
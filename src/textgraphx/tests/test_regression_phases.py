@@ -78,12 +78,15 @@ class TestPhaseAssertionsContract:
                 f"PhaseThresholds.{field_name} must be numeric, got {type(value)}"
             )
 
-    def test_after_ingestion_queries_three_node_types(self):
+    def test_after_ingestion_counts_three_node_types_in_one_query(self):
         graph = MagicMock()
-        graph.run.return_value.data.return_value = [{"c": 0}]
+        graph.run.return_value.data.return_value = [
+            {"annotated_text": 1, "sentences": 2, "tag_occurrences": 3}
+        ]
         pa = PhaseAssertions(graph)
-        pa.after_ingestion()
-        assert graph.run.call_count == 3
+        result = pa.after_ingestion()
+        assert graph.run.call_count == 1
+        assert [c["actual"] for c in result.checks] == [1, 2, 3]
 
     def test_check_dict_has_required_keys(self):
         graph = MagicMock()
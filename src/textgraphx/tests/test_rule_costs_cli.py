@@ -0,0 +1,87 @@
+"""Tests for per-rule metrics history and the rule cost ranking CLI."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from textgraphx.orchestration.runtime_history import ExecutionHistory
+from textgraphx.tools import rule_costs
+
+
+pytestmark = [pytest.mark.unit]
+
+
+def _cost(rule, duration_ms, rows=0, db_hits=None):
+    return {
+        "rule": rule,
+        "calls": 1,
+        "duration_ms": duration_ms,
+        "rows_affected": rows,
+        "db_hits": db_hits,
+        "counters": {"properties_set": rows},
+    }
+
+
+@pytest.fixture
+def history_db(tmp_path):
+    path = tmp_path / "history.db"
+    history = ExecutionHistory(str(path))
+    history.store_rule_metrics("run-1", "refinement", [_cost("linking.a", 40.0, 3), _cost("linking.b", 5.0)])
+    history.store_rule_metrics("run-2", "refinement", [_cost("linking.a", 20.0, 1), _cost("linking.b", 50.0)])
+    history.store_rule_metrics("run-3", "tlinks", [_cost("case1", 10.0, 2, db_hits=900)])
+    return path
+
+
+def test_rank_rules_aggregates_across_runs(history_db):
+    ranked = ExecutionHistory(str(history_db)).rank_rules()
+
+    assert [(row["phase"], row["rule"]) for row in ranked] == [
+        ("refinement", "linking.a"),
+        ("refinement", "linking.b"),
+        ("tlinks", "case1"),
+    ]
+    top = ranked[0]
+    assert top["runs"] == 2
+    assert top["total_ms"] == 60.0
+    assert top["max_ms"] == 40.0
+    assert top["rows_affected"] == 4
+
+
+def test_rank_rules_filters_phase_and_orders_by_column(history_db):
+    history = ExecutionHistory(str(history_db))
+
+    assert [row["rule"] for row in history.rank_rules(phase="refinement", order_by="max_ms")] == [
+        "linking.b",
+        "linking.a",
+    ]
+    assert history.rank_rules(order_by="db_hits", limit=1)[0]["rule"] == "case1"
+    with pytest.raises(ValueError):
+        history.rank_rules(order_by="duration_ms; DROP TABLE rule_metrics")
+
+
+def test_cli_emits_json_ranking(history_db, capsys):
+    rc = rule_costs.main(["--db", str(history_db), "--phase", "tlinks", "--json"])
+
+    assert rc == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload[0]["rule"] == "case1"
+    assert payload[0]["db_hits"] == 900
+
+
+def test_cli_prints_table(history_db, capsys):
+    rc = rule_costs.main(["--db", str(history_db), "--limit", "2"])
+
+    assert rc == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert "rule" in lines[0]
+    assert "linking.a" in lines[2]
+    assert len(lines) == 4
+
+
+def test_cli_missing_history_returns_error(tmp_path, capsys):
+    rc = rule_costs.main(["--db", str(tmp_path / "missing.db")])
+
+    assert rc == 2
+    assert "no rule metrics history" in capsys.readouterr().err
@@ -0,0 +1,161 @@
+"""Tests for the pooled, retrying service client layer."""
+
+import threading
+import time
+import types
+import unittest.mock as mock
+
+import pytest
+import requests
+
+from textgraphx.adapters import service_client
+from textgraphx.adapters.service_client import (
+    ServiceClient,
+    ServiceUnavailableError,
+    _CircuitBreaker,
+    get_service_client,
+    reset_service_clients,
+    service_stats,
+)
+from textgraphx.infrastructure import config as config_module
+
+pytestmark = [pytest.mark.unit]
+
+URL = "http://svc:9000/predict"
+
+
+def _response(status=200, text="{}"):
+    response = mock.Mock(status_code=status, text=text)
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(f"{status} error")
+    return response
+
+
+def _client(monkeypatch, responses, **kwargs):
+    client = ServiceClient("svc", backoff_sec=0.0, breaker=_CircuitBreaker(), **kwargs)
+    post = mock.Mock(side_effect=responses)
+    monkeypatch.setattr(client.session, "post", post)
+    return client, post
+
+
+def test_client_reuses_one_pooled_session(monkeypatch):
+    client, post = _client(monkeypatch, [_response(), _response()])
+
+    client.post(URL, json={"a": 1}, timeout=3)
+    client.post(URL, json={"a": 2}, timeout=3)
+
+    assert post.call_count == 2
+    assert post.call_args.kwargs == {"json": {"a": 2}, "timeout": 3}
+    adapter = client.session.get_adapter(URL)
+    assert adapter._pool_maxsize == 10
+
+
+def test_client_retries_gateway_errors_and_connection_failures(monkeypatch):
+    client, post = _client(
+        monkeypatch,
+        [_response(503), requests.exceptions.ConnectionError("reset"), _response(text="ok")],
+        retries=2,
+    )
+
+    assert client.post(URL).text == "ok"
+    assert post.call_count == 3
+    assert client.stats()["retries"] == 2
+    assert client.stats()["failures"] == 0
+
+
+def test_client_does_not_retry_client_errors(monkeypatch):
+    client, post = _client(monkeypatch, [_response(404), _response()], retries=2)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.post(URL)
+
+    assert post.call_count == 1
+    assert client.breaker._failures[URL] == 1
+
+
+def test_client_records_one_breaker_failure_after_exhausting_retries(monkeypatch):
+    client, post = _client(
+        monkeypatch, [requests.exceptions.Timeout("slow")] * 3, retries=2
+    )
+
+    with pytest.raises(requests.exceptions.Timeout):
+        client.post(URL)
+
+    assert post.call_count == 3
+    assert client.breaker._failures[URL] == 1
+    assert client.stats()["failures"] == 1
+
+
+def test_client_skips_requests_while_circuit_is_open(monkeypatch):
+    client, post = _client(monkeypatch, [_response()])
+    for _ in range(service_client._CB_FAILURE_THRESHOLD):
+        client.breaker.record_failure(URL)
+
+    with pytest.raises(ServiceUnavailableError):
+        client.post(URL)
+
+    post.assert_not_called()
+
+
+def test_client_bounds_in_flight_requests(monkeypatch):
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def slow_post(url, **kwargs):
+        with lock:
+            in_flight.append(url)
+            peak.append(len(in_flight))
+        time.sleep(0.02)
+        with lock:
+            in_flight.pop()
+        return _response()
+
+    client = ServiceClient("svc", max_concurrency=2, breaker=_CircuitBreaker())
+    monkeypatch.setattr(client.session, "post", slow_post)
+    threads = [threading.Thread(target=client.post, args=(URL,)) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) <= 2
+    assert client.stats()["requests"] == 6
+
+
+def test_get_service_client_is_shared_and_configured(monkeypatch):
+    monkeypatch.setenv("TEXTGRAPHX_HTTP_MAX_CONCURRENCY", "3")
+    monkeypatch.setenv("TEXTGRAPHX_HTTP_RETRIES", "0")
+    config_module._CACHED = None
+    reset_service_clients()
+    try:
+        client = get_service_client("ttk")
+        assert get_service_client("ttk") is client
+        assert client.max_concurrency == 3
+        assert client.retries == 0
+        assert client.breaker is service_client.circuit_breaker
+        assert "ttk" in service_stats()
+    finally:
+        reset_service_clients()
+        config_module._CACHED = None
+
+
+def test_srl_batch_goes_through_pooled_client(monkeypatch):
+    import textgraphx.adapters.rest_caller as rc
+
+    monkeypatch.setattr(rc._srl_cache, "_backend_factory", None)
+
+    url = "http://srl-batch:8010/predict"
+    cfg = types.SimpleNamespace(services=types.SimpleNamespace(srl_url=url, service_timeout_sec=5))
+    monkeypatch.setattr(rc, "get_config", lambda: cfg)
+    sentences = ["pooled batch one", "pooled batch two"]
+    for sentence in sentences:
+        rc._srl_cache._store.pop(rc._srl_cache._key(url, sentence), None)
+    response = _response()
+    response.json.return_value = {"verbs": []}
+    post = mock.Mock(return_value=response)
+    monkeypatch.setattr(requests.Session, "post", post)
+
+    assert rc.callAllenNlpApiBatch(sentences) == [{"verbs": []}, {"verbs": []}]
+    assert post.call_count == 2
+    assert rc._srl_cache.get(url, sentences[0]) == {"verbs": []}
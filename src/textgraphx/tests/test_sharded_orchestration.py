@@ -0,0 +1,257 @@
+"""Tests for document-scoped phases and sharded orchestrator execution."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from textgraphx.infrastructure import config as config_module
+from textgraphx.orchestration import sharding
+from textgraphx.orchestration.orchestrator import PipelineOrchestrator
+from textgraphx.pipeline.runtime.document_scope import (
+    active_document_scope,
+    document_scope,
+    extend_document_scope,
+    restrict_to_scope,
+)
+
+pytestmark = [pytest.mark.orchestration, pytest.mark.unit]
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("TEXTGRAPHX_OUTPUT_DIR", str(tmp_path / "out"))
+    monkeypatch.delenv("TEXTGRAPHX_INCREMENTAL_INGESTION", raising=False)
+    monkeypatch.delenv("TEXTGRAPHX_ENABLE_CROSS_DOCUMENT_FUSION", raising=False)
+    config_module._CACHED = None
+    yield tmp_path / "out"
+    config_module._CACHED = None
+
+
+def test_document_scope_restricts_and_restores():
+    assert active_document_scope() is None
+    assert restrict_to_scope([1, 2, 3]) == [1, 2, 3]
+    with document_scope([1]):
+        extend_document_scope(["3"])
+        assert active_document_scope() == {"1", "3"}
+        assert restrict_to_scope([1, 2, 3]) == [1, 3]
+    assert active_document_scope() is None
+    extend_document_scope([5])
+    assert active_document_scope() is None
+
+
+def test_split_phases_keeps_leading_shardable_chain():
+    shard, rest = sharding.split_phases(
+        ["ingestion", "refinement", "temporal", "event_enrichment", "tlinks", "graph_enhancements"]
+    )
+    assert shard == ["ingestion", "refinement", "temporal", "event_enrichment"]
+    assert rest == ["tlinks", "graph_enhancements"]
+    assert sharding.split_phases(["tlinks", "refinement"]) == ([], ["tlinks", "refinement"])
+
+
+def test_partition_files_round_robin_drops_empty_shards():
+    assert sharding.partition_files(["a", "b", "c", "d", "e"], 2) == [["a", "c", "e"], ["b", "d"]]
+    assert sharding.partition_files(["a"], 4) == [["a"]]
+
+
+def test_build_shard_directory_links_files(tmp_path):
+    source = tmp_path / "doc.xml"
+    source.write_text("<doc/>", encoding="utf-8")
+    target = sharding.build_shard_directory([str(source)], tmp_path / "shard" / "dataset")
+    (target / "stale.xml").write_text("", encoding="utf-8")
+    target = sharding.build_shard_directory([str(source)], target)
+    assert sorted(p.name for p in target.iterdir()) == ["doc.xml"]
+    assert (target / "doc.xml").read_text(encoding="utf-8") == "<doc/>"
+
+
+def _dataset(tmp_path, count):
+    dataset = tmp_path / "dataset"
+    dataset.mkdir()
+    for n in range(count):
+        (dataset / f"doc{n}.xml").write_text("<doc/>", encoding="utf-8")
+    return dataset
+
+
+def _shard_result(spec, docs_per_phase=1, error=""):
+    return sharding.ShardResult(
+        index=spec.index,
+        files=list(spec.files),
+        phases={
+            name: {
+                "status": "completed",
+                "duration": 1.0 + spec.index,
+                "documents_processed": docs_per_phase * len(spec.files),
+                "provenance_violations": 0,
+                "error": None,
+            }
+            for name in spec.phases
+        },
+        error=error,
+    )
+
+
+def _orchestrator(dataset):
+    orchestrator = PipelineOrchestrator(directory=str(dataset))
+    orchestrator.execution_history = MagicMock()
+    orchestrator.strict_transition_gate = False
+    return orchestrator
+
+
+def test_run_sharded_merges_shard_results(tmp_path, output_dir, monkeypatch):
+    dataset = _dataset(tmp_path, 3)
+    seen_specs = []
+
+    def fake_execute(specs, workers):
+        seen_specs.extend(specs)
+        return [_shard_result(spec) for spec in specs]
+
+    monkeypatch.setattr(sharding, "execute_shards", fake_execute)
+    orchestrator = _orchestrator(dataset)
+    orchestrator._run_cross_document_steps = MagicMock()
+    orchestrator.run_selected = MagicMock()
+
+    orchestrator.run_sharded(["ingestion", "refinement", "tlinks"], shards=2)
+
+    assert [len(spec.files) for spec in seen_specs] == [2, 1]
+    assert seen_specs[0].phases == ["ingestion", "refinement"]
+    assert seen_specs[1].output_dir.endswith("shard-1-of-2")
+    ingestion = orchestrator.summary.phases["ingestion"]
+    assert ingestion.status == "completed"
+    assert ingestion.documents_processed == 3
+    assert ingestion.duration == 2.0
+    assert orchestrator.phases_executed == ["ingestion", "refinement"]
+    orchestrator._run_cross_document_steps.assert_called_once()
+    orchestrator.run_selected.assert_called_once_with(["tlinks"])
+    assert orchestrator.summary.phase_count == 3
+    resume = orchestrator.checkpoint_manager.resume_from_checkpoint(
+        orchestrator._checkpoint_doc_id(), ["ingestion", "refinement", "tlinks"]
+    )
+    assert resume.remaining_phases == ["tlinks"]
+
+
+def test_run_sharded_raises_when_a_shard_fails(tmp_path, output_dir, monkeypatch):
+    dataset = _dataset(tmp_path, 2)
+
+    def fake_execute(specs, workers):
+        results = [_shard_result(spec) for spec in specs]
+        results[1].error = "RuntimeError: boom"
+        results[1].phases["refinement"]["status"] = "failed"
+        results[1].phases["refinement"]["error"] = "boom"
+        return results
+
+    monkeypatch.setattr(sharding, "execute_shards", fake_execute)
+    orchestrator = _orchestrator(dataset)
+    orchestrator.run_selected = MagicMock()
+
+    with pytest.raises(RuntimeError, match="1 of 2 shard"):
+        orchestrator.run_sharded(["ingestion", "refinement", "tlinks"], shards=2)
+
+    assert orchestrator.summary.phases["ingestion"].status == "completed"
+    assert orchestrator.summary.phases["refinement"].status == "failed"
+    assert orchestrator.summary.failed_count == 1
+    orchestrator.run_selected.assert_not_called()
+    record = orchestrator.execution_history.record_execution.call_args.kwargs
+    assert record["status"] == "failed"
+
+
+def test_run_sharded_falls_back_to_run_selected_for_single_shard(tmp_path, output_dir, monkeypatch):
+    dataset = _dataset(tmp_path, 1)
+    monkeypatch.setattr(sharding, "execute_shards", MagicMock(side_effect=AssertionError))
+    orchestrator = _orchestrator(dataset)
+    orchestrator.run_selected = MagicMock()
+
+    orchestrator.run_sharded(["ingestion", "tlinks"], shards=4)
+
+    orchestrator.run_selected.assert_called_once_with(["ingestion", "tlinks"])
+
+
+def _naf_dataset(tmp_path, public_ids):
+    dataset = tmp_path / "dataset"
+    dataset.mkdir()
+    for n, public_id in enumerate(public_ids):
+        (dataset / f"doc{n}.naf").write_text(
+            f'<NAF><nafHeader><public publicId="{public_id}"/></nafHeader></NAF>', encoding="utf-8"
+        )
+    return dataset
+
+
+def test_run_sharded_seeds_doc_ids_when_chain_lacks_ingestion(tmp_path, output_dir, monkeypatch):
+    dataset = _naf_dataset(tmp_path, ["11", "12", "13"])
+    seen_specs = []
+
+    def fake_execute(specs, workers):
+        seen_specs.extend(specs)
+        return [_shard_result(spec) for spec in specs]
+
+    monkeypatch.setattr(sharding, "execute_shards", fake_execute)
+    orchestrator = _orchestrator(dataset)
+    orchestrator._run_cross_document_steps = MagicMock()
+    orchestrator.run_selected = MagicMock()
+
+    orchestrator.run_sharded(["refinement", "temporal"], shards=2)
+
+    assert [spec.doc_ids for spec in seen_specs] == [["11", "13"], ["12"]]
+
+
+def test_run_sharded_runs_unsharded_when_doc_ids_are_unresolvable(tmp_path, output_dir, monkeypatch):
+    dataset = _naf_dataset(tmp_path, ["11", "not-a-number"])
+    monkeypatch.setattr(sharding, "execute_shards", MagicMock(side_effect=AssertionError))
+    orchestrator = _orchestrator(dataset)
+    orchestrator.run_selected = MagicMock()
+
+    orchestrator.run_sharded(["refinement", "temporal"], shards=2)
+
+    orchestrator.run_selected.assert_called_once_with(["refinement", "temporal"])
+
+
+def _fake_shard_orchestrator(seen_scopes):
+    class _FakeOrchestrator:
+        def __init__(self, directory, model_name=None):
+            self.summary = MagicMock(phases={})
+
+        def run_selected(self, phases):
+            seen_scopes.append(active_document_scope())
+
+    return _FakeOrchestrator
+
+
+def _shard_spec(tmp_path, phases, doc_ids):
+    source = tmp_path / "doc.naf"
+    source.write_text("<NAF/>", encoding="utf-8")
+    return sharding.ShardSpec(
+        index=0,
+        count=2,
+        files=[str(source)],
+        phases=phases,
+        model_name="sm",
+        output_dir=str(tmp_path / "shard-0-of-2"),
+        doc_ids=doc_ids,
+    )
+
+
+def test_run_shard_without_ingestion_scopes_to_spec_doc_ids(tmp_path, output_dir, monkeypatch):
+    from textgraphx.orchestration import orchestrator as orchestrator_module
+
+    seen_scopes = []
+    monkeypatch.setattr(orchestrator_module, "PipelineOrchestrator", _fake_shard_orchestrator(seen_scopes))
+    monkeypatch.setenv("TEXTGRAPHX_SRL_CACHE_PATH", str(tmp_path / "srl.sqlite"))
+    monkeypatch.setenv("TEXTGRAPHX_OUTPUT_DIR", str(output_dir))
+
+    result = sharding.run_shard(_shard_spec(tmp_path, ["refinement", "temporal"], ["11"]))
+
+    assert result.error == ""
+    assert seen_scopes == [{"11"}]
+    assert result.doc_ids == ["11"]
+
+
+def test_run_shard_without_ingestion_or_doc_ids_fails(tmp_path, output_dir, monkeypatch):
+    from textgraphx.orchestration import orchestrator as orchestrator_module
+
+    seen_scopes = []
+    monkeypatch.setattr(orchestrator_module, "PipelineOrchestrator", _fake_shard_orchestrator(seen_scopes))
+    monkeypatch.setenv("TEXTGRAPHX_SRL_CACHE_PATH", str(tmp_path / "srl.sqlite"))
+    monkeypatch.setenv("TEXTGRAPHX_OUTPUT_DIR", str(output_dir))
+
+    result = sharding.run_shard(_shard_spec(tmp_path, ["refinement", "temporal"], []))
+
+    assert "no ingestion phase" in result.error
+    assert seen_scopes == []
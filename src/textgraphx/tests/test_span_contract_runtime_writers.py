@@ -269,6 +269,13 @@ def test_coreference_writer_dual_writes_participation_and_in_mention_edges():
     assert params["doc_id"] == 1
 
 
+def _coref_rows(graph, marker):
+    """Return the ``rows`` parameter of the batched coreference statement containing *marker*."""
+    matches = [params["rows"] for query, params in graph.calls if marker in query]
+    assert len(matches) == 1, marker
+    return matches[0]
+
+
 @pytest.mark.unit
 def test_coreference_resolver_treats_two_value_service_spans_as_half_open_ranges():
     nlp = spacy.blank("en")
@@ -283,25 +290,24 @@ def test_coreference_resolver_treats_two_value_service_spans_as_half_open_ranges
             [[2, 3], [6, 7]],
         ]
     })
-    resolver.create_node = MagicMock(side_effect=["ant_1", "mention_1", "ant_2", "mention_2"])
-    resolver.connect_node_to_tag_occurrences = MagicMock()
 
     links = resolver.resolve_coreference(doc, 99)
 
     assert links == [
-        {"referent": "mention_1", "antecedent": "ant_1"},
-        {"referent": "mention_2", "antecedent": "ant_2"},
+        {"referent": "CorefMention_99_4_4", "antecedent": "Antecedent_99_0_0"},
+        {"referent": "CorefMention_99_6_6", "antecedent": "Antecedent_99_2_2"},
+    ]
+    antecedents = _coref_rows(graph, "MERGE (n:Antecedent {id: row.node_id})")
+    assert [(r["text"], r["start"], r["end"]) for r in antecedents] == [("Alice", 0, 0), ("Bob", 2, 2)]
+    assert antecedents[0]["node_uid"] == make_coref_uid(99, "Alice", 0, "Antecedent")
+    mentions = _coref_rows(graph, "MERGE (n:CorefMention {id: row.node_id})")
+    assert [(r["text"], r["start"], r["end"]) for r in mentions] == [("She", 4, 4), ("him", 6, 6)]
+    assert [r["indices"] for r in _coref_rows(graph, "MATCH (n:Antecedent {id: row.node_id})")] == [[0], [2]]
+    assert [r["indices"] for r in _coref_rows(graph, "MATCH (n:CorefMention {id: row.node_id})")] == [[4], [6]]
+    assert _coref_rows(graph, "MERGE (a)-[:COREF]->(b)") == [
+        {"mention_id": "CorefMention_99_4_4", "antecedent_id": "Antecedent_99_0_0"},
+        {"mention_id": "CorefMention_99_6_6", "antecedent_id": "Antecedent_99_2_2"},
     ]
-    create_calls = resolver.create_node.call_args_list
-    assert create_calls[0].args == ("Antecedent", "Alice", 0, 0, 99)
-    assert create_calls[1].args == ("CorefMention", "She", 4, 4, 99)
-    assert create_calls[2].args == ("Antecedent", "Bob", 2, 2, 99)
-    assert create_calls[3].args == ("CorefMention", "him", 6, 6, 99)
-    connect_calls = resolver.connect_node_to_tag_occurrences.call_args_list
-    assert list(connect_calls[0].args[1]) == [0]
-    assert list(connect_calls[1].args[1]) == [4]
-    assert list(connect_calls[2].args[1]) == [2]
-    assert list(connect_calls[3].args[1]) == [6]
 
 
 @pytest.mark.unit
@@ -317,17 +323,53 @@ def test_coreference_resolver_preserves_explicit_multi_index_spans():
             [[0, 1, 2, 3], [6]],
         ]
     })
-    resolver.create_node = MagicMock(side_effect=["ant_1", "mention_1"])
-    resolver.connect_node_to_tag_occurrences = MagicMock()
 
     resolver.resolve_coreference(doc, 7)
 
-    create_calls = resolver.create_node.call_args_list
-    assert create_calls[0].args == ("Antecedent", "The New York team", 0, 3, 7)
-    assert create_calls[1].args == ("CorefMention", "It", 6, 6, 7)
-    connect_calls = resolver.connect_node_to_tag_occurrences.call_args_list
-    assert list(connect_calls[0].args[1]) == [0, 1, 2, 3]
-    assert list(connect_calls[1].args[1]) == [6]
+    antecedents = _coref_rows(graph, "MERGE (n:Antecedent {id: row.node_id})")
+    assert [(r["text"], r["start"], r["end"]) for r in antecedents] == [("The New York team", 0, 3)]
+    mentions = _coref_rows(graph, "MERGE (n:CorefMention {id: row.node_id})")
+    assert [(r["text"], r["start"], r["end"]) for r in mentions] == [("It", 6, 6)]
+    assert _coref_rows(graph, "MATCH (n:Antecedent {id: row.node_id})")[0]["indices"] == [0, 1, 2, 3]
+    assert _coref_rows(graph, "MATCH (n:CorefMention {id: row.node_id})")[0]["indices"] == [6]
+
+
+@pytest.mark.unit
+def test_coreference_resolver_reuses_named_entities_and_batches_writes_per_document():
+    nlp = spacy.blank("en")
+    doc = nlp("Alice saw Bob. She greeted him. Bob smiled and he left.")
+    graph = _FakeGraph()
+    graph.results = [[
+        {"start": 2, "end": 2, "node_id": "ne_bob"},
+        {"start": 2, "end": 2, "node_id": "ne_bob_dup"},
+        {"start": 8, "end": 8, "node_id": "ne_bob_2"},
+    ]]
+    resolver = CoreferenceResolver.__new__(CoreferenceResolver)
+    resolver.graph = graph
+    resolver.coreference_service_endpoint = ""
+
+    links = resolver.resolve_coreference(
+        doc,
+        3,
+        clusters=[[[0, 1], [4, 5]], [[6, 7], [2, 3], [8, 9], [11, 12]]],
+    )
+
+    assert links == [
+        {"referent": "CorefMention_3_4_4", "antecedent": "Antecedent_3_0_0"},
+        {"referent": "ne_bob", "antecedent": "Antecedent_3_6_6"},
+        {"referent": "ne_bob_2", "antecedent": "Antecedent_3_6_6"},
+        {"referent": "CorefMention_3_11_11", "antecedent": "Antecedent_3_6_6"},
+    ]
+    # One span lookup, one reuse, two node merges, two token links, one COREF write.
+    assert len(graph.calls) == 7
+    reused = _coref_rows(graph, "MATCH (ne:NamedEntity {id: row.node_id})")
+    assert [r["node_id"] for r in reused] == ["ne_bob", "ne_bob_2"]
+    assert reused[0]["node_uid"] == make_coref_uid(3, "Bob", 2, "CorefMention")
+    mention_links = _coref_rows(graph, "MATCH (n:CorefMention {id: row.node_id})")
+    assert [r["node_id"] for r in mention_links] == [
+        "CorefMention_3_4_4", "ne_bob", "ne_bob_2", "CorefMention_3_11_11",
+    ]
+    assert all("{id: $node_id}" not in query and "MATCH (n {" not in query for query, _ in graph.calls)
 
 
 def test_entity_processor_syntactic_type_prefers_valid_upstream_meantime_type():
@@ -486,3 +528,20 @@ def test_entity_extractor_uid_fallback_uses_start_index_not_end_boundary():
     boundary_uid = make_ne_uid(9, "Market Watch", 4)
     assert uid_backfill_params["uid"] == expected_uid
     assert uid_backfill_params["uid"] != boundary_uid
+
+
+@pytest.mark.unit
+def test_coreference_resolver_persists_prefetched_clusters_without_calling_service():
+    nlp = spacy.blank("en")
+    doc = nlp("Alice saw Bob. She greeted him.")
+    resolver = CoreferenceResolver.__new__(CoreferenceResolver)
+    resolver.graph = _FakeGraph()
+    resolver.coreference_service_endpoint = "http://coref"
+    resolver.call_coreference_resolution_api = MagicMock(return_value={"clusters": [[[0, 1], [4, 5]]]})
+
+    clusters = resolver.fetch_clusters(doc, 5)
+    links = resolver.resolve_coreference(doc, 5, clusters=clusters)
+
+    assert clusters == [[[0, 1], [4, 5]]]
+    assert resolver.call_coreference_resolution_api.call_count == 1
+    assert links == [{"referent": "CorefMention_5_4_4", "antecedent": "Antecedent_5_0_0"}]
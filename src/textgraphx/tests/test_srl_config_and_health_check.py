@@ -103,7 +103,7 @@ def test_callAllenNlpApi__warns_on_legacy_schema(caplog):
     mock_response.raise_for_status = MagicMock()
     mock_response.text = legacy_body
 
-    with patch("textgraphx.adapters.rest_caller.requests.post", return_value=mock_response):
+    with patch("textgraphx.adapters.rest_caller.requests.Session.post", return_value=mock_response):
         with patch(
             "textgraphx.adapters.rest_caller.get_config"
         ) as mock_cfg:
@@ -135,7 +135,7 @@ def test_callAllenNlpApi__no_warning_for_transformer_srl(caplog):
     mock_response.raise_for_status = MagicMock()
     mock_response.text = modern_body
 
-    with patch("textgraphx.adapters.rest_caller.requests.post", return_value=mock_response):
+    with patch("textgraphx.adapters.rest_caller.requests.Session.post", return_value=mock_response):
         with patch(
             "textgraphx.adapters.rest_caller.get_config"
         ) as mock_cfg:
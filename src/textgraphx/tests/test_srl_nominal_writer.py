@@ -78,6 +78,16 @@ def _make_processor():
     return proc
 
 
+def _rows(proc, marker):
+    """Flatten the UNWIND ``rows`` of every write whose query contains *marker*."""
+    return [
+        row
+        for q, p in proc.graph.calls
+        if marker in q
+        for row in p.get("rows", [])
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -105,7 +115,7 @@ def test_process_nominal_srl__frame_created_with_nombank_framework():
 
     merge_calls = [q for q, _ in proc.graph.calls if "MERGE (f:Frame" in q]
     assert merge_calls, "Expected a Frame MERGE query"
-    frame_params = [p for _, p in proc.graph.calls if "framework" in p]
+    frame_params = [p for p in _rows(proc, "MERGE (f:Frame") if "framework" in p]
     assert frame_params, "Expected params with 'framework'"
     assert frame_params[0]["framework"] == "NOMBANK"
 
@@ -116,7 +126,7 @@ def test_process_nominal_srl__sense_and_sense_conf_persisted():
     doc = _fake_doc("docY")
     proc.process_nominal_srl(doc, [(0, NOMBANK_RESPONSE)])
 
-    frame_params = [p for _, p in proc.graph.calls if "sense" in p and "framework" in p]
+    frame_params = [p for p in _rows(proc, "MERGE (f:Frame") if "sense" in p and "framework" in p]
     assert frame_params, "Expected Frame params containing 'sense'"
     p = frame_params[0]
     assert p["sense"] == "acquisition.01"
@@ -153,12 +163,9 @@ def test_process_nominal_srl__argument_edge_has_normalized_type_and_raw_role():
     }
     proc.process_nominal_srl(doc, [(0, response)])
 
-    participant_calls = [
-        (q, p) for q, p in proc.graph.calls
-        if "MERGE (a)-[r:PARTICIPANT]->(f)" in q
-    ]
-    assert participant_calls, "Expected PARTICIPANT edge writes"
-    _, params = participant_calls[0]
+    participant_rows = _rows(proc, "MERGE (a)-[r:PARTICIPANT]->(f)")
+    assert participant_rows, "Expected PARTICIPANT edge writes"
+    params = participant_rows[0]
     # canonical label: C-ARG0 → ARG0
     assert params["canonical"] == "ARG0"
     # raw label preserved
@@ -204,7 +211,7 @@ def test_process_nominal_srl__sent_offset_applied_correctly():
     # Sentence starts at token 10 in the document
     proc.process_nominal_srl(doc, [(10, response)])
 
-    frame_params = [p for _, p in proc.graph.calls if "framework" in p]
+    frame_params = [p for p in _rows(proc, "MERGE (f:Frame") if "framework" in p]
     assert frame_params
     # head_index = sent_offset(10) + pred_index_in_sent(1) = 11
     assert frame_params[0]["head_index"] == 11
@@ -219,9 +226,39 @@ def test_process_nominal_srl__contract_framework_value_is_nombank():
     proc.process_nominal_srl(doc, [(0, NOMBANK_RESPONSE)])
 
     framework_values = [
-        p["framework"] for _, p in proc.graph.calls if "framework" in p
+        p["framework"] for p in _rows(proc, "MERGE (f:Frame") if "framework" in p
     ]
     assert framework_values, "No framework values written"
     assert all(fw == "NOMBANK" for fw in framework_values), (
         f"Expected all NOMBANK, got: {framework_values}"
     )
+
+
+@pytest.mark.unit
+def test_process_nominal_srl__writes_are_batched_per_document():
+    """One frame, one argument, token-link and PARTICIPANT statement per document."""
+    proc = _make_processor()
+    doc = _fake_doc("docBatch")
+    second = dict(NOMBANK_RESPONSE)
+    proc.process_nominal_srl(doc, [(0, NOMBANK_RESPONSE), (7, second)])
+
+    queries = [q for q, _ in proc.graph.calls]
+    assert sum("MERGE (f:Frame" in q for q in queries) == 1
+    assert sum("MERGE (a:FrameArgument" in q for q in queries) == 1
+    assert sum("MERGE (a)-[r:PARTICIPANT]->(f)" in q for q in queries) == 1
+    assert len(_rows(proc, "MERGE (f:Frame")) == 2
+    assert len(_rows(proc, "MERGE (a:FrameArgument")) == 4
+
+
+@pytest.mark.unit
+def test_process_nominal_srl__token_links_are_label_scoped():
+    proc = _make_processor()
+    doc = _fake_doc("docLinks")
+    proc.process_nominal_srl(doc, [(0, NOMBANK_RESPONSE)])
+
+    link_calls = [(q, p) for q, p in proc.graph.calls if "PARTICIPATES_IN" in q]
+    assert {q.split("MATCH (n:")[1].split(" ")[0] for q, _ in link_calls} == {"Frame", "FrameArgument"}
+    assert all("MATCH (n {" not in q for q, _ in link_calls)
+    assert all(p["doc_id"] == "docLinks" for _, p in link_calls)
+    frame_links = [row for q, p in link_calls if "MATCH (n:Frame " in q for row in p["rows"]]
+    assert frame_links == [{"idx": 1, "node_id": "frame_docLinks_1_1"}]
@@ -0,0 +1,108 @@
+"""Tests for the persistent SRL response store and its LRU front tier."""
+
+import types
+import unittest.mock as mock
+
+import pytest
+
+from textgraphx.adapters import srl_response_store
+from textgraphx.adapters.rest_caller import _LruCache
+from textgraphx.adapters.srl_response_store import (
+    SrlResponseStore,
+    get_srl_response_store,
+    reset_srl_response_store,
+)
+from textgraphx.infrastructure import config as config_module
+
+pytestmark = [pytest.mark.unit]
+
+URL = "http://srl:8010/predict"
+
+
+def test_store_round_trips_and_survives_reopen(tmp_path):
+    path = tmp_path / "srl.sqlite"
+    store = SrlResponseStore(str(path))
+    store.set(URL, "Markets fell.", {"verbs": [{"frame": "fall.01"}]})
+    store.set(URL, "Empty.", {})
+
+    reopened = SrlResponseStore(str(path))
+    assert reopened.get(URL, "Markets fell.") == {"verbs": [{"frame": "fall.01"}]}
+    assert reopened.get(URL, "Empty.") is None
+    assert reopened.get("http://other/predict", "Markets fell.") is None
+    assert reopened.stats() == {"hits": 1, "misses": 2, "writes": 0, "evictions": 0}
+
+
+def test_store_keys_include_model_version(tmp_path):
+    path = str(tmp_path / "srl.sqlite")
+    SrlResponseStore(path, model_version="srl-2.4.6").set(URL, "Prices rose.", {"verbs": []})
+
+    assert SrlResponseStore(path, model_version="srl-2.4.6").get(URL, "Prices rose.") == {"verbs": []}
+    assert SrlResponseStore(path, model_version="srl-2.5.0").get(URL, "Prices rose.") is None
+
+
+def test_store_evicts_least_recently_used_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(srl_response_store, "_EVICTION_CHECK_EVERY", 1)
+    clock = iter(range(100))
+    monkeypatch.setattr(srl_response_store.time, "time", lambda: next(clock))
+    store = SrlResponseStore(str(tmp_path / "srl.sqlite"), max_entries=2)
+
+    store.set(URL, "one", {"n": 1})
+    store.set(URL, "two", {"n": 2})
+    assert store.get(URL, "one") == {"n": 1}
+    store.set(URL, "three", {"n": 3})
+
+    assert store.entries() == 2
+    assert store.get(URL, "two") is None
+    assert store.get(URL, "one") == {"n": 1}
+    assert store.stats()["evictions"] == 1
+
+
+def test_lru_front_tier_falls_through_to_store_and_promotes(tmp_path):
+    store = SrlResponseStore(str(tmp_path / "srl.sqlite"))
+    store.set(URL, "Stocks fell.", {"verbs": ["a"]})
+    cache = _LruCache(maxsize=10, backend_factory=lambda: store)
+
+    assert cache.get(URL, "Stocks fell.") == {"verbs": ["a"]}
+    assert cache.get(URL, "Stocks fell.") == {"verbs": ["a"]}
+    assert cache.get(URL, "Unseen.") is None
+    cache.set(URL, "Bonds rose.", {"verbs": ["b"]})
+
+    assert store.get(URL, "Bonds rose.") == {"verbs": ["b"]}
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["store_hits"], stats["misses"]) == (1, 1, 1)
+
+
+def test_process_store_follows_configuration(tmp_path, monkeypatch):
+    monkeypatch.setenv("TEXTGRAPHX_SRL_CACHE_PATH", str(tmp_path / "cache" / "srl.sqlite"))
+    monkeypatch.setenv("TEXTGRAPHX_SRL_MODEL_VERSION", "v7")
+    config_module._CACHED = None
+    reset_srl_response_store()
+    try:
+        store = get_srl_response_store()
+        assert store is get_srl_response_store()
+        assert store.db_path == tmp_path / "cache" / "srl.sqlite"
+        assert store.model_version == "v7"
+
+        monkeypatch.setenv("TEXTGRAPHX_PERSIST_SRL_CACHE", "false")
+        config_module._CACHED = None
+        reset_srl_response_store()
+        assert get_srl_response_store() is None
+    finally:
+        config_module._CACHED = None
+        reset_srl_response_store()
+
+
+def test_warm_tool_sends_unique_sentences_in_batches(monkeypatch):
+    from textgraphx.adapters import rest_caller
+    from textgraphx.tools import warm_srl_cache
+
+    verbal = mock.Mock(side_effect=lambda batch: [{} for _ in batch])
+    nominal = mock.Mock(side_effect=lambda batch: [{} for _ in batch])
+    monkeypatch.setattr(rest_caller, "callAllenNlpApiBatch", verbal)
+    monkeypatch.setattr(rest_caller, "callNominalSrlApiBatch", nominal)
+
+    sent = warm_srl_cache.warm(["a", "b", "a", "c"], service="verbal", batch_size=2)
+
+    assert sent == 3
+    assert [call.args[0] for call in verbal.call_args_list] == [["a", "b"], ["c"]]
+    nominal.assert_not_called()
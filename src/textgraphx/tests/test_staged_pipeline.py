@@ -0,0 +1,91 @@
+"""Tests for the bounded, order-preserving ingestion pipeline engine."""
+
+import random
+import threading
+import time
+
+import pytest
+
+from textgraphx.pipeline.ingestion.staged_pipeline import Stage, StagedPipeline
+
+
+@pytest.mark.unit
+def test_items_leave_every_stage_in_source_order():
+    written = []
+
+    def _slow_double(item):
+        time.sleep(random.uniform(0, 0.005))
+        return item * 2
+
+    pipeline = StagedPipeline([
+        Stage("remote", _slow_double, workers=4, queue_size=2),
+        Stage("write", written.append, workers=1, queue_size=2),
+    ])
+
+    assert pipeline.run(range(30)) == 30
+    assert written == [i * 2 for i in range(30)]
+
+
+@pytest.mark.unit
+def test_stats_report_queue_depth_and_utilisation():
+    pipeline = StagedPipeline([
+        Stage("remote", lambda item: item, workers=2, queue_size=3),
+        Stage("write", lambda item: time.sleep(0.002), workers=1, queue_size=3),
+    ])
+    pipeline.run(range(10))
+
+    stats = pipeline.stats()
+    assert stats["remote"]["processed"] == 10
+    assert stats["write"]["processed"] == 10
+    assert stats["remote"]["workers"] == 2
+    for stage in stats.values():
+        assert 0 <= stage["max_queue_depth"] <= 3
+        assert stage["queue_depth"] == 0
+        assert 0.0 <= stage["utilization"] <= 1.0
+    assert stats["write"]["utilization"] > 0.0
+
+
+@pytest.mark.unit
+def test_slow_consumer_bounds_items_in_flight():
+    in_flight = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def _source():
+        for i in range(20):
+            with lock:
+                in_flight.append(i)
+                peak[0] = max(peak[0], len(in_flight))
+            yield i
+
+    def _write(item):
+        time.sleep(0.001)
+        with lock:
+            in_flight.remove(item)
+
+    StagedPipeline([
+        Stage("remote", lambda item: item, workers=1, queue_size=1),
+        Stage("write", _write, workers=1, queue_size=1),
+    ]).run(_source())
+
+    # queue + worker per stage, plus the item the source is blocked on.
+    assert peak[0] <= 5
+
+
+@pytest.mark.unit
+def test_stage_failure_stops_the_pipeline_and_is_raised():
+    written = []
+
+    def _write(item):
+        if item == 3:
+            raise RuntimeError("boom")
+        written.append(item)
+
+    pipeline = StagedPipeline([
+        Stage("remote", lambda item: item, workers=2, queue_size=2),
+        Stage("write", _write, workers=1, queue_size=2),
+    ])
+
+    with pytest.raises(RuntimeError, match="boom"):
+        pipeline.run(range(100))
+    assert written == [0, 1, 2]
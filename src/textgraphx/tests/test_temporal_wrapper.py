@@ -131,3 +131,154 @@ def test_temporal_wrapper_normalizes_numeric_document_ids(monkeypatch):
 
     assert result["documents"] == 4
     assert created == [2, 3, 5, 11]
+
+
+@pytest.mark.unit
+def test_temporal_wrapper_concurrent_mode_keeps_per_document_order(monkeypatch):
+    import threading
+
+    from textgraphx.pipeline.runtime.phase_wrappers import TemporalPhaseWrapper
+
+    steps = []
+    instances = []
+    lock = threading.Lock()
+
+    class FakeTemporalPhase:
+        def __init__(self, argv=None):
+            self.graph = MagicMock()
+            instances.append(self)
+
+        def get_annotated_text(self):
+            return [1, 2, 3, 4, 5, 6]
+
+        def _step(self, name, doc_id):
+            with lock:
+                steps.append((doc_id, name, id(self)))
+            if doc_id == 4 and name == "signals":
+                raise ValueError("ttk unavailable")
+
+        def create_DCT_node(self, doc_id):
+            self._step("dct", doc_id)
+
+        def materialize_tevents(self, doc_id):
+            self._step("tevents", doc_id)
+
+        def materialize_signals(self, doc_id):
+            self._step("signals", doc_id)
+
+        def materialize_timexes_fallback(self, doc_id):
+            self._step("timexes", doc_id)
+
+        def materialize_glinks(self, doc_id):
+            self._step("glinks", doc_id)
+
+    fake_module = types.ModuleType("textgraphx.pipeline.temporal.extraction")
+    fake_module.TemporalPhase = FakeTemporalPhase
+    monkeypatch.setitem(sys.modules, "textgraphx.pipeline.temporal.extraction", fake_module)
+    monkeypatch.setattr(TemporalPhaseWrapper, "_temporal_workers", staticmethod(lambda: 3))
+
+    with pytest.raises(RuntimeError, match=r"failed for 1 document\(s\): 4"):
+        TemporalPhaseWrapper().execute()
+
+    # one coordinator instance plus one isolated instance per worker, each closed
+    assert len(instances) == 4
+    workers = instances[1:]
+    for worker in workers:
+        worker.graph.close.assert_called_once()
+    assert {instance for _, _, instance in steps} <= {id(worker) for worker in workers}
+    for doc_id in (1, 2, 3, 5, 6):
+        doc_steps = [(name, instance) for d, name, instance in steps if d == doc_id]
+        assert [name for name, _ in doc_steps] == ["dct", "tevents", "signals", "timexes", "glinks"]
+        assert len({instance for _, instance in doc_steps}) == 1
+    assert [name for d, name, _ in steps if d == 4] == ["dct", "tevents", "signals"]
+
+
+@pytest.mark.unit
+def test_temporal_wrapper_resume_skips_checkpointed_documents(monkeypatch, tmp_path):
+    from textgraphx.orchestration.checkpoint import CheckpointManager
+    from textgraphx.pipeline.runtime.phase_wrappers import TemporalPhaseWrapper
+
+    processed = []
+
+    class FakeTemporalPhase:
+        def __init__(self, argv=None):
+            self.graph = MagicMock()
+
+        def get_annotated_text(self):
+            return [1, 2, 3]
+
+        def create_DCT_node(self, doc_id):
+            if doc_id == 3 and not resumed:
+                raise ValueError("heideltime down")
+            processed.append(doc_id)
+
+        def materialize_tevents(self, doc_id):
+            pass
+
+        def materialize_signals(self, doc_id):
+            pass
+
+        def materialize_timexes_fallback(self, doc_id):
+            pass
+
+        def materialize_glinks(self, doc_id):
+            pass
+
+    fake_module = types.ModuleType("textgraphx.pipeline.temporal.extraction")
+    fake_module.TemporalPhase = FakeTemporalPhase
+    monkeypatch.setitem(sys.modules, "textgraphx.pipeline.temporal.extraction", fake_module)
+    manager = CheckpointManager(base_dir=str(tmp_path / "checkpoints"))
+
+    resumed = False
+    with pytest.raises(RuntimeError, match="failed for 1 document"):
+        TemporalPhaseWrapper(
+            document_checkpoint=manager.document_checkpoint("dataset::d", "temporal")
+        ).execute()
+    assert processed == [1, 2]
+
+    resumed = True
+    result = TemporalPhaseWrapper(
+        document_checkpoint=manager.document_checkpoint("dataset::d", "temporal", resume=True)
+    ).execute()
+    assert processed == [1, 2, 3]
+    assert result["documents"] == 1
+    assert manager.documents.completed("dataset::d", "temporal") == {"1", "2", "3"}
+
+
+@pytest.mark.unit
+def test_temporal_wrapper_clears_tlinked_stamps_of_processed_documents(monkeypatch):
+    from textgraphx.pipeline.runtime.phase_wrappers import TemporalPhaseWrapper
+
+    graph = MagicMock()
+
+    class FakeTemporalPhase:
+        def __init__(self, argv=None):
+            self.graph = graph
+
+        def get_annotated_text(self):
+            return [{"doc_id": "2"}, 3]
+
+        def create_DCT_node(self, doc_id):
+            pass
+
+        def materialize_tevents(self, doc_id):
+            pass
+
+        def materialize_signals(self, doc_id):
+            pass
+
+        def materialize_timexes_fallback(self, doc_id):
+            pass
+
+        def materialize_glinks(self, doc_id):
+            pass
+
+    fake_module = types.ModuleType("textgraphx.pipeline.temporal.extraction")
+    fake_module.TemporalPhase = FakeTemporalPhase
+    monkeypatch.setitem(sys.modules, "textgraphx.pipeline.temporal.extraction", fake_module)
+
+    TemporalPhaseWrapper().execute()
+
+    cleared = [c for c in graph.run.call_args_list if "REMOVE d.tlinked_at" in c.args[0]]
+    assert len(cleared) == 1
+    assert sorted(cleared[0].args[1]["doc_ids"]) == [2, 3]
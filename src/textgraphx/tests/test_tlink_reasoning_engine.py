@@ -0,0 +1,199 @@
+"""Tests for the in-memory per-document TLINK reasoning engine."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from textgraphx.reasoning.temporal.engine import (
+    ALLEN_RELATIONS,
+    DocumentTlinkGraph,
+    SUMMARY_KEYS,
+    TLINK_ALLEN_RELATIONS,
+    TlinkReasoningEngine,
+    allen_composition_table,
+    allen_path_consistent,
+)
+
+pytestmark = [pytest.mark.unit]
+
+
+def _row(rel_id, src, dst, rel, confidence=None, **props):
+    return {
+        "id": rel_id,
+        "src": src,
+        "dst": dst,
+        "props": {"relType": rel, "relTypeCanonical": rel, "confidence": confidence, **props},
+    }
+
+
+def _edges(doc, src, dst):
+    return doc.between(doc.node(src), doc.node(dst))
+
+
+def test_case19_creates_missing_inverse_with_source_provenance():
+    doc = DocumentTlinkGraph.from_rows([_row("r1", "e1", "t1", "IS_INCLUDED", 0.7, source="ttk")])
+
+    assert doc.materialize_case19_inverses() == 1
+
+    (inverse,) = _edges(doc, "t1", "e1")
+    assert inverse.changes["relType"] == "INCLUDES"
+    assert inverse.changes["source"] == "ttk"
+    assert inverse.changes["rule_id"] == "case19_timeml_inverse"
+    assert inverse.changes["confidence"] == 0.7
+
+
+def test_case19_overrides_weaker_reverse_edge_and_skips_derived_edges():
+    doc = DocumentTlinkGraph.from_rows(
+        [
+            _row("r1", "e1", "e2", "BEGINS", 0.9),
+            _row("r2", "e2", "e1", "VAGUE", 0.2, rule_id="case3"),
+            _row("r3", "e3", "e4", "ENDS", 0.9, rule_id="transitive_closure"),
+        ]
+    )
+
+    assert doc.materialize_case19_inverses() == 0
+
+    (reverse,) = _edges(doc, "e2", "e1")
+    assert reverse.changes == {"relType": "BEGUN_BY", "relTypeCanonical": "BEGUN_BY", "confidence": 0.9, "derivedFrom": "BEGINS"}
+    assert _edges(doc, "e4", "e3") == []
+
+
+def test_identity_closure_runs_to_a_fixpoint():
+    rows = [_row(f"r{i}", f"e{i}", f"e{i + 1}", "IDENTITY", 1.0) for i in range(5)]
+    rows.append(_row("r9", "e5", "t1", "BEFORE", 0.5))
+    doc = DocumentTlinkGraph.from_rows(rows)
+
+    created = doc.close_identity()
+
+    befores = [(doc.node_ids[e.src], e.rel) for e in doc.edges if e.dst == doc.node("t1")]
+    assert sorted(src for src, rel in befores if rel == "BEFORE") == ["e0", "e1", "e2", "e3", "e4", "e5"]
+    assert created == len(doc.edges) - len(rows)
+    assert doc.close_identity() == 0
+
+
+def test_identity_closure_respects_round_limit_and_existing_edges():
+    rows = [_row(f"r{i}", f"e{i}", f"e{i + 1}", "IDENTITY", 1.0) for i in range(4)]
+    rows.append(_row("r8", "e4", "t1", "AFTER", 0.6))
+    rows.append(_row("r9", "e3", "t1", "AFTER", 0.1))
+    doc = DocumentTlinkGraph.from_rows(rows)
+
+    doc.close_identity(max_rounds=1)
+
+    assert [e.props["relType"] for e in _edges(doc, "e3", "t1")] == ["AFTER"]
+    assert [e.changes["confidence"] for e in _edges(doc, "e2", "t1")] == [0.55]
+    assert _edges(doc, "e0", "t1") == []
+
+
+def test_inverse_consistency_and_bidirectional_suppression():
+    doc = DocumentTlinkGraph.from_rows(
+        [
+            _row("r1", "e1", "e2", "BEFORE", 0.4),
+            _row("r2", "e2", "e1", "BEFORE", 0.8),
+        ]
+    )
+
+    assert doc.materialize_inverse_consistency() == 2
+    assert doc.suppress_bidirectional_conflicts(shadow_only=True) == 2
+    assert not any(e.suppressed for e in doc.edges)
+
+    assert doc.suppress_bidirectional_conflicts() == 2
+    suppressed = [(doc.node_ids[e.src], e.rel) for e in doc.edges if e.suppressed]
+    assert sorted(suppressed) == [("e1", "BEFORE"), ("e2", "AFTER")]
+    weaker = [e for e in doc.edges if e.element_id == "r1"][0]
+    assert weaker.changes["suppressionReason"] == "bidirectional_same_rel_conflict"
+
+
+def test_contradiction_suppression_breaks_ties_by_element_id():
+    doc = DocumentTlinkGraph.from_rows(
+        [
+            _row("r2", "e1", "t1", "INCLUDES", 0.5),
+            _row("r1", "e1", "t1", "IS_INCLUDED", 0.5),
+        ]
+    )
+
+    assert doc.suppress_contradictions(shadow_only=True) == 1
+    assert not any(e.changes for e in doc.edges)
+
+    assert doc.suppress_contradictions() == 1
+    loser = [e for e in doc.edges if e.suppressed][0]
+    assert loser.element_id == "r2"
+    assert loser.changes["suppressionReason"] == "contradiction:INCLUDES_vs_IS_INCLUDED"
+    assert loser.changes["suppressedAgainstRelType"] == "IS_INCLUDED"
+
+
+def test_allen_composition_table_matches_known_entries():
+    table = allen_composition_table()
+    index = {name: idx for idx, name in enumerate(ALLEN_RELATIONS)}
+
+    def names(mask):
+        return {name for idx, name in enumerate(ALLEN_RELATIONS) if mask & (1 << idx)}
+
+    assert names(table[index["b"]][index["b"]]) == {"b"}
+    assert names(table[index["m"]][index["d"]]) == {"o", "s", "d"}
+    assert names(table[index["o"]][index["o"]]) == {"b", "m", "o"}
+    assert len(names(table[index["b"]][index["bi"]])) == 13
+
+
+def test_allen_path_consistency_detects_cycles():
+    before = TLINK_ALLEN_RELATIONS["BEFORE"]
+    assert allen_path_consistent({(0, 1): before, (1, 2): before, (0, 2): before})
+    assert not allen_path_consistent({(0, 1): before, (1, 2): before, (2, 0): before})
+
+    doc = DocumentTlinkGraph.from_rows(
+        [
+            _row("r1", "e1", "e2", "BEFORE"),
+            _row("r2", "e2", "t1", "IS_INCLUDED"),
+            _row("r3", "t1", "e1", "BEFORE"),
+        ]
+    )
+    assert doc.reason(allen_check=True)["allen_inconsistent"] == 1
+
+
+def test_engine_loads_each_document_once_and_writes_one_delta():
+    graph = MagicMock()
+    rows = [_row("r1", "e1", "t1", "IS_INCLUDED", 0.9), _row("r2", "e1", "e2", "BEFORE", 0.6)]
+    graph.run.side_effect = [
+        MagicMock(data=MagicMock(return_value=rows)),
+        MagicMock(data=MagicMock(return_value=[{"created": 2, "updated": 0}])),
+        MagicMock(data=MagicMock(return_value=[])),
+    ]
+
+    summary = TlinkReasoningEngine(graph).run(["7", "8"])
+
+    assert graph.run.call_count == 3
+    load_query, load_params = graph.run.call_args_list[0][0]
+    assert "$doc_ids" in load_query
+    assert load_params == {"doc_ids": ["7", 7]}
+    write_query, write_params = graph.run.call_args_list[1][0]
+    assert "UNWIND $creates" in write_query and "UNWIND $updates" in write_query
+    assert [row["props"]["relType"] for row in write_params["creates"]] == ["INCLUDES", "AFTER"]
+    assert write_params["updates"] == [
+        {"id": "r1", "props": {"rule_id": "case19_timeml_inverse", "derivedFrom": "INCLUDES"}}
+    ]
+    assert summary["documents"] == 2
+    assert summary["case19_inverses"] == 1
+    assert summary["inverse_created"] == 1
+    assert summary["edges_created"] == 2
+    assert summary["allen_inconsistent_documents"] == []
+
+
+def test_recognizer_delegates_to_engine_for_annotated_documents(monkeypatch):
+    from textgraphx.pipeline.phases import tlinks_recognizer as module
+
+    calls = []
+
+    class _Engine:
+        def __init__(self, graph, shadow_only=False, allen_check=False):
+            calls.append((shadow_only, allen_check))
+
+        def run(self, doc_ids):
+            calls.append(list(doc_ids))
+            return dict(dict.fromkeys(SUMMARY_KEYS, 0), documents=2)
+
+    recognizer = module.TlinksRecognizer.__new__(module.TlinksRecognizer)
+    recognizer.graph = MagicMock()
+    monkeypatch.setattr(module, "TlinkReasoningEngine", _Engine)
+    monkeypatch.setattr(recognizer, "get_annotated_text", lambda: ["d1", "d2"], raising=False)
+
+    assert recognizer.apply_tlink_reasoning(allen_check=True)["documents"] == 2
+    assert calls == [(False, True), ["d1", "d2"]]
@@ -0,0 +1,217 @@
+"""Tests for document-partitioned execution of the TLINK rule cases."""
+
+import re
+import sys
+import types
+from types import SimpleNamespace
+
+import pytest
+
+from textgraphx.pipeline.phases.tlinks_recognizer import TlinksRecognizer
+from textgraphx.pipeline.runtime.phase_wrappers import TlinksRecognizerWrapper, _tlink_case_count
+from textgraphx.reasoning.temporal.engine import SUMMARY_KEYS
+
+CASE_METHODS = [
+    name
+    for name in sorted(vars(TlinksRecognizer))
+    if re.fullmatch(r"create_tlinks_case\d+", name)
+    and name not in ("create_tlinks_case8", "create_tlinks_case13", "create_tlinks_case14")
+]
+
+
+class _RecordingGraph:
+    def __init__(self, rows=None):
+        self.calls = []
+        self._rows = rows if rows is not None else [{"created": 0}]
+
+    def run(self, query, params=None):
+        self.calls.append((query, params))
+        rows = self._rows
+
+        class _Result:
+            def data(self):
+                return rows
+
+        return _Result()
+
+
+def _recognizer(graph):
+    recognizer = TlinksRecognizer.__new__(TlinksRecognizer)
+    recognizer.graph = graph
+    return recognizer
+
+
+@pytest.mark.unit
+def test_unscoped_cases_run_queries_unchanged():
+    graph = _RecordingGraph()
+    _recognizer(graph).create_tlinks_case1()
+
+    query, params = graph.calls[0]
+    assert params is None
+    assert "$doc_ids" not in query
+    assert "RETURN count(DISTINCT tl) AS touched" in query
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("method", CASE_METHODS)
+def test_scoped_case_runs_per_document_batches_and_returns_counts(method):
+    graph = _RecordingGraph()
+    recognizer = _recognizer(graph)
+    recognizer.set_doc_scope([3, 5], docs_per_transaction=4)
+
+    getattr(recognizer, method)()
+
+    assert graph.calls
+    for query, params in graph.calls:
+        assert query.lstrip().startswith("UNWIND $doc_ids AS scope_doc_id")
+        assert "} IN TRANSACTIONS OF 4 ROWS" in query
+        assert re.search(r"RETURN sum\((\w+)\) AS \1\s*$", query)
+        assert "RETURN p" not in query
+        assert params["doc_ids"] == [3, 5]
+
+
+@pytest.mark.unit
+def test_doc_scoped_anchors_case_variable_and_keeps_parameters():
+    recognizer = _recognizer(_RecordingGraph())
+    recognizer.set_doc_scope(["d1"])
+
+    query, params = recognizer._doc_scoped(
+        "MATCH (ann)-->(e) WHERE e.lemma IN $verbs RETURN count(e) AS created", "ann", "doc", {"verbs": ["say"]}
+    )
+
+    assert "MATCH (ann:AnnotatedText) WHERE ann.id = scope_doc_id" in query
+    assert "IN TRANSACTIONS OF 10 ROWS" in query
+    assert query.rstrip().endswith("RETURN sum(created) AS created")
+    assert params == {"verbs": ["say"], "doc_ids": ["d1"]}
+
+    with pytest.raises(ValueError):
+        recognizer._doc_scoped("MATCH (e:TEvent) RETURN e", "e")
+
+
+@pytest.mark.unit
+def test_set_doc_scope_none_restores_whole_graph_execution():
+    graph = _RecordingGraph()
+    recognizer = _recognizer(graph)
+    recognizer.set_doc_scope([1])
+    recognizer.set_doc_scope(None)
+
+    recognizer.create_tlinks_case24()
+
+    assert graph.calls[0][1] is None
+
+
+@pytest.mark.unit
+def test_untlinked_and_mark_documents_tlinked():
+    graph = _RecordingGraph(rows=[{"doc_id": 1}, {"doc_id": 2}])
+    recognizer = _recognizer(graph)
+
+    assert recognizer.untlinked_document_ids() == [1, 2]
+    assert "d.tlinked_at IS NULL" in graph.calls[0][0]
+
+    graph._rows = [{"marked": 2}]
+    assert recognizer.mark_documents_tlinked([1, 2], "2026-01-01T00:00:00Z") == 2
+    assert graph.calls[1][1] == {"doc_ids": [1, 2], "tlinked_at": "2026-01-01T00:00:00Z"}
+
+
+@pytest.mark.unit
+def test_tlink_case_count_sums_rows_and_sub_cases():
+    assert _tlink_case_count([{"created": 2}]) == 2
+    assert _tlink_case_count(([{"created": 1}], [{"created": 4}])) == 5
+    assert _tlink_case_count([]) == 0
+    assert _tlink_case_count(None) == 0
+
+
+@pytest.mark.unit
+def test_scoped_case_failures_are_recorded_until_scope_is_reset():
+    class _FailingGraph(_RecordingGraph):
+        def run(self, query, params=None):
+            raise RuntimeError("transaction failed")
+
+    recognizer = _recognizer(_FailingGraph())
+    recognizer.create_tlinks_case1()
+    assert recognizer.doc_scope_failures() == []
+
+    recognizer.set_doc_scope([1, 2])
+    assert recognizer.create_tlinks_case1() == []
+    assert len(recognizer.doc_scope_failures()) == 1
+
+    recognizer.set_doc_scope(None)
+    assert recognizer.doc_scope_failures() == []
+
+
+class _FakeTlinksRecognizer:
+    failures = []
+    stamped = []
+
+    def __init__(self, argv=None):
+        self.graph = None
+
+    def untlinked_document_ids(self):
+        return [1, 2, 3]
+
+    def set_doc_scope(self, doc_ids, docs_per_transaction=None):
+        self.scope = doc_ids
+
+    def doc_scope_failures(self):
+        return list(self.failures)
+
+    def create_tlinks_e2e(self, doc_id, precision_mode=True):
+        if doc_id == 2:
+            raise RuntimeError("bad TTK XML")
+
+    def create_tlinks_e2t(self, doc_id, precision_mode=True):
+        return []
+
+    def apply_tlink_reasoning(self, shadow_only=False, allen_check=False, doc_ids=None):
+        return dict(dict.fromkeys(SUMMARY_KEYS, 0), documents=0, allen_inconsistent_documents=[])
+
+    def mark_documents_tlinked(self, doc_ids, tlinked_at):
+        type(self).stamped.append(list(doc_ids))
+        return len(doc_ids)
+
+    def __getattr__(self, name):
+        if name.startswith("create_tlinks_case") or name == "normalize_tlink_reltypes":
+            return lambda: []
+        if name == "enforce_tlink_anchor_consistency":
+            return lambda shadow_only=False: []
+        if name == "endpoint_contract_violations":
+            return lambda: 0
+        raise AttributeError(name)
+
+
+def _run_tlinks_wrapper(monkeypatch, failures):
+    from textgraphx.infrastructure import config as config_module
+
+    runtime = SimpleNamespace(
+        incremental_tlinks=True,
+        tlink_docs_per_transaction=5,
+        enable_tlink_xml_seed=True,
+        tlink_shadow_mode=False,
+        tlink_reasoning_engine="memory",
+        tlink_allen_check=False,
+    )
+    monkeypatch.setattr(config_module, "get_config", lambda: SimpleNamespace(runtime=runtime))
+    module = types.ModuleType("textgraphx.TlinksRecognizer")
+    module.TlinksRecognizer = type("TlinksRecognizer", (_FakeTlinksRecognizer,), {"failures": failures, "stamped": []})
+    monkeypatch.setitem(sys.modules, "textgraphx.TlinksRecognizer", module)
+
+    result = TlinksRecognizerWrapper().execute()
+    return result, module.TlinksRecognizer.stamped
+
+
+@pytest.mark.unit
+def test_wrapper_stamps_only_documents_whose_cases_succeeded(monkeypatch):
+    result, stamped = _run_tlinks_wrapper(monkeypatch, failures=[])
+
+    assert stamped == [[1, 3]]
+    assert result["documents_tlinked"] == 2
+    assert result["case_failures"] == 0
+
+
+@pytest.mark.unit
+def test_wrapper_leaves_scope_unstamped_when_a_case_query_failed(monkeypatch):
+    result, stamped = _run_tlinks_wrapper(monkeypatch, failures=["MATCH ..."])
+
+    assert stamped == []
+    assert result["documents_tlinked"] == 0
+    assert result["case_failures"] == 1
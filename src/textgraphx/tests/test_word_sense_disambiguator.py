@@ -0,0 +1,106 @@
+"""Tests for batched AMuSE-WSD calls and bulk token sense writes."""
+
+import threading
+
+import pytest
+
+from textgraphx.text_processing_components.WordSenseDisambiguator import WordSenseDisambiguator
+
+
+class _RecordingExecutor:
+    def __init__(self, sentences):
+        self.sentences = sentences
+        self.queries = []
+
+    def execute_query(self, query, params):
+        self.queries.append((query, params))
+        if "RETURN s.id AS sentence_id" in query:
+            return self.sentences
+        return []
+
+
+def _sentences(count):
+    return [
+        {
+            "sentence_id": f"1_{i}",
+            "text": f"sentence {i}",
+            "tokens": [{"index": 0, "id": f"1_{i}_0"}, {"index": 1, "id": f"1_{i}_9"}],
+        }
+        for i in range(count)
+    ]
+
+
+def _sense(index, synset):
+    return {"index": index, "bnSynsetId": synset, "wnSynsetOffset": f"{synset}n", "nltkSynset": f"{synset}.n.01"}
+
+
+@pytest.mark.unit
+def test_perform_wsd__chunks_requests_and_writes_one_unwind():
+    executor = _RecordingExecutor(_sentences(5))
+    wsd = WordSenseDisambiguator("http://wsd", executor, batch_size=2, max_workers=3)
+    calls = []
+    threads = set()
+    lock = threading.Lock()
+
+    def fake_api(texts):
+        with lock:
+            calls.append(list(texts))
+            threads.add(threading.get_ident())
+        return [{"tokens": [_sense(1, text.split()[-1])]} for text in texts]
+
+    wsd._call_amuse_wsd_api = fake_api
+    wsd.perform_wsd("1")
+
+    assert sorted(len(chunk) for chunk in calls) == [1, 2, 2]
+    writes = [params for query, params in executor.queries if "UNWIND $rows" in query]
+    assert len(writes) == 1
+    rows = writes[0]["rows"]
+    assert [row["id"] for row in rows] == [f"1_{i}_9" for i in range(5)]
+    assert rows[3] == {"id": "1_3_9", "bnSynsetId": "3", "wnSynsetOffset": "3n", "nltkSynset": "3.n.01"}
+
+
+@pytest.mark.unit
+def test_perform_wsd__skips_failed_chunks_and_unknown_tokens():
+    executor = _RecordingExecutor(_sentences(4))
+    wsd = WordSenseDisambiguator("http://wsd", executor, batch_size=2, max_workers=1)
+
+    def fake_api(texts):
+        if texts[0] == "sentence 0":
+            return None
+        return [{"tokens": [_sense(0, "a"), _sense(7, "missing")]} for _ in texts]
+
+    wsd._call_amuse_wsd_api = fake_api
+    wsd.perform_wsd("1")
+
+    rows = [params for query, params in executor.queries if "UNWIND $rows" in query][0]["rows"]
+    assert [row["id"] for row in rows] == ["1_2_0", "1_3_0"]
+
+
+@pytest.mark.unit
+def test_perform_wsd__no_write_when_service_returns_nothing():
+    executor = _RecordingExecutor(_sentences(2))
+    wsd = WordSenseDisambiguator("http://wsd", executor, batch_size=8)
+    wsd._call_amuse_wsd_api = lambda texts: None
+
+    wsd.perform_wsd("1")
+
+    assert len(executor.queries) == 1
+
+
+@pytest.mark.unit
+def test_perform_wsd__uses_prefetched_senses_without_calling_the_api():
+    executor = _RecordingExecutor(_sentences(3))
+    wsd = WordSenseDisambiguator("http://wsd", executor, batch_size=2)
+    wsd._call_amuse_wsd_api = lambda texts: [{"tokens": [_sense(0, text.split()[-1])]} for text in texts]
+
+    senses = wsd.fetch_senses([("1_0", "sentence 0"), ("1_2", "sentence 2")])
+
+    def fail(texts):
+        raise AssertionError("API must not be called again")
+
+    wsd._call_amuse_wsd_api = fail
+    wsd.perform_wsd("1", senses=senses)
+
+    assert sorted(senses) == ["1_0", "1_2"]
+    rows = [params for query, params in executor.queries if "UNWIND $rows" in query][0]["rows"]
+    assert [row["id"] for row in rows] == ["1_0_0", "1_2_0"]
@@ -0,0 +1,69 @@
+"""Tests for the synset-keyed WordNet feature cache."""
+
+import pytest
+
+from textgraphx.adapters.wordnet_feature_cache import WordNetFeatureCache, build_feature_table
+
+
+class _Synset:
+    def __init__(self, name):
+        self._name = name
+
+    def name(self):
+        return self._name
+
+
+@pytest.mark.unit
+def test_memory_tier_computes_each_synset_once():
+    cache = WordNetFeatureCache()
+    calls = []
+
+    def _compute():
+        calls.append(1)
+        return {"wnLexname": "noun.act"}
+
+    assert cache.get_or_compute("act.n.01", _compute) == {"wnLexname": "noun.act"}
+    assert cache.get_or_compute("act.n.01", _compute) == {"wnLexname": "noun.act"}
+    assert len(calls) == 1
+    assert cache.stats() == {"entries": 1, "memory_hits": 1, "table_hits": 0, "misses": 1}
+
+
+@pytest.mark.unit
+def test_memory_tier_evicts_least_recently_used():
+    cache = WordNetFeatureCache(maxsize=2)
+    cache.get_or_compute("a.n.01", lambda: {"v": 1})
+    cache.get_or_compute("b.n.01", lambda: {"v": 2})
+    cache.get_or_compute("a.n.01", lambda: {"v": 0})
+    cache.get_or_compute("c.n.01", lambda: {"v": 3})
+
+    assert cache.get_or_compute("a.n.01", lambda: {"v": -1}) == {"v": 1}
+    assert cache.get_or_compute("b.n.01", lambda: {"v": 20}) == {"v": 20}
+
+
+@pytest.mark.unit
+def test_precomputed_table_is_read_before_computing(tmp_path):
+    table = tmp_path / "features.db"
+    written = build_feature_table(
+        str(table),
+        [_Synset("dog.n.01"), _Synset("run.v.01")],
+        lambda synset: {"hypernyms": [synset.name() + "-parent"]},
+        batch_size=1,
+    )
+    cache = WordNetFeatureCache(table_path=str(table))
+
+    def _fail():
+        raise AssertionError("table hit must not compute")
+
+    assert written == 2
+    assert cache.get_or_compute("run.v.01", _fail) == {"hypernyms": ["run.v.01-parent"]}
+    assert cache.get_or_compute("cat.n.01", lambda: {"hypernyms": []}) == {"hypernyms": []}
+    assert cache.stats()["table_hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.unit
+def test_missing_table_falls_back_to_computing(tmp_path):
+    cache = WordNetFeatureCache(table_path=str(tmp_path / "absent.db"))
+
+    assert cache.table_path is None
+    assert cache.get_or_compute("dog.n.01", lambda: {"x": 1}) == {"x": 1}
@@ -116,3 +116,83 @@ def test_depth_features_handles_zero_depth_safely():
     assert depth_min == 0
     assert depth_max == 0
     assert abstraction == 0.0
+
+
+class _FakeFullSynset(_FakeSynset):
+    def __init__(self, name, pos, hypernyms=None, lexname="noun.act", offset=42, **kwargs):
+        super().__init__(name, pos, **kwargs)
+        self._hypernyms = hypernyms or []
+        self._lexname = lexname
+        self._offset = offset
+
+    def hypernyms(self):
+        return self._hypernyms
+
+    def lexname(self):
+        return self._lexname
+
+    def offset(self):
+        return self._offset
+
+
+class _NamedLemma(_FakeLemma):
+    def __init__(self, name, related):
+        super().__init__(related)
+        self._name = name
+
+    def name(self):
+        return self._name
+
+
+class _RecordingExecutor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def execute_query(self, query, params):
+        self.calls.append((query, params))
+        return self.rows if len(self.calls) == 1 else []
+
+
+def test_all_hypernyms_keep_path_order_through_shared_ancestors():
+    entity = _FakeFullSynset("entity.n.01", "n")
+    group = _FakeFullSynset("group.n.01", "n", hypernyms=[entity])
+    act = _FakeFullSynset("act.n.02", "n", hypernyms=[entity])
+    source = _FakeFullSynset("institution.n.01", "n", hypernyms=[group, act])
+
+    hypernyms = _make_enricher().get_all_hypernyms(source)
+
+    assert hypernyms == ["group.n.01", "entity.n.01", "act.n.02", "entity.n.01"]
+
+
+def test_assign_synset_info_writes_one_update_per_synset_and_lemma():
+    from textgraphx.adapters.wordnet_feature_cache import WordNetFeatureCache
+
+    verb_rel = _FakeRelatedLemma("decide", _FakeSynset("decide.v.01", "v"))
+    synset = _FakeFullSynset("decision.n.01", "n", lemmas=[_NamedLemma("decision", [verb_rel])])
+    executor = _RecordingExecutor(
+        [
+            {"token_id": "t1", "token_lemma": "decision", "nltkSynset": "decision.n.01"},
+            {"token_id": "t2", "token_lemma": "decision", "nltkSynset": "decision.n.01"},
+            {"token_id": "t3", "token_lemma": "decider", "nltkSynset": "decision.n.01"},
+            {"token_id": "t4", "token_lemma": "the", "nltkSynset": "O"},
+        ]
+    )
+    cache = WordNetFeatureCache()
+    enricher = WordnetTokenEnricher(neo4j_executor=executor, feature_cache=cache)
+    computed = []
+
+    def _compute():
+        computed.append(1)
+        return enricher.compute_synset_features(synset)
+
+    cache.get_or_compute("decision.n.01", _compute)
+    enricher.assign_synset_info_to_tokens("doc-1")
+
+    updates = [params for _, params in executor.calls[1:]]
+    assert [u["token_ids"] for u in updates] == [["t1", "t2"], ["t3"]]
+    assert updates[0]["wnLexname"] == "noun.act"
+    assert updates[0]["wn31SynsetOffset"] == "42n"
+    assert updates[0]["wnDerivationalEventiveVerbs"] == ["decide.v.01"]
+    assert computed == [1]
+    assert cache.stats()["memory_hits"] == 2
@@ -10,6 +10,7 @@ deterministic ids for nodes so other phases can reference them consistently.
 """
 
 import requests
+from textgraphx.adapters.service_client import get_service_client
 from textgraphx.database.client import make_graph_from_config
 from textgraphx.infrastructure.config import get_config
 from textgraphx.utils.id_utils import make_coref_uid
@@ -31,6 +32,55 @@ class CoreferenceResolver:
         persist the returned clusters as nodes and COREF relations.
     """
 
+    # Batched writers used by resolve_coreference: one NamedEntity span lookup
+    # per document, then a fixed number of label-scoped UNWIND statements.
+    _NAMED_ENTITY_SPANS_QUERY = """
+    MATCH (:AnnotatedText {id: $doc_id})-[:CONTAINS_SENTENCE]->(:Sentence)-[:HAS_TOKEN]->(:TagOccurrence)-[:IN_MENTION]->(ne:NamedEntity)
+    WITH DISTINCT ne
+    RETURN coalesce(ne.start_tok, ne.token_start, ne.index) AS start,
+           coalesce(ne.end_tok, ne.token_end, ne.end_index) AS end,
+           ne.id AS node_id
+    ORDER BY ne.uid, ne.id
+    """
+
+    _REUSE_NAMED_ENTITIES_QUERY = """
+    UNWIND $rows AS row
+    MATCH (ne:NamedEntity {id: row.node_id})
+    SET ne:CorefMention,
+        ne:Mention,
+        ne.uid = coalesce(ne.uid, row.node_uid),
+        ne.text = coalesce(ne.text, ne.value, row.text),
+        ne.start_tok = coalesce(ne.start_tok, row.start),
+        ne.end_tok = coalesce(ne.end_tok, row.end),
+        ne.startIndex = coalesce(ne.startIndex, row.start),
+        ne.endIndex = coalesce(ne.endIndex, row.end)
+    """
+
+    _MERGE_NODES_QUERY = """
+    UNWIND $rows AS row
+    MERGE (n:%s {id: row.node_id})
+    SET n.text = row.text,
+        n.uid = row.node_uid,
+        n.start_tok = row.start, n.end_tok = row.end,
+        n.startIndex = row.start, n.endIndex = row.end
+    """
+
+    _LINK_TOKENS_QUERY = """
+    UNWIND $rows AS row
+    MATCH (n:%s {id: row.node_id})
+    UNWIND row.indices AS idx
+    MATCH (x:TagOccurrence {tok_index_doc: idx})-[:HAS_TOKEN]-()-[:CONTAINS_SENTENCE]-(:AnnotatedText {id: $doc_id})
+    MERGE (x)-[:PARTICIPATES_IN]->(n)
+    MERGE (x)-[:IN_MENTION]->(n)
+    """
+
+    _LINK_COREF_QUERY = """
+    UNWIND $rows AS row
+    MATCH (a:CorefMention {id: row.mention_id})
+    MATCH (b:Antecedent {id: row.antecedent_id})
+    MERGE (a)-[:COREF]->(b)
+    """
+
     def __init__(self, coreference_service_endpoint):
         """Initialize resolver and create a bolt-driver backed graph wrapper.
 
@@ -176,7 +226,7 @@ class CoreferenceResolver:
         logger.debug("create_node: created/merged %s for doc=%s span=%s-%s", node_id, doc_id, start_index, end_index)
         return node_id
 
-    def connect_node_to_tag_occurrences(self, node_id, index_range, doc_id):
+    def connect_node_to_tag_occurrences(self, node_id, index_range, doc_id, node_label=None):
         """Link TagOccurrence nodes (tokens) to a previously created node.
 
         This method issues a single UNWIND Cypher query that matches TagOccurrence
@@ -187,17 +237,89 @@ class CoreferenceResolver:
             node_id: The string id of the previously created node.
             index_range: Iterable of integer token indices (tok_index_doc values).
             doc_id: Document identifier used to scope the matching AnnotatedText.
+            node_label: Label of the node; derived from `node_id` when omitted
+                (re-used NamedEntity nodes carry the CorefMention label).
         """
-        query = """
-        UNWIND $indices as idx
-        MATCH (x:TagOccurrence {tok_index_doc: idx})-[:HAS_TOKEN]-()-[:CONTAINS_SENTENCE]-(:AnnotatedText {id: $doc_id})
-        MATCH (n {id: $node_id})
-        MERGE (x)-[:PARTICIPATES_IN]->(n)
-        MERGE (x)-[:IN_MENTION]->(n)
+        indices = list(index_range)
+        label = node_label or ("Antecedent" if str(node_id).startswith("Antecedent_") else "CorefMention")
+        params = {"rows": [{"node_id": node_id, "indices": indices}], "doc_id": doc_id}
+        logger.debug("connect_node_to_tag_occurrences: linking %d indices to node %s in doc %s", len(indices), node_id, doc_id)
+        self.graph.run(self._LINK_TOKENS_QUERY % label, params)
+
+    def _named_entity_spans(self, doc_id):
+        """Return ``{(start, end): NamedEntity id}`` for every NamedEntity of the document.
+
+        The first id in ``(uid, id)`` order wins, as in :meth:`_find_named_entity_by_span`.
         """
-        params = {"indices": list(index_range), "doc_id": doc_id, "node_id": node_id}
-        logger.debug("connect_node_to_tag_occurrences: linking %d indices to node %s in doc %s", len(list(index_range)), node_id, doc_id)
-        self.graph.run(query, params)
+        spans = {}
+        for row in self.graph.run(self._NAMED_ENTITY_SPANS_QUERY, {"doc_id": doc_id}).data():
+            if row.get("start") is None or row.get("end") is None:
+                continue
+            spans.setdefault((int(row["start"]), int(row["end"])), row.get("node_id"))
+        return spans
+
+    def _write_clusters(self, doc, doc_id, clusters):
+        """Persist parsed ``[(antecedent_span, [mention_span, ...]), ...]`` in a few statements.
+
+        Returns the COREF links as produced by :meth:`resolve_coreference`.
+        """
+        has_mentions = any(mentions for _, mentions in clusters)
+        named_entity_spans = self._named_entity_spans(doc_id) if has_mentions else {}
+
+        nodes = {"Antecedent": {}, "CorefMention": {}}
+        reused = {}
+        token_rows = {"Antecedent": {}, "CorefMention": {}}
+        coref_rows = []
+        coref = []
+
+        def _row(node_id, node_type, start, end):
+            text = doc[start:end + 1].text
+            return {
+                "node_id": node_id,
+                "node_uid": make_coref_uid(doc_id, text, start, node_type),
+                "text": text,
+                "start": start,
+                "end": end,
+            }
+
+        for (ant_start, ant_end), mentions in clusters:
+            antecedent_node_id = f"Antecedent_{doc_id}_{ant_start}_{ant_end}"
+            nodes["Antecedent"][antecedent_node_id] = _row(antecedent_node_id, "Antecedent", ant_start, ant_end)
+            token_rows["Antecedent"][antecedent_node_id] = list(range(ant_start, ant_end + 1))
+
+            for start, end in mentions:
+                existing = named_entity_spans.get((start, end))
+                if existing is not None:
+                    mention_node_id = existing
+                    reused[existing] = _row(existing, "CorefMention", start, end)
+                else:
+                    mention_node_id = f"CorefMention_{doc_id}_{start}_{end}"
+                    nodes["CorefMention"][mention_node_id] = _row(mention_node_id, "CorefMention", start, end)
+                token_rows["CorefMention"][mention_node_id] = list(range(start, end + 1))
+                coref_rows.append({"mention_id": mention_node_id, "antecedent_id": antecedent_node_id})
+                coref.append({"referent": mention_node_id, "antecedent": antecedent_node_id})
+
+        if reused:
+            self.graph.run(self._REUSE_NAMED_ENTITIES_QUERY, {"rows": list(reused.values())})
+        for label, rows in nodes.items():
+            if rows:
+                self.graph.run(self._MERGE_NODES_QUERY % label, {"rows": list(rows.values())})
+        for label, rows in token_rows.items():
+            if rows:
+                self.graph.run(
+                    self._LINK_TOKENS_QUERY % label,
+                    {
+                        "rows": [{"node_id": node_id, "indices": indices} for node_id, indices in rows.items()],
+                        "doc_id": doc_id,
+                    },
+                )
+        if coref_rows:
+            self.graph.run(self._LINK_COREF_QUERY, {"rows": coref_rows})
+        logger.debug(
+            "resolve_coreference: wrote %d antecedent(s), %d mention node(s), %d re-used NamedEntity(s), %d COREF link(s) for doc=%s",
+            len(nodes["Antecedent"]), len(nodes["CorefMention"]), len(reused), len(coref_rows), doc_id,
+        )
+        return coref
 
     def _service_span_to_inclusive_bounds(self, span_token_indexes, doc_length):
         """Normalize a service span to inclusive token boundaries.
@@ -228,7 +350,40 @@ class CoreferenceResolver:
 
         return start, end
 
-    def resolve_coreference(self, doc, text_id):
+    def fetch_clusters(self, doc, text_id):
+        """Return the raw coreference clusters of *doc* without touching the graph.
+
+        Clusters come from the external service when an endpoint is configured,
+        otherwise from spaCy's coref annotations. ``None`` means the external
+        service returned nothing.
+        """
+        endpoint = (self.coreference_service_endpoint or "").strip()
+        if endpoint:
+            result = self.call_coreference_resolution_api(endpoint, doc.text)
+            if result is None:
+                logger.warning("resolve_coreference: external coref returned no result for text_id=%s", text_id)
+                return None
+            return result.get("clusters", [])
+
+        spacy_clusters = self._extract_spacy_coref_clusters(doc)
+        if not spacy_clusters:
+            logger.info(
+                "resolve_coreference: external coref disabled and no spaCy coref clusters found for text_id=%s",
+                text_id,
+            )
+            return []
+        raw_clusters = [
+            [[start, end + 1] for start, end in cluster]
+            for cluster in spacy_clusters
+        ]
+        logger.info(
+            "resolve_coreference: using %d spaCy coref clusters for text_id=%s",
+            len(raw_clusters),
+            text_id,
+        )
+        return raw_clusters
+
+    def resolve_coreference(self, doc, text_id, clusters=None):
         """Resolve coreference clusters and persist nodes/relations in the graph.
 
         The method expects the external coreference service to return a JSON
@@ -245,6 +400,7 @@ class CoreferenceResolver:
         Args:
             doc: spaCy Doc object (tokens accessible by index).
             text_id: AnnotatedText document id used to scope graph matches.
+            clusters: Optional clusters already returned by :meth:`fetch_clusters`.
 
         Returns:
             A list of dicts describing created coreference links: each dict has
@@ -252,38 +408,17 @@ class CoreferenceResolver:
         """
         logger.info("resolve_coreference: resolving coref for text_id=%s", text_id)
 
-        endpoint = (self.coreference_service_endpoint or "").strip()
-        if endpoint:
-            result = self.call_coreference_resolution_api(endpoint, doc.text)
-            if result is None:
-                logger.warning("resolve_coreference: external coref returned no result for text_id=%s", text_id)
-                return []
-            raw_clusters = result.get("clusters", [])
-        else:
-            spacy_clusters = self._extract_spacy_coref_clusters(doc)
-            if not spacy_clusters:
-                logger.info(
-                    "resolve_coreference: external coref disabled and no spaCy coref clusters found for text_id=%s",
-                    text_id,
-                )
-                return []
-            raw_clusters = [
-                [[start, end + 1] for start, end in cluster]
-                for cluster in spacy_clusters
-            ]
-            logger.info(
-                "resolve_coreference: using %d spaCy coref clusters for text_id=%s",
-                len(raw_clusters),
-                text_id,
-            )
+        raw_clusters = self.fetch_clusters(doc, text_id) if clusters is None else clusters
+        if not raw_clusters:
+            return []
 
-        coref = []
+        parsed = []
         for cluster in raw_clusters:
             if not cluster:
                 continue
             antecedent = cluster[0]
             try:
-                ant_start, ant_end = self._service_span_to_inclusive_bounds(antecedent, len(doc))
+                ant_bounds = self._service_span_to_inclusive_bounds(antecedent, len(doc))
             except ValueError:
                 logger.warning(
                     "resolve_coreference: skipping invalid antecedent span %r for text_id=%s",
@@ -291,32 +426,22 @@ class CoreferenceResolver:
                     text_id,
                 )
                 continue
-            antecedent_node_id = self.create_node("Antecedent", doc[ant_start:ant_end+1].text, ant_start, ant_end, text_id)
-            self.connect_node_to_tag_occurrences(antecedent_node_id, range(ant_start, ant_end + 1), text_id)
-            logger.debug("Created antecedent %s for cluster size=%d", antecedent_node_id, len(cluster))
 
+            mentions = []
             for span_token_indexes in cluster[1:]:
                 try:
-                    start, end = self._service_span_to_inclusive_bounds(span_token_indexes, len(doc))
+                    mentions.append(self._service_span_to_inclusive_bounds(span_token_indexes, len(doc)))
                 except ValueError:
                     logger.warning(
                         "resolve_coreference: skipping invalid mention span %r for text_id=%s",
                         span_token_indexes,
                         text_id,
                     )
-                    continue
-                mention_node_id = self.create_node("CorefMention", doc[start:end+1].text, start, end, text_id)
-                self.connect_node_to_tag_occurrences(mention_node_id, range(start, end + 1), text_id)
-                # create COREF relation
-                q = """
-                MATCH (a {id: $mention_id}), (b {id: $ante_id})
-                MERGE (a)-[:COREF]->(b)
-                """
-                self.graph.run(q, {"mention_id": mention_node_id, "ante_id": antecedent_node_id})
-                coref.append({"referent": mention_node_id, "antecedent": antecedent_node_id})
-                logger.debug("Created mention %s for antecedent %s", mention_node_id, antecedent_node_id)
+            parsed.append((ant_bounds, mentions))
 
-        return coref
+        if not parsed:
+            return []
+        return self._write_clusters(doc, text_id, parsed)
 
     def call_coreference_resolution_api(self, coreference_service_endpoint, text):
         """
@@ -341,16 +466,13 @@ class CoreferenceResolver:
 
         try:
             # Send a POST request to the API
-            response = requests.post(
+            response = get_service_client("coref").post(
                 url,
                 headers=headers,
                 json=payload,
                 timeout=self._service_timeout_seconds(),
             )
 
-            # Check if the request was successful
-            response.raise_for_status()
-
             # Return the JSON response
             return response.json()
 
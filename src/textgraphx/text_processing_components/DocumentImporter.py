@@ -50,6 +50,8 @@ class MeantimeXMLImporter(DocumentImporter):
         UNWIND [item in nafHeader._children where item._type = "public"] AS public
         WITH  fileDesc.author as author, fileDesc.creationtime as creationtime, fileDesc.filename as filename, fileDesc.filetype as filetype, fileDesc.title as title, public.publicId as publicId, public.uri as uri, raw._text as text
         MERGE (at:AnnotatedText {id: $id}) set at.author = author, at.creationtime = creationtime, at.filename = filename, at.filetype = filetype, at.title = title, at.publicId = publicId, at.uri = uri, at.text = $text
+        REMOVE at.refined_at, at.tlinked_at
+        RETURN at.id AS id
         """
 
     def get_params(self):
@@ -0,0 +1,136 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentTokenWriter:
+    """Write a document's sentence/token layer in one explicit transaction.
+
+    Builds every ``Sentence``, ``TagOccurrence``, ``HAS_TOKEN``, ``HAS_NEXT``,
+    ``HAS_LEMMA`` and ``IS_DEPENDENT`` payload for a spaCy ``Doc`` in Python and
+    commits them through ``Neo4jRepository.execute_write_transaction`` as a
+    bounded number of ``UNWIND`` batches. A failing batch rolls the whole
+    document back, so a document is either fully tokenized in the graph or not
+    at all.
+
+    Ids and properties match the per-sentence path
+    (``SentenceCreator`` + ``TagOccurrenceQueryExecutor`` +
+    ``TagOccurrenceDependencyProcessor``): sentences are ``<text_id>_<i>`` and
+    tokens ``<text_id>_<i>_<char offset>``.
+    """
+
+    SENTENCE_QUERY = """
+        MATCH (ann:AnnotatedText {id: $ann_id})
+        UNWIND $rows AS row
+        MERGE (sentence:Sentence {id: row.id})
+        SET sentence.text = row.text
+        MERGE (ann)-[:CONTAINS_SENTENCE]->(sentence)
+    """
+
+    TOKEN_QUERY = """
+        UNWIND $rows AS row
+        MATCH (sentence:Sentence {id: row.sentence_id})
+        MERGE (tagOccurrence:TagOccurrence {id: row.token.id})
+        SET tagOccurrence = row.token
+        MERGE (sentence)-[:HAS_TOKEN]->(tagOccurrence)
+    """
+
+    NEXT_QUERY = """
+        UNWIND $rows AS row
+        MATCH (tagOccurrence1:TagOccurrence {id: row.source})
+        MATCH (tagOccurrence2:TagOccurrence {id: row.destination})
+        MERGE (tagOccurrence1)-[:HAS_NEXT {sentence: row.sentence_id}]->(tagOccurrence2)
+    """
+
+    LEMMA_QUERY = """
+        UNWIND $rows AS row
+        MATCH (tagOccurrence:TagOccurrence {id: row.id})
+        MERGE (tag:Tag {id: row.lemma})
+        MERGE (tag)<-[:HAS_LEMMA]-(tagOccurrence)
+    """
+
+    DEPENDENCY_QUERY = """
+        UNWIND $rows AS dependency
+        MATCH (source:TagOccurrence {id: dependency.source})
+        MATCH (destination:TagOccurrence {id: dependency.destination})
+        MERGE (source)-[:IS_DEPENDENT {type: dependency.type}]->(destination)
+    """
+
+    def __init__(self, neo4j_repository, tag_occurrence_creator, tag_occurrence_dependency_processor,
+                 batch_size=None):
+        self.neo4j_repository = neo4j_repository
+        self.tag_occurrence_creator = tag_occurrence_creator
+        self.tag_occurrence_dependency_processor = tag_occurrence_dependency_processor
+        self.batch_size = batch_size
+
+    def _batch_size(self):
+        if self.batch_size:
+            return max(1, int(self.batch_size))
+        try:
+            from textgraphx.infrastructure.config import get_config
+
+            return max(1, int(get_config().ingestion.write_batch_size))
+        except Exception:
+            return 1000
+
+    def build_payload(self, doc, text_id, store_tag=False):
+        """Return the row lists for every sentence/token write of *doc*."""
+        payload = {"sentences": [], "tokens": [], "next": [], "lemmas": [], "dependencies": []}
+        for i, sentence in enumerate(doc.sents):
+            sentence_id = str(text_id) + "_" + str(i)
+            payload["sentences"].append({"id": sentence_id, "text": sentence.text})
+
+            tag_occurrences = self.tag_occurrence_creator.create_tag_occurrences(sentence, text_id, i)
+            for tag_occurrence in tag_occurrences:
+                payload["tokens"].append({"sentence_id": sentence_id, "token": tag_occurrence})
+                if store_tag and not tag_occurrence["is_stop"]:
+                    payload["lemmas"].append({"id": tag_occurrence["id"], "lemma": tag_occurrence["lemma"]})
+            for current, following in zip(tag_occurrences, tag_occurrences[1:]):
+                payload["next"].append(
+                    {"source": current["id"], "destination": following["id"], "sentence_id": sentence_id}
+                )
+
+            payload["dependencies"].extend(
+                self.tag_occurrence_dependency_processor.create_tag_occurrence_dependencies(sentence, text_id, i)
+            )
+        return payload
+
+    def iter_statements(self, annotated_text, payload):
+        """Yield ``(query, params)`` pairs for *payload*, nodes before edges."""
+        batch_size = self._batch_size()
+        plan = (
+            (self.SENTENCE_QUERY, payload["sentences"], {"ann_id": annotated_text}),
+            (self.TOKEN_QUERY, payload["tokens"], {}),
+            (self.NEXT_QUERY, payload["next"], {}),
+            (self.LEMMA_QUERY, payload["lemmas"], {}),
+            (self.DEPENDENCY_QUERY, payload["dependencies"], {}),
+        )
+        for query, rows, extra in plan:
+            for offset in range(0, len(rows), batch_size):
+                params = dict(extra)
+                params["rows"] = rows[offset:offset + batch_size]
+                yield query, params
+
+    def write_document(self, annotated_text, doc, text_id, store_tag=False):
+        """Build and commit the sentence/token layer of *doc*.
+
+        Returns:
+            The payload dict that was written (row lists keyed by kind).
+
+        Raises:
+            Any driver error from the transaction, after it has been rolled
+            back.
+        """
+        payload = self.build_payload(doc, text_id, store_tag=store_tag)
+        statements = list(self.iter_statements(annotated_text, payload))
+        try:
+            self.neo4j_repository.execute_write_transaction(statements)
+        except Exception:
+            logger.exception("write_document: rolled back token layer for text_id=%s", text_id)
+            raise
+        logger.info(
+            "write_document: text_id=%s sentences=%d tokens=%d dependencies=%d statements=%d",
+            text_id, len(payload["sentences"]), len(payload["tokens"]),
+            len(payload["dependencies"]), len(statements),
+        )
+        return payload
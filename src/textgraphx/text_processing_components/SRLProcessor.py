@@ -6,6 +6,104 @@ from textgraphx.infrastructure.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Maximum rows per UNWIND statement when flushing an SRLWritePlan.
+_SRL_WRITE_BATCH = 500
+
+# Labels a TagOccurrence may be linked to via PARTICIPATES_IN / IN_FRAME.
+_SRL_LINK_LABELS = ("Frame", "FrameArgument")
+
+
+def _frame_provisional(sense_conf, threshold):
+    """A frame is provisional when ``sense_conf`` is set but below *threshold*."""
+    return sense_conf is not None and sense_conf < threshold
+
+
+def _frame_confidence_min():
+    try:
+        return get_config().ingestion.frame_confidence_min
+    except Exception:
+        return 0.50
+
+
+class SRLWritePlan:
+    """Document-level buffer of SRL writes.
+
+    Frames, frame arguments, token links and PARTICIPANT edges are collected
+    in Python and written by :meth:`SRLProcessor.flush_write_plan` as a handful
+    of label-scoped ``UNWIND`` statements instead of one query per item.
+    Re-adding an id overwrites the pending row, which mirrors the
+    last-write-wins behaviour of the per-item ``MERGE ... SET`` queries.
+    """
+
+    def __init__(self, doc_id):
+        self.doc_id = doc_id
+        self.frames = {}
+        self.arguments = {}
+        self.token_links = {label: {} for label in _SRL_LINK_LABELS}
+        self.participants = {}
+        self._threshold = _frame_confidence_min()
+
+    def __len__(self):
+        return (
+            len(self.frames)
+            + len(self.arguments)
+            + sum(len(links) for links in self.token_links.values())
+            + len(self.participants)
+        )
+
+    def add_frame(self, start, end, headword, head_index, text,
+                  sense=None, sense_conf=None, framework="PROPBANK"):
+        """Queue a Frame row and return its deterministic id."""
+        frame_id = make_frame_id(self.doc_id, start, end)
+        self.frames[frame_id] = {
+            "frame_id": frame_id,
+            "headword": headword,
+            "head_index": head_index,
+            "text": text,
+            "start": start,
+            "end": end,
+            "framework": framework,
+            "sense": sense,
+            "sense_conf": sense_conf,
+            "provisional": _frame_provisional(sense_conf, self._threshold),
+        }
+        return frame_id
+
+    def add_argument(self, start, end, head, head_index, arg_type, text):
+        """Queue a FrameArgument row and return its deterministic id."""
+        arg_id = make_fa_id(self.doc_id, start, end, arg_type)
+        self.arguments[arg_id] = {
+            "arg_id": arg_id,
+            "head": head,
+            "head_index": head_index,
+            "arg_type": arg_type,
+            "text": text,
+            "start": start,
+            "end": end,
+        }
+        return arg_id
+
+    def link_tokens(self, node_label, node_id, indices):
+        """Queue PARTICIPATES_IN / IN_FRAME links from tokens to a node."""
+        if node_label not in self.token_links:
+            raise ValueError(f"Unsupported SRL link label: {node_label!r}")
+        links = self.token_links[node_label]
+        for idx in indices:
+            links[(idx, node_id)] = {"idx": idx, "node_id": node_id}
+
+    def link_argument(self, arg_id, frame_id, raw_label):
+        """Queue the PARTICIPANT / HAS_FRAME_ARGUMENT edge for an argument."""
+        norm = normalize_role(raw_label)
+        self.participants[(arg_id, frame_id)] = {
+            "arg_id": arg_id,
+            "frame_id": frame_id,
+            "canonical": norm.canonical,
+            "raw": norm.raw,
+            "is_continuation": norm.flags.get("is_continuation", False),
+            "is_relative": norm.flags.get("is_relative", False),
+            "predicative": norm.flags.get("predicative", False),
+        }
+
 
 class SRLProcessor:
     """Semantic Role Labeling (SRL) storage component.
@@ -23,6 +121,9 @@ class SRLProcessor:
       - All writes use MERGE and deterministic ids so runs are idempotent.
       - The component reads Neo4j config via `make_graph_from_config()` and uses
         the BoltGraphCompat wrapper to preserve `.run(...).data()` semantics.
+      - `process_srl` / `process_nominal_srl` buffer a whole document in an
+        `SRLWritePlan` and flush it with a few batched `UNWIND` statements;
+        the single-item `_merge_*` / `_link_*` helpers remain for direct use.
     """
 
     def __init__(self, uri=None, username=None, password=None):
@@ -57,13 +158,7 @@ class SRLProcessor:
         frame_id = make_frame_id(doc_id, start, end)
         # Determine provisional flag: a frame is provisional when sense_conf is
         # provided but falls below the configured gating threshold.
-        try:
-            threshold = get_config().ingestion.frame_confidence_min
-        except Exception:
-            threshold = 0.50
-        provisional = (
-            sense_conf is not None and sense_conf < threshold
-        )
+        provisional = _frame_provisional(sense_conf, _frame_confidence_min())
         query = """
         MERGE (f:Frame {id: $frame_id})
         SET f.headword = $headword, f.headTokenIndex = $head_index, f.text = $text,
@@ -104,15 +199,18 @@ class SRLProcessor:
         Args:
             doc_id: Document id used to scope matching AnnotatedText.
             indices: Iterable of token indices (tok_index_doc) to link.
-            node_label: Label of the target node (unused by current cypher but
-                left for readability).
+            node_label: Label of the target node (``Frame`` or
+                ``FrameArgument``); scopes the match so it can use the label's
+                id index instead of scanning every node.
             node_id_prop: Property name used to match the node (e.g., 'id').
             node_id: Value of the id property to match the target node.
         """
-        query = """
+        if node_label not in _SRL_LINK_LABELS:
+            raise ValueError(f"Unsupported SRL link label: {node_label!r}")
+        query = f"""
         UNWIND $indices as idx
-        MATCH (x:TagOccurrence {tok_index_doc: idx})-[:HAS_TOKEN]-()-[:CONTAINS_SENTENCE]-(:AnnotatedText {id: $doc_id})
-        MATCH (n {id: $node_id})
+        MATCH (:AnnotatedText {{id: $doc_id}})-[:CONTAINS_SENTENCE]-()-[:HAS_TOKEN]-(x:TagOccurrence {{tok_index_doc: idx}})
+        MATCH (n:{node_label} {{id: $node_id}})
         MERGE (x)-[:PARTICIPATES_IN]->(n)
         MERGE (x)-[:IN_FRAME]->(n)
         """
@@ -191,12 +289,97 @@ class SRLProcessor:
             arg_id, frame_id, norm.canonical, norm.raw, norm.flags,
         )
 
+    _FLUSH_FRAMES = """
+        UNWIND $rows AS row
+        MERGE (f:Frame {id: row.frame_id})
+        SET f.headword = row.headword, f.headTokenIndex = row.head_index, f.text = row.text,
+            f.framework = row.framework,
+            f.start_tok = row.start, f.end_tok = row.end,
+            f.startIndex = row.start, f.endIndex = row.end,
+            f.provisional = row.provisional
+        FOREACH (_ IN CASE WHEN row.sense IS NULL THEN [] ELSE [1] END |
+            SET f.sense = row.sense
+        )
+        FOREACH (_ IN CASE WHEN row.sense_conf IS NULL THEN [] ELSE [1] END |
+            SET f.sense_conf = row.sense_conf
+        )
+        """
+
+    _FLUSH_ARGUMENTS = """
+        UNWIND $rows AS row
+        MERGE (a:FrameArgument {id: row.arg_id})
+        SET a.head = row.head, a.headTokenIndex = row.head_index, a.type = row.arg_type, a.text = row.text,
+            a.start_tok = row.start, a.end_tok = row.end,
+            a.startIndex = row.start, a.endIndex = row.end
+        """
+
+    _FLUSH_TOKEN_LINKS = """
+        UNWIND $rows AS row
+        MATCH (:AnnotatedText {{id: $doc_id}})-[:CONTAINS_SENTENCE]-()-[:HAS_TOKEN]-(x:TagOccurrence {{tok_index_doc: row.idx}})
+        MATCH (n:{label} {{id: row.node_id}})
+        MERGE (x)-[:PARTICIPATES_IN]->(n)
+        MERGE (x)-[:IN_FRAME]->(n)
+        """
+
+    _FLUSH_PARTICIPANTS = """
+        UNWIND $rows AS row
+        MATCH (a:FrameArgument {id: row.arg_id})
+        MATCH (f:Frame {id: row.frame_id})
+        SET a.type = row.canonical,
+            a.raw_role = row.raw
+        MERGE (a)-[r:PARTICIPANT]->(f)
+        SET r.type = row.canonical, r.raw_role = row.raw
+        FOREACH (_ IN CASE WHEN row.is_continuation THEN [1] ELSE [] END | SET r.is_continuation = true)
+        FOREACH (_ IN CASE WHEN row.is_relative     THEN [1] ELSE [] END | SET r.is_relative     = true)
+        FOREACH (_ IN CASE WHEN row.predicative      THEN [1] ELSE [] END | SET r.predicative      = true)
+        MERGE (a)-[cr:HAS_FRAME_ARGUMENT]->(f)
+        SET cr.type = row.canonical, cr.raw_role = row.raw
+        """
+
+    def _run_batched(self, query, rows, extra_params=None):
+        for offset in range(0, len(rows), _SRL_WRITE_BATCH):
+            params = dict(extra_params or {})
+            params["rows"] = rows[offset:offset + _SRL_WRITE_BATCH]
+            self.graph.run(query, params)
+
+    def flush_write_plan(self, plan):
+        """Write every row queued on *plan* and return per-kind row counts.
+
+        Nodes are written before the relationships that match them: frames,
+        then arguments, then token links (one statement per target label), then
+        PARTICIPANT / HAS_FRAME_ARGUMENT edges. Each kind is chunked into
+        ``UNWIND`` batches of at most ``_SRL_WRITE_BATCH`` rows.
+        """
+        frames = list(plan.frames.values())
+        arguments = list(plan.arguments.values())
+        participants = list(plan.participants.values())
+        self._run_batched(self._FLUSH_FRAMES, frames)
+        self._run_batched(self._FLUSH_ARGUMENTS, arguments)
+        token_links = 0
+        for label, links in plan.token_links.items():
+            rows = list(links.values())
+            token_links += len(rows)
+            self._run_batched(
+                self._FLUSH_TOKEN_LINKS.format(label=label), rows, {"doc_id": plan.doc_id},
+            )
+        self._run_batched(self._FLUSH_PARTICIPANTS, participants)
+        counts = {
+            "frames": len(frames),
+            "arguments": len(arguments),
+            "token_links": token_links,
+            "participants": len(participants),
+        }
+        logger.debug("flush_write_plan doc_id=%s counts=%s", plan.doc_id, counts)
+        return counts
+
     def process_srl(self, doc, flag_display=False):
         """Process SRL frames for a spaCy document and store frames and
         frame-arguments in the graph.
 
         The spaCy SRL extension is expected on tokens under `tok._.SRL` where
         each item maps a label (e.g., 'V', 'ARG0') to a list of index spans.
+        All writes for the document are collected in an :class:`SRLWritePlan`
+        and flushed as batched ``UNWIND`` statements.
         """
         doc_id = getattr(doc._, "text_id", None)
         if doc_id is None:
@@ -204,6 +387,7 @@ class SRLProcessor:
             raise ValueError("Document must have ._.text_id set")
 
         logger.info("process_srl called for doc_id=%s", doc_id)
+        plan = SRLWritePlan(doc_id)
         for tok in doc:
             frameDict = {}
             sg_id = None
@@ -226,32 +410,30 @@ class SRLProcessor:
                     end = y[-1]
                     span = doc[start:end + 1]
                     token = span.root
+                    indices = list(range(start, end + 1)) if len(y) == 2 else list(y)
 
                     if x == "V":
-                        # create/merge the Frame node, passing PropBank sense if available
-                        sg_id = self._merge_frame(
-                            doc_id, start, end, token.text, token.i, span.text,
+                        # queue the Frame node, passing PropBank sense if available
+                        sg_id = plan.add_frame(
+                            start, end, token.text, token.i, span.text,
                             sense=frame_sense, sense_conf=frame_score, framework="PROPBANK",
                         )
-                        # link tag occurrences to the frame
-                        indices = list(range(start, end + 1)) if len(y) == 2 else list(y)
-                        self._link_indices_to_node(doc_id, indices, "Frame", "id", sg_id)
+                        plan.link_tokens("Frame", sg_id, indices)
                     else:
                         # frame argument
-                        arg_id = self._merge_frame_argument(doc_id, start, end, token.text, token.i, x, span.text)
-                        indices = list(range(start, end + 1)) if len(y) == 2 else list(y)
-                        self._link_indices_to_node(doc_id, indices, "FrameArgument", "id", arg_id)
-
-                        if x not in frameDict:
-                            frameDict[x] = []
-                        frameDict[x].append(arg_id)
+                        arg_id = plan.add_argument(start, end, token.text, token.i, x, span.text)
+                        plan.link_tokens("FrameArgument", arg_id, indices)
+                        frameDict.setdefault(x, []).append(arg_id)
 
             # after collecting, link frame arguments to the frame via PARTICIPANT
             if sg_id is not None:
                 for arg_type, arg_ids in frameDict.items():
                     for arg_id in arg_ids:
-                        self._link_argument_to_frame(arg_id, sg_id, arg_type)
-                        logger.debug("Linked FrameArgument %s to Frame %s", arg_id, sg_id)
+                        plan.link_argument(arg_id, sg_id, arg_type)
+
+        if len(plan):
+            counts = self.flush_write_plan(plan)
+            logger.info("process_srl wrote doc_id=%s %s", doc_id, counts)
 
     @staticmethod
     def _bio_to_spans(tags):
@@ -301,6 +483,7 @@ class SRLProcessor:
         if not sentence_results:
             return
 
+        plan = SRLWritePlan(doc_id)
         for sent_offset, response in sentence_results:
             if not response:
                 continue
@@ -321,16 +504,14 @@ class SRLProcessor:
                 except (TypeError, ValueError):
                     sense_conf = None
 
-                frame_id = self._merge_frame(
-                    doc_id, pred_idx_doc, pred_idx_doc, pred_text, pred_idx_doc,
+                frame_id = plan.add_frame(
+                    pred_idx_doc, pred_idx_doc, pred_text, pred_idx_doc,
                     pred_text,
                     sense=str(sense) if sense else None,
                     sense_conf=sense_conf,
                     framework="NOMBANK",
                 )
-                self._link_indices_to_node(
-                    doc_id, [pred_idx_doc], "Frame", "id", frame_id,
-                )
+                plan.link_tokens("Frame", frame_id, [pred_idx_doc])
 
                 tags = fr.get("tags") or []
                 arg_spans = self._bio_to_spans(tags)
@@ -339,15 +520,15 @@ class SRLProcessor:
                     e_doc = sent_offset + e_sent
                     span_text = " ".join(words[s_sent:e_sent + 1])
                     head_text = str(words[e_sent])  # rightmost token as fallback head
-                    arg_id = self._merge_frame_argument(
-                        doc_id, s_doc, e_doc, head_text, e_doc, label, span_text,
-                    )
-                    self._link_indices_to_node(
-                        doc_id, list(range(s_doc, e_doc + 1)),
-                        "FrameArgument", "id", arg_id,
+                    arg_id = plan.add_argument(
+                        s_doc, e_doc, head_text, e_doc, label, span_text,
                     )
-                    self._link_argument_to_frame(arg_id, frame_id, label)
+                    plan.link_tokens("FrameArgument", arg_id, range(s_doc, e_doc + 1))
+                    plan.link_argument(arg_id, frame_id, label)
                 logger.debug(
                     "process_nominal_srl: doc=%s pred=%s sense=%s args=%d",
                     doc_id, pred_text, sense, len(arg_spans),
-                )
\ No newline at end of file
+                )
+
+        if len(plan):
+            self.flush_write_plan(plan)
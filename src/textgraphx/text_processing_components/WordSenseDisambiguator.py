@@ -1,73 +1,174 @@
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 
+from textgraphx.adapters.service_client import get_service_client
+
 logger = logging.getLogger(__name__)
 
 
 class WordSenseDisambiguator:
     """
     A class that performs word sense disambiguation on a given document using the AMuSE-WSD API.
+
+    Sentences are sent in chunks of ``batch_size`` (``services.wsd_batch_size``)
+    with up to ``max_workers`` (``services.wsd_max_workers``) requests in
+    flight, and all synset attributes of a document are written in one
+    ``UNWIND`` keyed by ``TagOccurrence.id``.
+    """
+
+    SENTENCE_QUERY = """
+        MATCH (d:AnnotatedText {id: $doc_id})-[:CONTAINS_SENTENCE]->(s:Sentence)
+        OPTIONAL MATCH (s)-[:HAS_TOKEN]->(t:TagOccurrence)
+        WITH s, collect({index: t.tok_index_sent, id: t.id}) AS tokens
+        RETURN s.id AS sentence_id, s.text AS text, tokens
     """
 
-    def __init__(self, amuse_wsd_api_endpoint, neo4j_executor):
+    UPDATE_QUERY = """
+        UNWIND $rows AS row
+        MATCH (t:TagOccurrence {id: row.id})
+        SET t.bnSynsetId = row.bnSynsetId,
+            t.wnSynsetOffset = row.wnSynsetOffset,
+            t.nltkSynset = row.nltkSynset
+    """
+
+    def __init__(self, amuse_wsd_api_endpoint, neo4j_executor, batch_size=None, max_workers=None):
         """
         Initializes the WordSenseDisambiguator instance.
 
         Args:
         amuse_wsd_api_endpoint (str): The endpoint of the AMuSE-WSD API.
         neo4j_executor (object): An instance that provides a method to execute Cypher queries on a Neo4j database.
+        batch_size (int): Sentences per API request; defaults to ``services.wsd_batch_size``.
+        max_workers (int): Concurrent API requests; defaults to ``services.wsd_max_workers``.
         """
         self.amuse_wsd_api_endpoint = amuse_wsd_api_endpoint
         self.neo4j_executor = neo4j_executor
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+
+    @staticmethod
+    def _services_setting(name, default):
+        try:
+            from textgraphx.infrastructure.config import get_config
+
+            return getattr(get_config().services, name, default)
+        except Exception:
+            return default
+
+    def _batch_size(self):
+        return max(1, int(self.batch_size or self._services_setting("wsd_batch_size", 32)))
+
+    def _max_workers(self):
+        return max(1, int(self.max_workers or self._services_setting("wsd_max_workers", 4)))
+
+    def fetch_senses(self, sentences):
+        """
+        Call the API for ``(sentence_id, text)`` pairs without touching the graph.
+
+        Lets the ingestion pipeline query AMuSE-WSD while the document's
+        sentences are still being written.
+
+        Returns:
+        dict: Sentence id to API response; sentences whose chunk failed are left out.
+        """
+        records = [{"sentence_id": sentence_id, "text": text} for sentence_id, text in sentences]
+        return {
+            record["sentence_id"]: response
+            for record, response in self._disambiguate_sentences(records)
+        }
 
-    def perform_wsd(self, document_id: str) -> None:
+    def perform_wsd(self, document_id: str, senses=None) -> None:
         """
         Perform word sense disambiguation on a given document using the AMuSE-WSD API.
 
         Args:
         document_id (str): The ID of the document to process.
+        senses (dict): Optional responses from :meth:`fetch_senses`, keyed by
+            sentence id; when given, the API is not called again.
         """
-        # Define the Cypher query as a constant
-        SENTENCE_QUERY = """
-            MATCH (d:AnnotatedText {id: $doc_id})-[:CONTAINS_SENTENCE]->(s:Sentence)
-            RETURN s.id AS sentence_id, s.text AS text
-        """
-
         # Validate the input
         if not document_id:
             raise ValueError("Document ID cannot be empty")
 
         try:
-            # Execute the Cypher query to retrieve sentences
+            # Retrieve sentences with their tok_index_sent -> TagOccurrence id map
             query_parameters = {"doc_id": document_id}
-            sentence_query_result = self.neo4j_executor.execute_query(SENTENCE_QUERY, query_parameters)
-
-            # Extract sentence IDs and texts from the query result
-            sentence_ids = [record["sentence_id"] for record in sentence_query_result]
-            sentences_to_process = [record["text"] for record in sentence_query_result]
-
-            # Call the AMuSE-WSD API with the sentences
-            api_response = self._call_amuse_wsd_api(sentences_to_process)
-
-            if api_response:
-                # Update the token nodes in Neo4j with the API response
-                for idx, sentence_data in enumerate(api_response):
-                    sentence_id = sentence_ids[idx]
-                    for token_data in sentence_data['tokens']:
-                        token_index = token_data['index']
-                        token_attrs = {
-                            'bnSynsetId': token_data['bnSynsetId'],
-                            'wnSynsetOffset': token_data['wnSynsetOffset'],
-                            'nltkSynset': token_data['nltkSynset']
-                        }
-                        self._update_tokens_in_neo4j(sentence_id, token_index, token_attrs)
-
-            logger.info("Word sense disambiguation completed for document %s", document_id)
+            sentences = self.neo4j_executor.execute_query(self.SENTENCE_QUERY, query_parameters)
+            if senses is None:
+                pairs = self._disambiguate_sentences(sentences)
+            else:
+                pairs = [
+                    (sentence, senses[sentence["sentence_id"]])
+                    for sentence in sentences
+                    if sentence["sentence_id"] in senses
+                ]
+
+            rows = []
+            for sentence, sentence_response in pairs:
+                token_ids = {
+                    token["index"]: token["id"]
+                    for token in sentence["tokens"] or []
+                    if token.get("id") is not None
+                }
+                for token_data in sentence_response.get("tokens", []):
+                    token_id = token_ids.get(token_data.get("index"))
+                    if token_id is None:
+                        continue
+                    rows.append({
+                        "id": token_id,
+                        "bnSynsetId": token_data.get("bnSynsetId"),
+                        "wnSynsetOffset": token_data.get("wnSynsetOffset"),
+                        "nltkSynset": token_data.get("nltkSynset"),
+                    })
+
+            if rows:
+                self.neo4j_executor.execute_query(self.UPDATE_QUERY, {"rows": rows})
+
+            logger.info(
+                "Word sense disambiguation completed for document %s (%d tokens)", document_id, len(rows)
+            )
 
         except Exception:
             logger.exception("Error performing word sense disambiguation for document %s", document_id)
 
+    def _disambiguate_sentences(self, sentences):
+        """
+        Call the API for *sentences* in chunks, concurrently.
+
+        Returns:
+        list: ``(sentence_record, sentence_response)`` pairs, in sentence order.
+        Sentences whose chunk failed are left out.
+        """
+        batch_size = self._batch_size()
+        chunks = [sentences[i:i + batch_size] for i in range(0, len(sentences), batch_size)]
+        if not chunks:
+            return []
+
+        def _call(chunk):
+            return self._call_amuse_wsd_api([record["text"] or "" for record in chunk])
+
+        workers = min(self._max_workers(), len(chunks))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wsd") as pool:
+                responses = list(pool.map(_call, chunks))
+        else:
+            responses = [_call(chunk) for chunk in chunks]
+
+        pairs = []
+        for chunk, response in zip(chunks, responses):
+            if not response:
+                continue
+            if len(response) != len(chunk):
+                logger.warning(
+                    "AMuSE-WSD returned %d results for %d sentences; extra or missing sentences are skipped",
+                    len(response), len(chunk),
+                )
+            pairs.extend(zip(chunk, response))
+        return pairs
+
     def _call_amuse_wsd_api(self, sentences):
         """
         Calls the AMuSE-WSD API with the given sentences.
@@ -93,42 +194,15 @@ class WordSenseDisambiguator:
         data = [{"text": sentence, "lang": "EN"} for sentence in updated_sentences]
 
         try:
-            response = requests.post(self.amuse_wsd_api_endpoint, json=data, headers=headers)
-            response.raise_for_status()
+            response = get_service_client("wsd").post(
+                self.amuse_wsd_api_endpoint, json=data, headers=headers,
+                timeout=self._services_setting("service_timeout_sec", 20),
+            )
             return response.json()
         except requests.exceptions.RequestException:
             logger.exception("Error while calling AMuSE-WSD API")
             return None
 
-    def _update_tokens_in_neo4j(self, sentence_id, token_index, token_attrs):
-        """
-        Updates the token nodes in Neo4j with the given attributes.
-
-        Args:
-        sentence_id (str): The ID of the sentence.
-        token_index (int): The index of the token.
-        token_attrs (dict): A dictionary of token attributes.
-        """
-        # Implement the token update logic here
-
-        query = """
-            MATCH (s:Sentence {id: $sentence_id})-[:HAS_TOKEN]->(t:TagOccurrence {tok_index_sent: $index})
-            SET t.bnSynsetId = $bnSynsetId,
-                t.wnSynsetOffset = $wnSynsetOffset,
-                t.nltkSynset = $nltkSynset
-        """
-
-        params = {
-            "sentence_id": sentence_id,
-            "index": token_index,
-            "bnSynsetId": token_attrs['bnSynsetId'],
-            "wnSynsetOffset": token_attrs['wnSynsetOffset'],
-            "nltkSynset": token_attrs['nltkSynset']
-        }
-
-        self.neo4j_executor.execute_query(query, params)
-
-
     def replace_hyphens_to_underscores(self, sentence):
         # Define a regular expression pattern to match hyphens used as infixes
         pattern = re.compile(r'(?<=\w)-(?=\w)')
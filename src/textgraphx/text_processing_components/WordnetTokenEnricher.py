@@ -2,17 +2,23 @@ import nltk
 from nltk.corpus import wordnet as wn
 from nltk.stem import WordNetLemmatizer
 import logging
+
+from textgraphx.adapters.wordnet_feature_cache import get_wordnet_feature_cache
+
 logger = logging.getLogger(__name__)
 
 class WordnetTokenEnricher:
-    def __init__(self, neo4j_executor):
+    def __init__(self, neo4j_executor, feature_cache=None):
         """
         Initialize the TokenEnricher class.
 
         Args:
             neo4j_driver (Neo4jDriver): The Neo4j driver instance.
+            feature_cache (WordNetFeatureCache, optional): Per-synset feature
+                cache; defaults to the process-wide cache.
         """
         self.neo4j_executor = neo4j_executor
+        self.feature_cache = feature_cache if feature_cache is not None else get_wordnet_feature_cache()
         self.wn_lemmatizer = WordNetLemmatizer()
         # Rough POS-specific reference depths for WordNet normalization.
         # Used to convert raw depth into a comparable abstraction score.
@@ -24,96 +30,120 @@ class WordnetTokenEnricher:
             "r": 8.0,
         }
 
+    TOKEN_QUERY = """
+    MATCH (d:AnnotatedText {id: $doc_id})-[:CONTAINS_SENTENCE]->(:Sentence)-[:HAS_TOKEN]->(t:TagOccurrence)
+    RETURN t.id AS token_id, t.lemma AS token_lemma, t.nltkSynset AS nltkSynset
+    """
+
+    UPDATE_QUERY = """
+    MATCH (t:TagOccurrence)
+    WHERE t.id IN $token_ids
+    SET t.hypernyms = $hypernyms, t.wn31SynsetOffset = $wn31SynsetOffset, t.synonyms = $synonyms, t.domain_labels = $domain_labels,
+        t.wnLexname = $wnLexname,
+        t.wnDerivationalForms = $wnDerivationalForms,
+        t.wnDerivationalEventiveVerbs = $wnDerivationalEventiveVerbs,
+        t.wnEntails = $wnEntails,
+        t.wnCauses = $wnCauses,
+        t.wnDepthMin = $wnDepthMin,
+        t.wnDepthMax = $wnDepthMax,
+        t.wnAbstractionLevel = $wnAbstractionLevel
+    """
+
     def assign_synset_info_to_tokens(self, doc_id):
         """
         Assign synset information to tokens in a document.
 
+        Tokens are read in one query and grouped by synset (and lemma, which
+        drives the eventive-verb filter); every group is written with a single
+        update. Per-synset features come from the shared WordNet feature cache.
+
         Args:
             doc_id (str): The ID of the document.
         """
-        # Step 1: Retrieve all Sentence nodes for the given AnnotatedText document
-        query = """
-        MATCH (d:AnnotatedText {id: $doc_id})-[:CONTAINS_SENTENCE]->(s:Sentence)
-        RETURN s.id AS sentence_id, s.text AS sentence_text
-        """
         params = {"doc_id": doc_id}
-        result = self.neo4j_executor.execute_query(query, params)
-
-        for record in result:
-            sentence_id = record["sentence_id"]
-            sentence_text = record["sentence_text"]
-
-            # Step 2: Retrieve the linked Token nodes for each Sentence node
-            query = """
-            MATCH (s:Sentence {id: $sentence_id})-[:HAS_TOKEN]->(t:TagOccurrence)
-            RETURN t.id AS token_id, t.lemma AS token_lemma, t.nltkSynset AS nltkSynset, t.wnSynsetOffset AS wnSynsetOffset
-            """
-            params = {"sentence_id": sentence_id}
-            token_result = self.neo4j_executor.execute_query(query, params)
-
-            for token_record in token_result:
-                token_id = token_record["token_id"]
-                token_lemma = token_record.get("token_lemma")
-                nltk_synset = token_record["nltkSynset"]
-
-                if nltk_synset and nltk_synset != 'O':
-                    try:
-                        # Get synset information from WordNet
-                        synset = wn.synset(nltk_synset)
-                        synset_identifier = synset.name()
-                        logger.debug("Found synset: %s", synset_identifier)
-                        lemma, pos, sense_num = synset_identifier.split('.')
-                        wn_synset_offset = synset.offset()
-                        wn_synset_offset = str(wn_synset_offset) + pos
-                        wn_lexname = synset.lexname()
-
-                        # Get hypernyms, synonyms, and domain labels for the synset
-                        hypernyms = self.get_all_hypernyms(synset)
-                        synonyms = self.get_synonyms(synset)
-                        domain_labels = self.get_domain_labels(synset)
-                        derivational_forms, derivational_eventive_verbs = self.get_derivational_features(
-                            synset,
-                            token_lemma=token_lemma or lemma,
-                        )
-                        entails, causes = self.get_verb_relation_features(synset)
-                        depth_min, depth_max, abstraction_level = self.get_depth_features(synset)
-
-                        # Update the Token node in Neo4j with synset-related information
-                        update_query = """
-                        MATCH (t:TagOccurrence {id: $token_id})
-                        SET t.hypernyms = $hypernyms, t.wn31SynsetOffset = $wn31SynsetOffset, t.synonyms = $synonyms, t.domain_labels = $domain_labels,
-                            t.wnLexname = $wnLexname,
-                            t.wnDerivationalForms = $wnDerivationalForms,
-                            t.wnDerivationalEventiveVerbs = $wnDerivationalEventiveVerbs,
-                            t.wnEntails = $wnEntails,
-                            t.wnCauses = $wnCauses,
-                            t.wnDepthMin = $wnDepthMin,
-                            t.wnDepthMax = $wnDepthMax,
-                            t.wnAbstractionLevel = $wnAbstractionLevel
-                        """
-                        params = {
-                            "token_id": token_id,
-                            "hypernyms": hypernyms,
-                            "synonyms": synonyms,
-                            "domain_labels": domain_labels,
-                            "wn31SynsetOffset": wn_synset_offset,
-                            "wnLexname": wn_lexname,
-                            "wnDerivationalForms": derivational_forms,
-                            "wnDerivationalEventiveVerbs": derivational_eventive_verbs,
-                            "wnEntails": entails,
-                            "wnCauses": causes,
-                            "wnDepthMin": depth_min,
-                            "wnDepthMax": depth_max,
-                            "wnAbstractionLevel": abstraction_level,
-                        }
-                        self.neo4j_executor.execute_query(update_query, params)
-                    except Exception as e:
-                        logger.exception("Synset not found for token_id: %s. Skipping processing.", token_id)
-                else:
-                    # This is a noisy, expected condition when offsets are missing; log at DEBUG level
-                    # so it can be enabled when troubleshooting without flooding INFO logs.
-                    logger.debug("Synset offset 'O' or empty for token_id: %s. Skipping processing.", token_id)
-    def get_all_hypernyms(self, synset):
+        result = self.neo4j_executor.execute_query(self.TOKEN_QUERY, params)
+
+        groups = {}
+        for token_record in result:
+            token_id = token_record["token_id"]
+            nltk_synset = token_record["nltkSynset"]
+            if nltk_synset and nltk_synset != 'O':
+                key = (nltk_synset, token_record.get("token_lemma"))
+                groups.setdefault(key, []).append(token_id)
+            else:
+                # This is a noisy, expected condition when offsets are missing; log at DEBUG level
+                # so it can be enabled when troubleshooting without flooding INFO logs.
+                logger.debug("Synset offset 'O' or empty for token_id: %s. Skipping processing.", token_id)
+
+        for (nltk_synset, token_lemma), token_ids in groups.items():
+            try:
+                features = self.get_synset_features(nltk_synset)
+                lemma = nltk_synset.split('.')[0]
+                params = {
+                    "token_ids": token_ids,
+                    "hypernyms": features["hypernyms"],
+                    "synonyms": features["synonyms"],
+                    "domain_labels": features["domain_labels"],
+                    "wn31SynsetOffset": features["wn31SynsetOffset"],
+                    "wnLexname": features["wnLexname"],
+                    "wnDerivationalForms": features["wnDerivationalForms"],
+                    "wnDerivationalEventiveVerbs": self.score_eventive_verbs(
+                        features["derivationalVerbCandidates"],
+                        token_lemma=token_lemma or lemma,
+                    ),
+                    "wnEntails": features["wnEntails"],
+                    "wnCauses": features["wnCauses"],
+                    "wnDepthMin": features["wnDepthMin"],
+                    "wnDepthMax": features["wnDepthMax"],
+                    "wnAbstractionLevel": features["wnAbstractionLevel"],
+                }
+                self.neo4j_executor.execute_query(self.UPDATE_QUERY, params)
+            except Exception:
+                logger.exception("Synset not found for token_ids: %s. Skipping processing.", token_ids)
+
+    def get_synset_features(self, nltk_synset):
+        """Return the cached token features of the synset named *nltk_synset*."""
+        return self.feature_cache.get_or_compute(
+            nltk_synset, lambda: self.compute_synset_features(wn.synset(nltk_synset))
+        )
+
+    def compute_synset_features(self, synset):
+        """
+        Compute the token features that depend only on the synset.
+
+        The eventive-verb subset of derivational forms also depends on the
+        token lemma, so only its candidates are kept here.
+
+        Args:
+            synset (Synset): The synset.
+
+        Returns:
+            dict: JSON-serialisable features keyed by token property name.
+        """
+        synset_identifier = synset.name()
+        logger.debug("Found synset: %s", synset_identifier)
+        pos = synset_identifier.split('.')[1]
+        wn_synset_offset = str(synset.offset()) + pos
+        wn_lexname = synset.lexname()
+        derivational_forms, verb_candidates = self.get_derivational_candidates(synset)
+        entails, causes = self.get_verb_relation_features(synset)
+        depth_min, depth_max, abstraction_level = self.get_depth_features(synset)
+        return {
+            "wn31SynsetOffset": wn_synset_offset,
+            "wnLexname": wn_lexname,
+            "hypernyms": self.get_all_hypernyms(synset),
+            "synonyms": self.get_synonyms(synset),
+            "domain_labels": self.get_domain_labels(synset),
+            "wnDerivationalForms": derivational_forms,
+            "derivationalVerbCandidates": verb_candidates,
+            "wnEntails": entails,
+            "wnCauses": causes,
+            "wnDepthMin": depth_min,
+            "wnDepthMax": depth_max,
+            "wnAbstractionLevel": abstraction_level,
+        }
+
+    def get_all_hypernyms(self, synset, _memo=None):
         """
         Get all hypernyms for a given synset.
 
@@ -123,11 +153,17 @@ class WordnetTokenEnricher:
         Returns:
             list: A list of hypernyms.
         """
+        # Shared ancestors are expanded once per call instead of once per path.
+        memo = {} if _memo is None else _memo
+        key = synset.name()
+        if key in memo:
+            return memo[key]
         hypernyms = []
         hypernym_synsets = synset.hypernyms()
         for hypernym_synset in hypernym_synsets:
             hypernyms.append(hypernym_synset.name())  # Store hypernym synset name
-            hypernyms.extend(self.get_all_hypernyms(hypernym_synset))  # Recursive call to get hypernyms of hypernyms
+            hypernyms.extend(self.get_all_hypernyms(hypernym_synset, memo))  # Recursive call to get hypernyms of hypernyms
+        memo[key] = hypernyms
         return hypernyms
 
     def get_synonyms(self, synset):
@@ -192,15 +228,10 @@ class WordnetTokenEnricher:
 
         return max(token_jaccard, char_jaccard)
 
-    def get_derivational_features(self, synset, token_lemma=""):
-        """Return derivationally related forms and eventive-verb subset.
-
-        This is useful for bridging nominal mentions to eventive verb concepts,
-        which strengthens event-centric KG construction.
-        """
+    def get_derivational_candidates(self, synset):
+        """Return derivationally related forms and ``[name, synset]`` verb candidates."""
         forms = set()
-        scored_eventive_verbs = []
-        token_lemma_n = self._normalize_lemma(token_lemma)
+        verb_candidates = []
 
         for lemma in synset.lemmas():
             for rel in lemma.derivationally_related_forms():
@@ -215,22 +246,38 @@ class WordnetTokenEnricher:
                 try:
                     rel_synset = rel.synset()
                     if rel_synset.pos() == "v":
-                        # Keep only reasonably lexical-aligned derivations.
-                        rel_score = self._lemma_similarity(token_lemma_n, rel_name)
-                        if rel_score >= 0.45:
-                            scored_eventive_verbs.append((rel_synset.name(), rel_score))
+                        verb_candidates.append([rel_name, rel_synset.name()])
                 except Exception:
                     continue
 
+        return sorted(forms), verb_candidates
+
+    def score_eventive_verbs(self, verb_candidates, token_lemma=""):
+        """Keep the verb candidates lexically aligned with *token_lemma*."""
+        token_lemma_n = self._normalize_lemma(token_lemma)
+        scored_eventive_verbs = []
+        for rel_name, rel_synset_name in verb_candidates:
+            # Keep only reasonably lexical-aligned derivations.
+            rel_score = self._lemma_similarity(token_lemma_n, rel_name)
+            if rel_score >= 0.45:
+                scored_eventive_verbs.append((rel_synset_name, rel_score))
+
         # Deterministic top-k to reduce noisy long tails.
         scored_eventive_verbs = sorted(
             scored_eventive_verbs,
             key=lambda x: (x[1], x[0]),
             reverse=True,
         )[:5]
-        eventive_verbs = [syn_name for syn_name, _ in scored_eventive_verbs]
+        return [syn_name for syn_name, _ in scored_eventive_verbs]
+
+    def get_derivational_features(self, synset, token_lemma=""):
+        """Return derivationally related forms and eventive-verb subset.
 
-        return sorted(forms), eventive_verbs
+        This is useful for bridging nominal mentions to eventive verb concepts,
+        which strengthens event-centric KG construction.
+        """
+        forms, verb_candidates = self.get_derivational_candidates(synset)
+        return forms, self.score_eventive_verbs(verb_candidates, token_lemma=token_lemma)
 
     def get_verb_relation_features(self, synset):
         """Return verb entailment and causal relation synset names."""
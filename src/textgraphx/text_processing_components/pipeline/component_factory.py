@@ -24,6 +24,7 @@ class TextPipelineComponents:
     entity_processor: Any
     entity_fuser: Any
     entity_disambiguator: Any
+    document_token_writer: Any = None
 
 
 class TextPipelineComponentFactory:
@@ -43,18 +44,24 @@ class TextPipelineComponentFactory:
         from textgraphx.text_processing_components.EntityProcessor import EntityProcessor
         from textgraphx.text_processing_components.EntityFuser import EntityFuser
         from textgraphx.text_processing_components.EntityDisambiguator import EntityDisambiguator
+        from textgraphx.text_processing_components.DocumentTokenWriter import DocumentTokenWriter
 
+        tag_occurrence_creator = TagOccurrenceCreator(nlp)
+        tag_occurrence_dependency_processor = TagOccurrenceDependencyProcessor(neo4j_repository)
         return TextPipelineComponents(
             wsd=WordSenseDisambiguator(wsd_endpoint, neo4j_repository),
             wn_token_enricher=WordnetTokenEnricher(neo4j_repository),
             coref=CoreferenceResolver(coref_endpoint),
             srl_processor=SRLProcessor(),
             sentence_creator=SentenceCreator(neo4j_repository),
-            tag_occurrence_creator=TagOccurrenceCreator(nlp),
-            tag_occurrence_dependency_processor=TagOccurrenceDependencyProcessor(neo4j_repository),
+            tag_occurrence_creator=tag_occurrence_creator,
+            tag_occurrence_dependency_processor=tag_occurrence_dependency_processor,
             tag_occurrence_query_executor=TagOccurrenceQueryExecutor(neo4j_repository),
             noun_chunk_processor=NounChunkProcessor(neo4j_repository),
             entity_processor=EntityProcessor(neo4j_repository),
             entity_fuser=EntityFuser(neo4j_repository),
             entity_disambiguator=EntityDisambiguator(neo4j_repository),
+            document_token_writer=DocumentTokenWriter(
+                neo4j_repository, tag_occurrence_creator, tag_occurrence_dependency_processor,
+            ),
         )
@@ -59,7 +59,7 @@ class EntityDisambiguatorLike(Protocol):
 
 
 class WSDLike(Protocol):
-    def perform_wsd(self, text_id: Any) -> Any:
+    def perform_wsd(self, text_id: Any, senses: Any = None) -> Any:
         ...
 
 
@@ -0,0 +1,75 @@
+"""Precompute the WordNet token features of every synset into a SQLite table.
+
+The table is read by the WordNet feature cache when ``paths.wordnet_feature_table``
+(``TEXTGRAPHX_WORDNET_FEATURE_TABLE``) points at it, so ingestion looks token
+features up instead of walking WordNet for every token.
+
+Examples:
+  python -m textgraphx.tools.build_wordnet_feature_table --output .textgraphx/wordnet_features.db
+  python -m textgraphx.tools.build_wordnet_feature_table --corpus wordnet31
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Iterable
+
+from textgraphx.adapters.wordnet_feature_cache import build_feature_table
+
+DEFAULT_TABLE_PATH = ".textgraphx/wordnet_features.db"
+
+
+def _default_table_path() -> str:
+    try:
+        from textgraphx.infrastructure.config import get_config
+
+        return get_config().paths.wordnet_feature_table or DEFAULT_TABLE_PATH
+    except Exception:
+        return DEFAULT_TABLE_PATH
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Precompute per-synset WordNet token features into a SQLite table.",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Table file (default: paths.wordnet_feature_table or .textgraphx/wordnet_features.db).",
+    )
+    parser.add_argument(
+        "--corpus",
+        default="wordnet",
+        help="NLTK WordNet corpus to read (default: wordnet, the corpus the enricher resolves synsets from).",
+    )
+    return parser
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    try:
+        from nltk.corpus import wordnet, wordnet31
+
+        corpus = {"wordnet": wordnet, "wordnet31": wordnet31}.get(args.corpus)
+        if corpus is None:
+            print(f"ERROR: unsupported corpus {args.corpus!r}", file=sys.stderr)
+            return 2
+        synsets = list(corpus.all_synsets())
+    except LookupError as exc:
+        print(f"ERROR: WordNet corpus {args.corpus!r} is not installed: {exc}", file=sys.stderr)
+        return 2
+
+    from textgraphx.text_processing_components.WordnetTokenEnricher import WordnetTokenEnricher
+
+    enricher = WordnetTokenEnricher(neo4j_executor=None)
+    output = args.output or _default_table_path()
+    written = build_feature_table(output, synsets, enricher.compute_synset_features)
+    print(f"Wrote features of {written} synsets to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
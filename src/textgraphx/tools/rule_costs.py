@@ -0,0 +1,99 @@
+"""Operator CLI ranking refinement, TLINK and enrichment rules by cost.
+
+Reads the per-rule metrics that phase runs append to the SQLite history file
+named by ``runtime.rule_metrics_history`` (``TEXTGRAPHX_RULE_METRICS_HISTORY``).
+
+Examples:
+  python -m textgraphx.tools.rule_costs
+  python -m textgraphx.tools.rule_costs --phase tlinks --limit 10
+  python -m textgraphx.tools.rule_costs --order-by db_hits --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Iterable, List
+
+from textgraphx.orchestration.runtime_history import ExecutionHistory
+
+DEFAULT_HISTORY_PATH = ".textgraphx/history.db"
+ORDER_COLUMNS = ("total_ms", "avg_ms", "max_ms", "rows_affected", "db_hits")
+
+
+def _default_db_path() -> str:
+    try:
+        from textgraphx.infrastructure.config import get_config
+
+        return get_config().runtime.rule_metrics_history or DEFAULT_HISTORY_PATH
+    except Exception:
+        return DEFAULT_HISTORY_PATH
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Rank pipeline rules by cost across recorded runs.",
+    )
+    parser.add_argument(
+        "--db",
+        default=None,
+        help="History SQLite file (default: runtime.rule_metrics_history or .textgraphx/history.db).",
+    )
+    parser.add_argument(
+        "--phase",
+        default=None,
+        help="Only rank rules of this phase (refinement, tlinks, event_enrichment).",
+    )
+    parser.add_argument("--limit", type=int, default=20, help="Number of rules to show.")
+    parser.add_argument(
+        "--order-by",
+        choices=ORDER_COLUMNS,
+        default="total_ms",
+        help="Ranking column (default: total_ms).",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        default=False,
+        help="Emit the ranking as JSON instead of a table.",
+    )
+    return parser
+
+
+def _format_table(rows: List[dict]) -> str:
+    header = f"{'#':>3}  {'phase':<17} {'rule':<52} {'runs':>5} {'total_ms':>11} {'avg_ms':>9} {'rows':>9} {'db_hits':>11}"
+    lines = [header, "-" * len(header)]
+    for rank, row in enumerate(rows, start=1):
+        db_hits = "-" if row.get("db_hits") is None else str(row["db_hits"])
+        lines.append(
+            f"{rank:>3}  {row['phase']:<17} {row['rule']:<52} {row['runs']:>5} "
+            f"{row['total_ms']:>11.1f} {row['avg_ms']:>9.1f} {row['rows_affected'] or 0:>9} {db_hits:>11}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    db_path = args.db or _default_db_path()
+    if not Path(db_path).exists():
+        print(f"ERROR: no rule metrics history at {db_path}", file=sys.stderr)
+        return 2
+
+    rows = ExecutionHistory(db_path).rank_rules(
+        limit=args.limit, phase=args.phase, order_by=args.order_by
+    )
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    elif rows:
+        print(_format_table(rows))
+    else:
+        print("No rule metrics recorded.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
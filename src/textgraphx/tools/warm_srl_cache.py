@@ -0,0 +1,123 @@
+"""Warm, inspect or trim the persistent SRL/nominal-SRL response store.
+
+Sentences are sent through the regular batch callers, so only sentences
+missing from the store reach the services. ``--from-graph`` reads the text of
+every ``Sentence`` node, i.e. exactly what ingestion sends to SRL.
+
+Examples:
+  python -m textgraphx.tools.warm_srl_cache --sentences sentences.txt
+  python -m textgraphx.tools.warm_srl_cache --from-graph --service verbal
+  python -m textgraphx.tools.warm_srl_cache --stats
+  python -m textgraphx.tools.warm_srl_cache --evict
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import Iterable, List
+
+DEFAULT_BATCH_SIZE = 64
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Warm, inspect or trim the persistent SRL response store.",
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--sentences", help="Text file with one sentence per line.")
+    source.add_argument(
+        "--from-graph",
+        action="store_true",
+        help="Read the text of every Sentence node from the configured Neo4j database.",
+    )
+    parser.add_argument(
+        "--service",
+        choices=("verbal", "nominal", "both"),
+        default="both",
+        help="Which SRL service to warm (default: both).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Sentences per batch call (default: {DEFAULT_BATCH_SIZE}).",
+    )
+    parser.add_argument("--stats", action="store_true", help="Print the store size and exit.")
+    parser.add_argument(
+        "--evict",
+        action="store_true",
+        help="Evict least recently used rows beyond services.srl_cache_max_entries and exit.",
+    )
+    return parser
+
+
+def _read_sentences(path: str) -> List[str]:
+    with open(path, encoding="utf-8") as handle:
+        return [line.strip() for line in handle if line.strip()]
+
+
+def _graph_sentences() -> List[str]:
+    from textgraphx.database.client import make_graph_from_config
+
+    graph = make_graph_from_config()
+    rows = graph.run(
+        "MATCH (s:Sentence) WHERE s.text IS NOT NULL RETURN DISTINCT s.text AS text"
+    ).data()
+    return [row["text"] for row in rows if row.get("text")]
+
+
+def warm(sentences: Iterable[str], service: str = "both", batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Send *sentences* through the SRL batch callers; return how many were sent."""
+    from textgraphx.adapters import rest_caller
+
+    callers = []
+    if service in ("verbal", "both"):
+        callers.append(rest_caller.callAllenNlpApiBatch)
+    if service in ("nominal", "both"):
+        callers.append(rest_caller.callNominalSrlApiBatch)
+    sentences = list(dict.fromkeys(sentences))
+    batch_size = max(1, int(batch_size))
+    for start in range(0, len(sentences), batch_size):
+        batch = sentences[start:start + batch_size]
+        for caller in callers:
+            caller(batch)
+    return len(sentences)
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    from textgraphx.adapters.srl_response_store import get_srl_response_store
+
+    store = get_srl_response_store()
+    if store is None:
+        print("ERROR: the persistent SRL cache is disabled (features.persist_srl_cache)", file=sys.stderr)
+        return 2
+
+    if args.stats:
+        print(json.dumps({"path": str(store.db_path), "entries": store.entries()}, indent=2))
+        return 0
+    if args.evict:
+        print(f"Evicted {store.evict()} response(s) from {store.db_path}")
+        return 0
+
+    if args.sentences:
+        sentences = _read_sentences(args.sentences)
+    elif args.from_graph:
+        sentences = _graph_sentences()
+    else:
+        parser.error("one of --sentences, --from-graph, --stats or --evict is required")
+
+    from textgraphx.adapters.rest_caller import _srl_cache
+
+    sent = warm(sentences, service=args.service, batch_size=args.batch_size)
+    print(f"Warmed {sent} sentence(s) into {store.db_path}")
+    print(json.dumps(_srl_cache.stats(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())